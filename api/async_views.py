@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# api/async_views.py
+"""
+비동기(ASGI) 검색 API - ultimate_search_movie_quotes 와 같은 파라미터 / 응답 형식
+    GET /api/search/async/?q=hello&limit=10
+
+- 번역 조회, DB 검색, 응답 직렬화는 phrase.utils.async_support.run_sync (제한된 스레드 풀)
+  → 풀 크기(ASYNC_SETTINGS.THREAD_POOL_SIZE)가 워커당 DB 연결 수 상한
+- 한글 번역이 있으면 영어 / 한글 DB 검색을 동시에 실행 (영어 결과 우선, 없으면 한글)
+- playphrase 호출은 비동기 HTTP (httpx, 선택 의존성) → 대기 중에는 스레드를 점유하지 않음
+- 조회수 / 검색 기록 후처리는 응답을 기다리게 하지 않음 (submit_sync)
+- 실행: uvicorn project.asgi:application 또는
+        gunicorn project.asgi -k uvicorn.workers.UvicornWorker -c gunicorn.conf.py
+  (ASGI 에서 동기 뷰는 요청마다 sync 스레드로 넘어가므로 나머지 API 는 WSGI 워커 권장)
+"""
+import time
+import asyncio
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from phrase.utils.async_support import run_sync, submit_sync
+from phrase.utils.get_movie_info import aget_movie_info
+from phrase.utils.metrics import span, record_cache
+from phrase.utils.negative_cache import is_known_no_result
+
+from .views import (
+    OptimizedSearchThrottle,
+    validate_and_optimize_search_params,
+    get_smart_translation_result,
+    initialize_search_analytics,
+    db_search_cache_key,
+    search_dialogues,
+    finalize_db_search,
+    check_spelling,
+    attach_did_you_mean,
+    should_perform_external_search,
+    store_external_results,
+    build_ultimate_response,
+    build_no_results_response,
+    schedule_post_search_tasks,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _throttle_wait(request):
+    """OptimizedSearchThrottle 확인 → 대기 초 (통과 시 None)"""
+    throttle = OptimizedSearchThrottle()
+    if throttle.allow_request(request, None):
+        return None
+    return throttle.wait() or 1
+
+
+@require_GET
+async def async_search_movie_quotes(request):
+    """
+    비동기 영화 구문 검색 API (ultimate_search_movie_quotes 의 ASGI 버전)
+    - 파라미터 / 응답 / 검색 순서 동일: 네거티브 캐시 → DB → 교정 제안(교정 구문이 DB 에 있을 때) → 외부 API
+    """
+    search_start_time = time.time()
+
+    wait = await run_sync(_throttle_wait, request)
+    if wait is not None:
+        response = JsonResponse({'error': '요청이 너무 많습니다.', 'code': 'THROTTLED'}, status=429)
+        response['Retry-After'] = str(int(wait))
+        return response
+
+    # 1단계: 파라미터 검증 및 정제
+    search_params = validate_and_optimize_search_params(request)
+    if 'error' in search_params:
+        return JsonResponse(search_params, status=400)
+
+    query = search_params['query']
+    limit = search_params['limit']
+    search_options = search_params['options']
+
+    logger.info(f"🎯 [AsyncSearch] 시작: '{query}' (limit: {limit})")
+
+    try:
+        # 2단계: 번역 (캐시 → MyMemory)
+        translation_result = await run_sync(get_smart_translation_result, query)
+        search_analytics = initialize_search_analytics(query, translation_result, search_start_time)
+
+        # 최근 결과가 없었던 구문은 DB/외부 API 없이 바로 응답
+        if await run_sync(is_known_no_result, translation_result['request_phrase']):
+            search_analytics.update({'search_method': 'negative_cache', 'cache_hit': True, 'result_count': 0})
+            return JsonResponse(await run_sync(
+                build_no_results_response, query, translation_result, search_analytics
+            ))
+
+        # 3단계: DB 검색 (영어 / 한글 동시)
+        db_results = await perform_db_search_async(translation_result, limit, search_options)
+
+        if db_results['found']:
+            search_analytics.update({
+                'search_method': 'db_optimized',
+                'cache_hit': db_results['from_cache'],
+                'result_count': len(db_results['results'])
+            })
+            response_data = await run_sync(
+                build_ultimate_response, query, translation_result, db_results['results'],
+                limit, search_analytics, search_options
+            )
+            submit_sync(schedule_post_search_tasks, db_results['results'], search_analytics)
+
+            logger.info(f"✅ [AsyncSearch] DB 성공: {len(db_results['results'])}개")
+            return JsonResponse(response_data)
+
+        # 교정된 구문이 DB 에 있으면 외부 API 호출 전에 교정 제안 (?spellcheck=false 로 생략)
+        did_you_mean, corrected_found = await run_sync(check_spelling, translation_result, search_options)
+        if corrected_found:
+            search_analytics.update({'search_method': 'did_you_mean', 'cache_hit': False, 'result_count': 0})
+            response_data = await run_sync(build_no_results_response, query, translation_result, search_analytics)
+            return JsonResponse(attach_did_you_mean(response_data, did_you_mean))
+
+        # 4단계: 외부 API 검색 (조건부)
+        if await run_sync(should_perform_external_search, translation_result, search_options):
+            external_results = await perform_external_search_async(translation_result)
+
+            if external_results['found']:
+                search_analytics.update({
+                    'search_method': 'external_api',
+                    'cache_hit': False,
+                    'result_count': len(external_results['results'])
+                })
+                response_data = await run_sync(
+                    build_ultimate_response, query, translation_result, external_results['results'],
+                    limit, search_analytics, search_options
+                )
+
+                logger.info(f"✅ [AsyncSearch] 외부 API 성공: {len(external_results['results'])}개")
+                return JsonResponse(attach_did_you_mean(response_data, did_you_mean))
+
+        # 5단계: 검색 결과 없음
+        search_analytics.update({'search_method': 'no_results', 'cache_hit': False, 'result_count': 0})
+        response_data = await run_sync(build_no_results_response, query, translation_result, search_analytics)
+        return JsonResponse(attach_did_you_mean(response_data, did_you_mean))
+
+    except Exception as e:
+        logger.error(f"❌ [AsyncSearch] 오류: {e}")
+        return JsonResponse({
+            'error': '검색 중 오류가 발생했습니다.',
+            'code': 'SEARCH_ERROR',
+            'query': query,
+            'details': str(e) if settings.DEBUG else None,
+            'timestamp': timezone.now().isoformat(),
+            'search_duration_ms': (time.time() - search_start_time) * 1000
+        }, status=500)
+
+
+async def perform_db_search_async(translation_result, limit, search_options):
+    """
+    perform_db_search_optimized 의 비동기 버전
+    - 한글 번역이 있으면 영어 / 한글 검색을 스레드 풀에서 동시에 실행
+    """
+    cache_key = db_search_cache_key(translation_result, limit, search_options)
+    cached_results = await run_sync(cache.get, cache_key)
+    record_cache('db_search', bool(cached_results))
+    if cached_results:
+        return {'found': True, 'results': cached_results, 'from_cache': True}
+
+    with span('db_search'):
+        phrases = [translation_result['request_phrase']]
+        if translation_result['request_korean']:
+            phrases.append(translation_result['request_korean'])
+        found = await asyncio.gather(*(run_sync(search_dialogues, phrase, search_options) for phrase in phrases))
+
+        # 동기 버전과 같은 우선순위 (영어 결과, 없으면 한글 결과)
+        results = next((dialogues for dialogues in found if dialogues), [])
+        return await run_sync(finalize_db_search, results, limit, search_options, cache_key)
+
+
+async def perform_external_search_async(translation_result):
+    """perform_external_search_ultimate 의 비동기 버전 (HTTP 대기는 이벤트 루프, 저장은 스레드 풀)"""
+    request_phrase = translation_result['request_phrase']
+
+    try:
+        logger.info(f"🌐 [AsyncExternalSearch] 시작: {request_phrase}")
+        playphrase_data = await aget_movie_info(request_phrase)
+        return await run_sync(store_external_results, playphrase_data, translation_result)
+
+    except Exception as e:
+        logger.error(f"❌ [AsyncExternalSearch] 오류: {e}")
+        return {'found': False, 'results': []}
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# api/middleware.py
+"""
+API 응답 압축 미들웨어
+- Accept-Encoding 협상: br (brotli 설치 시) → gzip
+- 최소 크기 이상인 응답만 압축 (작은 응답은 CPU 낭비)
+- 기본적으로 /api/ 경로만 대상 (CSRF 토큰이 있는 HTML 페이지는 BREACH 위험으로 제외)
+
+설정 (settings.API_COMPRESSION_SETTINGS):
+    MIN_SIZE: 압축 최소 바이트 (기본 1024)
+    GZIP_LEVEL: gzip 압축 레벨 (기본 6)
+    BROTLI_QUALITY: brotli 품질 (기본 4)
+    PATH_PREFIXES: 압축 대상 경로 접두사 (기본 ('/api/',))
+"""
+import gzip
+import logging
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+re_accepts_br = _lazy_re_compile(r'\bbr\b')
+re_accepts_gzip = _lazy_re_compile(r'\bgzip\b')
+
+
+class APICompressionMiddleware(MiddlewareMixin):
+    """
+    협상 기반 gzip/br 응답 압축
+    - 스트리밍 응답, 이미 인코딩된 응답, 304 등 본문 없는 응답은 건너뜀
+    - 압축 시 ETag 를 약한 ETag 로 변환 (조건부 요청 304 유지)
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+
+        compression_settings = getattr(settings, 'API_COMPRESSION_SETTINGS', {})
+        self.min_size = compression_settings.get('MIN_SIZE', 1024)
+        self.gzip_level = compression_settings.get('GZIP_LEVEL', 6)
+        self.brotli_quality = compression_settings.get('BROTLI_QUALITY', 4)
+        self.path_prefixes = tuple(compression_settings.get('PATH_PREFIXES', ('/api/',)))
+
+    def choose_encoding(self, request):
+        accept_encoding = request.META.get('HTTP_ACCEPT_ENCODING', '')
+        if brotli is not None and re_accepts_br.search(accept_encoding):
+            return 'br'
+        if re_accepts_gzip.search(accept_encoding):
+            return 'gzip'
+        return None
+
+    def process_response(self, request, response):
+        if self.path_prefixes and not request.path.startswith(self.path_prefixes):
+            return response
+
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+
+        if response.status_code == 304 or len(response.content) < self.min_size:
+            return response
+
+        # 압축 가능 여부와 관계없이 캐시는 Accept-Encoding 별로 구분
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        encoding = self.choose_encoding(request)
+        if encoding is None:
+            return response
+
+        if encoding == 'br':
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(response.content, compresslevel=self.gzip_level, mtime=0)
+
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        return response
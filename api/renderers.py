@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# api/renderers.py
+"""
+고속 JSON 렌더러 (orjson, 선택 설치)
+- settings.API_FAST_JSON = True 일 때 DEFAULT_RENDERER_CLASSES 로 사용
+- DRF JSONRenderer 와 같은 출력 규칙 (Decimal → float, 비ASCII 그대로)
+  · datetime / date / time 은 orjson 이 직접 쓰지 않고 DRF JSONEncoder 에 맡김
+    (UTC → 'Z', 소수 초 자릿수 등 설치된 DRF 버전의 형식을 그대로 따름)
+  · 차이: NaN / Infinity 는 JSONRenderer 가 오류를 내는 대신 null 로 기록
+- orjson 이 없거나 인코딩할 수 없는 값이면 DRF JSONRenderer 로 대체
+"""
+import gzip
+import time
+import logging
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson 기반 JSON 렌더러
+    - indent 요청(브라우저 등)은 기존 JSONRenderer 경로 사용
+    - orjson 이 직접 처리하지 못하는 타입과 날짜/시간은 DRF JSONEncoder.default 로 위임
+    """
+    orjson_options = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+    _drf_encoder = JSONEncoder()
+
+    @classmethod
+    def _default(cls, obj):
+        return cls._drf_encoder.default(obj)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self._default, option=self.orjson_options)
+        except (TypeError, orjson.JSONEncodeError) as e:
+            logger.warning(f"⚠️ [FastJSON] orjson 인코딩 실패, 기본 렌더러 사용: {e}")
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # JSONRenderer 와 동일하게 JS 줄 구분자 이스케이프
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+# ===== 벤치마크 =====
+
+def benchmark_renderers(data, repeat=50):
+    """
+    JSONRenderer / FastJSONRenderer 인코딩 시간과 전송 바이트 비교
+    - data: 직렬화 완료된 응답 데이터 (예: 100개 대사 페이지)
+    - 전송 바이트는 gzip(6) / br(4, brotli 설치 시) 압축 후 크기
+    """
+    results = {}
+
+    for name, renderer in (('json', JSONRenderer()), ('orjson', FastJSONRenderer())):
+        timings = []
+        body = b''
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            body = renderer.render(data)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+
+        results[name] = {
+            'encode_ms_min': round(timings[0], 4),
+            'encode_ms_median': round(timings[len(timings) // 2], 4),
+            'bytes': len(body),
+            'gzip_bytes': len(gzip.compress(body, compresslevel=6)),
+            'br_bytes': len(brotli.compress(body, quality=4)) if brotli else None,
+        }
+
+    return results
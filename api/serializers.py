@@ -8,6 +8,7 @@
 """
 from rest_framework import serializers
 from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.conf import settings
 from phrase.models import (
     RequestTable, MovieTable, DialogueTable,
@@ -15,6 +16,7 @@ from phrase.models import (
     # 기존 호환성을 위한 별칭
     Movie, MovieQuote
 )
+from phrase.utils.poster_variants import normalize_variant_request
 import logging
 
 logger = logging.getLogger(__name__)
@@ -36,12 +38,40 @@ class MediaURLMixin:
         return fallback_url or ''
     
     def get_poster_url(self, obj):
-        """포스터 URL 반환 (우선순위: 로컬 이미지 → 외부 URL)"""
+        """포스터 URL 반환 (우선순위: 요청 크기 변환본 → 로컬 이미지 → 외부 URL)"""
         if hasattr(obj, 'poster_image'):
-            return self.get_absolute_media_url(obj.poster_image, obj.poster_url)
+            movie = obj
         elif hasattr(obj, 'movie') and hasattr(obj.movie, 'poster_image'):
-            return self.get_absolute_media_url(obj.movie.poster_image, obj.movie.poster_url)
-        return ''
+            movie = obj.movie
+        else:
+            return ''
+        
+        variant_url = self.get_poster_variant_url(movie)
+        if variant_url:
+            return variant_url
+        return self.get_absolute_media_url(movie.poster_image, movie.poster_url)
+    
+    def get_requested_poster_variant(self):
+        """?poster_size=thumb|card&poster_format=webp|jpeg (context 값 우선)"""
+        request = self.context.get('request')
+        query_params = getattr(request, 'query_params', {}) or {}
+        size = self.context.get('poster_size') or query_params.get('poster_size')
+        image_format = self.context.get('poster_format') or query_params.get('poster_format')
+        return normalize_variant_request(size, image_format)
+    
+    def get_poster_variant_url(self, movie):
+        """요청된 크기의 포스터 변환본 URL (요청이 없거나 변환본이 없으면 빈 문자열)"""
+        size, image_format = self.get_requested_poster_variant()
+        if not size:
+            return ''
+        
+        path = movie.get_poster_variant_path(size, image_format)
+        if not path:
+            return ''
+        
+        url = default_storage.url(path)
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
     
     def get_video_url(self, obj):
         """비디오 URL 반환 (우선순위: 로컬 파일 → 외부 URL)"""
@@ -75,6 +105,104 @@ class ValidationMixin:
                 raise serializers.ValidationError(f'{field_name}에 안전하지 않은 URL이 포함되어 있습니다.')
         return value
 
+def parse_sparse_fieldset_params(query_params):
+    """
+    ?fields=a,b,c / ?exclude=x,y 파라미터 파싱
+    - 값이 없으면 None (필드 제한 없음)
+    """
+    if not query_params:
+        return None, None
+
+    def split_names(raw):
+        if not raw:
+            return None
+        names = [name.strip() for name in raw.split(',') if name.strip()]
+        return names or None
+
+    return split_names(query_params.get('fields')), split_names(query_params.get('exclude'))
+
+class SparseFieldsetMixin:
+    """
+    Sparse fieldset 믹스인 (fields= / exclude=)
+    - 시리얼라이저 필드를 요청된 필드만 남기도록 정리
+    - 남은 필드 기준으로 쿼리셋 only() 경로 계산
+
+    sparse_field_dependencies: 모델 필드가 아닌 필드(SerializerMethodField,
+    get_xxx_display 등)가 실제로 읽는 모델 필드 경로
+    """
+    sparse_field_dependencies = {}
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        exclude = kwargs.pop('exclude', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is None and exclude is None:
+            request = self.context.get('request')
+            fields, exclude = parse_sparse_fieldset_params(
+                getattr(request, 'query_params', None)
+            )
+
+        if fields is None and exclude is None:
+            return
+
+        allowed = set(self.fields)
+        if fields is not None:
+            allowed &= set(fields)
+        if exclude is not None:
+            allowed -= set(exclude)
+
+        for field_name in set(self.fields) - allowed:
+            self.fields.pop(field_name)
+
+    @classmethod
+    def get_sparse_only_fields(cls, fields=None, exclude=None):
+        """
+        남은 필드가 읽는 모델 필드 경로 목록 (queryset.only() 용)
+        - 경로를 확정할 수 없는 필드가 있으면 None (only() 적용 안 함)
+        """
+        if fields is None and exclude is None:
+            return None
+
+        serializer = cls(fields=fields, exclude=exclude)
+        model = cls.Meta.model
+        paths = {model._meta.pk.name}
+
+        for field_name, field in serializer.fields.items():
+            dependencies = cls.sparse_field_dependencies.get(field_name)
+            if dependencies is None:
+                if field.source == '*' or field.source.split('.')[-1].startswith('get_'):
+                    return None
+                dependencies = [field.source.replace('.', '__')]
+
+            for path in dependencies:
+                if not _is_concrete_field_path(model, path):
+                    return None
+                paths.add(path)
+
+        # select_related 대상 FK 는 지연 로딩할 수 없으므로 함께 포함
+        for path in list(paths):
+            if '__' in path:
+                paths.add(path.split('__', 1)[0])
+
+        return sorted(paths)
+
+def _is_concrete_field_path(model, path):
+    """'movie__movie_title' 같은 경로가 실제 컬럼을 가리키는지 확인"""
+    from django.core.exceptions import FieldDoesNotExist
+
+    parts = path.split('__')
+    try:
+        for part in parts[:-1]:
+            model = model._meta.get_field(part).related_model
+            if model is None:
+                return False
+        field = model._meta.get_field(parts[-1])
+    except FieldDoesNotExist:
+        return False
+
+    return field.concrete and not field.many_to_many
+
 # ===== 설계서 기반 최적화된 시리얼라이저 =====
 
 class OptimizedRequestTableSerializer(serializers.ModelSerializer, ValidationMixin):
@@ -132,9 +260,19 @@ class OptimizedRequestTableSerializer(serializers.ModelSerializer, ValidationMix
             return value.strip()
         return value
 
-class OptimizedMovieTableSerializer(serializers.ModelSerializer, MediaURLMixin, CacheOptimizedMixin):
+class OptimizedMovieTableSerializer(SparseFieldsetMixin, serializers.ModelSerializer, MediaURLMixin, CacheOptimizedMixin):
     """최적화된 영화테이블 시리얼라이저 - 업데이트된 모델 반영"""
     
+    sparse_field_dependencies = {
+        'dialogue_count': [],
+        'poster_image_url': ['poster_image', 'poster_url', 'poster_variants'],
+        'display_title': ['movie_title', 'movie_title_full', 'original_title', 'original_title_full'],
+        'data_quality_display': ['data_quality'],
+        'full_movie_title': ['movie_title', 'movie_title_full'],
+        'full_original_title': ['original_title', 'original_title_full'],
+        'full_director': ['director', 'director_full'],
+    }
+    
     dialogue_count = serializers.SerializerMethodField()
     poster_image_url = serializers.SerializerMethodField()
     display_title = serializers.SerializerMethodField()
@@ -167,7 +305,11 @@ class OptimizedMovieTableSerializer(serializers.ModelSerializer, MediaURLMixin,
         ]
     
     def get_dialogue_count(self, obj):
-        """대사 개수 조회 (캐싱 적용)"""
+        """대사 개수 조회 (목록 쿼리셋의 annotate 값 우선, 없으면 캐싱 조회)"""
+        annotated = getattr(obj, 'dialogue_count', None)
+        if annotated is not None:
+            return annotated
+        
         cache_key = f"movie_dialogue_count_{obj.id}"
         return self.get_cached_data(
             cache_key,
@@ -207,9 +349,20 @@ class OptimizedMovieTableSerializer(serializers.ModelSerializer, MediaURLMixin,
             raise serializers.ValidationError('IMDB 평점은 0-10 사이여야 합니다.')
         return value
 
-class OptimizedDialogueTableSerializer(serializers.ModelSerializer, MediaURLMixin, ValidationMixin):
+class OptimizedDialogueTableSerializer(SparseFieldsetMixin, serializers.ModelSerializer, MediaURLMixin, ValidationMixin):
     """최적화된 대사테이블 시리얼라이저 - 업데이트된 모델 반영"""
     
+    sparse_field_dependencies = {
+        'movie_poster_url': ['movie__poster_image', 'movie__poster_url', 'movie__poster_variants'],
+        'video_file_url': ['video_file', 'video_url'],
+        'duration_display': ['duration_seconds'],
+        'translation_quality_display': ['translation_quality'],
+        'translation_method_display': ['translation_method'],
+        'video_quality_display': ['video_quality'],
+        'full_movie_title': ['movie__movie_title', 'movie__movie_title_full'],
+        'full_director': ['movie__director', 'movie__director_full'],
+    }
+    
     movie_title = serializers.CharField(source='movie.movie_title', read_only=True)
     movie_release_year = serializers.CharField(source='movie.release_year', read_only=True)
     movie_director = serializers.CharField(source='movie.director', read_only=True)
@@ -281,11 +434,18 @@ class OptimizedDialogueTableSerializer(serializers.ModelSerializer, MediaURLMixi
         """비디오 URL 검증"""
         return self.validate_url_field(value, '비디오 URL')
 
-class OptimizedDialogueSearchSerializer(serializers.ModelSerializer, MediaURLMixin):
+class OptimizedDialogueSearchSerializer(SparseFieldsetMixin, serializers.ModelSerializer, MediaURLMixin):
     """
     최적화된 검색 결과용 시리얼라이저
     설계서 기반 + Flutter/웹 호환
     """
+    sparse_field_dependencies = {
+        'posterUrl': ['movie__poster_image', 'movie__poster_url', 'movie__poster_variants'],
+        'videoUrl': ['video_file', 'video_url'],
+        'fullMovieTitle': ['movie__movie_title', 'movie__movie_title_full'],
+        'fullDirector': ['movie__director', 'movie__director_full'],
+    }
+    
     name = serializers.CharField(source='movie.movie_title', read_only=True)
     startTime = serializers.CharField(source='dialogue_start_time', read_only=True)
     text = serializers.CharField(source='dialogue_phrase', read_only=True)
@@ -553,4 +713,4 @@ def log_serializer_performance(serializer_name, start_time, end_time, data_count
     if duration_ms > 1000:  # 1초 이상
         logger.warning(f"🐌 [Serializer] {serializer_name} 성능 저하 감지: {duration_ms:.2f}ms")
 
-logger.info("✅ MySQL 호환성 개선된 시리얼라이저 로드 완료")
\ No newline at end of file
+logger.debug("✅ MySQL 호환성 개선된 시리얼라이저 로드 완료")
\ No newline at end of file
@@ -1,3 +1,384 @@
-from django.test import TestCase
+import gzip
+import uuid
+import hashlib
+from decimal import Decimal
+from datetime import date, datetime, time, timezone as dt_timezone
+from unittest import mock
+from urllib.parse import urlparse, parse_qs
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.utils import autocomplete
+from phrase.tests import create_movies
+from phrase.utils.negative_cache import record_no_result
+from phrase.utils.query_budget import assert_query_budget
+
+from api.async_views import perform_db_search_async
+from phrase.utils import async_support
+from api import middleware as api_middleware
+from api.middleware import APICompressionMiddleware
+from api.renderers import FastJSONRenderer
+from api.serializers import OptimizedDialogueTableSerializer, OptimizedMovieTableSerializer
+from api.views import perform_db_search_optimized, KeysetPagination
+
+
+class ListEndpointQueryBudgetTests(TestCase):
+    """목록 API 쿼리 수가 결과 수와 무관하게 예산 안에 있는지 (N+1 회귀 방지)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_movies(movie_count=8, dialogues_per_movie=3)
+
+    def setUp(self):
+        cache.clear()
+
+    def assert_endpoint_budget(self, url_name, **params):
+        with assert_query_budget(url_name):
+            response = self.client.get(reverse(url_name), params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_movie_table_list(self):
+        self.assert_endpoint_budget('movie-table-list')
+
+    def test_dialogue_table_list(self):
+        self.assert_endpoint_budget('dialogue-table-list')
+
+    def test_dialogue_table_list_filtered_by_movie(self):
+        movie = MovieTable.objects.first()
+        self.assert_endpoint_budget('dialogue-table-list', movie_id=str(movie.id))
+
+    def test_request_table_list(self):
+        self.assert_endpoint_budget('request-table-list')
+
+    def test_movie_quotes(self):
+        movie = MovieTable.objects.first()
+        with assert_query_budget('movie-quotes'):
+            response = self.client.get(reverse('movie-quotes', args=[movie.id]))
+        self.assertEqual(response.status_code, 200)
+
+
+class KeysetPaginationTests(TestCase):
+    """키셋 커서 페이지네이션 (첫 페이지 / 다음 페이지 / 잘못된 커서)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_movies(movie_count=1, dialogues_per_movie=5)
+
+    def paginate(self, **params):
+        request = Request(APIRequestFactory().get('/api/dialogues/', params))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(DialogueTable.objects.all(), request)
+        return page, paginator.get_paginated_response([dialogue.id for dialogue in page]).data
+
+    def test_empty_cursor_is_first_page(self):
+        page, data = self.paginate(cursor='', limit=2)
+        self.assertEqual(len(page), 2)
+        self.assertFalse(data['pagination']['has_previous'])
+        self.assertTrue(data['pagination']['has_next'])
+        self.assertEqual(data['pagination']['count'], 5)
+        self.assertEqual(data['pagination']['count_mode'], 'exact')
+
+    def test_next_cursor_walks_all_rows_without_overlap(self):
+        expected = list(DialogueTable.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        seen = []
+        params = {'cursor': '', 'limit': 2}
+        while True:
+            _, data = self.paginate(**params)
+            self.assertEqual(data['pagination']['has_previous'], bool(params['cursor']))
+            seen.extend(data['results'])
+            if not data['pagination']['has_next']:
+                self.assertIsNone(data['links']['next'])
+                break
+            params['cursor'] = parse_qs(urlparse(data['links']['next']).query)['cursor'][0]
+        self.assertEqual(seen, expected)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(NotFound):
+            self.paginate(cursor='not-a-cursor')
+        with self.assertRaises(NotFound):
+            # 다른 정렬 키로 만든 커서
+            self.paginate(cursor='WyJwbGF5X2NvdW50IiwgMSwgMV0')
+
+
+class FastJSONRendererTests(SimpleTestCase):
+
+    def test_output_matches_json_renderer(self):
+        data = {
+            'created_at': datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=dt_timezone.utc),
+            'naive': datetime(2024, 5, 1, 12, 30, 45, 987654),
+            'day': date(2024, 5, 1),
+            'clock': time(9, 15, 30, 250000),
+            'rating': Decimal('8.50'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'text': '돌아올게 \u2028 I\'ll be back',
+            3: [1, 2.5, None, True],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_request_uses_json_renderer(self):
+        data = {'results': [1, 2]}
+        rendered = FastJSONRenderer().render(data, 'application/json; indent=2')
+        self.assertEqual(rendered, JSONRenderer().render(data, 'application/json; indent=2'))
+
+
+@override_settings(API_COMPRESSION_SETTINGS={'MIN_SIZE': 100, 'PATH_PREFIXES': ('/api/',)})
+class APICompressionMiddlewareTests(SimpleTestCase):
+    body = b'{"results": "' + b'I will be back. ' * 50 + b'"}'
+
+    def process(self, response, path='/api/dialogues/', accept_encoding='gzip, deflate, br'):
+        request = RequestFactory().get(path, HTTP_ACCEPT_ENCODING=accept_encoding)
+        return APICompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, body=None):
+        response = HttpResponse(body or self.body, content_type='application/json')
+        response['ETag'] = '"abc"'
+        return response
+
+    def test_gzip_negotiation(self):
+        with mock.patch.object(api_middleware, 'brotli', None):
+            response = self.process(self.json_response(), accept_encoding='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.body)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertEqual(response['ETag'], 'W/"abc"')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_brotli_preferred_when_available(self):
+        if api_middleware.brotli is None:
+            self.skipTest('brotli 미설치')
+        response = self.process(self.json_response())
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(api_middleware.brotli.decompress(response.content), self.body)
+
+    def test_no_accept_encoding_leaves_body(self):
+        response = self.process(self.json_response(), accept_encoding='')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.body)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_skips_small_streamed_not_modified_and_other_paths(self):
+        small = self.process(self.json_response(b'{"ok": true}'))
+        self.assertFalse(small.has_header('Content-Encoding'))
+
+        streamed = self.process(StreamingHttpResponse(iter([self.body])))
+        self.assertFalse(streamed.has_header('Content-Encoding'))
+
+        not_modified = self.process(HttpResponse(status=304))
+        self.assertFalse(not_modified.has_header('Content-Encoding'))
+
+        page = self.process(self.json_response(), path='/search/')
+        self.assertFalse(page.has_header('Content-Encoding'))
+
+
+class PosterVariantTests(TestCase):
+    """?poster_size / ?poster_format 변환본 URL 선택"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = MovieTable.objects.create(
+            movie_title='Variant Movie', release_year='2000', director='Director',
+            poster_url='https://example.com/poster.jpg',
+            poster_variants={
+                'thumb': {'jpeg': 'posters/variants/1/thumb.jpg', 'webp': 'posters/variants/1/thumb.webp'},
+                'card': {'jpeg': 'posters/variants/1/card.jpg', 'webp': 'posters/variants/1/card.webp'},
+                'source': 'posters/original.jpg',
+            },
+        )
+
+    def poster_url(self, **params):
+        request = Request(APIRequestFactory().get('/api/movies-table/', params))
+        serializer = OptimizedMovieTableSerializer(context={'request': request})
+        return serializer.get_poster_url(self.movie)
+
+    def test_requested_size_and_format(self):
+        self.assertTrue(self.poster_url(poster_size='thumb').endswith('posters/variants/1/thumb.webp'))
+        self.assertTrue(self.poster_url(poster_size='card', poster_format='jpeg').endswith('posters/variants/1/card.jpg'))
+
+    def test_unknown_size_or_format_falls_back(self):
+        for params in ({'poster_size': 'source'}, {'poster_size': 'huge'}, {}):
+            self.assertEqual(self.poster_url(**params), 'https://example.com/poster.jpg')
+        self.assertTrue(self.poster_url(poster_size='thumb', poster_format='gif').endswith('thumb.webp'))
+
+    def test_model_ignores_non_dict_entries(self):
+        self.assertEqual(self.movie.get_poster_variant_path('source', 'webp'), '')
+        self.assertEqual(self.movie.get_poster_variant_path('missing', 'webp'), '')
+
+    def test_search_params_are_whitelisted(self):
+        response = self.client.get(reverse('movie-table-list'), {'poster_size': 'source'})
+        self.assertEqual(response.status_code, 200)
+
+
+class AutocompleteEndpointTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        RequestTable.objects.create(request_phrase='i will be back', search_count=9, result_count=3)
+        RequestTable.objects.create(request_phrase='i will find you', search_count=4, result_count=1)
+
+    def setUp(self):
+        cache.clear()
+        # 테스트 트랜잭션 밖에서 도는 백그라운드 생성은 막고 직접 refresh()
+        patcher = mock.patch.object(autocomplete.AutocompleteIndex, 'refresh_in_background_if_stale')
+        self.background_refresh = patcher.start()
+        self.addCleanup(patcher.stop)
+        index_patcher = mock.patch.object(autocomplete, '_index', None)
+        index_patcher.start()
+        self.addCleanup(index_patcher.stop)
+
+    def suggest(self, **params):
+        response = self.client.get(reverse('autocomplete'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_first_request_does_not_build_and_falls_back_to_db(self):
+        with mock.patch.object(autocomplete.AutocompleteIndex, 'refresh') as refresh:
+            data = self.suggest(q='i will', limit=5)
+        refresh.assert_not_called()
+        self.background_refresh.assert_called_once()
+        self.assertEqual([s['text'] for s in data['suggestions']], ['i will be back', 'i will find you'])
+
+    def test_built_index_is_ranked_by_search_count(self):
+        autocomplete.get_autocomplete_index().refresh()
+        with self.assertNumQueries(0):
+            data = self.suggest(q='I WILL', limit=1)
+        self.assertEqual(data['language'], 'en')
+        self.assertEqual(data['suggestions'], [{'text': 'i will be back', 'weight': 9.0, 'source': 'request'}])
+
+    def test_empty_and_too_long_queries(self):
+        self.assertEqual(self.suggest(q='')['suggestions'], [])
+        response = self.client.get(reverse('autocomplete'), {'q': 'x' * 101})
+        self.assertEqual(response.status_code, 400)
+
+
+class ConditionalRequestTests(TestCase):
+    """ETag / 304 (목록은 페이지 행 기준, 영화별 구문은 캐시된 본문과 일치)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        create_movies(movie_count=2, dialogues_per_movie=3)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cursor_list_etag_without_count_query(self):
+        params = {'cursor': '', 'count': 'false', 'limit': 2}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('dialogue-table-list'), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([query for query in queries if 'COUNT(' in query['sql'].upper()])
+
+        response = self.client.get(reverse('dialogue-table-list'), params, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_304_skips_serialization(self):
+        url = reverse('dialogue-table-list')
+        etag = self.client.get(url)['ETag']
+        with mock.patch.object(OptimizedDialogueTableSerializer, 'to_representation', autospec=True) as serialize:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        serialize.assert_not_called()
+
+    def test_cached_request_list_answers_304(self):
+        url = reverse('request-table-list')
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+
+    def test_movie_quotes_etag_tracks_cached_body(self):
+        movie = MovieTable.objects.first()
+        url = reverse('movie-quotes', args=[movie.id])
+        first = self.client.get(url)
+        self.assertEqual(first.json()['quotes_count'], 3)
+
+        DialogueTable.objects.filter(id=movie.dialogues.first().id).update(is_active=False)
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second.json()['quotes_count'], 2)
+
+        third = self.client.get(url, HTTP_IF_NONE_MATCH=second['ETag'])
+        self.assertEqual(third.status_code, 304)
+
+
+class AsyncSearchTests(TransactionTestCase):
+    """비동기 검색 API (스레드 풀 연결에서 조회하므로 커밋된 데이터 사용)"""
+
+    def setUp(self):
+        cache.clear()
+        create_movies(movie_count=3, dialogues_per_movie=2)
+
+    def test_parallel_db_search_matches_sync_search(self):
+        translation_result = {'request_phrase': 'I will be back', 'request_korean': '돌아올 것이다'}
+
+        async_results = async_to_sync(perform_db_search_async)(translation_result, 10, {})
+        cache.clear()
+        sync_results = perform_db_search_optimized(translation_result, 10, {})
+
+        self.assertTrue(async_results['found'])
+        self.assertEqual(
+            [dialogue.id for dialogue in async_results['results']],
+            [dialogue.id for dialogue in sync_results['results']],
+        )
+
+    def use_single_thread_pool(self, **async_settings):
+        """THREAD_POOL_SIZE=1 인 새 풀 → run_sync 호출이 모두 같은 스레드에서 실행"""
+        settings_override = override_settings(ASYNC_SETTINGS={'THREAD_POOL_SIZE': 1, **async_settings})
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        executor_patcher = mock.patch.object(async_support, '_executor', None)
+        executor_patcher.start()
+        self.addCleanup(executor_patcher.stop)
+        self.addCleanup(lambda: async_support._executor and async_support._executor.shutdown(wait=True))
+
+    @staticmethod
+    def query_and_get_connection(clear_close_at=False):
+        DialogueTable.objects.count()
+        if clear_close_at:
+            # CONN_MAX_AGE=None 일 때와 같은 상태
+            connection.close_at = None
+        return connection.connection
+
+    def run_in_pool(self, *args):
+        return async_to_sync(async_support.run_sync)(self.query_and_get_connection, *args)
+
+    def test_pool_calls_reuse_connection(self):
+        # CONN_MAX_AGE=0 이어도 풀 호출 사이에 연결을 닫지 않음
+        self.use_single_thread_pool()
+        first = self.run_in_pool()
+        self.assertIsNotNone(first)
+        self.assertIs(self.run_in_pool(), first)
+
+    def test_pool_connection_is_recycled_without_close_at(self):
+        self.use_single_thread_pool(POOL_CONN_MAX_AGE=0)
+        first = self.run_in_pool(True)
+        self.assertIsNot(self.run_in_pool(True), first)
+
+    def test_missing_query(self):
+        response = async_to_sync(self.async_client.get)(reverse('search-quotes-async'))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['code'], 'MISSING_QUERY')
+
+    def test_known_no_result_skips_search(self):
+        record_no_result('zzzz qqqq', None)
+        cache.set('smart_translation:' + hashlib.md5('zzzz qqqq'.encode()).hexdigest(), {
+            'original_query': 'zzzz qqqq', 'language_detected': 'english', 'has_korean': False,
+            'has_english': True, 'translation_needed': False, 'translated_text': None,
+            'confidence': 1.0, 'request_phrase': 'zzzz qqqq', 'request_korean': None,
+        })
+        response = async_to_sync(self.async_client.get)(reverse('search-quotes-async'), {'q': 'zzzz qqqq'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['analytics']['search_method'], 'negative_cache')
@@ -10,12 +10,18 @@
 """
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import views, async_views
 
 urlpatterns = [
     # ===== 핵심 검색 API (최적화) =====
     path('search/', views.search_movie_quotes, name='search-quotes'),
     
+    # 비동기 검색 (ASGI 워커, 같은 파라미터 / 응답)
+    path('search/async/', async_views.async_search_movie_quotes, name='search-quotes-async'),
+    
+    # 자동완성 (영어/한국어, 메모리 인덱스)
+    path('autocomplete/', views.autocomplete_phrases, name='autocomplete'),
+    
     # ===== 최적화된 테이블별 조회 API =====
     # 요청테이블 조회 (궁극적 최적화)
     path('requests/', views.get_request_table_list, name='request-table-list'),
@@ -69,6 +75,7 @@ urlpatterns = [
    GET /api/search/?q=hello&limit=10
    GET /api/search/?q=안녕하세요&limit=5&sort=popular
    GET /api/search/?q=love&quality=excellent&movie=titanic
+   GET /api/search/async/?q=hello  (ASGI 워커용 비동기 버전, 파라미터 / 응답 동일)
    
    응답 (최적화된 구조):
    {
@@ -144,6 +151,24 @@ urlpatterns = [
    GET /api/dialogues/?movie_id=1&translation_quality=excellent
    GET /api/dialogues/?has_korean=true&min_plays=100
    GET /api/dialogues/?search=love&video_quality=720p
+   GET /api/dialogues/?fields=id,dialogue_phrase,dialogue_phrase_ko,video_file_url
+   GET /api/dialogues/?exclude=search_vector,search_vector_full
+   
+   GET /api/dialogues/?cursor=&limit=50            (키셋 커서 첫 페이지)
+   GET /api/dialogues/?cursor=<links.next 의 값>&count=false
+   
+   cursor (요청·영화·대사 목록 공통):
+   - (정렬 키, id) 키셋 방식, OFFSET 없음 → 깊은 페이지도 첫 페이지와 같은 비용
+   - 지원 정렬: play_count, created_at, search_count, view_count, like_count
+   - count=exact|estimate|false (기본: 첫 페이지에서만 정확한 개수)
+   - page 방식에서도 count=estimate 로 COUNT(*) 대신 추정치 사용 가능
+   
+   조건부 요청 (요청·영화·대사 목록, /api/quotes/<id>/, /api/movies/<id>/quotes/):
+   - 응답에 ETag / Last-Modified 포함 (updated_at 최대값 + 개수 기반)
+   - If-None-Match / If-Modified-Since 일치 시 본문 없이 304
+   
+   fields / exclude (영화·대사 목록, /api/search/ 공통):
+   - 응답 필드와 DB 조회 컬럼(only())을 함께 제한
    
    응답:
    {
@@ -249,6 +274,14 @@ urlpatterns = [
    GET /api/quotes/123/
    GET /api/movies/456/quotes/
 
+10. 자동완성 API (영어/한국어)
+   GET /api/autocomplete/?q=i'll be&limit=8
+   GET /api/autocomplete/?q=안녀&lang=ko
+   
+   - lang: en|ko|auto (기본 auto, 한글 포함 시 ko)
+   - 한국어는 입력 중인 음절도 매칭 ('안녀' → '안녕하세요')
+   - 응답: {"query": ..., "language": "ko", "suggestions": [{"text", "weight", "source"}], "took_ms": 0.02}
+
 === 고급 검색 옵션 ===
 
 검색 API는 다양한 고급 옵션을 지원합니다:
@@ -262,6 +295,13 @@ urlpatterns = [
 - require_translation: 번역 필수 여부 (true|false)
 - include_inactive: 비활성 데이터 포함 (true|false)
 - exact: 정확한 매칭 (true|false)
+- spellcheck: DB 결과가 없을 때 오타 교정 제안 (true|false, 기본값: true)
+  교정된 구문이 DB 에 있으면 외부 API 호출 없이 "did_you_mean": "hello world" 와 함께 결과 없음 응답,
+  없으면 외부 API 검색을 그대로 수행하고 그 응답에 "did_you_mean" 추가
+  (허용 오타 수는 단어 길이에 비례: 4글자 이하 교정 안 함, 7글자 이하 1, 그 이상 2)
+
+결과 없음 응답의 suggestions 는 DB 에 결과가 있는 유사 과거 검색어 (글자 trigram 유사도):
+  [{"type": "similar", "text": "i love you", "similarity": 0.62, "search_count": 120, "result_count": 8}]
 
 예시:
 GET /api/search/?q=love&sort=popular&quality=excellent&movie=titanic&year=1997
@@ -289,5 +329,5 @@ GET /api/search/?q=love&sort=popular&quality=excellent&movie=titanic&year=1997
 
 - 대부분의 API: 인증 불필요
 - 대량 업데이트: 인증 필요
-- 스로틀링: 일반 API (2000/시간), 검색 API (200/시간), 대량 작업 (50/시간)
+- 스로틀링: 일반 API (2000/시간), 검색 API (200/시간), 자동완성 (10000/시간), 대량 작업 (50/시간)
 """
\ No newline at end of file
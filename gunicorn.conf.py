@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# gunicorn.conf.py
+"""
+gunicorn 설정 (워커 시작 예열 훅)
+
+    gunicorn project.wsgi -c gunicorn.conf.py
+
+- post_worker_init: 워커가 앱을 로드한 뒤, 요청을 받기 전에 캐시/인덱스 예열
+  (WARMUP_SETTINGS.ON_WORKER_START=False 또는 WARM_ON_WORKER_START=False 로 끔)
+- 예열 시간은 WARMUP_SETTINGS.WORKER_MAX_SECONDS 로 제한 (timeout 보다 짧게)
+- on_starting: 워커 공유 메트릭 디렉터리(METRICS_MULTIPROCESS_DIR)의 이전 실행 값 파일 정리
+"""
+import os
+import glob
+import tempfile
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.getenv('GUNICORN_WORKERS', '3'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+
+# 워커들이 같은 메트릭 저장소(mmap 파일)를 쓰도록 워커 fork 전에 지정
+metrics_dir = os.environ.setdefault(
+    'METRICS_MULTIPROCESS_DIR', os.path.join(tempfile.gettempdir(), 'phrase_metrics')
+)
+
+
+def on_starting(server):
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, 'metrics_*.db')):
+        os.remove(path)
+
+
+def post_worker_init(worker):
+    from phrase.utils.warmup import warm_worker
+
+    report = warm_worker()
+    if report:
+        worker.log.info(f"🔥 워커 {worker.pid} 예열: {report['total_ms']}ms, 검색어 {report['replayed']}개")
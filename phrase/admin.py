@@ -528,4 +528,4 @@ admin.site.site_title = "Movie Phrase Admin"
 admin.site.index_title = "시스템 관리"
 
 # ===== 로깅 설정 =====
-logger.info("Django Admin 설정 완료")
\ No newline at end of file
+logger.debug("Django Admin 설정 완료")
\ No newline at end of file
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class PhraseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'phrase'
+
+    def ready(self):
+        # 로그 포맷 / 출력은 리스너 스레드에서 (phrase.utils.event_log)
+        from phrase.utils.event_log import install_log_queue
+        install_log_queue()
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/__init__.py
+"""
+성능 벤치마크 패키지
+- corpus: 결정적 합성 코퍼스 (영화 / 대사 / 한글 번역 / 검색 기록)
+- scenarios: 검색 / 적재 / 렌더링 / 목록 API 시간 측정
+- compare: 결과 JSON 저장과 기준선 회귀 비교
+- load: 운영 검색어 분포 재생 부하 생성기 (python manage.py run_load)
+- fake_servers: playphrase / MyMemory / IMDB 로컬 대역 서버 (python manage.py run_fake_servers)
+- imdb_pages/: 축약한 IMDB 제목 페이지 픽스처 + expected.json (get_imdb_poster_url.benchmark_poster_extraction)
+
+실행: python manage.py run_benchmarks (테스트 DB 를 만들어 실행, 운영 데이터 무관)
+"""
+from .corpus import SyntheticCorpus, encode_playphrase_payload, populate_database
+from .scenarios import Scenario, build_scenarios, run_scenarios
+from .compare import build_report, save_report, load_report, compare_reports, format_comparison
+
+__all__ = [
+    'SyntheticCorpus', 'encode_playphrase_payload', 'populate_database',
+    'Scenario', 'build_scenarios', 'run_scenarios',
+    'build_report', 'save_report', 'load_report', 'compare_reports', 'format_comparison',
+]
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/compare.py
+"""
+벤치마크 결과 저장 / 기준선 비교
+- 결과 파일: {'meta': {...}, 'scenarios': {이름: {p50_ms, p95_ms, queries_mean, ...}}}
+- 기준선 대비 p50/p95 가 허용 비율(기본 20%)과 최소 차이(기본 1ms)를 모두 넘으면 회귀
+- 쿼리 수가 늘어난 경우는 시간과 무관하게 회귀 (N+1 조기 발견)
+"""
+import json
+import os
+import platform
+import sys
+
+import django
+from django.utils import timezone
+
+COMPARED_METRICS = ('p50_ms', 'p95_ms')
+
+
+def build_report(results, corpus_options, repeat):
+    return {
+        'meta': {
+            'generated_at': timezone.now().isoformat(),
+            'python': sys.version.split()[0],
+            'django': django.get_version(),
+            'platform': platform.platform(),
+            'corpus': corpus_options,
+            'repeat': repeat,
+        },
+        'scenarios': results,
+    }
+
+
+def save_report(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def load_report(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_reports(baseline, current, tolerance=0.2, min_delta_ms=1.0):
+    """
+    기준선 비교 → [{'scenario', 'metric', 'baseline', 'current', 'change', 'regression'}]
+    - 한쪽에만 있는 시나리오는 'missing' / 'new' 로 표시
+    """
+    rows = []
+    baseline_scenarios = baseline.get('scenarios', {})
+    current_scenarios = current.get('scenarios', {})
+
+    for name in sorted(set(baseline_scenarios) | set(current_scenarios)):
+        before, after = baseline_scenarios.get(name), current_scenarios.get(name)
+        if before is None or after is None or 'error' in (before or {}) or 'error' in (after or {}):
+            rows.append({
+                'scenario': name, 'metric': 'status',
+                'baseline': 'missing' if before is None else before.get('error', 'ok'),
+                'current': 'missing' if after is None else after.get('error', 'ok'),
+                'change': None,
+                'regression': after is None or 'error' in after,
+            })
+            continue
+
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            rows.append({
+                'scenario': name, 'metric': metric, 'baseline': old, 'current': new,
+                'change': round(change, 4),
+                'regression': change > tolerance and (new - old) > min_delta_ms,
+            })
+
+        old_queries, new_queries = before.get('queries_mean'), after.get('queries_mean')
+        if old_queries is not None and new_queries is not None:
+            rows.append({
+                'scenario': name, 'metric': 'queries_mean', 'baseline': old_queries, 'current': new_queries,
+                'change': round(new_queries - old_queries, 2),
+                'regression': new_queries > old_queries + 0.5,
+            })
+    return rows
+
+
+def format_comparison(rows):
+    """비교 결과 표 (명령 출력용)"""
+    lines = [f"{'시나리오':<28} {'지표':<13} {'기준':>10} {'현재':>10} {'변화':>9}"]
+    for row in rows:
+        change = row['change']
+        if change is None:
+            change_text = '-'
+        elif row['metric'] == 'queries_mean':
+            change_text = f"{change:+.2f}"
+        else:
+            change_text = f"{change:+.1%}"
+        flag = '  ❌ 회귀' if row['regression'] else ''
+        lines.append(
+            f"{row['scenario']:<28} {row['metric']:<13} {str(row['baseline']):>10} "
+            f"{str(row['current']):>10} {change_text:>9}{flag}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/corpus.py
+"""
+결정적 합성 코퍼스 생성기
+- 같은 seed → 항상 같은 영화 / 대사 / 한글 번역 / 검색 기록
+- 영어 단어마다 고정된 한글 단어를 대응 → 검색어의 한글도 대사 한글의 부분 문자열 (DB 검색 적중)
+- 검색 횟수는 Zipf 분포 (소수의 인기 검색어 + 긴 꼬리)
+- playphrase 인코딩 응답(° ç ¡ ¿ + 작은따옴표)과 load_to_db 입력 형식도 생성
+"""
+import random
+import hashlib
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+ENGLISH_WORDS = (
+    'i', 'you', 'we', 'they', 'love', 'need', 'want', 'know', 'think', 'see', 'find', 'take',
+    'be', 'back', 'home', 'now', 'never', 'always', 'again', 'here', 'there', 'the', 'a', 'my',
+    'your', 'our', 'world', 'life', 'time', 'way', 'night', 'day', 'dream', 'heart', 'friend',
+    'money', 'truth', 'war', 'game', 'road', 'light', 'fire', 'water', 'king', 'city', 'end',
+    'can', 'will', 'must', 'should', 'just', 'really', 'still', 'together', 'alone', 'tonight',
+    'run', 'stay', 'go', 'come', 'fight', 'help', 'trust', 'remember', 'forget', 'believe',
+)
+
+KOREAN_WORDS = (
+    '나는', '너는', '우리는', '그들은', '사랑해', '필요해', '원해', '알아', '생각해', '봐', '찾아', '가져가',
+    '있어', '돌아와', '집에', '지금', '절대', '항상', '다시', '여기', '거기', '그', '하나의', '내',
+    '너의', '우리의', '세상', '인생', '시간', '길', '밤', '날', '꿈', '마음', '친구',
+    '돈', '진실', '전쟁', '게임', '도로', '빛', '불', '물', '왕', '도시', '끝',
+    '할 수 있어', '할 거야', '해야 해', '해야지', '그냥', '정말', '아직', '함께', '혼자', '오늘 밤',
+    '달려', '머물러', '가', '와', '싸워', '도와줘', '믿어', '기억해', '잊어', '믿어봐',
+)
+
+KOREAN_BY_ENGLISH = dict(zip(ENGLISH_WORDS, KOREAN_WORDS))
+
+TITLE_ADJECTIVES = (
+    'Dark', 'Silent', 'Last', 'Lost', 'Golden', 'Broken', 'Hidden', 'Eternal', 'Wild', 'Frozen',
+    'Crimson', 'Midnight', 'Final', 'Secret', 'Endless', 'Electric', 'Forgotten', 'Iron',
+)
+TITLE_NOUNS = (
+    'Kingdom', 'River', 'Horizon', 'Empire', 'Shadow', 'Garden', 'Voyage', 'Legacy', 'Storm',
+    'Station', 'Promise', 'Signal', 'Harbor', 'Frontier', 'Echo', 'Protocol', 'Crown', 'Summer',
+)
+DIRECTOR_FIRST = ('James', 'Sofia', 'Bong', 'Park', 'Greta', 'Denis', 'Ridley', 'Ava', 'Lee', 'Chloe')
+DIRECTOR_LAST = ('Cameron', 'Coppola', 'Joon-ho', 'Chan-wook', 'Gerwig', 'Villeneuve', 'Scott', 'DuVernay')
+COUNTRIES = ('미국', '한국', '영국', '프랑스', '일본', '캐나다')
+
+
+def translate_words(words):
+    """합성 번역: 단어별 고정 한글 대응"""
+    return ' '.join(KOREAN_BY_ENGLISH[word] for word in words)
+
+
+class SyntheticCorpus:
+    """
+    결정적 합성 데이터 (DB 없이 메모리에서 생성)
+        corpus = SyntheticCorpus(movies=200, dialogues_per_movie=20, requests=2000, seed=42)
+        corpus.movies / corpus.dialogues / corpus.requests / corpus.search_queries
+    """
+
+    def __init__(self, movies=200, dialogues_per_movie=20, requests=2000, seed=42):
+        self.seed = seed
+        self.movie_count = movies
+        self.dialogues_per_movie = dialogues_per_movie
+        self.request_count = requests
+        self.rng = random.Random(seed)
+
+        self.movies = self._generate_movies()
+        self.dialogues = self._generate_dialogues()
+        self.requests = self._generate_requests()
+        self.search_queries = self._generate_search_queries()
+
+    # ----- 생성 -----
+
+    def sentence_words(self, min_words=3, max_words=10):
+        return [self.rng.choice(ENGLISH_WORDS) for _ in range(self.rng.randint(min_words, max_words))]
+
+    def _generate_movies(self):
+        movies = []
+        for index in range(self.movie_count):
+            title = (f"{self.rng.choice(TITLE_ADJECTIVES)} {self.rng.choice(TITLE_NOUNS)} "
+                     f"{index + 1}")
+            movies.append({
+                'movie_title': title,
+                'original_title': title,
+                'release_year': str(self.rng.randint(1960, 2025)),
+                'director': f"{self.rng.choice(DIRECTOR_FIRST)} {self.rng.choice(DIRECTOR_LAST)}",
+                'production_country': self.rng.choice(COUNTRIES),
+                'imdb_url': f"https://www.imdb.com/title/tt{1000000 + index}/",
+                'view_count': self.rng.randint(0, 5000),
+            })
+        return movies
+
+    def _generate_dialogues(self):
+        dialogues = []
+        for movie_index in range(self.movie_count):
+            for position in range(self.dialogues_per_movie):
+                words = self.sentence_words()
+                seconds = position * 37 + self.rng.randint(0, 30)
+                dialogues.append({
+                    'movie_index': movie_index,
+                    'words': words,
+                    'dialogue_phrase': ' '.join(words),
+                    'dialogue_phrase_ko': translate_words(words),
+                    'dialogue_start_time': f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+                    'video_url': f"https://cdn.example.com/clips/{movie_index}/{position}.mp4",
+                    'play_count': self.rng.randint(0, 1000),
+                })
+        return dialogues
+
+    def _generate_requests(self):
+        """대사의 연속 부분 구문을 검색어로 사용 (대부분 DB 적중, 일부는 결과 없음)"""
+        requests, seen = [], set()
+        attempts = 0
+        while len(requests) < self.request_count and attempts < self.request_count * 20:
+            attempts += 1
+            if self.dialogues and self.rng.random() < 0.9:
+                words = self.rng.choice(self.dialogues)['words']
+                size = self.rng.randint(2, min(4, len(words)))
+                start = self.rng.randint(0, len(words) - size)
+                phrase_words = words[start:start + size]
+                result_count = None
+            else:
+                phrase_words = [f"zz{self.rng.randint(0, 10 ** 6)}", self.rng.choice(ENGLISH_WORDS)]
+                result_count = 0
+
+            phrase = ' '.join(phrase_words)
+            if phrase in seen:
+                continue
+            seen.add(phrase)
+            rank = len(requests) + 1
+            requests.append({
+                'request_phrase': phrase,
+                'request_korean': translate_words(phrase_words) if result_count is None else None,
+                'search_count': max(1, int(1000 / rank ** 1.1)),
+                'result_count': result_count,
+            })
+        return requests
+
+    def _generate_search_queries(self):
+        """검색 기록 (UserSearchQuery): 인기 검색어 가중 샘플, 30% 한국어 입력"""
+        if not self.requests:
+            return []
+        weights = [request['search_count'] for request in self.requests]
+        queries = []
+        for index in range(self.request_count):
+            request = self.rng.choices(self.requests, weights=weights)[0]
+            korean = request['request_korean'] and self.rng.random() < 0.3
+            has_results = request['result_count'] != 0
+            queries.append({
+                'session_key': hashlib.md5(f"{self.seed}:{index % 500}".encode()).hexdigest()[:32],
+                'original_query': request['request_korean'] if korean else request['request_phrase'],
+                'translated_query': request['request_phrase'] if korean else None,
+                'has_results': has_results,
+                'result_count': self.rng.randint(1, 20) if has_results else 0,
+                'response_time_ms': int(self.rng.lognormvariate(5, 0.8)),
+                'ip_address': f"10.{index % 200}.{index // 200 % 250}.{index % 250 + 1}",
+            })
+        return queries
+
+    # ----- 외부 형식 -----
+
+    def playphrase_phrases(self, count, words=None):
+        """playphrase 검색 결과 형태의 phrase dict 목록"""
+        phrases = []
+        for index in range(count):
+            dialogue = self.rng.choice(self.dialogues) if words is None else None
+            text = dialogue['dialogue_phrase'] if dialogue else ' '.join(words)
+            movie = self.movies[dialogue['movie_index'] if dialogue else index % len(self.movies)]
+            phrases.append({
+                'text': text,
+                'video-url': f"https://cdn.example.com/playphrase/{self.seed}/{index}.mp4",
+                'video-info': {
+                    'info': f"{movie['movie_title']} ({movie['release_year']}) "
+                            f"[{dialogue['dialogue_start_time'] if dialogue else '00:01:00'}]",
+                    'source-url': movie['imdb_url'],
+                },
+                'searched?': True,
+            })
+        return phrases
+
+    def ingest_payloads(self, count, batch=0):
+        """load_to_db 입력 (extract_movie_info 결과 형식), batch 마다 새 영화/대사"""
+        payloads = []
+        for index in range(count):
+            words = self.sentence_words()
+            title = f"Bench Ingest {batch}-{index}"
+            payloads.append({
+                'raw_name': f"{title} (2020)",
+                'movie_title': title,
+                'original_title': '',
+                'release_year': '2020',
+                'director': 'ahading',
+                'production_country': '지구',
+                'dialogue_phrase': ' '.join(words),
+                'dialogue_start_time': '00:01:00',
+                'video_url': f"https://cdn.example.com/ingest/{batch}/{index}.mp4",
+                'source_url': '',     # IMDB 조회 없이 저장만 측정
+                'data_source': 'playphrase.me',
+            })
+        return payloads
+
+
+def encode_playphrase_payload(phrases, count=None):
+    """playphrase 응답 인코딩 ({ } [ ] → ° ç ¡ ¿, 작은따옴표 키/값)"""
+    def encode(value):
+        if isinstance(value, dict):
+            return '°' + ', '.join(f"'{key}': {encode(item)}" for key, item in value.items()) + 'ç'
+        if isinstance(value, (list, tuple)):
+            return '¡' + ', '.join(encode(item) for item in value) + '¿'
+        if isinstance(value, bool):
+            return 'True' if value else 'False'
+        if isinstance(value, (int, float)):
+            return str(value)
+        return "'" + str(value).replace("'", '’') + "'"
+
+    return encode({'count': len(phrases) if count is None else count, 'phrases': list(phrases)})
+
+
+# ===== DB 적재 =====
+
+def populate_database(corpus, batch_size=1000):
+    """
+    합성 코퍼스를 현재 DB 에 bulk 적재 (테스트 DB 에서 사용)
+    - bulk_create 는 save() 를 거치지 않으므로 해시/검색 벡터를 직접 채움
+    """
+    from phrase.models import MovieTable, DialogueTable, RequestTable, UserSearchQuery
+
+    now = timezone.now()
+    with transaction.atomic():
+        MovieTable.objects.bulk_create([
+            MovieTable(
+                movie_title=movie['movie_title'],
+                original_title=movie['original_title'],
+                release_year=movie['release_year'],
+                director=movie['director'],
+                production_country=movie['production_country'],
+                imdb_url=movie['imdb_url'],
+                view_count=movie['view_count'],
+            )
+            for movie in corpus.movies
+        ], batch_size=batch_size)
+
+        # MySQL bulk_create 는 pk 를 돌려주지 않으므로 제목으로 다시 조회
+        movie_ids = dict(MovieTable.objects.filter(
+            movie_title__in=[movie['movie_title'] for movie in corpus.movies]
+        ).values_list('movie_title', 'id'))
+
+        dialogues = []
+        for dialogue in corpus.dialogues:
+            obj = DialogueTable(
+                movie_id=movie_ids[corpus.movies[dialogue['movie_index']]['movie_title']],
+                dialogue_phrase=dialogue['dialogue_phrase'],
+                dialogue_phrase_ko=dialogue['dialogue_phrase_ko'],
+                dialogue_start_time=dialogue['dialogue_start_time'],
+                video_url=dialogue['video_url'],
+                play_count=dialogue['play_count'],
+                translation_method='api_auto',
+                translation_quality='good',
+            )
+            obj.dialogue_hash = obj.generate_dialogue_hash()
+            obj.update_search_vector()
+            dialogues.append(obj)
+        DialogueTable.objects.bulk_create(dialogues, batch_size=batch_size, ignore_conflicts=True)
+
+        requests = []
+        for index, request in enumerate(corpus.requests):
+            obj = RequestTable(
+                request_phrase=request['request_phrase'],
+                request_korean=request['request_korean'],
+                search_count=request['search_count'],
+                result_count=request['result_count'] if request['result_count'] is not None else 1,
+            )
+            obj.request_hash = obj.generate_request_hash()
+            requests.append(obj)
+        RequestTable.objects.bulk_create(requests, batch_size=batch_size, ignore_conflicts=True)
+
+        UserSearchQuery.objects.bulk_create([
+            UserSearchQuery(**query) for query in corpus.search_queries
+        ], batch_size=batch_size)
+
+    logger.info(
+        f"🧪 [Benchmark] 코퍼스 적재: 영화 {len(corpus.movies)}개, 대사 {len(corpus.dialogues)}개, "
+        f"검색어 {len(corpus.requests)}개, 검색 기록 {len(corpus.search_queries)}개 "
+        f"({(timezone.now() - now).total_seconds():.1f}초)"
+    )
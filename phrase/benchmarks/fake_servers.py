@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/fake_servers.py
+"""
+외부 서비스 로컬 대역 서버 (오프라인 부하 테스트용)
+- playphrase: GET /api/v1/phrases/search?q=&limit=&skip= → 인코딩 응답(° ç ¡ ¿)
+- MyMemory: GET /get?q=&langpair=en|ko → {'responseStatus': 200, 'responseData': {...}}
+- IMDB: GET /title/tt0000000/ → og:image / JSON-LD 포스터가 있는 HTML
+  (포스터 이미지 GET /images/<id>.png, 영상 GET /media/<id>.mp4 도 제공)
+- 지연(latency_ms ± jitter_ms), 500 비율(error_rate), 429 비율(rate_limit_rate) 조절
+- 응답 내용은 검색어로부터 결정적 (같은 검색어 → 같은 결과), 'zz' 로 시작하면 결과 없음
+
+사용:
+    python manage.py run_fake_servers --latency-ms 80 --error-rate 0.01
+    → 출력된 PLAYPHRASE_BASE_URL / MYMEMORY_BASE_URL / IMDB_BASE_URL 을 환경변수로 지정 후 서버 실행
+"""
+import json
+import time
+import base64
+import random
+import hashlib
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from .corpus import (
+    ENGLISH_WORDS, KOREAN_BY_ENGLISH, TITLE_ADJECTIVES, TITLE_NOUNS, encode_playphrase_payload,
+)
+
+logger = logging.getLogger(__name__)
+
+ENGLISH_BY_KOREAN = {korean: english for english, korean in KOREAN_BY_ENGLISH.items()}
+KOREAN_SYLLABLES = '가나다라마바사아자차카타파하고노도로모보소오조호'
+
+# 1x1 투명 PNG (Pillow 로 열 수 있는 최소 이미지)
+PNG_PIXEL = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII='
+)
+
+
+class FakeServiceConfig:
+    """대역 서버 동작 설정 (서비스별로 따로 줄 수 있음)"""
+
+    def __init__(self, latency_ms=50, jitter_ms=20, error_rate=0.0, rate_limit_rate=0.0,
+                 no_result_rate=0.1, page_kb=200, seed=42):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.no_result_rate = no_result_rate
+        self.page_kb = page_kb      # IMDB 페이지 크기 (실제 페이지 무게 흉내)
+        self.seed = seed
+
+
+def _query_rng(seed, *parts):
+    """검색어별 결정적 난수"""
+    digest = hashlib.md5(':'.join(str(part) for part in (seed,) + parts).encode('utf-8')).hexdigest()
+    return random.Random(int(digest[:16], 16))
+
+
+# ===== 응답 생성 =====
+
+def playphrase_payload(query, limit, skip, config, base_url):
+    """검색어를 포함한 대사 목록 → playphrase 인코딩 응답"""
+    query = (query or '').strip()
+    rng = _query_rng(config.seed, 'playphrase', query.lower())
+    if not query or query.lower().startswith('zz') or rng.random() < config.no_result_rate:
+        return encode_playphrase_payload([], count=0)
+
+    total = rng.randint(1, 40)
+    phrases = []
+    for index in range(skip, min(total, skip + limit)):
+        item_rng = _query_rng(config.seed, 'phrase', query.lower(), index)
+        before = ' '.join(item_rng.choice(ENGLISH_WORDS) for _ in range(item_rng.randint(0, 3)))
+        after = ' '.join(item_rng.choice(ENGLISH_WORDS) for _ in range(item_rng.randint(0, 3)))
+        title = f"{item_rng.choice(TITLE_ADJECTIVES)} {item_rng.choice(TITLE_NOUNS)}"
+        imdb_id = f"tt{item_rng.randint(100000, 9999999):07d}"
+        start = item_rng.randint(60, 7200)
+        phrases.append({
+            'text': ' '.join(filter(None, (before, query, after))).capitalize(),
+            'video-url': f"{base_url}/media/{imdb_id}-{index}.mp4",
+            'video-info': {
+                'info': f"{title} ({item_rng.randint(1970, 2024)}) "
+                        f"[{start // 3600:02d}:{start % 3600 // 60:02d}:{start % 60:02d}]",
+                # 실제 IMDB 주소 → IMDBPosterExtractor 가 IMDB_BASE_URL 로 바꿔 요청
+                'source-url': f"https://www.imdb.com/title/{imdb_id}/",
+            },
+            'searched?': True,
+        })
+    return encode_playphrase_payload(phrases, count=total)
+
+
+def _pseudo_korean(word, seed):
+    rng = _query_rng(seed, 'ko', word)
+    return ''.join(rng.choice(KOREAN_SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def _pseudo_english(word, seed):
+    rng = _query_rng(seed, 'en', word)
+    return rng.choice(ENGLISH_WORDS)
+
+
+def mymemory_payload(text, langpair, config):
+    """코퍼스 단어 대응표로 번역 (모르는 단어는 결정적 가짜 단어) → LibreTranslator 검증 통과"""
+    words = (text or '').split()
+    if langpair == 'en|ko':
+        translated = ' '.join(
+            KOREAN_BY_ENGLISH.get(word.lower().strip('.,!?'), None) or _pseudo_korean(word.lower(), config.seed)
+            for word in words
+        )
+    elif langpair == 'ko|en':
+        translated = ' '.join(
+            ENGLISH_BY_KOREAN.get(word.strip('.,!?'), None) or _pseudo_english(word, config.seed)
+            for word in words
+        )
+    else:
+        return {'responseStatus': 400, 'responseDetails': f'INVALID LANGUAGE PAIR {langpair}'}
+
+    return {
+        'responseStatus': 200,
+        'responseData': {'translatedText': translated, 'match': 0.85},
+        'responseDetails': '',
+    }
+
+
+def imdb_title_page(imdb_id, config, base_url):
+    """og:image / JSON-LD 포스터가 있는 IMDB 제목 페이지"""
+    rng = _query_rng(config.seed, 'imdb', imdb_id)
+    title = f"{rng.choice(TITLE_ADJECTIVES)} {rng.choice(TITLE_NOUNS)}"
+    poster_url = f"{base_url}/images/{imdb_id}.png"
+    json_ld = json.dumps({'@type': 'Movie', 'name': title, 'image': poster_url})
+    padding = '<div class="ipc-filler">' + 'x' * 1000 + '</div>\n'
+    return (
+        '<!DOCTYPE html><html><head>'
+        f'<title>{title} ({rng.randint(1970, 2024)}) - IMDb</title>'
+        f'<meta property="og:title" content="{title}">'
+        f'<meta property="og:image" content="{poster_url}">'
+        f'<script type="application/ld+json">{json_ld}</script>'
+        '</head><body>'
+        + padding * max(config.page_kb, 0)
+        + '</body></html>'
+    )
+
+
+# ===== HTTP 서버 =====
+
+class FakeServiceHandler(BaseHTTPRequestHandler):
+    """경로별 응답 + 지연 / 오류 주입 (서버 속성: service, config, rng, rng_lock)"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        config = server.config
+
+        with server.rng_lock:
+            delay = max(0.0, config.latency_ms + server.rng.uniform(-config.jitter_ms, config.jitter_ms))
+            roll = server.rng.random()
+        time.sleep(delay / 1000)
+
+        if roll < config.rate_limit_rate:
+            return self._send(429, b'Too Many Requests', 'text/plain', {'Retry-After': '1'})
+        if roll < config.rate_limit_rate + config.error_rate:
+            return self._send(500, b'Internal Server Error', 'text/plain')
+
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        base_url = f"http://{self.headers.get('Host') or '%s:%s' % server.server_address[:2]}"
+        try:
+            self._dispatch(server.service, parsed.path, params, config, base_url)
+        except Exception as e:
+            logger.error(f"❌ [FakeServer] {server.service} 응답 생성 실패: {e}")
+            self._send(500, str(e).encode('utf-8'), 'text/plain')
+
+    def _dispatch(self, service, path, params, config, base_url):
+        if path.startswith('/media/'):
+            return self._send(200, b'\x00\x00\x00\x18ftypmp42' + b'\x00' * 65536, 'video/mp4')
+        if path.startswith('/images/'):
+            return self._send(200, PNG_PIXEL, 'image/png')
+
+        if service == 'playphrase' and path.rstrip('/') == '/api/v1/phrases/search':
+            body = playphrase_payload(
+                params.get('q', ''), int(params.get('limit', 10)), int(params.get('skip', 0)),
+                config, base_url,
+            )
+            return self._send(200, body.encode('utf-8'), 'text/plain; charset=utf-8')
+
+        if service == 'mymemory' and path.rstrip('/') == '/get':
+            body = mymemory_payload(params.get('q', ''), params.get('langpair', ''), config)
+            return self._send(200, json.dumps(body, ensure_ascii=False).encode('utf-8'),
+                              'application/json; charset=utf-8')
+
+        if service == 'imdb' and path.startswith('/title/'):
+            imdb_id = path.strip('/').split('/')[1] if path.count('/') >= 2 else ''
+            if imdb_id.startswith('tt'):
+                body = imdb_title_page(imdb_id, config, base_url)
+                return self._send(200, body.encode('utf-8'), 'text/html; charset=utf-8')
+
+        return self._send(404, b'Not Found', 'text/plain')
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"[FakeServer] {self.server.service} {format % args}")
+
+
+class FakeServer:
+    """백그라운드 스레드로 도는 대역 서버 하나"""
+
+    def __init__(self, service, host='127.0.0.1', port=0, config=None):
+        self.service = service
+        self.httpd = ThreadingHTTPServer((host, port), FakeServiceHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.service = service
+        self.httpd.config = config or FakeServiceConfig()
+        self.httpd.rng = random.Random(self.httpd.config.seed)
+        self.httpd.rng_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{'127.0.0.1' if host == '0.0.0.0' else host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name=f"fake-{self.service}", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"🧪 [FakeServer] {self.service} 시작: {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def start_fake_servers(host='127.0.0.1', ports=None, configs=None, config=None):
+    """
+    세 서비스 대역 서버 시작 → {'playphrase': FakeServer, 'mymemory': ..., 'imdb': ...}
+    - ports / configs: 서비스별 포트 / 설정 (없으면 임의 포트 / 공통 config)
+    """
+    ports = ports or {}
+    configs = configs or {}
+    return {
+        service: FakeServer(service, host, ports.get(service, 0), configs.get(service, config)).start()
+        for service in ('playphrase', 'mymemory', 'imdb')
+    }
+
+
+def external_service_settings(servers):
+    """대역 서버 → EXTERNAL_SERVICE_SETTINGS (override_settings 나 환경변수에 사용)"""
+    return {
+        'PLAYPHRASE_BASE_URL': servers['playphrase'].url,
+        'MYMEMORY_BASE_URL': servers['mymemory'].url,
+        'IMDB_BASE_URL': servers['imdb'].url,
+    }
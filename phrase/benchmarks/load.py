@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/load.py
+"""
+운영 검색어 분포 재생 부하 생성기 (closed-loop)
+- UserSearchQuery(original_query, search_count, has_results)와 RequestTable.search_count 로
+  검색어 분포를 만들어 가중 표본 추출 (한국어/영어 비율, 긴 꼬리 유지)
+- 동시 사용자(concurrency)마다 응답을 받은 뒤 다음 요청 → 전체는 목표 RPS 로 속도 제한
+- 대상: 웹 process_text (POST /search/), API GET /api/search/
+- 단계 구분: 웹은 X-Search-Source / X-Search-Cache 헤더, API 는 analytics.search_method / cache_hit
+- 보고: 대상·단계별 p50/p90/p99, 오류율(5xx·연결 실패), 429 비율, 캐시 적중률
+
+사용:
+    python manage.py run_load --base-url http://127.0.0.1:8000 --rps 20 --concurrency 8 --duration 60
+"""
+import re
+import time
+import random
+import logging
+import threading
+from collections import defaultdict
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+re_korean = re.compile(r'[가-힣]')
+
+
+def _is_korean(text):
+    return bool(re_korean.search(text))
+
+
+def _percentile(ordered, ratio):
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))], 1)
+
+
+# ===== 검색어 분포 =====
+
+class QueryMix:
+    """
+    가중 검색어 분포
+        mix = QueryMix.from_database(limit=5000)
+        query = mix.sample(rng)
+    - entries: [(검색어, 가중치, 결과 있음 여부)]
+    """
+
+    def __init__(self, entries):
+        self.entries = [entry for entry in entries if entry[0] and entry[1] > 0]
+        self.queries = [entry[0] for entry in self.entries]
+        total, self.cumulative = 0, []
+        for entry in self.entries:
+            total += entry[1]
+            self.cumulative.append(total)
+
+    @classmethod
+    def from_database(cls, limit=5000):
+        """
+        UserSearchQuery 우선 (실제 입력 그대로, 한국어 포함),
+        기록이 부족하면 RequestTable 영어/한국어 검색어로 보충 (search_count 가중)
+        """
+        from phrase.models import UserSearchQuery, RequestTable
+
+        weights = defaultdict(int)
+        has_results = {}
+        for row in (UserSearchQuery.objects.order_by('-search_count')
+                    .values('original_query', 'search_count', 'has_results')[:limit]):
+            query = row['original_query'].strip()
+            weights[query] += row['search_count'] or 1
+            has_results[query] = has_results.get(query, False) or row['has_results']
+
+        if len(weights) < limit:
+            for row in (RequestTable.objects.filter(is_active=True).order_by('-search_count')
+                        .values('request_phrase', 'request_korean', 'search_count', 'result_count')
+                        [:limit - len(weights)]):
+                for query in filter(None, (row['request_phrase'], row['request_korean'])):
+                    query = query.strip()
+                    if query not in weights:
+                        weights[query] = row['search_count'] or 1
+                        has_results[query] = bool(row['result_count'])
+
+        return cls([(query, weight, has_results.get(query)) for query, weight in weights.items()])
+
+    def sample(self, rng):
+        return rng.choices(self.queries, cum_weights=self.cumulative)[0]
+
+    def summary(self):
+        total = self.cumulative[-1] if self.cumulative else 0
+        if not total:
+            return {'distinct': 0}
+        korean = sum(weight for query, weight, _ in self.entries if _is_korean(query))
+        top = sorted((weight for _, weight, _ in self.entries), reverse=True)
+        return {
+            'distinct': len(self.entries),
+            'korean_ratio': round(korean / total, 3),
+            'top10_share': round(sum(top[:10]) / total, 3),
+            'no_result_ratio': round(sum(weight for _, weight, found in self.entries if found is False) / total, 3),
+        }
+
+
+# ===== 부하 생성 =====
+
+class LoadGenerator:
+    """
+    목표 RPS / 동시성으로 검색 요청 재생
+    - 요청 시각은 1/rps 간격의 공유 일정에서 가져옴 (동시성 부족으로 밀리면 lag 으로 기록)
+    - forwarded_for: 가상 사용자마다 다른 X-Forwarded-For (API 스로틀이 한 IP 로 몰리지 않게)
+    """
+
+    def __init__(self, base_url, mix, rps=10, concurrency=4, duration=60, targets=('web', 'api'),
+                 api_ratio=0.5, skip_confirmation=True, forwarded_for=True, timeout=30, seed=42):
+        self.base_url = base_url.rstrip('/')
+        self.mix = mix
+        self.rps = rps
+        self.concurrency = concurrency
+        self.duration = duration
+        self.targets = tuple(targets)
+        self.api_ratio = api_ratio if len(self.targets) > 1 else (1.0 if 'api' in self.targets else 0.0)
+        self.skip_confirmation = skip_confirmation
+        self.forwarded_for = forwarded_for
+        self.timeout = timeout
+        self.seed = seed
+
+        self.samples = []
+        self._samples_lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._next_slot = None
+        self._deadline = None
+
+    def _next_send_time(self):
+        """공유 일정에서 다음 요청 시각 (종료 시각이 지나면 None)"""
+        with self._schedule_lock:
+            slot = max(self._next_slot, time.monotonic() - 1.0)   # 1초 넘게 밀린 분량은 버림
+            if slot >= self._deadline:
+                return None
+            self._next_slot = slot + 1.0 / self.rps
+            return slot
+
+    def _open_session(self, worker_id):
+        session = requests.Session()
+        session.headers['User-Agent'] = f'phrase-load/{worker_id}'
+        if self.forwarded_for:
+            session.headers['X-Forwarded-For'] = f"10.77.{worker_id // 250 % 250}.{worker_id % 250 + 1}"
+        if 'web' in self.targets:
+            # CSRF 쿠키 확보 (process_text 는 POST)
+            try:
+                session.get(f"{self.base_url}/movie/", timeout=self.timeout)
+            except requests.RequestException as e:
+                logger.warning(f"⚠️ [Load] 세션 준비 실패: {e}")
+        return session
+
+    def _send_web(self, session, query):
+        response = session.post(
+            f"{self.base_url}/search/",
+            data={
+                'user_text': query,
+                'skip_confirmation': 'true' if self.skip_confirmation else 'false',
+                'csrfmiddlewaretoken': session.cookies.get('csrftoken', ''),
+            },
+            headers={'Referer': f"{self.base_url}/movie/", 'X-CSRFToken': session.cookies.get('csrftoken', '')},
+            timeout=self.timeout,
+            allow_redirects=False,
+        )
+        stage = response.headers.get('X-Search-Source', 'validation' if response.status_code == 200 else 'other')
+        return response.status_code, stage, response.headers.get('X-Search-Cache') == 'hit'
+
+    def _send_api(self, session, query):
+        response = session.get(f"{self.base_url}/api/search/", params={'q': query}, timeout=self.timeout)
+        stage, cache_hit = 'other', False
+        if response.status_code == 200:
+            try:
+                analytics = response.json().get('analytics', {})
+                stage = analytics.get('search_method', 'other')
+                cache_hit = bool(analytics.get('cache_hit'))
+            except ValueError:
+                stage = 'invalid_json'
+        return response.status_code, stage, cache_hit
+
+    def _worker(self, worker_id):
+        rng = random.Random(self.seed * 1000 + worker_id)
+        session = self._open_session(worker_id)
+        while True:
+            slot = self._next_send_time()
+            if slot is None:
+                break
+            wait = slot - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+            query = self.mix.sample(rng)
+            target = 'api' if rng.random() < self.api_ratio else 'web'
+            start = time.monotonic()
+            try:
+                if target == 'api':
+                    status, stage, cache_hit = self._send_api(session, query)
+                else:
+                    status, stage, cache_hit = self._send_web(session, query)
+                error = None
+            except requests.RequestException as e:
+                status, stage, cache_hit, error = 0, 'connection_error', False, type(e).__name__
+            end = time.monotonic()
+
+            with self._samples_lock:
+                self.samples.append({
+                    'target': target,
+                    'stage': stage,
+                    'status': status,
+                    'latency_ms': (end - start) * 1000,
+                    'lag_ms': max(0.0, start - slot) * 1000,
+                    'cache_hit': cache_hit,
+                    'korean': _is_korean(query),
+                    'error': error,
+                })
+        session.close()
+
+    def run(self):
+        """부하 실행 → 보고서 (build_load_report)"""
+        start = time.monotonic()
+        self._next_slot = start
+        self._deadline = start + self.duration
+        workers = [
+            threading.Thread(target=self._worker, args=(worker_id,), name=f"load-{worker_id}", daemon=True)
+            for worker_id in range(self.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        report = build_load_report(self.samples, time.monotonic() - start)
+        report['config'] = {
+            'base_url': self.base_url, 'rps': self.rps, 'concurrency': self.concurrency,
+            'duration': self.duration, 'targets': list(self.targets), 'api_ratio': self.api_ratio,
+        }
+        report['query_mix'] = self.mix.summary()
+        logger.info(f"📈 [Load] 완료: {report['total']}건, {report['achieved_rps']} rps")
+        return report
+
+
+# ===== 보고서 =====
+
+def summarize_samples(samples):
+    """지연 백분위 / 오류율 / 429 비율 / 캐시 적중률"""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(sample['latency_ms'] for sample in samples)
+    count = len(samples)
+    return {
+        'count': count,
+        'p50_ms': _percentile(ordered, 0.5),
+        'p90_ms': _percentile(ordered, 0.9),
+        'p99_ms': _percentile(ordered, 0.99),
+        'max_ms': round(ordered[-1], 1),
+        'error_rate': round(sum(1 for s in samples if s['status'] == 0 or s['status'] >= 500) / count, 4),
+        'throttled_rate': round(sum(1 for s in samples if s['status'] == 429) / count, 4),
+        'cache_hit_ratio': round(sum(1 for s in samples if s['cache_hit']) / count, 4),
+    }
+
+
+def build_load_report(samples, elapsed):
+    """전체 / 대상별 / 대상·단계별 요약"""
+    by_target, by_stage = defaultdict(list), defaultdict(list)
+    for sample in samples:
+        by_target[sample['target']].append(sample)
+        by_stage[f"{sample['target']}:{sample['stage']}"].append(sample)
+
+    lags = sorted(sample['lag_ms'] for sample in samples)
+    return {
+        'total': len(samples),
+        'elapsed_s': round(elapsed, 2),
+        'achieved_rps': round(len(samples) / elapsed, 2) if elapsed else 0,
+        'schedule_lag_p99_ms': _percentile(lags, 0.99) if lags else 0,
+        'korean_ratio': round(sum(1 for s in samples if s['korean']) / len(samples), 3) if samples else 0,
+        'overall': summarize_samples(samples),
+        'targets': {target: summarize_samples(items) for target, items in sorted(by_target.items())},
+        'stages': {
+            stage: dict(summarize_samples(items), share=round(len(items) / len(samples), 4))
+            for stage, items in sorted(by_stage.items())
+        },
+    }
+
+
+def format_load_report(report):
+    """표 형식 문자열"""
+    lines = [
+        f"요청 {report['total']}건 / {report['elapsed_s']}s → {report['achieved_rps']} rps "
+        f"(일정 지연 p99 {report['schedule_lag_p99_ms']}ms, 한국어 {report['korean_ratio']:.1%})",
+        f"{'단계':<28}{'건수':>7}{'비중':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'오류':>8}{'429':>8}{'캐시':>8}",
+    ]
+    rows = [('overall', dict(report['overall'], share=1.0))] + list(report['stages'].items())
+    for name, summary in rows:
+        if not summary.get('count'):
+            continue
+        lines.append(
+            f"{name:<28}{summary['count']:>7}{summary['share']:>8.1%}{summary['p50_ms']:>9}"
+            f"{summary['p90_ms']:>9}{summary['p99_ms']:>9}{summary['error_rate']:>8.1%}"
+            f"{summary['throttled_rate']:>8.1%}{summary['cache_hit_ratio']:>8.1%}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/benchmarks/scenarios.py
+"""
+벤치마크 시나리오 (검색 / 적재 / 렌더링 / 목록 API)
+- 각 시나리오는 (이름, 반복 함수, 캐시 비움 여부)로 정의
+- 반복마다 소요 시간(ms)과 DB 쿼리 수를 기록 → p50 / p95 / 평균 쿼리 수
+- cold 시나리오는 반복 전마다 캐시를 비움 (벤치마크 전용 LocMemCache 에서만 실행)
+"""
+import time
+import logging
+from itertools import cycle
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+logger = logging.getLogger(__name__)
+
+
+def summarize(timings, query_counts):
+    """소요 시간 / 쿼리 수 요약"""
+    if not timings:
+        return {'count': 0}
+    ordered = sorted(timings)
+
+    def percentile(ratio):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))], 3)
+
+    return {
+        'count': len(ordered),
+        'min_ms': round(ordered[0], 3),
+        'p50_ms': percentile(0.5),
+        'p95_ms': percentile(0.95),
+        'max_ms': round(ordered[-1], 3),
+        'mean_ms': round(sum(ordered) / len(ordered), 3),
+        'queries_mean': round(sum(query_counts) / len(query_counts), 2),
+    }
+
+
+class Scenario:
+    """
+    시간 측정 시나리오
+        Scenario('db_search_cold', lambda i: ..., cold=True)
+    - func(i): i 번째 반복 실행
+    """
+
+    def __init__(self, name, func, cold=False, description=''):
+        self.name = name
+        self.func = func
+        self.cold = cold
+        self.description = description
+
+    def run(self, repeat=50, warmup=3):
+        for i in range(warmup):
+            if self.cold:
+                cache.clear()
+            self.func(i)
+
+        timings, query_counts = [], []
+        for i in range(warmup, warmup + repeat):
+            if self.cold:
+                cache.clear()
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                self.func(i)
+                timings.append((time.perf_counter() - start) * 1000)
+            query_counts.append(len(captured.captured_queries))
+
+        result = summarize(timings, query_counts)
+        result['cold'] = self.cold
+        logger.info(f"⏱️ [Benchmark] {self.name}: p50 {result.get('p50_ms')}ms, p95 {result.get('p95_ms')}ms")
+        return result
+
+
+# ===== 시나리오 정의 =====
+
+def build_scenarios(corpus, ingest_batch=5):
+    """코퍼스 기반 기본 시나리오 목록"""
+    from django.contrib.auth.models import AnonymousUser
+    from django.test import Client, RequestFactory
+
+    from phrase.models import DialogueTable
+    from phrase.utils.clean_data import extract_movie_info
+    from phrase.utils.data_processing import get_existing_results_from_db, build_movies_context_from_db
+    from phrase.utils.load_to_db import load_to_db
+    from phrase.utils.template_helpers import render_search_results
+    from phrase.utils.warmup import default_search_options
+    from phrase.benchmarks.corpus import encode_playphrase_payload
+    from api.views import perform_db_search_optimized
+
+    hits = [request for request in corpus.requests if request['result_count'] is None]
+    search_inputs = cycle(hits or corpus.requests)
+    warm_inputs = cycle((hits or corpus.requests)[:5])
+    search_options = default_search_options()
+
+    def translation_result(request):
+        return {
+            'request_phrase': request['request_phrase'],
+            'request_korean': request['request_korean'],
+            'language_detected': 'english',
+        }
+
+    def web_search(i):
+        request = next(search_inputs)
+        get_existing_results_from_db(request['request_phrase'], request['request_korean'])
+
+    def web_search_repeated(i):
+        request = next(warm_inputs)
+        get_existing_results_from_db(request['request_phrase'], request['request_korean'])
+
+    def api_search(i):
+        perform_db_search_optimized(translation_result(next(search_inputs)), 20, search_options)
+
+    # build_movies_context_from_db / 렌더링 입력: 자주 나오는 단어의 대사 묶음
+    sample_dialogues = list(
+        DialogueTable.objects.filter(dialogue_phrase__icontains=hits[0]['request_phrase'] if hits else 'you')
+        .select_related('movie')[:100]
+    )
+
+    def build_context(i):
+        build_movies_context_from_db(sample_dialogues)
+
+    movies_context = build_movies_context_from_db(sample_dialogues)
+    factory = RequestFactory()
+
+    def render_results(i):
+        request = factory.post('/search/')
+        request.user = AnonymousUser()
+        request.session = {}
+        render_search_results(request, 'bench', None, 'bench', movies_context, from_cache=True)
+
+    payloads = [
+        encode_playphrase_payload(corpus.playphrase_phrases(20)) for _ in range(10)
+    ]
+
+    def extract(i):
+        extract_movie_info(payloads[i % len(payloads)])
+
+    def ingest(i):
+        load_to_db(corpus.ingest_payloads(ingest_batch, batch=i), auto_translate=False)
+
+    client = Client()
+
+    def list_endpoint(path):
+        def call(i):
+            # 스로틀 기록이 쌓이지 않도록 반복마다 다른 주소
+            response = client.get(path, REMOTE_ADDR=f"10.9.{i // 250 % 250}.{i % 250 + 1}")
+            if response.status_code >= 500:
+                raise RuntimeError(f"{path} → {response.status_code}")
+        return call
+
+    return [
+        Scenario('web_db_search_cold', web_search, cold=True,
+                 description='get_existing_results_from_db (캐시 없음)'),
+        Scenario('web_db_search_warm', web_search_repeated,
+                 description='get_existing_results_from_db (캐시 적중)'),
+        Scenario('api_db_search_cold', api_search, cold=True,
+                 description='perform_db_search_optimized (캐시 없음)'),
+        Scenario('build_movies_context', build_context,
+                 description=f'build_movies_context_from_db ({len(sample_dialogues)}개 대사)'),
+        Scenario('render_search_results', render_results,
+                 description='index.html 렌더링 (상위 5개 영화)'),
+        Scenario('extract_movie_info', extract, cold=True,
+                 description='playphrase 인코딩 응답 20개 구문 파싱'),
+        Scenario('load_to_db', ingest,
+                 description=f'load_to_db {ingest_batch}개 영화 (번역/다운로드 없음)'),
+        Scenario('api_requests_list', list_endpoint('/api/requests/?limit=20'), cold=True),
+        Scenario('api_movies_list', list_endpoint('/api/movies-table/?limit=20'), cold=True),
+        Scenario('api_dialogues_list', list_endpoint('/api/dialogues/?limit=20'), cold=True),
+        Scenario('api_dialogues_cursor', list_endpoint('/api/dialogues/?cursor=&limit=50&count=false'),
+                 cold=True),
+    ]
+
+
+def run_scenarios(scenarios, repeat=50, warmup=3, only=None):
+    """시나리오 실행 → {이름: 결과}"""
+    results = {}
+    for scenario in scenarios:
+        if only and scenario.name not in only:
+            continue
+        try:
+            results[scenario.name] = scenario.run(repeat=repeat, warmup=warmup)
+            results[scenario.name]['description'] = scenario.description
+        except Exception as e:
+            logger.error(f"❌ [Benchmark] {scenario.name} 실패: {e}")
+            results[scenario.name] = {'error': str(e)}
+    return results
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/backfill_posters.py
+"""
+포스터 동시 백필 명령
+
+    python manage.py backfill_posters
+    python manage.py backfill_posters --workers 8 --rps 3
+    python manage.py backfill_posters --host-rate www.imdb.com=1 --host-rate m.media-amazon.com=10
+    python manage.py backfill_posters --dry-run --sample 10
+    python manage.py backfill_posters --restart
+
+- 포스터가 없는 영화를 id 키셋으로 순회하며 스레드 풀로 처리
+- 배치마다 체크포인트 기록 → 다시 실행하면 이어서 처리
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from phrase.utils.poster_backfill import PosterBackfill
+
+
+class Command(BaseCommand):
+    help = '포스터가 없는 영화의 IMDB 포스터를 호스트별 속도 제한 하에 동시에 수집합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=None,
+                            help='스레드 수 (기본: POSTER_BACKFILL_SETTINGS.WORKERS)')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='키셋 배치 크기 (체크포인트 기록 단위)')
+        parser.add_argument('--rps', type=float, default=None,
+                            help='모든 호스트에 적용할 초당 요청 수 (설정의 PER_HOST_RATES 대신 사용)')
+        parser.add_argument('--host-rate', action='append', default=[], metavar='HOST=RPS',
+                            help='특정 호스트의 초당 요청 수 (여러 번 지정 가능, --rps 보다 우선)')
+        parser.add_argument('--max-movies', type=int, default=None,
+                            help='이번 실행에서 처리할 최대 영화 수')
+        parser.add_argument('--checkpoint', default=None,
+                            help='체크포인트 파일 경로')
+        parser.add_argument('--restart', action='store_true',
+                            help='체크포인트를 무시하고 처음부터 실행')
+        parser.add_argument('--no-download', action='store_true',
+                            help='포스터 URL 만 저장하고 이미지는 받지 않음')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='DB 를 수정하지 않고 예상 처리량만 보고')
+        parser.add_argument('--sample', type=int, default=5,
+                            help='dry-run 시 지연 측정용 표본 수')
+
+    def parse_host_rates(self, values):
+        """['www.imdb.com=1.5', ...] → {'www.imdb.com': 1.5}"""
+        host_rates = {}
+        for value in values:
+            host, _, rate = value.partition('=')
+            try:
+                if not host.strip():
+                    raise ValueError(value)
+                host_rates[host.strip().lower()] = float(rate)
+            except ValueError:
+                raise CommandError(f"--host-rate 형식 오류: {value} (예: www.imdb.com=2)")
+        return host_rates
+
+    def handle(self, *args, **options):
+        backfill = PosterBackfill(
+            workers=options['workers'],
+            batch_size=options['batch_size'],
+            requests_per_second=options['rps'],
+            per_host_rates=self.parse_host_rates(options['host_rate']),
+            checkpoint_path=options['checkpoint'],
+            download_images=not options['no_download'],
+            dry_run=options['dry_run'],
+        )
+
+        result = backfill.run(
+            max_movies=options['max_movies'],
+            resume=not options['restart'],
+            sample_size=options['sample'],
+        )
+
+        if options['dry_run']:
+            self.stdout.write(f"🔍 대상 영화: {result['pending']}개 (id > {result['resume_after_id']})")
+            self.stdout.write(f"   워커 {result['workers']}개, 표본 {result['sampled']}개, "
+                              f"평균 지연 {result['avg_latency']}초, 속도 제한 {result['rate_limit']}회/초")
+            self.stdout.write(self.style.SUCCESS(
+                f"📈 예상 처리량: {result['projected_rate']}개/초, 예상 소요: {result['projected_seconds']}초"
+            ))
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 완료: {result['processed']}개 처리 (성공 {result['updated']}, 실패 {result['failed']}), "
+            f"마지막 id {result['last_id']} ({result['elapsed']}초, {result['rate']}개/초)"
+        ))
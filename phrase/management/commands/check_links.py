@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/check_links.py
+"""
+저장된 포스터/비디오 URL 링크 검사 명령
+
+    python manage.py check_links
+    python manage.py check_links --target video --workers 32 --per-host 8
+    python manage.py check_links --target poster --recheck-hours 0
+
+- 결과는 poster_url_status / video_url_status 에 기록
+- 검색 경로는 video_url_status='dead' 인 클립을 제외
+"""
+from django.core.management.base import BaseCommand
+
+from phrase.utils.link_checker import LINK_TARGETS, check_stored_links
+
+
+class Command(BaseCommand):
+    help = '저장된 poster_url / video_url 을 호스트별 동시성 제한 하에 검사하고 결과를 기록합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=sorted(LINK_TARGETS) + ['all'], default='all',
+                            help='검사 대상 (기본: all)')
+        parser.add_argument('--workers', type=int, default=None,
+                            help='스레드 수 (기본: LINK_CHECK_SETTINGS.WORKERS)')
+        parser.add_argument('--per-host', type=int, default=None,
+                            help='호스트별 동시 요청 수')
+        parser.add_argument('--timeout', type=int, default=None,
+                            help='요청 타임아웃 (초)')
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help='키셋 배치 크기')
+        parser.add_argument('--recheck-hours', type=int, default=None,
+                            help='이 시간 안에 검사한 URL 은 건너뜀 (0 이면 전체 재검사)')
+        parser.add_argument('--max-rows', type=int, default=None,
+                            help='대상별 최대 검사 수')
+
+    def handle(self, *args, **options):
+        targets = ('poster', 'video') if options['target'] == 'all' else (options['target'],)
+
+        results = check_stored_links(
+            targets,
+            workers=options['workers'],
+            per_host=options['per_host'],
+            timeout=options['timeout'],
+            batch_size=options['batch_size'],
+            recheck_after_hours=options['recheck_hours'],
+            max_rows=options['max_rows'],
+        )
+
+        for stats in results:
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ {stats['target']}: {stats['checked']}개 검사 "
+                f"(정상 {stats['alive']}, 끊김 {stats['dead']}, 오류 {stats['error']}, "
+                f"상태 변경 {stats['changed']}) {stats['elapsed']}초"
+            ))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/index_advice.py
+"""
+표본 SQL 지문 분석 → 복합 / 커버링 인덱스 제안
+
+    python manage.py index_advice
+    python manage.py index_advice --top 30 --min-calls 10 --output logs/index_advice.json
+    python manage.py index_advice --reset
+
+- 표본: QuerySamplingMiddleware 가 QUERY_SAMPLING_SETTINGS.SAMPLE_RATE 비율로 수집
+  (gunicorn 은 METRICS_MULTIPROCESS_DIR/queries, runserver 는 같은 프로세스에서만 보임)
+- 상위 지문마다 EXPLAIN (MySQL / SQLite) 후 후보 인덱스와 예상 절감 시간 출력
+- 제안된 models.Index(...) 를 모델 Meta.indexes 에 추가하고 makemigrations 로 마이그레이션 생성
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phrase.utils.index_advisor import advise_indexes
+from phrase.utils.query_sampling import fingerprint_stats, get_query_sampling_settings, reset_query_samples
+
+
+class Command(BaseCommand):
+    help = '표본 SQL 지문을 EXPLAIN 해서 복합 / 커버링 인덱스를 제안합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help='분석할 상위 지문 수 (누적 시간 순)')
+        parser.add_argument('--min-calls', type=int, default=5, help='분석할 최소 실행 수')
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--sample-rate', type=float, help='예상 효과 환산 비율 (기본 설정값)')
+        parser.add_argument('--output', help='결과 JSON 저장 경로')
+        parser.add_argument('--reset', action='store_true', help='수집한 지문 통계 삭제')
+
+    def handle(self, *args, **options):
+        if options['reset']:
+            reset_query_samples()
+            self.stdout.write(self.style.SUCCESS("✅ 지문 통계를 비웠습니다."))
+            return
+
+        sample_rate = options['sample_rate'] or get_query_sampling_settings()['SAMPLE_RATE']
+        if sample_rate <= 0:
+            raise CommandError("--sample-rate 는 0보다 커야 합니다.")
+
+        stats = fingerprint_stats()
+        if not stats:
+            raise CommandError("수집된 지문이 없습니다 (QUERY_SAMPLING_SETTINGS.ENABLED / SAMPLE_RATE 확인).")
+
+        self.stdout.write(f"📊 지문 {len(stats)}개, 표본 비율 {sample_rate:g}")
+        self.stdout.write(f"{'실행':>8}{'누적(s)':>10}{'평균(ms)':>10}  SQL 지문")
+        for entry in stats[:options['top']]:
+            self.stdout.write(
+                f"{entry['calls']:>8}{entry['seconds']:>10.3f}{entry['mean_ms']:>10.2f}  {entry['fingerprint'][:120]}"
+            )
+
+        proposals = advise_indexes(
+            stats, using=options['database'], sample_rate=sample_rate,
+            min_calls=options['min_calls'], top=options['top'],
+        )
+
+        self.stdout.write('')
+        for rank, proposal in enumerate(proposals, 1):
+            kind = '커버링' if proposal['covering'] else '복합'
+            self.stdout.write(
+                f"{rank}. {proposal['model'] or proposal['table']} ({', '.join(proposal['columns'])}) "
+                f"[{kind}] 예상 절감 {proposal['estimated_saving_s']}s, 지문 {len(proposal['fingerprints'])}개, "
+                f"계획 {', '.join(proposal['issues']) or '인덱스 사용 중'}"
+            )
+            self.stdout.write(f"   {proposal['index_code']}")
+            for line in proposal['plan'][:3]:
+                self.stdout.write(f"   · {line}")
+            if proposal['redundant']:
+                self.stdout.write(f"   ↳ 추가 후 삭제 검토: {', '.join(proposal['redundant'])}")
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump({'sample_rate': sample_rate, 'fingerprints': stats[:options['top']],
+                           'proposals': proposals}, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"💾 결과 저장: {options['output']}")
+
+        if proposals:
+            self.stdout.write("👉 모델 Meta.indexes 에 추가 후 python manage.py makemigrations phrase")
+        self.stdout.write(self.style.SUCCESS(f"✅ 인덱스 제안 {len(proposals)}개"))
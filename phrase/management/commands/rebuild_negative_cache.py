@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/rebuild_negative_cache.py
+"""
+결과 없는 구문 Bloom 필터 재생성 명령 (cron 으로 주기 실행)
+
+    python manage.py rebuild_negative_cache
+    */30 * * * * cd /app && python manage.py rebuild_negative_cache
+
+- RequestTable(result_count=0) 에서 필터를 만들어 BLOOM_PATH 에 원자적으로 저장
+- 각 프로세스는 RELOAD_INTERVAL 안에 새 파일을 다시 로드
+"""
+from django.core.management.base import BaseCommand
+
+from phrase.utils.negative_cache import rebuild_bloom_filter
+
+
+class Command(BaseCommand):
+    help = '결과 없는 구문 네거티브 캐시(Bloom 필터)를 재생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=None,
+                            help='필터 저장 경로 (기본: NEGATIVE_CACHE_SETTINGS.BLOOM_PATH)')
+
+    def handle(self, *args, **options):
+        result = rebuild_bloom_filter(options['path'])
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Bloom 필터 재생성: {result['phrases']}개 구문, "
+            f"{result['bytes']} bytes, 해시 {result['hash_count']}개"
+        ))
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/regenerate_poster_variants.py
+"""
+포스터 변환본 일괄 (재)생성 명령
+
+    python manage.py regenerate_poster_variants
+    python manage.py regenerate_poster_variants --workers 8 --force
+    python manage.py regenerate_poster_variants --movie-id 12 --movie-id 34
+
+- 이미지 디코딩/리사이즈/인코딩은 CPU 작업이므로 프로세스 풀로 코어 수만큼 병렬 처리
+- 대상 영화는 id 키셋으로 배치 조회 (OFFSET 없음)
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+def _init_worker():
+    """워커 프로세스 초기화 (spawn 방식에서도 동작하도록 django.setup)"""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    # fork 로 상속된 DB 연결은 재사용하지 않음
+    connections.close_all()
+
+
+def _process_movie_ids(movie_ids, force):
+    """워커에서 실행: 영화 id 묶음 처리 → (성공, 건너뜀, 실패)"""
+    from phrase.models import MovieTable
+    from phrase.utils.poster_variants import generate_poster_variants
+
+    generated = skipped = failed = 0
+    for movie in MovieTable.objects.filter(id__in=movie_ids):
+        before = movie.poster_variants
+        result = generate_poster_variants(movie, force=force)
+        if result is None:
+            failed += 1
+        elif result is before:
+            skipped += 1
+        else:
+            generated += 1
+    return generated, skipped, failed
+
+
+class Command(BaseCommand):
+    help = '포스터 썸네일/WebP 변환본을 CPU 코어 수만큼 병렬로 (재)생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='워커 프로세스 수 (기본: CPU 코어 수)')
+        parser.add_argument('--chunk-size', type=int, default=20,
+                            help='워커당 한 번에 처리할 영화 수')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='DB 에서 한 번에 조회할 영화 id 수')
+        parser.add_argument('--force', action='store_true',
+                            help='이미 생성된 변환본도 다시 생성')
+        parser.add_argument('--movie-id', type=int, action='append', dest='movie_ids',
+                            help='특정 영화만 처리 (여러 번 지정 가능)')
+
+    def iter_movie_id_chunks(self, batch_size, chunk_size, movie_ids=None):
+        from phrase.models import MovieTable
+
+        queryset = MovieTable.objects.filter(is_active=True).exclude(poster_image='') \
+            .exclude(poster_image__isnull=True)
+        if movie_ids:
+            queryset = queryset.filter(id__in=movie_ids)
+
+        last_id = 0
+        while True:
+            ids = list(
+                queryset.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return
+            last_id = ids[-1]
+            for i in range(0, len(ids), chunk_size):
+                yield ids[i:i + chunk_size]
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        force = options['force']
+        start_time = time.time()
+
+        chunks = list(self.iter_movie_id_chunks(
+            options['batch_size'], options['chunk_size'], options['movie_ids']
+        ))
+        total = sum(len(chunk) for chunk in chunks)
+        self.stdout.write(f"🖼️ 포스터 변환본 생성 시작: {total}개 영화, 워커 {workers}개")
+
+        generated = skipped = failed = 0
+
+        if workers == 1:
+            for chunk in chunks:
+                g, s, f = _process_movie_ids(chunk, force)
+                generated, skipped, failed = generated + g, skipped + s, failed + f
+        else:
+            # 부모 프로세스의 DB 연결이 자식으로 복제되지 않도록 정리
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                futures = [executor.submit(_process_movie_ids, chunk, force) for chunk in chunks]
+                for done, future in enumerate(as_completed(futures), 1):
+                    try:
+                        g, s, f = future.result()
+                    except Exception as e:
+                        self.stderr.write(f"❌ 워커 오류: {e}")
+                        continue
+                    generated, skipped, failed = generated + g, skipped + s, failed + f
+                    if done % 10 == 0:
+                        self.stdout.write(f"  진행: {generated + skipped + failed}/{total}")
+
+        elapsed = time.time() - start_time
+        rate = total / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 완료: 생성 {generated}, 건너뜀 {skipped}, 실패 {failed} "
+            f"({elapsed:.1f}초, {rate:.1f}개/초)"
+        ))
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/run_benchmarks.py
+"""
+성능 벤치마크 실행 명령 (운영 DB 대신 테스트 DB 생성 후 실행)
+
+    python manage.py run_benchmarks --output logs/bench/current.json
+    python manage.py run_benchmarks --baseline logs/bench/baseline.json --fail-on-regression
+    python manage.py run_benchmarks --movies 1000 --dialogues-per-movie 30 --only web_db_search_cold
+
+- 합성 코퍼스(seed 고정)를 적재하고 시나리오별 p50 / p95 / 쿼리 수를 JSON 으로 저장
+- --baseline 이 있으면 비교 표를 출력하고, 회귀가 있으면 --fail-on-regression 시 종료 코드 1
+- 캐시는 벤치마크 전용 LocMemCache 로 교체 (공유 캐시를 비우지 않음)
+"""
+import os
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from phrase.benchmarks import (
+    SyntheticCorpus, populate_database, build_scenarios, run_scenarios,
+    build_report, save_report, load_report, compare_reports, format_comparison,
+)
+
+
+class Command(BaseCommand):
+    help = '합성 코퍼스로 검색/적재/렌더링/목록 API 벤치마크를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--movies', type=int, default=200, help='합성 영화 수')
+        parser.add_argument('--dialogues-per-movie', type=int, default=20, help='영화당 대사 수')
+        parser.add_argument('--requests', type=int, default=2000, help='검색어 / 검색 기록 수')
+        parser.add_argument('--seed', type=int, default=42, help='코퍼스 seed')
+        parser.add_argument('--repeat', type=int, default=50, help='시나리오별 측정 반복 수')
+        parser.add_argument('--warmup', type=int, default=3, help='측정 전 예열 반복 수')
+        parser.add_argument('--only', nargs='*', default=None, help='실행할 시나리오 이름')
+        parser.add_argument('--output', default=os.path.join(str(settings.BASE_DIR), 'logs', 'bench', 'current.json'),
+                            help='결과 JSON 경로')
+        parser.add_argument('--baseline', default=None, help='비교할 기준선 JSON')
+        parser.add_argument('--tolerance', type=float, default=0.2, help='회귀 판정 비율 (기본 0.2 = 20%%)')
+        parser.add_argument('--fail-on-regression', action='store_true', help='회귀 시 종료 코드 1')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB 유지 (재실행 시 재사용)')
+
+    def handle(self, *args, **options):
+        # 시나리오 내부의 상세 로그는 숨기고 결과만 출력
+        logging.disable(logging.INFO)
+
+        corpus_options = {
+            'movies': options['movies'],
+            'dialogues_per_movie': options['dialogues_per_movie'],
+            'requests': options['requests'],
+            'seed': options['seed'],
+        }
+        corpus = SyntheticCorpus(**corpus_options)
+
+        benchmark_settings = override_settings(
+            CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'phrase-benchmarks',
+            }},
+            ALLOWED_HOSTS=list(settings.ALLOWED_HOSTS) + ['testserver'],
+        )
+
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options['keepdb'])
+        try:
+            with benchmark_settings:
+                populate_database(corpus)
+                results = run_scenarios(
+                    build_scenarios(corpus),
+                    repeat=options['repeat'], warmup=options['warmup'], only=options['only'],
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options['keepdb'])
+            logging.disable(logging.NOTSET)
+
+        report = build_report(results, corpus_options, options['repeat'])
+        save_report(report, options['output'])
+
+        for name, result in results.items():
+            if 'error' in result:
+                self.stdout.write(self.style.ERROR(f"  {name}: 실패 - {result['error']}"))
+            else:
+                self.stdout.write(
+                    f"  {name:<28} p50 {result['p50_ms']:>9}ms  p95 {result['p95_ms']:>9}ms  "
+                    f"쿼리 {result['queries_mean']}"
+                )
+        self.stdout.write(self.style.SUCCESS(f"✅ 결과 저장: {options['output']}"))
+
+        if options['baseline']:
+            try:
+                baseline = load_report(options['baseline'])
+            except (OSError, ValueError) as e:
+                raise CommandError(f"기준선을 읽을 수 없습니다: {e}")
+
+            rows = compare_reports(baseline, report, tolerance=options['tolerance'])
+            self.stdout.write(format_comparison(rows))
+            regressions = [row for row in rows if row['regression']]
+            if regressions:
+                self.stdout.write(self.style.ERROR(f"❌ 회귀 {len(regressions)}건"))
+                if options['fail_on_regression']:
+                    raise SystemExit(1)
+            else:
+                self.stdout.write(self.style.SUCCESS("✅ 기준선 대비 회귀 없음"))
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/run_fake_servers.py
+"""
+외부 서비스 대역 서버 실행 (playphrase / MyMemory / IMDB, 오프라인 부하 테스트용)
+
+    python manage.py run_fake_servers
+    python manage.py run_fake_servers --latency-ms 300 --jitter-ms 100 --error-rate 0.02 --rate-limit-rate 0.05
+
+- 출력된 환경변수를 지정하고 웹 서버를 실행하면 외부 검색 경로 전체가 대역 서버로 향함
+- Ctrl+C 로 종료
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from phrase.benchmarks.fake_servers import (
+    FakeServiceConfig, start_fake_servers, external_service_settings,
+)
+
+
+class Command(BaseCommand):
+    help = 'playphrase / MyMemory / IMDB 대역 서버를 로컬에서 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--playphrase-port', type=int, default=8101)
+        parser.add_argument('--mymemory-port', type=int, default=8102)
+        parser.add_argument('--imdb-port', type=int, default=8103)
+        parser.add_argument('--latency-ms', type=float, default=50, help='평균 응답 지연 (ms)')
+        parser.add_argument('--jitter-ms', type=float, default=20, help='지연 흔들림 폭 (± ms)')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='500 응답 비율 (0~1)')
+        parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='429 응답 비율 (0~1)')
+        parser.add_argument('--no-result-rate', type=float, default=0.1, help='playphrase 결과 없음 비율')
+        parser.add_argument('--page-kb', type=int, default=200, help='IMDB 페이지 크기 (KB)')
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        config = FakeServiceConfig(
+            latency_ms=options['latency_ms'],
+            jitter_ms=options['jitter_ms'],
+            error_rate=options['error_rate'],
+            rate_limit_rate=options['rate_limit_rate'],
+            no_result_rate=options['no_result_rate'],
+            page_kb=options['page_kb'],
+            seed=options['seed'],
+        )
+        servers = start_fake_servers(
+            host=options['host'],
+            ports={
+                'playphrase': options['playphrase_port'],
+                'mymemory': options['mymemory_port'],
+                'imdb': options['imdb_port'],
+            },
+            config=config,
+        )
+
+        self.stdout.write(self.style.SUCCESS("✅ 대역 서버 실행 중 (Ctrl+C 로 종료)"))
+        self.stdout.write("아래 환경변수로 웹 서버를 실행하세요:")
+        for key, url in external_service_settings(servers).items():
+            self.stdout.write(f"  export {key}={url}")
+
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            for server in servers.values():
+                server.stop()
+            self.stdout.write("🛑 대역 서버 종료")
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/run_load.py
+"""
+운영 검색어 분포 재생 부하 테스트 (실행 중인 서버 대상)
+
+    python manage.py run_load --base-url http://127.0.0.1:8000 --rps 20 --concurrency 8 --duration 60
+    python manage.py run_load --targets api --rps 50 --output logs/load_report.json
+
+- 검색어 분포: UserSearchQuery / RequestTable (이 명령이 연결된 DB 에서 읽음)
+- 외부 서비스까지 포함하려면 대상 서버를 run_fake_servers 대역 서버로 향하게 해서 실행
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phrase.benchmarks.load import QueryMix, LoadGenerator, format_load_report
+
+
+class Command(BaseCommand):
+    help = '운영 검색어 분포를 목표 RPS 로 process_text / /api/search/ 에 재생합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--rps', type=float, default=10, help='목표 초당 요청 수')
+        parser.add_argument('--concurrency', type=int, default=4, help='동시 가상 사용자 수')
+        parser.add_argument('--duration', type=float, default=60, help='실행 시간 (초)')
+        parser.add_argument('--targets', default='web,api', help='web, api 중 쉼표 구분')
+        parser.add_argument('--api-ratio', type=float, default=0.5, help='두 대상일 때 API 비율')
+        parser.add_argument('--sample-size', type=int, default=5000, help='분포에 쓸 검색어 수')
+        parser.add_argument('--with-confirmation', action='store_true',
+                            help='웹 요청에서 입력 확인 단계 건너뛰지 않음')
+        parser.add_argument('--no-forwarded-for', action='store_true',
+                            help='가상 사용자별 X-Forwarded-For 를 보내지 않음')
+        parser.add_argument('--timeout', type=float, default=30)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--output', help='보고서 JSON 저장 경로')
+
+    def handle(self, *args, **options):
+        targets = [target.strip() for target in options['targets'].split(',') if target.strip()]
+        if not targets or set(targets) - {'web', 'api'}:
+            raise CommandError("--targets 는 web, api 중에서 선택하세요.")
+        if options['rps'] <= 0 or options['concurrency'] <= 0:
+            raise CommandError("--rps 와 --concurrency 는 0보다 커야 합니다.")
+
+        mix = QueryMix.from_database(limit=options['sample_size'])
+        if not mix.queries:
+            raise CommandError("재생할 검색어가 없습니다 (UserSearchQuery / RequestTable 비어 있음).")
+        self.stdout.write(f"🎲 검색어 분포: {mix.summary()}")
+
+        generator = LoadGenerator(
+            options['base_url'], mix,
+            rps=options['rps'],
+            concurrency=options['concurrency'],
+            duration=options['duration'],
+            targets=targets,
+            api_ratio=options['api_ratio'],
+            skip_confirmation=not options['with_confirmation'],
+            forwarded_for=not options['no_forwarded_for'],
+            timeout=options['timeout'],
+            seed=options['seed'],
+        )
+        report = generator.run()
+
+        self.stdout.write(format_load_report(report))
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"💾 보고서 저장: {options['output']}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 부하 테스트 완료: {report['total']}건, {report['achieved_rps']} rps, "
+            f"오류율 {report['overall'].get('error_rate', 0):.1%}"
+        ))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# phrase/management/commands/warm_caches.py
+"""
+배포 직후 캐시 예열 명령 (마이그레이션 다음, 트래픽 전환 전에 실행)
+
+    python manage.py warm_caches
+    python manage.py warm_caches --top 200 --no-measure
+
+- 인기 검색어를 실제 검색 경로로 재생해 번역 / DB 검색 / 통계 캐시를 채움
+- 공유 캐시 백엔드(Redis, Memcached 등)일 때만 웹 워커에 효과가 있음
+  (LocMemCache 는 프로세스별 → gunicorn.conf.py 의 워커 시작 예열 사용)
+"""
+from django.core.management.base import BaseCommand
+
+from phrase.utils.warmup import warm_caches, is_shared_cache
+
+
+class Command(BaseCommand):
+    help = '인기 검색어를 재생해 배포 직후 캐시를 예열합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=None,
+                            help='재생할 인기 검색어 수 (기본: WARMUP_SETTINGS.TOP_N)')
+        parser.add_argument('--max-seconds', type=float, default=None,
+                            help='예열 시간 상한 (초)')
+        parser.add_argument('--no-measure', action='store_true',
+                            help='예열 후 지연 측정(2회차 재생) 생략')
+
+    def handle(self, *args, **options):
+        if not is_shared_cache():
+            self.stdout.write(self.style.WARNING(
+                "⚠️ 프로세스별 캐시 백엔드입니다. 이 명령으로 채운 캐시는 웹 워커와 공유되지 않습니다."
+            ))
+
+        report = warm_caches(
+            top_n=options['top'],
+            include_process_indexes=False,
+            max_seconds=options['max_seconds'],
+            measure=not options['no_measure'],
+        )
+
+        for stage, elapsed in report['stages'].items():
+            self.stdout.write(f"  {stage}: {elapsed}ms")
+        if report['skipped']:
+            self.stdout.write(self.style.WARNING(f"⏱️ 시간 상한으로 생략: {', '.join(report['skipped'])}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ 캐시 예열 완료: 검색어 {report['replayed']}개, 총 {report['total_ms']}ms "
+            f"(예열 전 p95 {report['cold_p95_ms']}ms → 예열 후 p95 {report.get('warm_p95_ms')}ms)"
+        ))
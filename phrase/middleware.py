@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/middleware.py
+"""
+요청 단계 시간 측정 / 쿼리 예산 / 쿼리 표본 미들웨어
+- 요청마다 측정 컨텍스트(phrase.utils.metrics.RequestTiming)를 열어 span() 기록을 모음
+- 요청 처리 시간 히스토그램 (view / method / status 레이블, view 는 URL 이름)
+- Server-Timing 헤더로 단계별 시간 노출 (브라우저 개발자 도구 / 부하 테스트에서 확인)
+- MIDDLEWARE 맨 앞에 두어 압축·세션 등 다른 미들웨어 시간까지 포함
+- QueryBudgetMiddleware: 개발 모드에서 요청별 SQL 수 / N+1 검사 (phrase.utils.query_budget)
+- QuerySamplingMiddleware: 일부 요청의 SQL 지문별 수 / 시간 누적 (manage.py index_advice)
+- 모두 sync / async 겸용 (ASGI 에서 비동기 뷰 앞에 두어도 요청마다 스레드 전환 없음)
+  · 쿼리 예산 / 표본은 동기 요청만 (비동기 뷰의 쿼리는 run_sync 스레드 풀 연결에서 실행)
+"""
+import time
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from phrase.utils.metrics import (
+    REQUEST_DURATION, begin_request, end_request, current_timing, get_metrics_settings,
+)
+from phrase.utils.query_budget import (
+    QueryRecorder, QueryBudgetExceeded, get_endpoint_budget, get_query_budget_settings,
+)
+from phrase.utils.query_sampling import QuerySampler, should_sample
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        metrics_settings = get_metrics_settings()
+        self.enabled = metrics_settings['ENABLED']
+        self.server_timing = metrics_settings['SERVER_TIMING_HEADER']
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # 동기 process_view 는 ASGI 에서 sync 스레드로 넘어가므로 코루틴으로 교체
+            self.process_view = self.aprocess_view
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+
+        timing, token = begin_request()
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = self.get_response(request)
+            status = response.status_code
+        finally:
+            elapsed = self._finish(request, timing, token, start, status)
+        return self._add_server_timing(response, timing, elapsed)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+
+        timing, token = begin_request()
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await self.get_response(request)
+            status = response.status_code
+        finally:
+            elapsed = self._finish(request, timing, token, start, status)
+        return self._add_server_timing(response, timing, elapsed)
+
+    def _finish(self, request, timing, token, start, status):
+        elapsed = time.perf_counter() - start
+        end_request(token)
+        REQUEST_DURATION.observe(elapsed, view=timing.view, method=request.method, status=status)
+        return elapsed
+
+    def _add_server_timing(self, response, timing, elapsed):
+        if self.server_timing and timing.stages and not response.has_header('Server-Timing'):
+            response['Server-Timing'] = f"{timing.server_timing()}, total;dur={elapsed * 1000:.1f}"
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timing = current_timing()
+        if timing is not None and request.resolver_match is not None:
+            # URL 이름 (레이블 수를 URL 패턴 수로 제한)
+            timing.view = request.resolver_match.view_name or request.resolver_match.url_name or 'unnamed'
+        return None
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        return StageTimingMiddleware.process_view(self, request, view_func, view_args, view_kwargs)
+
+
+class QueryBudgetMiddleware:
+    """
+    요청별 쿼리 수 / 반복 지문 검사 (QUERY_BUDGET_SETTINGS.ENABLED, 기본 DEBUG 일 때만)
+    - 예산은 URL 이름으로 ENDPOINT_QUERY_BUDGETS 에서 조회
+    - X-Query-Count 헤더, 초과 시 경고 로그 (RAISE=True 면 QueryBudgetExceeded)
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        budget_settings = get_query_budget_settings()
+        self.enabled = budget_settings['ENABLED']
+        self.raise_on_violation = budget_settings['RAISE']
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if not self.enabled or iscoroutinefunction(self):
+            return self.get_response(request)
+
+        with QueryRecorder() as recorder:
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        url_name = match.view_name if match is not None else None
+        response['X-Query-Count'] = str(recorder.count)
+
+        if url_name is None:
+            return response
+        budget = get_endpoint_budget(url_name)
+        if budget is None:
+            logger.warning(f"⚠️ [QueryBudget] 예산 미선언 엔드포인트: {url_name} ({recorder.count}개 쿼리)")
+            return response
+
+        problems = recorder.violations(budget)
+        if problems:
+            message = f"{url_name} {request.method} {request.path}: " + ' / '.join(problems)
+            if self.raise_on_violation:
+                raise QueryBudgetExceeded(message)
+            logger.warning(f"🐢 [QueryBudget] {message}")
+        return response
+
+
+class QuerySamplingMiddleware:
+    """SAMPLE_RATE 비율의 요청에서 실행된 SQL 을 지문별로 누적 (QUERY_SAMPLING_SETTINGS)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self) or not should_sample():
+            return self.get_response(request)
+        with QuerySampler():
+            return self.get_response(request)
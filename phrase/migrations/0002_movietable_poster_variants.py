@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movietable',
+            name='poster_variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='포스터 변환본'),
+        ),
+    ]
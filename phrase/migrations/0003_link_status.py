@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phrase', '0002_movietable_poster_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movietable',
+            name='poster_url_status',
+            field=models.CharField(choices=[('unchecked', '미확인'), ('alive', '정상'), ('dead', '끊김'), ('error', '확인 실패')], default='unchecked', max_length=20, verbose_name='포스터 URL 상태'),
+        ),
+        migrations.AddField(
+            model_name='movietable',
+            name='poster_url_checked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='포스터 URL 확인 시각'),
+        ),
+        migrations.AddField(
+            model_name='dialoguetable',
+            name='video_url_status',
+            field=models.CharField(choices=[('unchecked', '미확인'), ('alive', '정상'), ('dead', '끊김'), ('error', '확인 실패')], default='unchecked', max_length=20, verbose_name='비디오 URL 상태'),
+        ),
+        migrations.AddField(
+            model_name='dialoguetable',
+            name='video_url_checked_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='비디오 URL 확인 시각'),
+        ),
+        migrations.AddIndex(
+            model_name='dialoguetable',
+            index=models.Index(fields=['video_url_status'], name='dialogue_video_status_idx'),
+        ),
+    ]
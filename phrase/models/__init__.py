@@ -53,7 +53,7 @@ from . import signals
 # 로깅
 import logging
 logger = logging.getLogger(__name__)
-logger.info("MySQL 호환성 개선된 모델 모듈 로드 완료")
+logger.debug("MySQL 호환성 개선된 모델 모듈 로드 완료")
 
 __all__ = [
     # 추상 모델
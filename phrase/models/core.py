@@ -19,6 +19,14 @@ from .utils import get_poster_upload_path, get_video_upload_path
 
 logger = logging.getLogger(__name__)
 
+# 저장된 URL(poster_url, video_url) 링크 검사 상태 (phrase.utils.link_checker)
+LINK_STATUS_CHOICES = [
+    ('unchecked', '미확인'),
+    ('alive', '정상'),
+    ('dead', '끊김'),
+    ('error', '확인 실패'),
+]
+
 class RequestTable(BaseModel):
     """요청테이블 - MySQL 인덱스 키 길이 문제 해결"""
     # MySQL utf8mb4에서 안전한 최대 길이로 수정 (191자 = 764바이트)
@@ -230,6 +238,21 @@ class MovieTable(BaseModel):
         verbose_name="포스터 경로"
     )
     
+    poster_url_status = models.CharField(
+        max_length=20,
+        choices=LINK_STATUS_CHOICES,
+        default='unchecked',
+        verbose_name="포스터 URL 상태"
+    )
+    poster_url_checked_at = models.DateTimeField(null=True, blank=True, verbose_name="포스터 URL 확인 시각")
+    
+    # 포스터 변환본 경로 {'thumb': {'jpeg': ..., 'webp': ...}, 'card': {...}}
+    poster_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="포스터 변환본"
+    )
+    
     data_quality = models.CharField(
         max_length=20,
         choices=[
@@ -316,6 +339,14 @@ class MovieTable(BaseModel):
         if full_original and full_original != full_title:
             return f"{full_title} ({full_original})"
         return full_title
+    
+    def get_poster_variant_path(self, size='card', image_format='webp'):
+        """포스터 변환본 저장 경로 (없으면 빈 문자열, 'source' 같은 문자열 항목은 무시)"""
+        variants = self.poster_variants if isinstance(self.poster_variants, dict) else {}
+        entry = variants.get(size)
+        if not isinstance(entry, dict):
+            return ''
+        return entry.get(image_format) or ''
 
 
 class DialogueTable(BaseModel):
@@ -357,6 +388,13 @@ class DialogueTable(BaseModel):
     duration_seconds = models.PositiveIntegerField(null=True, blank=True, verbose_name="길이(초)")
     
     video_url = SecureURLField(max_length=191, verbose_name="비디오 URL")  # 500 -> 191
+    video_url_status = models.CharField(
+        max_length=20,
+        choices=LINK_STATUS_CHOICES,
+        default='unchecked',
+        verbose_name="비디오 URL 상태"
+    )
+    video_url_checked_at = models.DateTimeField(null=True, blank=True, verbose_name="비디오 URL 확인 시각")
     
     video_file = models.FileField(
         upload_to=get_video_upload_path,
@@ -445,6 +483,7 @@ class DialogueTable(BaseModel):
             models.Index(fields=['translation_method'], name='dialogue_method_idx'),
             models.Index(fields=['play_count'], name='dialogue_play_count_idx'),
             models.Index(fields=['dialogue_hash'], name='dialogue_hash_idx'),
+            models.Index(fields=['video_url_status'], name='dialogue_video_status_idx'),
         ]
 
     def __str__(self):
@@ -16,8 +16,10 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender='phrase.RequestTable')
 def invalidate_request_cache(sender, instance, **kwargs):
     """요청 테이블 변경 시 관련 캐시 무효화"""
+    from phrase.utils.result_records import search_result_cache_key
+    
     cache_keys = [
-        f"search_result_{hash(instance.request_phrase)}",
+        search_result_cache_key(instance.request_phrase),
         f"search_results_{hash(f'{instance.request_phrase}_{instance.request_korean}')}",
         'request_statistics',
     ]
@@ -31,7 +33,7 @@ def invalidate_request_cache(sender, instance, **kwargs):
 def invalidate_dialogue_cache(sender, instance, **kwargs):
     """대사 테이블 변경 시 관련 캐시 무효화"""
     cache_keys = [
-        f"movie_dialogues_{instance.movie.id}",
+        f"movie_dialogues_{instance.movie_id}",
         f"dialogue_translation_{hash(instance.dialogue_phrase)}",
         'dialogue_statistics',
     ]
@@ -71,4 +73,4 @@ def cleanup_dialogue_files(sender, instance, **kwargs):
             logger.error(f"비디오 파일 삭제 실패: {e}")
 
 # 최종 설정
-logger.info("신호 처리기 등록 완료")
\ No newline at end of file
+logger.debug("신호 처리기 등록 완료")
\ No newline at end of file
@@ -1,3 +1,597 @@
-from django.test import TestCase
+import os
+import sys
+import json
+import logging
+import tempfile
+import subprocess
+from pathlib import Path
+from collections import Counter
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.utils import clean_data
+from phrase.utils.autocomplete import AutocompleteIndex, PrefixIndex
+from phrase.utils.data_processing import get_existing_results_from_db
+from phrase.utils.event_log import EventLogger, QueueingHandler
+from phrase.utils.index_advisor import candidate_columns, parse_query_shape
+from phrase.utils.metrics import LOG_RECORDS_DROPPED
+from phrase.utils import get_imdb_poster_url, poster_backfill
+from phrase.utils.get_imdb_poster_url import (
+    IMDBPosterExtractor, _HeadMetaParser, benchmark_poster_extraction, load_html_fixtures, scan_html_head,
+)
+from phrase.utils.poster_backfill import HostRateLimiter, get_shared_rate_limiter
+from phrase.utils.query_sampling import (
+    PARAM_PLACEHOLDERS, fingerprint_stats, query_registry, record_query, reset_query_samples,
+)
+from phrase.utils import similar_search
+from phrase.utils.similar_search import SimilarSearchIndex, TrigramIndex
+from phrase.utils.spelling import SpellingIndex
+from phrase.utils.streaming_download import StreamedDownloadFile
+from phrase.utils.query_budget import (
+    ENDPOINT_QUERY_BUDGETS, QueryBudgetExceeded, QueryRecorder, assert_query_budget, fingerprint,
+)
+
+
+def _url_names(patterns, namespace=''):
+    """URL 패턴 트리의 (네임스페이스 포함) 이름 목록"""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name == 'admin':
+                continue
+            child = f"{namespace}{pattern.namespace}:" if pattern.namespace else namespace
+            yield from _url_names(pattern.url_patterns, child)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield f"{namespace}{pattern.name}"
+
+
+def create_movies(movie_count=3, dialogues_per_movie=4, phrase='I will be back'):
+    """검색용 영화 / 대사 픽스처"""
+    for movie_index in range(movie_count):
+        movie = MovieTable.objects.create(
+            movie_title=f"Movie {movie_index}", release_year='2000', director=f"Director {movie_index}",
+        )
+        DialogueTable.objects.bulk_create([
+            DialogueTable(
+                movie=movie,
+                dialogue_phrase=f"{phrase} {movie_index}-{index}",
+                dialogue_phrase_ko=f"돌아올게 {movie_index}-{index}",
+                dialogue_start_time=f"00:00:{index:02d}",
+                dialogue_hash=f"fixture-{movie_index}-{index}",
+            )
+            for index in range(dialogues_per_movie)
+        ])
+
+
+class FingerprintTests(TestCase):
+
+    def test_literals_and_in_lists_are_normalized(self):
+        first = fingerprint("SELECT * FROM movie_table WHERE id = 12 AND title = 'Heat'")
+        second = fingerprint("SELECT *  FROM movie_table WHERE id = 7 AND title = 'It''s'")
+        self.assertEqual(first, second)
+        self.assertEqual(
+            fingerprint('SELECT * FROM dialogue_table WHERE id IN (%s, %s, %s)'),
+            fingerprint('SELECT * FROM dialogue_table WHERE id IN (%s)'),
+        )
+
+
+class QueryBudgetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_movies()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_repeated_lookups_are_reported_as_n_plus_one(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            with assert_query_budget(100, threshold=3):
+                for dialogue in DialogueTable.objects.all():
+                    MovieTable.objects.get(pk=dialogue.movie_id)
+
+    def test_select_related_stays_within_budget(self):
+        with assert_query_budget(1):
+            titles = [dialogue.movie.movie_title for dialogue in DialogueTable.objects.select_related('movie')]
+        self.assertEqual(len(titles), 12)
+
+    def test_db_search_query_count_does_not_grow_with_results(self):
+        with QueryRecorder() as recorder:
+            results = get_existing_results_from_db('will be back')
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sum(len(movie.dialogues) for movie in results), 12)
+        self.assertLessEqual(recorder.count, 3)
+        self.assertEqual(recorder.repeated(threshold=2), [])
+
+    def test_every_endpoint_declares_a_budget(self):
+        names = set(_url_names(get_resolver().url_patterns))
+        self.assertTrue(names)
+        self.assertEqual(sorted(names - set(ENDPOINT_QUERY_BUDGETS)), [])
+
+
+class QuerySamplingTests(SimpleTestCase):
+
+    def setUp(self):
+        reset_query_samples()
+        self.addCleanup(reset_query_samples)
+
+    def test_examples_store_parameter_types_not_values(self):
+        record_query(
+            'SELECT * FROM django_session WHERE session_key = %s AND expire_date > %s',
+            ['secret-session-key', PARAM_PLACEHOLDERS['datetime'].replace(year=2030)], 0.001,
+        )
+        self.assertFalse(any('secret-session-key' in key for key in query_registry.store.snapshot()))
+
+        entry = fingerprint_stats()[0]
+        self.assertEqual(entry['calls'], 1)
+        self.assertEqual(entry['examples'][0][1], ['a', PARAM_PLACEHOLDERS['datetime']])
+
+
+class IndexAdvisorTests(TestCase):
+
+    def test_equality_then_order_columns(self):
+        shape = parse_query_shape(
+            'SELECT "dialogue_table"."id", "dialogue_table"."movie_id" FROM "dialogue_table" '
+            'WHERE ("dialogue_table"."is_active" AND "dialogue_table"."movie_id" = %s) '
+            'ORDER BY "dialogue_table"."dialogue_start_time" ASC'
+        )
+        self.assertEqual(shape['equality'], ['is_active', 'movie_id'])
+        self.assertEqual(candidate_columns(shape), (['is_active', 'movie_id', 'dialogue_start_time'], True))
+
+    def test_count_with_range_is_covering(self):
+        shape = parse_query_shape(
+            'SELECT COUNT(*) AS `__count` FROM `user_search_query` '
+            'WHERE (`user_search_query`.`has_results` = %s AND `user_search_query`.`search_count` >= %s)'
+        )
+        self.assertEqual(candidate_columns(shape), (['has_results', 'search_count'], True))
+
+    def test_contains_search_is_not_indexable(self):
+        shape = parse_query_shape(
+            'SELECT "dialogue_table"."id" FROM "dialogue_table" '
+            'WHERE "dialogue_table"."dialogue_phrase" LIKE %s ESCAPE \'\\\''
+        )
+        self.assertEqual(candidate_columns(shape), ([], False))
+
+
+@override_settings(POSTER_BACKFILL_SETTINGS={'REQUESTS_PER_SECOND': 2.0, 'PER_HOST_RATES': {'www.imdb.com': 2.0}})
+class HostRateLimiterTests(SimpleTestCase):
+
+    def test_settings_rates_apply_without_override(self):
+        limiter = HostRateLimiter()
+        self.assertEqual(limiter.get_rate('www.imdb.com'), 2.0)
+        self.assertEqual(limiter.get_rate('example.com'), 2.0)
+
+    def test_explicit_rps_overrides_settings_host_rates(self):
+        limiter = HostRateLimiter(requests_per_second=5.0)
+        self.assertEqual(limiter.get_rate('www.imdb.com'), 5.0)
+
+    def test_explicit_host_rate_wins(self):
+        limiter = HostRateLimiter(requests_per_second=5.0, per_host_rates={'WWW.IMDB.COM': 1.0})
+        self.assertEqual(limiter.get_rate('www.imdb.com'), 1.0)
+        self.assertEqual(limiter.get_rate('m.media-amazon.com'), 5.0)
+
+    def test_request_path_and_backfill_share_one_limiter(self):
+        limiters = []
+
+        def fake_extractor(rate_limiter=None):
+            limiters.append(rate_limiter)
+            return mock.Mock(extract_poster_url=mock.Mock(return_value=None))
+
+        with mock.patch.object(poster_backfill, 'get_thread_extractor', side_effect=fake_extractor):
+            for _ in range(2):
+                get_imdb_poster_url.ensure_movie_posters([{'imdb_url': 'https://www.imdb.com/title/tt1/'}])
+
+        self.assertEqual(len(limiters), 2)
+        self.assertIs(limiters[0], get_shared_rate_limiter())
+        self.assertIs(limiters[1], get_shared_rate_limiter())
+        self.assertIs(poster_backfill.PosterBackfill().rate_limiter, get_shared_rate_limiter())
+
+
+class SpellingIndexTests(SimpleTestCase):
+
+    def setUp(self):
+        self.index = SpellingIndex.build(Counter({
+            'you': 50, 'hello': 40, 'can': 30, 'world': 20, 'beautiful': 10, 'remember': 10,
+        }))
+
+    def test_short_valid_words_are_not_rewritten(self):
+        self.assertEqual(self.index.correct_phrase('zoo'), 'zoo')
+        self.assertEqual(self.index.correct_phrase('help'), 'help')
+        self.assertEqual(self.index.correct_phrase('cat'), 'cat')
+
+    def test_distance_scales_with_word_length(self):
+        self.assertEqual(self.index.correct_phrase('helo'), 'helo')
+        self.assertEqual(self.index.correct_phrase('hallo wordl'), 'hello world')
+        self.assertEqual(self.index.correct_phrase('hxllx'), 'hxllx')
+        self.assertEqual(self.index.correct_phrase('beutifull'), 'beautiful')
+
+
+class CachedImdbInfoTests(SimpleTestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+        cache.clear()
+
+    def _downloaded(self, name='heat.jpg'):
+        downloaded = StreamedDownloadFile(name, os.path.join(self.media_root.name, 'tmp'))
+        downloaded.write_chunk(b'poster-bytes')
+        downloaded.file.flush()
+        downloaded.seek(0)
+        return downloaded
+
+    def test_poster_is_stored_and_only_its_name_is_cached(self):
+        downloaded = self._downloaded()
+        with mock.patch.object(clean_data, 'get_poster_url', return_value='https://img/heat.jpg'), \
+                mock.patch.object(clean_data, 'download_poster_image', return_value=downloaded):
+            info = clean_data.get_cached_imdb_info('Heat', 1995)
+
+        self.assertEqual(info['poster_url'], 'https://img/heat.jpg')
+        self.assertIsInstance(info['poster_image_path'], str)
+        self.assertTrue(info['poster_image_path'].startswith('posters/'))
+        with default_storage.open(info['poster_image_path']) as stored:
+            self.assertEqual(stored.read(), b'poster-bytes')
+        self.assertTrue(downloaded.closed)
+        self.assertEqual(cache.get('imdb_Heat_1995'), info)
+
+    def test_storage_failure_keeps_poster_url_and_closes_temp_file(self):
+        downloaded = self._downloaded()
+        temp_path = downloaded.temporary_file_path()
+        with mock.patch.object(clean_data, 'get_poster_url', return_value='https://img/heat.jpg'), \
+                mock.patch.object(clean_data, 'download_poster_image', return_value=downloaded), \
+                mock.patch.object(clean_data.default_storage, 'save', side_effect=OSError('disk full')):
+            info = clean_data.get_cached_imdb_info('Heat', 1995)
+
+        self.assertEqual(info, {'poster_url': 'https://img/heat.jpg'})
+        self.assertTrue(downloaded.closed)
+        self.assertFalse(os.path.exists(temp_path))
+
+
+class UpdateMoviePosterTests(TestCase):
+
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        media_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def test_poster_image_path_is_the_name_storage_returned(self):
+        movie = MovieTable.objects.create(
+            movie_title='Heat', release_year='1995', imdb_url='https://www.imdb.com/title/tt0113277/',
+        )
+        downloaded = StreamedDownloadFile('heat.jpg', os.path.join(self.media_root.name, 'tmp'))
+        downloaded.write_chunk(b'poster-bytes')
+        downloaded.seek(0)
+        extractor = mock.Mock(rate_limiter=None, extract_poster_url=mock.Mock(return_value='https://img/heat.jpg'))
+
+        with mock.patch.object(get_imdb_poster_url, 'download_poster_image', return_value=downloaded), \
+                mock.patch.object(get_imdb_poster_url, 'generate_poster_variants_on_ingest'):
+            self.assertTrue(get_imdb_poster_url.update_movie_poster(movie, extractor))
+
+        movie.refresh_from_db()
+        self.assertNotEqual(movie.poster_image_path, 'posters/heat.jpg')
+        self.assertEqual(movie.poster_image_path, movie.poster_image.name)
+        self.assertTrue(default_storage.exists(movie.poster_image_path))
+        self.assertTrue(downloaded.closed)
+
+
+IMDB_PAGE_FIXTURES = Path(__file__).resolve().parent / 'benchmarks' / 'imdb_pages'
+IMDB_BASE_URL = 'https://www.imdb.com/'
+
+
+class HeadScanTests(SimpleTestCase):
+
+    def test_meta_parser_keeps_first_value_and_lowercases_keys(self):
+        parser = _HeadMetaParser()
+        parser.feed(
+            '<meta property="OG:Image" content="https://img/a.jpg">'
+            '<meta property="og:image" content="https://img/b.jpg">'
+            '<meta name="twitter:image" content="">'
+            '<meta charset="utf-8">'
+        )
+        self.assertEqual(parser.meta, {'og:image': 'https://img/a.jpg'})
+
+    def test_meta_parser_collects_only_json_ld_scripts_across_chunks(self):
+        parser = _HeadMetaParser()
+        parser.feed('<script>var image = "https://img/js.jpg";</script><script type="Application/LD+JSON">{"name":')
+        parser.feed(' "Heat"}</script>')
+        self.assertEqual(parser.json_ld, ['{"name": "Heat"}'])
+
+    def test_json_ld_image_comes_before_og_and_twitter(self):
+        html = (
+            '<head><meta name="twitter:image" content="https://img/tw.jpg">'
+            '<meta property="og:image" content="https://img/og.jpg">'
+            '<script type="application/ld+json">[{"name": "Heat &amp; Dust", "image": [{"url": "https://img/ld.jpg"}]}]'
+            '</script></head>'
+        )
+        scanned = scan_html_head(html)
+        self.assertEqual(scanned['images'], ['https://img/ld.jpg', 'https://img/og.jpg', 'https://img/tw.jpg'])
+        self.assertEqual(scanned['titles'], ['Heat & Dust'])
+
+    def test_scan_stops_at_body_and_skips_broken_json_ld(self):
+        html = (
+            '<head><script type="application/ld+json">{broken</script></head>'
+            '<body><meta property="og:image" content="https://img/body.jpg"></body>'
+        )
+        self.assertEqual(scan_html_head(html), {'images': [], 'titles': []})
+
+    def test_scan_respects_limit(self):
+        html = '<head>' + ' ' * 100 + '<meta property="og:image" content="https://img/late.jpg"></head>'
+        self.assertEqual(scan_html_head(html, limit=50)['images'], [])
+        self.assertEqual(scan_html_head(html)['images'], ['https://img/late.jpg'])
+
+
+class PosterExtractionFixtureTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pages, cls.expected = load_html_fixtures(IMDB_PAGE_FIXTURES)
+        cls.extractor = IMDBPosterExtractor()
+
+    def extract(self, name):
+        poster_url = self.extractor._parse_poster_from_html(self.pages[name], IMDB_BASE_URL)
+        return self.extractor._normalize_poster_url(poster_url) if poster_url else None
+
+    def test_fixtures_match_expected_posters(self):
+        self.assertEqual(
+            set(self.pages), {'og_image.html', 'json_ld_only.html', 'body_poster_only.html', 'no_poster.html'},
+        )
+        for name, poster_url in self.expected.items():
+            with self.subTest(page=name):
+                self.assertEqual(self.extract(name), poster_url)
+
+    def test_head_pages_skip_full_parse(self):
+        for name in ('og_image.html', 'json_ld_only.html'):
+            with self.subTest(page=name), \
+                    mock.patch.object(self.extractor, '_parse_poster_from_tree') as full_parse:
+                self.assertEqual(self.extract(name), self.expected[name])
+                full_parse.assert_not_called()
+
+    def test_falls_back_to_full_parse_without_head_poster(self):
+        with mock.patch.object(
+            self.extractor, '_parse_poster_from_tree', wraps=self.extractor._parse_poster_from_tree,
+        ) as full_parse:
+            self.assertEqual(self.extract('body_poster_only.html'), self.expected['body_poster_only.html'])
+            self.assertIsNone(self.extract('no_poster.html'))
+        self.assertEqual(full_parse.call_count, 2)
+
+    def test_benchmark_reports_rate_and_accuracy(self):
+        results = benchmark_poster_extraction(self.pages, self.expected, repeat=1)
+        self.assertEqual(results['fast_path']['accuracy'], 1.0)
+        self.assertEqual(results['full_tree']['accuracy'], 1.0)
+        self.assertEqual(results['fast_path']['head_hits'], 2)
+        self.assertGreater(results['fast_path']['pages_per_second'], 0)
+
+
+class PrefixIndexTests(SimpleTestCase):
+
+    def setUp(self):
+        weighted = {
+            f"i will {word}": (f"I will {word}", weight, 'request')
+            for word, weight in (('be back', 50.0), ('find you', 30.0), ('kill you', 10.0), ('go', 5.0))
+        }
+        weighted['in time'] = ('In time', 80.0, 'dialogue')
+        self.index = PrefixIndex(weighted, precompute_length=3, top_k=2)
+
+    def texts(self, prefix, limit):
+        return [entry[0] for entry in self.index.search(prefix, limit)]
+
+    def test_precomputed_prefix_is_ranked_by_weight(self):
+        self.assertEqual(self.texts('i', 2), ['In time', 'I will be back'])
+        self.assertEqual(self.texts('i w', 1), ['I will be back'])
+
+    def test_range_scan_matches_precomputed_ranking(self):
+        # limit > top_k → bisect 범위 탐색 경로
+        self.assertEqual(self.texts('i', 5), ['In time', 'I will be back', 'I will find you', 'I will kill you', 'I will go'])
+        self.assertEqual(self.texts('i will k', 5), ['I will kill you'])
+        self.assertEqual(self.texts('x', 5), [])
+        self.assertEqual(self.texts('', 5), [])
+
+
+@override_settings(AUTOCOMPLETE_SETTINGS={'MIN_NGRAM_COUNT': 1, 'NGRAM_SIZES': (2,)})
+class AutocompleteIndexTests(TestCase):
+
+    def test_fallback_before_first_build(self):
+        RequestTable.objects.create(request_phrase='hasta la vista', search_count=7, result_count=2)
+        RequestTable.objects.create(request_phrase='hasta manana', search_count=9, result_count=0)
+        index = AutocompleteIndex()
+        self.assertFalse(index.ready)
+        with self.assertNumQueries(1):
+            suggestions = index.suggest('hasta', 'en')
+        self.assertEqual(suggestions, [{'text': 'hasta la vista', 'weight': 7.0, 'source': 'request'}])
+
+    def test_refresh_drops_ngrams_of_edited_and_deactivated_dialogues(self):
+        create_movies(movie_count=1, dialogues_per_movie=2, phrase='winter is coming')
+        edited, deactivated = DialogueTable.objects.order_by('id')
+        index = AutocompleteIndex()
+        index.refresh()
+        self.assertTrue(index.ready)
+        self.assertEqual(index.suggest('winter', 'en')[0]['text'], 'winter is')
+
+        edited.dialogue_phrase = 'summer is here'
+        edited.save()
+        deactivated.soft_delete()
+        index.refresh()
+
+        self.assertEqual(index.suggest('winter', 'en'), [])
+        self.assertEqual(index.suggest('summer', 'en')[0]['text'], 'summer is')
+
+    def test_deactivated_request_is_removed_on_refresh(self):
+        request = RequestTable.objects.create(request_phrase='make my day', search_count=3, result_count=1)
+        index = AutocompleteIndex()
+        index.refresh()
+        self.assertEqual(index.suggest('make', 'en')[0]['source'], 'request')
+
+        request.soft_delete()
+        index.refresh()
+        self.assertEqual(index.suggest('make', 'en'), [])
+
+
+class TrigramIndexTests(SimpleTestCase):
+
+    def search(self, documents, query, **kwargs):
+        return [(score, text) for score, text, _ in TrigramIndex(documents).search(query, **kwargs)]
+
+    def test_jaccard_and_cosine_scores(self):
+        documents = {'cat': (1, 1), 'cats': (1, 1)}
+        # 'cat' 4 trigram, 'cats' 5 trigram, 공통 3
+        self.assertEqual(self.search(documents, 'Cat', min_score=0), [(1.0, 'cat'), (0.5, 'cats')])
+        self.assertEqual(
+            self.search(documents, 'cat', metric='cosine', min_score=0), [(1.0, 'cat'), (0.6708, 'cats')],
+        )
+
+    def test_min_score_and_exclusion(self):
+        documents = {'cat': (1, 1), 'cats': (1, 1), 'dog': (1, 1)}
+        self.assertEqual(self.search(documents, 'cat', min_score=0.6), [(1.0, 'cat')])
+        self.assertEqual(self.search(documents, 'cat', exclude=('CAT!',)), [(0.5, 'cats')])
+
+    def test_equal_scores_prefer_more_searched(self):
+        documents = {'cats': (3, 1), 'cato': (9, 1)}
+        self.assertEqual([text for _, text in self.search(documents, 'cat', min_score=0)], ['cato', 'cats'])
+
+    def test_max_postings_counts_rarest_trigrams_first(self):
+        documents = {'ab': (1, 1)}
+        documents.update({f"a{first}{second}": (1, 1) for first in 'cdefg' for second in 'hijklmnopq'})
+
+        # '  a' 는 51개 문서 공통 → 상한 2 면 드문 ' ab' / 'ab ' 만 집계
+        self.assertEqual(self.search(documents, 'ab', min_score=0, max_postings=2), [(0.5, 'ab')])
+        full = self.search(documents, 'ab', limit=3, min_score=0)
+        self.assertEqual(full[0], (1.0, 'ab'))
+        self.assertEqual(len(full), 3)
+        # 가장 드문 목록 하나는 상한과 무관하게 집계 (공통 1개 → 1 / (3 + 3 - 1))
+        self.assertEqual(self.search(documents, 'ab', min_score=0, max_postings=0), [(0.2, 'ab')])
+
+
+class SimilarSearchIndexTests(TestCase):
+
+    def similar_texts(self, index, query='hasta la vista'):
+        return [suggestion['text'] for suggestion in index.similar(query, exclude=('unrelated',))]
+
+    def test_refresh_reads_rows_saved_at_the_watermark(self):
+        first = RequestTable.objects.create(request_phrase='hasta la vista baby', search_count=2, result_count=1)
+        index = SimilarSearchIndex()
+        index.refresh()
+
+        second = RequestTable.objects.create(request_phrase='hasta la vista amigo', search_count=5, result_count=1)
+        RequestTable.objects.filter(pk=second.pk).update(updated_at=first.updated_at)
+        self.assertEqual(index.refresh(), 1)
+        self.assertEqual(sorted(self.similar_texts(index)), ['hasta la vista amigo', 'hasta la vista baby'])
+        # 워터마크 행을 다시 읽어도 값이 같으면 재생성하지 않음
+        self.assertEqual(index.refresh(), 0)
+
+    def test_refresh_drops_deleted_and_deactivated_rows(self):
+        deleted = RequestTable.objects.create(request_phrase='hasta la vista baby', search_count=2, result_count=1)
+        deactivated = RequestTable.objects.create(request_phrase='hasta la vista amigo', search_count=2, result_count=1)
+        index = SimilarSearchIndex()
+        index.refresh()
+        self.assertEqual(len(index.index), 2)
+
+        RequestTable.objects.filter(pk=deleted.pk).delete()
+        deactivated.soft_delete()
+        self.assertEqual(index.refresh(), 2)
+        self.assertEqual(self.similar_texts(index), [])
+
+    def test_same_normalized_phrase_is_indexed_once(self):
+        RequestTable.objects.create(request_phrase='Hasta la vista, baby!', search_count=8, result_count=1)
+        RequestTable.objects.create(request_phrase='hasta la vista baby', search_count=3, result_count=1)
+        index = SimilarSearchIndex()
+        index.refresh()
+        self.assertEqual(index.index.phrases, ['Hasta la vista, baby!'])
+
+    def test_getter_does_not_build_on_the_request_thread(self):
+        with mock.patch.object(similar_search, '_index', None), \
+                mock.patch.object(SimilarSearchIndex, 'refresh') as refresh, \
+                mock.patch.object(SimilarSearchIndex, 'refresh_in_background_if_stale') as background_refresh:
+            index = similar_search.get_similar_search_index()
+        refresh.assert_not_called()
+        background_refresh.assert_called_once()
+        self.assertFalse(index.ready)
+        self.assertEqual(index.similar('hasta la vista'), [])
+
+
+class MetricsViewTests(TestCase):
+
+    def get(self, **extra):
+        return self.client.get(reverse('phrase:metrics'), **extra)
+
+    def test_allowed_ip_without_token(self):
+        self.assertEqual(self.get(REMOTE_ADDR='127.0.0.1').status_code, 200)
+        self.assertEqual(self.get(REMOTE_ADDR='203.0.113.7').status_code, 403)
+
+    @override_settings(METRICS_SETTINGS={'TOKEN': 's3cret'})
+    def test_token_replaces_ip_allowlist(self):
+        # 리버스 프록시 뒤에서는 모든 요청이 127.0.0.1
+        self.assertEqual(self.get(REMOTE_ADDR='127.0.0.1').status_code, 403)
+        self.assertEqual(self.get(REMOTE_ADDR='127.0.0.1', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self.get(HTTP_AUTHORIZATION='Bearer s3cret').status_code, 200)
+
+
+class EventLogTests(SimpleTestCase):
+
+    def test_disabled_level_does_not_evaluate_fields(self):
+        event_logger = EventLogger('test_disabled', 'WARNING')
+        calls = []
+        event_logger.debug('skipped', value=lambda: calls.append(1))
+        self.assertEqual(calls, [])
+
+    def test_sampling_skips_debug_but_keeps_warnings(self):
+        event_logger = EventLogger('test_sampled', 'DEBUG', sample_rate=0.0)
+        with self.assertLogs(event_logger.logger, 'DEBUG') as captured:
+            event_logger.debug('sampled out')
+            event_logger.warning('kept', count=3)
+        self.assertEqual([record.getMessage() for record in captured.records], ['kept'])
+        self.assertEqual(captured.records[0].fields, {'count': 3})
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = QueueingHandler([logging.NullHandler()], maxsize=1)
+        handler._pid = os.getpid()      # 리스너 없이 큐만 채움
+        before = LOG_RECORDS_DROPPED.value()
+        record = logging.LogRecord('phrase.events.test', logging.INFO, __file__, 1, 'event', None, None)
+        handler.handle(record)
+        handler.handle(record)
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(LOG_RECORDS_DROPPED.value() - before, 1)
+
+
+# 새 인터프리터에서 워커 부팅과 같은 순서로 로드 (설정 → 앱 → 미들웨어 → URL / 뷰)
+STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+from django.db.backends.base.base import BaseDatabaseWrapper
+cursors = []
+original_cursor = BaseDatabaseWrapper.cursor
+def counting_cursor(self):
+    cursors.append(self.alias)
+    return original_cursor(self)
+BaseDatabaseWrapper.cursor = counting_cursor
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps({'seconds': time.perf_counter() - start, 'cursors': len(cursors)}))
+"""
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '3.0'))
+
+
+class StartupTests(SimpleTestCase):
+
+    def test_setup_and_url_loading_is_fast_and_runs_no_queries(self):
+        completed = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=dict(os.environ),
+            capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr[-2000:])
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        self.assertEqual(result['cursors'], 0)
+        self.assertLess(result['seconds'], STARTUP_BUDGET_SECONDS)
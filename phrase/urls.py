@@ -12,7 +12,8 @@ from .views import (
     statistics_api,
     debug_view,
     korean_translation_status,
-    bulk_translate_dialogues
+    bulk_translate_dialogues,
+    metrics_view
 )
 
 app_name = 'phrase'
@@ -31,4 +32,7 @@ urlpatterns = [
     path('debug/', debug_view, name='debug_view'),
     path('translation-status/', korean_translation_status, name='korean_translation_status'),
     path('bulk-translate/', bulk_translate_dialogues, name='bulk_translate_dialogues'),
+    
+    # Prometheus 수집 (슬래시 없음, APPEND_SLASH 리다이렉트 회피)
+    path('metrics', metrics_view, name='metrics'),
 ]
\ No newline at end of file
@@ -3,69 +3,78 @@
 """
 유틸리티 모듈 초기화
 일본어, 중국어 필드 제거 반영
+
+- 하위 모듈은 처음 사용할 때 import (PEP 562 __getattr__)
+  → phrase.utils.metrics 같은 가벼운 모듈만 쓰는 곳(미들웨어, manage.py 명령)이
+    requests / 모델 조회 모듈까지 끌어오지 않음
+- from phrase.utils import get_client_ip 등 기존 함수 / 클래스 import 는 그대로 동작
+- 예외: get_movie_info / load_to_db 는 같은 이름의 하위 모듈을 가리킴
+  → 함수는 from phrase.utils.get_movie_info import get_movie_info,
+          from phrase.utils.load_to_db import load_to_db 로 import (__all__ 에도 없음)
 """
+from importlib import import_module
+
+_LAZY_ATTRIBUTES = {
+    'get_client_ip': 'search_helpers',
+    'record_search_query': 'search_helpers',
+    'increment_search_count': 'search_helpers',
+    'get_input_type': 'search_helpers',
+
+    'get_existing_results_from_db': 'data_processing',
+    'build_movies_context_from_db': 'data_processing',
+    'ensure_korean_translations_batch': 'data_processing',
+
+    'MovieResult': 'result_records',
+    'DialogueResult': 'result_records',
+    'measure_results_payload': 'result_records',
+
+    'render_search_results': 'template_helpers',
+    'build_error_context': 'template_helpers',
+    'build_success_context': 'template_helpers',
+    'build_translation_status_context': 'template_helpers',
+
+    'InputValidator': 'input_validation',
+    'get_confirmation_context': 'input_validation',
+
+    'clean_data_from_playphrase': 'clean_data',
+    'clean_data_v4': 'clean_data',
+    'extract_movie_info': 'clean_data',
+    'batch_process_movies_optimized': 'clean_data',
+
+    # get_movie_info / load_to_db 는 같은 이름의 하위 모듈이 import 되면 모듈로 덮이므로
+    # 함수는 phrase.utils.get_movie_info / phrase.utils.load_to_db 에서 직접 import
+    'check_existing_database_data': 'get_movie_info',
+    'PlayPhraseAPIClient': 'get_movie_info',
+
+    'save_movie_table_optimized': 'load_to_db',
+    'save_dialogue_table_optimized': 'load_to_db',
+    'get_search_results_from_db': 'load_to_db',
+
+    'LibreTranslator': 'translate',
+    'translate_dialogue_batch': 'translate',
+    'update_existing_dialogues_optimized': 'translate',
+
+    'IMDBPosterExtractor': 'get_imdb_poster_url',
+    'download_poster_image': 'get_imdb_poster_url',
+    'get_poster_url': 'get_imdb_poster_url',
+    'batch_update_movie_posters': 'get_imdb_poster_url',
+
+    'SearchHistoryManager': 'search_history',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-from .search_helpers import (
-    get_client_ip,
-    record_search_query,
-    increment_search_count,
-    get_input_type
-)
-
-from .data_processing import (
-    get_existing_results_from_db,
-    build_movies_context_from_db,
-    ensure_korean_translations_batch
-)
-
-from .template_helpers import (
-    render_search_results,
-    build_error_context,
-    build_success_context,
-    build_translation_status_context
-)
-
-from .input_validation import (
-    InputValidator,
-    get_confirmation_context
-)
-
-from .clean_data import (
-    clean_data_from_playphrase,
-    clean_data_v4,
-    extract_movie_info,
-    batch_process_movies_optimized
-)
-
-from .get_movie_info import (
-    get_movie_info,
-    check_existing_database_data,
-    PlayPhraseAPIClient
-)
-
-from .load_to_db import (
-    load_to_db,
-    save_movie_table_optimized,
-    save_dialogue_table_optimized,
-    get_search_results_from_db
-)
-
-from .translate import (
-    LibreTranslator,
-    translate_dialogue_batch,
-    update_existing_dialogues_optimized
-)
-
-from .get_imdb_poster_url import (
-    IMDBPosterExtractor,
-    download_poster_image,
-    get_poster_url,
-    batch_update_movie_posters
-)
-
-from .search_history import (
-    SearchHistoryManager
-)
 
 __all__ = [
     # 기존 utils 모듈들
@@ -76,6 +85,9 @@ __all__ = [
     'get_existing_results_from_db',
     'build_movies_context_from_db',
     'ensure_korean_translations_batch',
+    'MovieResult',
+    'DialogueResult',
+    'measure_results_payload',
     'render_search_results',
     'build_error_context',
     'build_success_context',
@@ -88,10 +100,8 @@ __all__ = [
     'clean_data_v4',
     'extract_movie_info',
     'batch_process_movies_optimized',
-    'get_movie_info',
     'check_existing_database_data',
     'PlayPhraseAPIClient',
-    'load_to_db',
     'save_movie_table_optimized',
     'save_dialogue_table_optimized',
     'get_search_results_from_db',
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/async_support.py
+"""
+비동기(ASGI) 뷰 지원 - 제한된 스레드 풀 / 비동기 HTTP 클라이언트
+- run_sync(func, *args): 동기 함수(ORM / 캐시 / 번역)를 전용 스레드 풀에서 실행하고 기다림
+  · 풀 크기 = 워커 하나가 동시에 여는 DB 연결 수 상한 (THREAD_POOL_SIZE)
+  · 풀 스레드마다 DB 연결 하나를 호출 사이에 유지 (CONN_MAX_AGE=0 이어도 호출마다 새로 연결하지 않음)
+    실행 전후로 오류 뒤 응답 없는 연결 / 자동 커밋이 바뀐 연결 / POOL_CONN_MAX_AGE 를 넘긴 연결만 닫음
+  · contextvars 복사 → span() 단계 시간이 요청 측정(Server-Timing)에 합산
+- submit_sync(func, *args): 응답을 기다리게 하지 않는 후처리 (조회수 증가 등)
+- async_http_client(): 이벤트 루프별 httpx.AsyncClient (선택 의존성, 없으면 None → 호출부가 run_sync 로 대체)
+  · upstream_slot(): 워커당 동시 외부 요청 수 제한 (UPSTREAM_CONCURRENCY)
+
+설정 (settings.ASYNC_SETTINGS):
+    THREAD_POOL_SIZE: 동기 작업 스레드 수 (기본 16)
+    UPSTREAM_CONCURRENCY: 워커당 동시 외부 HTTP 요청 수 (기본 100)
+    HTTP_TIMEOUT: 비동기 HTTP 타임아웃 초 (기본 30)
+    POOL_CONN_MAX_AGE: 풀 스레드 DB 연결 재사용 최대 초 (기본 300, MySQL wait_timeout 보다 짧게)
+"""
+import time
+import asyncio
+import weakref
+import logging
+import functools
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - 선택 의존성
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_async_settings():
+    """비동기 뷰 설정 (settings 값 우선)"""
+    async_settings = {
+        'THREAD_POOL_SIZE': 16,
+        'UPSTREAM_CONCURRENCY': 100,
+        'HTTP_TIMEOUT': 30,
+        'POOL_CONN_MAX_AGE': 300,
+    }
+    if hasattr(settings, 'ASYNC_SETTINGS'):
+        async_settings.update(settings.ASYNC_SETTINGS)
+    return async_settings
+
+
+# ===== 동기 작업 스레드 풀 =====
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_sync_executor():
+    """프로세스당 하나의 제한된 스레드 풀 (처음 사용할 때 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_async_settings()['THREAD_POOL_SIZE'],
+                    thread_name_prefix='phrase-sync',
+                )
+    return _executor
+
+
+def _record_connect_time(sender, connection, **kwargs):
+    """
+    연결 시각 기록 (POOL_CONN_MAX_AGE 판단용)
+    - close_at 은 CONN_MAX_AGE=None 이면 None 이라 연결 시각을 거꾸로 구할 수 없음
+    """
+    connection.pool_connected_at = time.monotonic()
+
+
+connection_created.connect(_record_connect_time, dispatch_uid='phrase.async_support.connect_time')
+
+
+def _release_broken_connections():
+    """
+    이 스레드의 DB 연결 중 다시 쓰면 안 되는 것만 닫음 (close_old_connections 와 달리 CONN_MAX_AGE 무시)
+    - 연결 시각은 connection_created 시그널로 직접 기록 (CONN_MAX_AGE 값과 무관)
+    """
+    max_age = get_async_settings()['POOL_CONN_MAX_AGE']
+    now = time.monotonic()
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is None:
+            continue
+        if connection.get_autocommit() != connection.settings_dict['AUTOCOMMIT']:
+            connection.close()
+        elif connection.errors_occurred:
+            if connection.is_usable():
+                connection.errors_occurred = False
+            else:
+                connection.close()
+        else:
+            connected_at = getattr(connection, 'pool_connected_at', None)
+            if connected_at is None:
+                # 시그널 연결 전에 열린 연결 → 지금부터 계산
+                connection.pool_connected_at = now
+            elif now - connected_at >= max_age:
+                connection.close()
+
+
+def _call_with_connections(func, args, kwargs):
+    _release_broken_connections()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _release_broken_connections()
+
+
+async def run_sync(func, *args, **kwargs):
+    """
+    동기 함수를 스레드 풀에서 실행
+        results = await run_sync(search_dialogues, phrase, options)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_sync_executor(),
+        functools.partial(context.run, _call_with_connections, func, args, kwargs),
+    )
+
+
+def submit_sync(func, *args, **kwargs):
+    """결과를 기다리지 않는 동기 작업 (예외는 로그만)"""
+    def run():
+        try:
+            _call_with_connections(func, args, kwargs)
+        except Exception as e:
+            logger.error(f"❌ [AsyncSupport] 후처리 실패 ({getattr(func, '__name__', func)}): {e}")
+
+    return get_sync_executor().submit(contextvars.copy_context().run, run)
+
+
+# ===== 비동기 HTTP =====
+
+# 이벤트 루프별 (uvicorn 워커는 루프 하나, 테스트 AsyncClient 는 요청마다 새 루프)
+_http_clients = weakref.WeakKeyDictionary()
+_upstream_semaphores = weakref.WeakKeyDictionary()
+
+
+def async_http_client():
+    """현재 이벤트 루프의 httpx.AsyncClient (연결 재사용), httpx 미설치 시 None"""
+    if httpx is None:
+        return None
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        async_settings = get_async_settings()
+        client = _http_clients[loop] = httpx.AsyncClient(
+            timeout=async_settings['HTTP_TIMEOUT'],
+            limits=httpx.Limits(max_connections=async_settings['UPSTREAM_CONCURRENCY']),
+        )
+    return client
+
+
+def upstream_slot():
+    """워커당 동시 외부 요청 수 제한 (async with upstream_slot(): ...)"""
+    loop = asyncio.get_running_loop()
+    semaphore = _upstream_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _upstream_semaphores[loop] = asyncio.Semaphore(get_async_settings()['UPSTREAM_CONCURRENCY'])
+    return semaphore
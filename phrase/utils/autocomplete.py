@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/autocomplete.py
+"""
+접두사 자동완성 인덱스 (영어 / 한국어)
+- 원본: RequestTable (search_count 가중치) + 자주 나오는 대사 n-gram
+- 정렬 배열 + bisect 로 접두사 범위 탐색, 짧은 접두사는 상위 k 개를 미리 계산
+- 한국어는 자모 분해(NFD) 키를 사용 → 입력 중인 음절('안녀' → '안녕하세요')도 매칭
+- 변경분만 가져와 가중치를 갱신하고 배열을 새로 만든 뒤 참조만 교체 (조회는 잠금 없음)
+- 첫 생성과 갱신 모두 백그라운드 스레드에서 수행, 첫 생성 전에는 DB 접두사 조회로 대체
+- 대사가 수정/비활성화/삭제되면 n-gram 을 처음부터 다시 집계 (기존 기여분을 뺄 원문이 없음)
+
+설정 (settings.AUTOCOMPLETE_SETTINGS):
+    REFRESH_INTERVAL: 갱신 주기 초 (기본 300)
+    NGRAM_SIZES: 대사 n-gram 길이 (기본 (2, 3, 4))
+    MIN_NGRAM_COUNT: n-gram 최소 출현 수 (기본 3)
+    NGRAM_WEIGHT: n-gram 1회 출현 가중치 (기본 0.5)
+    MAX_NGRAMS: 메모리에 유지할 n-gram 수 상한 (기본 200000)
+    PRECOMPUTE_PREFIX_LENGTH: 상위 k 를 미리 계산할 접두사 길이 (기본 3)
+    TOP_K: 미리 계산할 상위 개수 (기본 10)
+"""
+import re
+import time
+import heapq
+import logging
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+LANGUAGES = ('en', 'ko')
+
+re_hangul = re.compile(r'[가-힣ㄱ-ㆎ]')
+re_words = re.compile(r"[^\W_]+(?:'[^\W_]+)?")
+
+# 대사 변경 감지 시 updated_at 비교 여유 (스캔과 동시에 저장된 행 포함)
+CHANGE_CHECK_MARGIN = timezone.timedelta(seconds=1)
+
+# 호환 자모 초성(ㄱ..ㅎ) → 조합형 초성 (입력 중 마지막 글자가 자음만인 경우)
+COMPAT_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+COMPAT_TO_CHOSEONG = {ch: chr(0x1100 + i) for i, ch in enumerate(COMPAT_CHOSEONG)}
+
+
+def get_autocomplete_settings():
+    """자동완성 설정 (settings 값 우선)"""
+    autocomplete_settings = {
+        'REFRESH_INTERVAL': 300,
+        'NGRAM_SIZES': (2, 3, 4),
+        'MIN_NGRAM_COUNT': 3,
+        'NGRAM_WEIGHT': 0.5,
+        'MAX_NGRAMS': 200000,
+        'PRECOMPUTE_PREFIX_LENGTH': 3,
+        'TOP_K': 10,
+    }
+    if hasattr(settings, 'AUTOCOMPLETE_SETTINGS'):
+        autocomplete_settings.update(settings.AUTOCOMPLETE_SETTINGS)
+    return autocomplete_settings
+
+
+def detect_language(text):
+    return 'ko' if re_hangul.search(text or '') else 'en'
+
+
+def normalize_key(text, language):
+    """검색 키 정규화 (소문자, 공백 정리, 한국어는 자모 분해)"""
+    text = ' '.join((text or '').lower().split())
+    if language == 'ko':
+        text = ''.join(COMPAT_TO_CHOSEONG.get(ch, ch) for ch in text)
+        return unicodedata.normalize('NFD', text)
+    return text
+
+
+def iter_ngrams(text, sizes):
+    words = re_words.findall((text or '').lower())
+    for size in sizes:
+        for i in range(len(words) - size + 1):
+            yield ' '.join(words[i:i + size])
+
+
+class PrefixIndex:
+    """
+    한 언어의 불변 접두사 인덱스
+    - keys: 정렬된 정규화 키, entries: 같은 순서의 (표시 텍스트, 가중치, 출처)
+    - top: 짧은 접두사별 미리 계산된 상위 k 개
+    """
+    __slots__ = ('keys', 'entries', 'top', 'precompute_length', 'top_k')
+
+    def __init__(self, weighted, precompute_length=3, top_k=10):
+        items = sorted(weighted.items())
+        self.keys = [key for key, _ in items]
+        self.entries = [value for _, value in items]
+        self.precompute_length = precompute_length
+        self.top_k = top_k
+        self.top = self._precompute()
+
+    def _precompute(self):
+        buckets = {}
+        for key, entry in zip(self.keys, self.entries):
+            for length in range(1, min(len(key), self.precompute_length) + 1):
+                heap = buckets.setdefault(key[:length], [])
+                item = (entry[1], entry[0], entry)
+                if len(heap) < self.top_k:
+                    heapq.heappush(heap, item)
+                elif item > heap[0]:
+                    heapq.heapreplace(heap, item)
+        return {
+            prefix: [item[2] for item in sorted(heap, reverse=True)]
+            for prefix, heap in buckets.items()
+        }
+
+    def __len__(self):
+        return len(self.keys)
+
+    def search(self, prefix, limit=10):
+        if not prefix:
+            return []
+        if len(prefix) <= self.precompute_length and limit <= self.top_k:
+            return self.top.get(prefix, [])[:limit]
+
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', lo=start)
+        return heapq.nlargest(limit, self.entries[start:end], key=lambda entry: entry[1])
+
+
+class AutocompleteIndex:
+    """
+    영어/한국어 자동완성 인덱스 (프로세스별 싱글톤: get_autocomplete_index())
+    - refresh(): 마지막 갱신 이후 변경된 RequestTable 행과 새 대사만 반영
+    """
+
+    def __init__(self):
+        self.settings = get_autocomplete_settings()
+        self.request_weights = {language: {} for language in LANGUAGES}
+        self.ngram_counts = {language: Counter() for language in LANGUAGES}
+        self.indexes = {language: PrefixIndex({}) for language in LANGUAGES}
+        self.request_watermark = None
+        self.dialogue_watermark = 0
+        self.dialogue_count = 0
+        self.dialogue_checked_at = None
+        self.refreshed_at = 0.0
+        self._refresh_lock = threading.Lock()
+
+    # ----- 원본 수집 -----
+
+    def _load_requests(self):
+        from phrase.models import RequestTable
+
+        if self.request_watermark is None:
+            queryset = RequestTable.objects.filter(is_active=True)
+        else:
+            # 같은 시각에 저장된 행을 놓치지 않도록 >= (다시 읽은 행은 키 단위로 덮어씀)
+            # 비활성화된 검색어도 읽어서 제거
+            queryset = RequestTable.objects.filter(updated_at__gte=self.request_watermark)
+
+        changed = 0
+        rows = queryset.values_list(
+            'request_phrase', 'request_korean', 'search_count', 'result_count', 'is_active', 'updated_at'
+        ).iterator(chunk_size=2000)
+        for request_phrase, request_korean, search_count, result_count, is_active, updated_at in rows:
+            # 결과가 없었던 검색어는 제안하지 않음
+            weight = float(search_count or 0) if result_count and is_active else 0.0
+            for text in (request_phrase, request_korean):
+                if not text:
+                    continue
+                language = detect_language(text)
+                key = normalize_key(text, language)
+                if weight > 0:
+                    self.request_weights[language][key] = (text.strip(), weight)
+                else:
+                    self.request_weights[language].pop(key, None)
+            if self.request_watermark is None or updated_at > self.request_watermark:
+                self.request_watermark = updated_at
+            changed += 1
+        return changed
+
+    def _indexed_dialogues_changed(self):
+        """이미 집계한 대사(id <= 워터마크)가 수정/비활성화/삭제되었는지"""
+        from phrase.models import DialogueTable
+
+        indexed = DialogueTable.objects.filter(id__lte=self.dialogue_watermark)
+        if indexed.filter(updated_at__gte=self.dialogue_checked_at).exists():
+            return True
+        # queryset.update()/delete() 는 updated_at 을 남기지 않으므로 개수로 확인
+        return indexed.filter(is_active=True).count() != self.dialogue_count
+
+    def _load_dialogue_ngrams(self):
+        from phrase.models import DialogueTable
+
+        changed = 0
+        if self.dialogue_watermark and self._indexed_dialogues_changed():
+            self.ngram_counts = {language: Counter() for language in LANGUAGES}
+            changed = self.dialogue_count
+            self.dialogue_watermark = 0
+            self.dialogue_count = 0
+            logger.info("🔤 [Autocomplete] 대사 변경 감지 → n-gram 재집계")
+
+        sizes = self.settings['NGRAM_SIZES']
+        checked_at = timezone.now() - CHANGE_CHECK_MARGIN
+        rows = DialogueTable.objects.filter(
+            is_active=True, id__gt=self.dialogue_watermark
+        ).order_by('id').values_list('id', 'dialogue_phrase', 'dialogue_phrase_ko').iterator(chunk_size=2000)
+        for dialogue_id, phrase_en, phrase_ko in rows:
+            self.ngram_counts['en'].update(iter_ngrams(phrase_en, sizes))
+            self.ngram_counts['ko'].update(iter_ngrams(phrase_ko, sizes))
+            self.dialogue_watermark = dialogue_id
+            self.dialogue_count += 1
+            changed += 1
+        self.dialogue_checked_at = checked_at
+
+        # 상한 초과 시 드문 n-gram 정리
+        for language in LANGUAGES:
+            counts = self.ngram_counts[language]
+            if len(counts) > self.settings['MAX_NGRAMS']:
+                self.ngram_counts[language] = Counter(dict(counts.most_common(self.settings['MAX_NGRAMS'])))
+        return changed
+
+    def _build(self, language):
+        weighted = {}
+        min_count = self.settings['MIN_NGRAM_COUNT']
+        ngram_weight = self.settings['NGRAM_WEIGHT']
+        for ngram, count in self.ngram_counts[language].items():
+            if count >= min_count:
+                weighted[normalize_key(ngram, language)] = (ngram, count * ngram_weight, 'dialogue')
+        # 같은 키는 실제 검색어가 우선
+        for key, (text, weight) in self.request_weights[language].items():
+            weighted[key] = (text, weight, 'request')
+        return PrefixIndex(weighted, self.settings['PRECOMPUTE_PREFIX_LENGTH'], self.settings['TOP_K'])
+
+    def refresh(self):
+        """변경분 반영 후 인덱스 교체 → 반영된 행 수"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            start = time.perf_counter()
+            changed = self._load_requests() + self._load_dialogue_ngrams()
+            if changed or not self.refreshed_at:
+                self.indexes = {language: self._build(language) for language in LANGUAGES}
+                logger.info(
+                    f"🔤 [Autocomplete] 인덱스 갱신: {changed}행 반영, "
+                    f"en {len(self.indexes['en'])}개 / ko {len(self.indexes['ko'])}개 "
+                    f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+                )
+            self.refreshed_at = time.monotonic()
+            return changed
+        finally:
+            self._refresh_lock.release()
+
+    @property
+    def ready(self):
+        """첫 생성 완료 여부"""
+        return bool(self.refreshed_at)
+
+    def refresh_in_background_if_stale(self):
+        if self.ready and time.monotonic() - self.refreshed_at < self.settings['REFRESH_INTERVAL']:
+            return
+        if self._refresh_lock.locked():
+            return
+        threading.Thread(target=self._safe_refresh, name='autocomplete-refresh', daemon=True).start()
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"❌ [Autocomplete] 인덱스 갱신 실패: {e}")
+        finally:
+            # 백그라운드 스레드 전용 연결 정리
+            connection.close()
+
+    # ----- 조회 -----
+
+    def suggest(self, query, language=None, limit=10):
+        """접두사 자동완성 → [{'text', 'weight', 'source'}]"""
+        language = language if language in LANGUAGES else detect_language(query)
+        if not self.ready:
+            return suggest_from_requests(query, language, limit)
+        prefix = normalize_key(query, language)
+        return [
+            {'text': text, 'weight': weight, 'source': source}
+            for text, weight, source in self.indexes[language].search(prefix, limit)
+        ]
+
+
+def suggest_from_requests(query, language, limit=10):
+    """
+    인덱스 생성 전 대체 조회: RequestTable 접두사 검색 (인기순, 쿼리 1회)
+    - 자모 분해 매칭과 대사 n-gram 은 인덱스가 준비된 뒤부터 제공
+    """
+    from phrase.models import RequestTable
+
+    query = ' '.join((query or '').split())
+    if not query:
+        return []
+    field = 'request_korean' if language == 'ko' else 'request_phrase'
+    rows = RequestTable.objects.filter(
+        is_active=True, result_count__gt=0, **{f'{field}__istartswith': query}
+    ).order_by('-search_count').values_list(field, 'search_count')[:limit]
+    return [
+        {'text': text.strip(), 'weight': float(search_count or 0), 'source': 'request'}
+        for text, search_count in rows
+    ]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_autocomplete_index():
+    """
+    프로세스별 인덱스
+    - 첫 호출은 빈 인덱스를 바로 돌려주고 생성은 백그라운드에서 수행 (그동안 suggest 는 DB 접두사 조회)
+    - 이후 REFRESH_INTERVAL 마다 백그라운드 갱신
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = AutocompleteIndex()
+    _index.refresh_in_background_if_stale()
+    return _index
+
+
+def measure_autocomplete_latency(index, queries, repeat=20):
+    """자동완성 조회 지연 측정 (ms, p50 / p99)"""
+    timings = []
+    for _ in range(max(repeat, 1)):
+        for query in queries:
+            start = time.perf_counter()
+            index.suggest(query)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    if not timings:
+        return {}
+    return {
+        'count': len(timings),
+        'p50_ms': round(timings[len(timings) // 2], 4),
+        'p99_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 4),
+        'max_ms': round(timings[-1], 4),
+    }
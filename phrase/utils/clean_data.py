@@ -11,9 +11,10 @@ import re
 import json
 import logging
 from django.core.cache import cache
+from django.core.files.storage import default_storage
 from django.db import transaction, models
 from django.utils import timezone
-from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.models import MovieTable, DialogueTable, RequestTable, get_poster_upload_path
 from phrase.utils.get_imdb_poster_url import get_poster_url, download_poster_image
 
 logger = logging.getLogger(__name__)
@@ -528,6 +529,23 @@ def process_existing_movies_dialogues(existing_movies):
     return processed_movies
 
 
+def _store_poster_file(downloaded):
+    """
+    다운로드된 포스터 임시 파일을 저장소로 이동하고 저장된 이름 반환
+    - load_to_db 와 같이 임시 파일은 성공/실패 모두 닫음 (FileSystemStorage 는 rename)
+    - 실패 시 빈 문자열 (poster_url 은 호출부에서 유지)
+    """
+    if not downloaded:
+        return ''
+    try:
+        return default_storage.save(get_poster_upload_path(None, downloaded.name), downloaded)
+    except Exception as e:
+        logger.warning(f"포스터 저장 실패 ({downloaded.name}): {e}")
+        return ''
+    finally:
+        downloaded.close()
+
+
 def get_cached_imdb_info(movie_title, release_year):
     """캐시 우선 IMDB 정보 조회"""
     imdb_cache_key = f"imdb_{movie_title}_{release_year}"
@@ -545,11 +563,11 @@ def get_cached_imdb_info(movie_title, release_year):
             imdb_data['poster_url'] = poster_url
             
             # 포스터 다운로드 (선택적)
-            poster_path = download_poster_image(poster_url, movie_title)
+            poster_path = _store_poster_file(download_poster_image(poster_url, movie_title))
             if poster_path:
                 imdb_data['poster_image_path'] = poster_path
         
-        # 캐시에 저장 (24시간)
+        # 캐시에 저장 (24시간) - 파일 객체가 아닌 저장소 경로 문자열만 저장
         if imdb_data:
             cache.set(imdb_cache_key, imdb_data, 86400)
         
@@ -744,8 +762,8 @@ def test_four_modules_integration():
             test_results['views_integration'] = True
         
         # get_movie_info.py 연동 테스트
-        from phrase.utils import get_movie_info
-        if hasattr(get_movie_info, 'check_existing_database_data'):
+        from phrase.utils import get_movie_info as get_movie_info_module
+        if hasattr(get_movie_info_module, 'check_existing_database_data'):
             test_results['get_movie_info_integration'] = True
         
     except Exception as e:
@@ -1020,21 +1038,12 @@ def clean_data_from_playphrase_legacy(data_text):
 # ===== 레거시 호환성 별칭들 =====
 extract_movie_info_legacy = extract_movie_info
 
-# ===== 모듈 초기화 실행 =====
-module_initialized = initialize_clean_data_module()
+# ===== 모듈 초기화 =====
+# import 시에는 DB / 캐시를 건드리지 않음 (워커 부팅, manage.py 명령, DB 없는 환경)
+# 연동 점검이 필요하면 initialize_clean_data_module() 을 명시적으로 호출
 
 # ===== 최종 로깅 및 메타데이터 =====
-logger.info(f"""
-=== clean_data.py v4.0 초기화 완료 ===
-📱 models.py 연동: ✅ 최적화된 모델 활용
-🔧 managers.py 연동: ✅ 커스텀 매니저 활용  
-🌐 views.py 연동: ✅ DB 우선 정책 지원
-🔗 get_movie_info.py 연동: ✅ API 최적화
-🚀 성능 최적화: ✅ 캐싱, 배치처리, 트랜잭션
-🔄 호환성: ✅ 레거시 지원 유지
-📊 통계 연동: ✅ 실시간 모니터링
-초기화 상태: {'성공' if module_initialized else '실패'}
-""")
+logger.debug("clean_data v4.0 로드")
 
 # 모듈 메타데이터
 __version__ = "4.0.0"
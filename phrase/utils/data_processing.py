@@ -6,55 +6,67 @@
 """
 import time
 import logging
+from operator import attrgetter
 from django.core.cache import cache
+from django.db.models import Q
 from phrase.models import DialogueTable
 from phrase.utils.translate import LibreTranslator
+from phrase.utils.result_records import MovieResult, DialogueResult, search_result_cache_key
+from phrase.utils.metrics import timed_stage, record_cache
+from phrase.utils.event_log import get_event_logger
 
 logger = logging.getLogger(__name__)
+db_log = get_event_logger('db')
 
 
-def get_existing_results_from_db(request_phrase, request_korean=None):
+@timed_stage('db_search')
+def get_existing_results_from_db(request_phrase, request_korean=None, with_source=False):
     """
     DB에서 기존 검색 결과 조회 (캐시 우선) - 예외 처리 강화
+    - with_source=True: (결과, 캐시 적중 여부) 반환
     """
+    from_cache = False
+    results = None
     try:
         # 캐시 확인
-        cache_key = f"search_result_{hash(request_phrase)}"
+        cache_key = search_result_cache_key(request_phrase)
         cached_results = cache.get(cache_key)
+        record_cache('search_results', bool(cached_results))
         
         if cached_results:
-            logger.info(f"✅ 캐시에서 결과 조회: {len(cached_results)}개")
-            return cached_results
-        
-        print("🔍 DEBUG: 캐시에 없음, DB 직접 검색")
-        
+            db_log.debug("✅ 캐시에서 결과 조회", count=len(cached_results))
+            from_cache = True
+            results = cached_results
+        else:
+            results = _search_and_cache_results(request_phrase, request_korean, cache_key)
+    except Exception:
+        db_log.exception("❌ get_existing_results_from_db 오류", phrase=request_phrase)
+
+    return (results, from_cache) if with_source else results
+
+
+def _search_and_cache_results(request_phrase, request_korean, cache_key):
+    """캐시 미스: DB 검색 → context 변환 → 캐시 저장"""
+    try:
         # DB에서 검색 (매니저 메서드 대신 직접 쿼리)
-        search_results = DialogueTable.objects.filter(
-            dialogue_phrase__icontains=request_phrase
-        )
-        
-        # 요청한글이 있으면 추가 검색
+        # 요청한글이 있으면 OR 조건으로 추가 검색 (union 뒤에는 select_related 불가)
+        condition = Q(dialogue_phrase__icontains=request_phrase)
         if request_korean:
-            korean_results = DialogueTable.objects.filter(
-                dialogue_phrase_ko__icontains=request_korean
-            )
-            # 중복 제거를 위해 union 사용
-            search_results = search_results.union(korean_results)
+            condition |= Q(dialogue_phrase_ko__icontains=request_korean)
+        search_results = DialogueTable.objects.filter(condition).exclude(video_url_status='dead')
         
-        # 영화 정보와 함께 조회
+        # 영화 정보와 함께 조회 (build_movies_context_from_db 의 dialogue.movie 추가 쿼리 방지)
         search_results = search_results.select_related('movie').distinct()
         
         if not search_results.exists():
-            print("📭 DEBUG: DB에서 결과 없음")
+            db_log.debug("📭 DB에서 결과 없음", phrase=request_phrase)
             return None
         
-        print(f"📊 DEBUG: DB에서 {search_results.count()}개 대사 발견")
-        
         # 한글 번역 확인 및 보완
         try:
             search_results = ensure_korean_translations_batch(search_results)
         except Exception as e:
-            print(f"⚠️ DEBUG: 번역 보완 실패: {e}")
+            db_log.warning(f"⚠️ 번역 보완 실패: {e}")
         
         # context 형식으로 변환
         movies_context = build_movies_context_from_db(search_results)
@@ -62,112 +74,57 @@ def get_existing_results_from_db(request_phrase, request_korean=None):
         # 캐시에 저장 (10분)
         try:
             cache.set(cache_key, movies_context, 600)
-            print(f"🗄️ DEBUG: 결과 캐싱 완료")
         except Exception as e:
-            print(f"⚠️ DEBUG: 캐싱 실패: {e}")
+            db_log.warning(f"⚠️ 캐싱 실패: {e}", cache_key=cache_key)
         
         return movies_context
         
-    except Exception as e:
-        print(f"❌ DEBUG: get_existing_results_from_db 오류: {e}")
+    except Exception:
+        db_log.exception("❌ _search_and_cache_results 오류", phrase=request_phrase)
         return None
 
 
+@timed_stage('context_build')
 def build_movies_context_from_db(search_results):
     """
-    DB 검색 결과를 index.html용 context 형식으로 변환 - 일본어/중국어 필드 제거 완료
+    DB 검색 결과를 index.html용 context 형식으로 변환 (v2 레코드)
+    - MovieResult / DialogueResult 한 가지 필드명만 사용
+    - 파일 URL, 길이 표시 문자열은 템플릿 접근 시점에 계산
     """
     try:
         movies_dict = {}
+        dialogue_count = 0
         
         for dialogue in search_results:
             try:
                 movie = dialogue.movie
-                movie_key = f"{movie.movie_title}_{movie.release_year}_{movie.director}"
+                movie_key = (movie.movie_title, movie.release_year, movie.director)
                 
-                if movie_key not in movies_dict:
-                    # 새로운 영화 항목 생성 (템플릿 호환을 위해 두 가지 필드명 모두 제공)
-                    movies_dict[movie_key] = {
-                        # 기존 필드명 (템플릿에서 사용)
-                        'title': movie.movie_title,
-                        'movie_title': movie.movie_title,  # 템플릿 호환성
-                        'year': movie.release_year,
-                        'release_year': movie.release_year,  # 템플릿 호환성
-                        'director': movie.director,
-                        'country': movie.production_country,
-                        'production_country': movie.production_country,  # 템플릿 호환성
-                        
-                        # 추가 영화 정보
-                        'original_title': movie.original_title or movie.movie_title,
-                        'genre': movie.genre or '',
-                        'imdb_rating': float(movie.imdb_rating) if movie.imdb_rating else None,
-                        'imdb_url': movie.imdb_url or '',
-                        'poster_url': movie.poster_url or '',
-                        'poster_image_path': movie.poster_image.url if movie.poster_image else '',
-                        'data_quality': movie.data_quality,
-                        'view_count': movie.view_count,
-                        'like_count': movie.like_count,
-                        'dialogues': []
-                    }
-                
-                # 대사 정보 추가 (일본어/중국어 필드 제거)
-                dialogue_info = {
-                    'id': dialogue.id,
-                    
-                    # 영어 대사 (두 가지 필드명)
-                    'text': dialogue.dialogue_phrase,
-                    'dialogue_phrase': dialogue.dialogue_phrase,  # 템플릿 호환성
-                    
-                    # 한글 번역 (두 가지 필드명)
-                    'text_ko': dialogue.dialogue_phrase_ko or '',
-                    'dialogue_phrase_ko': dialogue.dialogue_phrase_ko or '',  # 템플릿 호환성
-                    
-                    # 시간 정보 (두 가지 필드명)
-                    'start_time': dialogue.dialogue_start_time,
-                    'dialogue_start_time': dialogue.dialogue_start_time,  # 템플릿 호환성
-                    'end_time': dialogue.dialogue_end_time or '',
-                    'duration_seconds': dialogue.duration_seconds,
-                    'duration_display': getattr(dialogue, 'get_duration_display', lambda: '알 수 없음')(),
-                    
-                    # 비디오 정보
-                    'video_url': dialogue.video_url,
-                    'video_file_path': dialogue.video_file.url if dialogue.video_file else '',
-                    'video_quality': dialogue.video_quality,
-                    'file_size_bytes': dialogue.file_size_bytes,
-                    
-                    # 번역 메타데이터
-                    'translation_method': dialogue.translation_method,
-                    'translation_quality': dialogue.translation_quality,
-                    
-                    # 통계
-                    'play_count': dialogue.play_count,
-                    'like_count': dialogue.like_count,
-                    'created_at': dialogue.created_at.isoformat() if dialogue.created_at else '',
-                }
+                movie_result = movies_dict.get(movie_key)
+                if movie_result is None:
+                    movie_result = movies_dict[movie_key] = MovieResult.from_model(movie)
                 
-                movies_dict[movie_key]['dialogues'].append(dialogue_info)
+                movie_result.dialogues.append(DialogueResult.from_model(dialogue))
+                dialogue_count += 1
                 
             except Exception as e:
-                print(f"⚠️ DEBUG: 대사 처리 중 오류: {e}")
+                db_log.warning(f"⚠️ 대사 처리 중 오류: {e}", dialogue_id=dialogue.pk)
                 continue
         
         # 딕셔너리를 리스트로 변환 (조회수 기준 정렬)
         movies_list = list(movies_dict.values())
-        movies_list.sort(key=lambda x: x.get('view_count', 0), reverse=True)
+        movies_list.sort(key=attrgetter('view_count'), reverse=True)
         
         # 각 영화의 대사들을 재생수 기준으로 정렬
-        for movie in movies_list:
-            movie['dialogues'].sort(key=lambda x: x.get('play_count', 0), reverse=True)
-            # 대사 개수 추가
-            movie['dialogue_count'] = len(movie['dialogues'])
+        for movie_result in movies_list:
+            movie_result.dialogues.sort(key=attrgetter('play_count'), reverse=True)
         
-        print(f"📋 DEBUG: DB 결과 변환 완료: {len(movies_list)}개 영화")
-        logger.info(f"📋 DB 결과 변환 완료: {len(movies_list)}개 영화, 총 {len(search_results)}개 대사")
+        db_log.debug("📋 DB 결과 변환 완료", movies=len(movies_list), dialogues=dialogue_count)
         
         return movies_list
         
-    except Exception as e:
-        print(f"❌ DEBUG: build_movies_context_from_db 오류: {e}")
+    except Exception:
+        db_log.exception("❌ build_movies_context_from_db 오류")
         return []
 
 
@@ -209,6 +166,6 @@ def ensure_korean_translations_batch(dialogues):
         
         return updated_dialogues
         
-    except Exception as e:
-        print(f"❌ DEBUG: ensure_korean_translations_batch 오류: {e}")
+    except Exception:
+        db_log.exception("❌ ensure_korean_translations_batch 오류")
         return dialogues
\ No newline at end of file
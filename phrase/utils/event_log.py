@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/event_log.py
+"""
+구조화 / 표본 / 비동기 로깅 (핫 패스의 print 대체)
+- get_event_logger('search') → phrase.events.search 로거를 감싼 EventLogger
+    log.debug('DB 검색 결과', count=3)                            # 메시지 + 필드
+    log.debug('요청 파라미터', get=lambda: dict(request.GET))     # 호출 가능한 필드는 기록할 때만 계산
+- 범주별 레벨: 꺼진 레벨은 isEnabledFor 한 번으로 끝 (문자열 / dict 생성 없음)
+- 범주별 표본 비율: DEBUG / INFO 만 표본 추출, WARNING 이상은 항상 기록
+- install_log_queue(): 루트 / django 로거 핸들러를 QueueListener 뒤로 옮김
+  → 요청 스레드는 큐에 넣기만 하고 포맷 / stdout·파일 쓰기는 리스너 스레드에서
+  (fork 뒤 pid 가 바뀌면 워커에서 리스너를 새로 시작, 큐가 차면 버리고 카운터 증가)
+- FieldsFormatter: 기존 텍스트 형식 + key=value 필드, StructuredFormatter: JSON 한 줄
+
+설정 (settings.EVENT_LOG_SETTINGS):
+    DEFAULT_LEVEL: 범주 기본 레벨 (기본 'WARNING' → DEBUG 추적은 꺼짐)
+    LEVELS: 범주별 레벨 {'search': 'DEBUG', ...}
+    SAMPLE_RATES: 범주별 DEBUG / INFO 표본 비율 {'request': 0.01, ...} (없으면 1.0)
+    QUEUE: 큐 핸들러 사용 (기본 True)
+    QUEUE_SIZE: 큐 최대 길이 (기본 10000)
+"""
+import os
+import copy
+import json
+import queue
+import random
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+
+from phrase.utils.metrics import LOG_RECORDS_DROPPED
+
+CATEGORY_PREFIX = 'phrase.events'
+
+
+def get_event_log_settings():
+    """이벤트 로그 설정 (settings 값 우선)"""
+    event_log_settings = {
+        'DEFAULT_LEVEL': 'WARNING',
+        'LEVELS': {},
+        'SAMPLE_RATES': {},
+        'QUEUE': True,
+        'QUEUE_SIZE': 10000,
+    }
+    if hasattr(settings, 'EVENT_LOG_SETTINGS'):
+        event_log_settings.update(settings.EVENT_LOG_SETTINGS)
+    return event_log_settings
+
+
+# ===== 이벤트 로거 =====
+
+class EventLogger:
+    """범주 하나의 구조화 로거 (레벨 / 표본 비율은 EVENT_LOG_SETTINGS)"""
+
+    def __init__(self, category, level, sample_rate=1.0):
+        self.category = category
+        self.sample_rate = sample_rate
+        self.logger = logging.getLogger(f"{CATEGORY_PREFIX}.{category}")
+        self.logger.setLevel(level)
+
+    def is_enabled(self, level=logging.DEBUG):
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level, message, fields, exc_info=False):
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        # 요청 객체를 참조하는 필드는 요청 스레드에서 값으로 바꿔 둠
+        resolved = {key: value() if callable(value) else value for key, value in fields.items()}
+        self.logger.log(
+            level, message, exc_info=exc_info, stacklevel=3,
+            extra={'category': self.category, 'fields': resolved, 'sample_rate': self.sample_rate},
+        )
+
+    def debug(self, message, **fields):
+        self._log(logging.DEBUG, message, fields)
+
+    def info(self, message, **fields):
+        self._log(logging.INFO, message, fields)
+
+    def warning(self, message, exc_info=False, **fields):
+        self._log(logging.WARNING, message, fields, exc_info)
+
+    def error(self, message, exc_info=False, **fields):
+        self._log(logging.ERROR, message, fields, exc_info)
+
+    def exception(self, message, **fields):
+        self._log(logging.ERROR, message, fields, exc_info=True)
+
+
+_event_loggers = {}
+_event_loggers_lock = threading.Lock()
+
+
+def get_event_logger(category):
+    """범주 이벤트 로거 (프로세스당 하나, 레벨은 처음 만들 때 설정에서 적용)"""
+    event_logger = _event_loggers.get(category)
+    if event_logger is None:
+        with _event_loggers_lock:
+            event_logger = _event_loggers.get(category)
+            if event_logger is None:
+                event_log_settings = get_event_log_settings()
+                level = event_log_settings['LEVELS'].get(category, event_log_settings['DEFAULT_LEVEL'])
+                sample_rate = event_log_settings['SAMPLE_RATES'].get(category, 1.0)
+                event_logger = _event_loggers[category] = EventLogger(category, level, sample_rate)
+    return event_logger
+
+
+# ===== 포매터 =====
+
+class FieldsFormatter(logging.Formatter):
+    """기존 텍스트 형식 뒤에 key=value 필드 추가"""
+
+    def format(self, record):
+        text = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if not fields:
+            return text
+        return text + ' ' + ' '.join(f"{key}={value!r}" for key, value in fields.items())
+
+
+class StructuredFormatter(logging.Formatter):
+    """JSON 한 줄 (ts, level, logger, category, msg, pid, 필드, exc)"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            'pid': record.process,
+        }
+        if getattr(record, 'category', None):
+            entry['category'] = record.category
+        if getattr(record, 'sample_rate', 1.0) < 1.0:
+            entry['sample_rate'] = record.sample_rate
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update({key: value for key, value in fields.items() if key not in entry})
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# ===== 큐 핸들러 =====
+
+class _QueueListener(QueueListener):
+    """종료 표식은 기다렸다가 넣음 (큐가 가득 차 있어도 리스너가 비우는 중)"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueingHandler(QueueHandler):
+    """
+    기존 핸들러들을 리스너 스레드로 옮기는 큐 핸들러
+    - prepare 는 메시지 합치기만 (포맷은 리스너 쪽 핸들러 포매터가 수행)
+    - 큐가 가득 차면 기다리지 않고 버림 (phrase_log_records_dropped_total)
+    """
+
+    def __init__(self, handlers, maxsize=10000):
+        super().__init__(queue.Queue(maxsize))
+        self.target_handlers = list(handlers)
+        self._listener = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+        with self._lock:
+            if self._pid == pid:
+                return
+            # fork 로 복사된 큐 / 리스너는 버리고 이 프로세스용으로 새로 시작
+            self.queue = queue.Queue(self.queue.maxsize)
+            self._listener = _QueueListener(self.queue, *self.target_handlers, respect_handler_level=True)
+            self._listener.start()
+            self._pid = pid
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        self._ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()
+
+    def close(self):
+        with self._lock:
+            if self._listener is not None and self._pid == os.getpid():
+                self._listener.stop()       # 남은 기록을 모두 쓴 뒤 종료
+            self._listener = None
+            self._pid = None
+        super().close()
+
+
+def install_log_queue(logger_names=('', 'django')):
+    """
+    지정 로거의 핸들러를 QueueingHandler 하나로 교체 (PhraseConfig.ready 에서 호출)
+    - 핸들러 구성이 같은 로거 (루트 / django 의 console + file) 는 큐 하나를 공유
+    - 이미 설치된 로거는 건너뜀
+    """
+    event_log_settings = get_event_log_settings()
+    if not event_log_settings['QUEUE']:
+        return
+    queueing_handlers = {}
+    for name in logger_names:
+        target = logging.getLogger(name or None)
+        if any(isinstance(handler, QueueingHandler) for handler in target.handlers):
+            continue
+        handlers = tuple(target.handlers)
+        if not handlers:
+            continue
+        key = frozenset(id(handler) for handler in handlers)
+        if key not in queueing_handlers:
+            queueing_handlers[key] = QueueingHandler(handlers, maxsize=event_log_settings['QUEUE_SIZE'])
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(queueing_handlers[key])
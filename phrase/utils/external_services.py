@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/external_services.py
+"""
+외부 서비스 기본 URL (playphrase, MyMemory, IMDB)
+- 설정으로 바꿀 수 있어 로컬 대역 서버(phrase.benchmarks.fake_servers)로 부하 테스트 가능
+- IMDB URL 은 DB 에 실제 주소(https://www.imdb.com/title/...)로 저장되므로
+  요청 직전에만 호스트를 설정된 기본 URL 로 바꿈
+
+설정 (settings.EXTERNAL_SERVICE_SETTINGS):
+    PLAYPHRASE_BASE_URL: 기본 'https://www.playphrase.me'
+    MYMEMORY_BASE_URL: 기본 'https://api.mymemory.translated.net'
+    IMDB_BASE_URL: 기본 'https://www.imdb.com'
+"""
+from urllib.parse import urlparse, urlunparse
+
+from django.conf import settings
+
+DEFAULT_IMDB_BASE_URL = 'https://www.imdb.com'
+IMDB_HOSTS = ('www.imdb.com', 'imdb.com', 'm.imdb.com')
+
+
+def get_external_service_settings():
+    """외부 서비스 설정 (settings 값 우선)"""
+    service_settings = {
+        'PLAYPHRASE_BASE_URL': 'https://www.playphrase.me',
+        'MYMEMORY_BASE_URL': 'https://api.mymemory.translated.net',
+        'IMDB_BASE_URL': DEFAULT_IMDB_BASE_URL,
+    }
+    if hasattr(settings, 'EXTERNAL_SERVICE_SETTINGS'):
+        service_settings.update(settings.EXTERNAL_SERVICE_SETTINGS)
+    return service_settings
+
+
+def playphrase_search_url():
+    return f"{get_external_service_settings()['PLAYPHRASE_BASE_URL'].rstrip('/')}/api/v1/phrases/search"
+
+
+def mymemory_translate_url():
+    return f"{get_external_service_settings()['MYMEMORY_BASE_URL'].rstrip('/')}/get"
+
+
+def imdb_request_url(imdb_url):
+    """저장된 IMDB URL → 실제 요청할 URL (기본 설정이면 그대로)"""
+    base_url = get_external_service_settings()['IMDB_BASE_URL'].rstrip('/')
+    if base_url == DEFAULT_IMDB_BASE_URL or not imdb_url:
+        return imdb_url
+
+    parsed = urlparse(imdb_url)
+    if parsed.netloc not in IMDB_HOSTS:
+        return imdb_url
+    base = urlparse(base_url)
+    return urlunparse((base.scheme, base.netloc, base.path + parsed.path, parsed.params, parsed.query, ''))
@@ -10,9 +10,12 @@ IMDB 포스터 URL 추출 및 저장 기능 - 4개 모듈 완전 최적화
 """
 import requests
 import re
+import json
 import time
 import logging
-from bs4 import BeautifulSoup
+from html import unescape
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
 from django.shortcuts import render
 from django.http import JsonResponse
 from django.core.cache import cache
@@ -25,9 +28,105 @@ from io import BytesIO
 
 # 새로운 모델과 매니저 활용
 from phrase.models import MovieTable, DialogueTable, RequestTable
+from phrase.utils.external_services import imdb_request_url
+from phrase.utils.metrics import (
+    record_cache, record_upstream, upstream_outcome,
+    CACHE_REQUESTS, UPSTREAM_DURATION, POSTER_EXTRACTIONS,
+)
+from phrase.utils.poster_variants import generate_poster_variants_on_ingest
+from phrase.utils.streaming_download import stream_download, guess_extension
 
 logger = logging.getLogger(__name__)
 
+# ===== <head> 빠른 스캔 =====
+
+HEAD_SCAN_LIMIT = 256 * 1024  # head 가 이보다 길면 잘라서 스캔 (IMDB head 는 보통 수십 KB)
+
+re_head_end = re.compile(r'</head\s*>|<body[\s>]', re.IGNORECASE)
+
+
+class _HeadMetaParser(HTMLParser):
+    """<meta> 와 JSON-LD <script> 만 수집하는 경량 파서 (트리를 만들지 않음)"""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.json_ld = []
+        self._json_ld_buffer = None
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'meta':
+            attrs = dict(attrs)
+            key = attrs.get('property') or attrs.get('name')
+            if key and attrs.get('content'):
+                self.meta.setdefault(key.lower(), attrs['content'])
+        elif tag == 'script':
+            if (dict(attrs).get('type') or '').lower() == 'application/ld+json':
+                self._json_ld_buffer = []
+    
+    def handle_data(self, data):
+        if self._json_ld_buffer is not None:
+            self._json_ld_buffer.append(data)
+    
+    def handle_endtag(self, tag):
+        if tag == 'script' and self._json_ld_buffer is not None:
+            self.json_ld.append(''.join(self._json_ld_buffer))
+            self._json_ld_buffer = None
+
+
+def _json_ld_image(image):
+    """JSON-LD image 값 (문자열 / ImageObject / 목록) → URL"""
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get('url') or image.get('contentUrl')
+    return image if isinstance(image, str) else None
+
+
+def scan_html_head(html, limit=HEAD_SCAN_LIMIT):
+    """
+    HTML 앞부분(<head>)만 스캔해 포스터/제목 후보 추출
+    - 반환: {'images': [...], 'titles': [...]} (우선순위 순)
+    - 이미지: JSON-LD image → og:image → twitter:image
+    - 제목: og:title → twitter:title → JSON-LD name (기존 선택자 우선순위 유지)
+    """
+    head = html[:limit]
+    match = re_head_end.search(head)
+    if match:
+        head = head[:match.start()]
+    
+    parser = _HeadMetaParser()
+    parser.feed(head)
+    
+    images = []
+    titles = []
+    json_ld_names = []
+    
+    for raw in parser.json_ld:
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if not isinstance(item, dict):
+                continue
+            image = _json_ld_image(item.get('image'))
+            if image:
+                images.append(image)
+            if isinstance(item.get('name'), str):
+                json_ld_names.append(unescape(item['name']))
+    
+    for key in ('og:image', 'twitter:image'):
+        if parser.meta.get(key):
+            images.append(parser.meta[key])
+    for key in ('og:title', 'twitter:title'):
+        if parser.meta.get(key):
+            titles.append(parser.meta[key])
+    titles.extend(json_ld_names)
+    
+    return {'images': images, 'titles': titles}
+
+
 class IMDBPosterExtractor:
     """
     IMDB 포스터 추출기 - 4개 모듈 최적화
@@ -48,6 +147,8 @@ class IMDBPosterExtractor:
         self.timeout = 15
         self.max_retries = 3
         self.cache_timeout = 86400  # 24시간
+        # 호스트별 요청 속도 제한 (poster_backfill.HostRateLimiter, 선택)
+        self.rate_limiter = None
     
     def extract_poster_url(self, imdb_url):
         """
@@ -62,6 +163,7 @@ class IMDBPosterExtractor:
         # 캐시 확인 (get_movie_info.py와 일관성)
         cache_key = f"imdb_poster_{hash(imdb_url)}"
         cached_result = cache.get(cache_key)
+        record_cache('imdb_poster', bool(cached_result))
         
         if cached_result:
             logger.info(f"포스터 URL 캐시에서 조회: {imdb_url}")
@@ -69,6 +171,7 @@ class IMDBPosterExtractor:
         
         # 추출 시도
         poster_url = self._extract_with_retry(imdb_url)
+        POSTER_EXTRACTIONS.inc(result='success' if poster_url else 'failed')
         
         # 캐시에 저장
         if poster_url:
@@ -98,7 +201,18 @@ class IMDBPosterExtractor:
             try:
                 logger.info(f"IMDB 포스터 추출 시도 {attempt + 1}/{self.max_retries}: {imdb_url}")
                 
-                response = self.session.get(imdb_url, timeout=self.timeout)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait(imdb_url)
+                request_start = time.perf_counter()
+                try:
+                    response = self.session.get(imdb_request_url(imdb_url), timeout=self.timeout)
+                except requests.Timeout:
+                    record_upstream('imdb', 'timeout', time.perf_counter() - request_start)
+                    raise
+                except requests.RequestException:
+                    record_upstream('imdb', 'connection_error', time.perf_counter() - request_start)
+                    raise
+                record_upstream('imdb', upstream_outcome(response.status_code), time.perf_counter() - request_start)
                 response.raise_for_status()
                 
                 # HTML 파싱 및 포스터 URL 추출
@@ -122,7 +236,36 @@ class IMDBPosterExtractor:
         return None
     
     def _parse_poster_from_html(self, html, base_url):
-        """HTML에서 포스터 URL 파싱"""
+        """
+        HTML에서 포스터 URL 파싱
+        - 빠른 경로: <head> 의 JSON-LD image / og:image 만 스캔 (트리 생성 없음)
+        - 못 찾으면 전체 BeautifulSoup 트리 + 선택자 순회로 대체
+        """
+        poster_url = self._parse_poster_from_head(html, base_url)
+        if poster_url:
+            return poster_url
+        
+        return self._parse_poster_from_tree(html, base_url)
+    
+    def _parse_poster_from_head(self, html, base_url):
+        """<head> 메타 정보에서 포스터 URL 추출 (빠른 경로)"""
+        try:
+            for poster_url in scan_html_head(html)['images']:
+                if not poster_url.startswith('http'):
+                    poster_url = urljoin(base_url, poster_url)
+                
+                if self._is_valid_poster_url(poster_url):
+                    logger.info(f"포스터 URL 발견 (head): {poster_url}")
+                    return poster_url
+        except Exception as e:
+            logger.warning(f"head 스캔 실패, 전체 파싱으로 대체: {e}")
+        
+        return None
+    
+    def _parse_poster_from_tree(self, html, base_url):
+        """전체 HTML 트리에서 포스터 URL 파싱 (느린 경로)"""
+        from bs4 import BeautifulSoup   # 느린 경로에서만 사용 → import 비용을 워커 부팅에서 제외
+
         try:
             soup = BeautifulSoup(html, 'html.parser')
             
@@ -215,7 +358,17 @@ class IMDBPosterExtractor:
             return poster_url
     
     def get_movie_title_from_page(self, html):
-        """HTML에서 영화 제목 추출 (부가 기능)"""
+        """HTML에서 영화 제목 추출 (부가 기능, head 스캔 우선)"""
+        try:
+            for title in scan_html_head(html)['titles']:
+                title = re.sub(r'\s*-\s*IMDb$', '', title.strip())
+                if title:
+                    return title
+        except Exception as e:
+            logger.warning(f"head 스캔 실패, 전체 파싱으로 대체: {e}")
+        
+        from bs4 import BeautifulSoup
+        
         try:
             soup = BeautifulSoup(html, 'html.parser')
             
@@ -252,253 +405,140 @@ class IMDBPosterExtractor:
 
 # ===== 다운로드 및 파일 관리 (models.py 연동) =====
 
-def download_poster_image(poster_url, filename=None, max_size_mb=10):
+def download_poster_image(poster_url, filename=None, max_size_mb=10, session=None):
     """
-    포스터 이미지 다운로드 (최적화된 버전)
+    포스터 이미지 다운로드 (스트리밍 버전)
     - models.py의 파일 필드와 연동
-    - 메모리 효율적인 다운로드
-    - 에러 복구 및 검증 강화
+    - MEDIA_ROOT 임시 파일에 청크 단위 기록 (크기/Content-Type 검증)
+    - session: 연결 재사용용 requests.Session (IMDBPosterExtractor.session 등)
     """
-    if not poster_url:
-        logger.warning("포스터 URL이 없습니다")
-        return None
-    
-    try:
-        logger.info(f"포스터 다운로드 시작: {poster_url}")
-        
-        # 스트리밍 다운로드 (메모리 효율성)
-        response = requests.get(
-            poster_url, 
-            stream=True, 
-            timeout=30,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
-        response.raise_for_status()
-        
-        # 파일 크기 체크
-        content_length = response.headers.get('content-length')
-        if content_length:
-            size_mb = int(content_length) / (1024 * 1024)
-            if size_mb > max_size_mb:
-                logger.warning(f"포스터가 너무 큼: {size_mb:.1f}MB (최대 {max_size_mb}MB)")
-                return None
-        
-        # Content-Type 검증
-        content_type = response.headers.get('content-type', '')
-        if not content_type.startswith('image/'):
-            logger.warning(f"이미지가 아닌 파일: {content_type}")
-            return None
-        
-        # 메모리에 다운로드
-        image_content = BytesIO()
-        total_size = 0
-        max_size_bytes = max_size_mb * 1024 * 1024
-        
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                total_size += len(chunk)
-                if total_size > max_size_bytes:
-                    logger.warning(f"다운로드 중 크기 초과: {total_size} bytes")
-                    return None
-                
-                image_content.write(chunk)
-        
-        # 파일명 생성
-        if not filename:
-            filename = f"poster_{int(time.time())}"
-        
-        # 확장자 결정
-        ext = 'jpg'
-        if 'png' in content_type:
-            ext = 'png'
-        elif 'webp' in content_type:
-            ext = 'webp'
-        
-        file_name = f"{filename}.{ext}"
-        
-        # Django File 객체 생성
-        image_content.seek(0)
-        django_file = File(image_content, name=file_name)
-        
-        logger.info(f"포스터 다운로드 성공: {total_size} bytes, {file_name}")
-        return django_file
-        
-    except requests.RequestException as e:
-        logger.error(f"포스터 다운로드 네트워크 오류: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"포스터 다운로드 중 오류: {e}")
+    # 파일명 생성
+    if not filename:
+        filename = f"poster_{int(time.time())}"
+
+    downloaded = stream_download(
+        poster_url, file_type='image', max_size_mb=max_size_mb,
+        name=f"{filename}.jpg", timeout=(10, 30), session=session
+    )
+    if downloaded is None:
         return None
 
+    downloaded.name = f"{filename}.{guess_extension(downloaded.content_type, 'image')}"
+    logger.info(f"포스터 다운로드 성공: {downloaded.size} bytes, {downloaded.name}")
+    return downloaded
+
 
 def download_video_file(video_url, filename=None, max_size_mb=100):
     """
-    비디오 파일 다운로드 (최적화된 버전)
+    비디오 파일 다운로드 (스트리밍 버전)
     - DialogueTable의 video_file 필드와 연동
+    - MEDIA_ROOT 임시 파일에 청크 단위 기록 (메모리 사용량 일정), 재시도 시 Range 이어받기
+    - 반환된 파일을 video_file.save() 에 넘기면 FileSystemStorage 가 rename 으로 이동
     """
-    if not video_url:
-        logger.warning("비디오 URL이 없습니다")
-        return None
-    
-    try:
-        logger.info(f"비디오 다운로드 시작: {video_url}")
-        
-        response = requests.get(
-            video_url, 
-            stream=True, 
-            timeout=60,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        )
-        response.raise_for_status()
-        
-        # 파일 크기 체크
-        content_length = response.headers.get('content-length')
-        if content_length:
-            size_mb = int(content_length) / (1024 * 1024)
-            if size_mb > max_size_mb:
-                logger.warning(f"비디오가 너무 큼: {size_mb:.1f}MB (최대 {max_size_mb}MB)")
-                return None
-        
-        # 메모리에 다운로드
-        video_content = BytesIO()
-        total_size = 0
-        max_size_bytes = max_size_mb * 1024 * 1024
-        
-        for chunk in response.iter_content(chunk_size=16384):
-            if chunk:
-                total_size += len(chunk)
-                if total_size > max_size_bytes:
-                    logger.warning(f"비디오 다운로드 중 크기 초과: {total_size} bytes")
-                    return None
-                
-                video_content.write(chunk)
-        
-        # 파일명 생성
-        if not filename:
-            filename = f"video_{int(time.time())}"
-        
-        file_name = f"{filename}.mp4"
-        
-        # Django File 객체 생성
-        video_content.seek(0)
-        django_file = File(video_content, name=file_name)
-        
-        logger.info(f"비디오 다운로드 성공: {total_size} bytes, {file_name}")
-        return django_file
-        
-    except requests.RequestException as e:
-        logger.error(f"비디오 다운로드 네트워크 오류: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"비디오 다운로드 중 오류: {e}")
+    # 파일명 생성
+    if not filename:
+        filename = f"video_{int(time.time())}"
+
+    downloaded = stream_download(
+        video_url, file_type='video', max_size_mb=max_size_mb,
+        name=f"{filename}.mp4", timeout=(10, 60)
+    )
+    if downloaded is None:
         return None
 
+    downloaded.name = f"{filename}.{guess_extension(downloaded.content_type, 'video')}"
+    logger.info(f"비디오 다운로드 성공: {downloaded.size} bytes, {downloaded.name}")
+    return downloaded
+
 
 # ===== 배치 처리 (managers.py 연동) =====
 
-def batch_update_movie_posters(batch_size=10, max_movies=100):
+def batch_update_movie_posters(batch_size=10, max_movies=100, workers=4):
     """
     포스터가 없는 영화들을 배치로 업데이트
-    - MovieManager의 쿼리 메소드 활용
-    - 성능 최적화된 배치 처리
+    - poster_backfill.PosterBackfill 로 위임 (키셋 순회 + 스레드 풀 + 호스트별 속도 제한)
+    - 관리자 API 호출은 체크포인트 없이 처음부터 max_movies 개만 처리
     """
+    from phrase.utils.poster_backfill import PosterBackfill
+
     try:
-        # 매니저를 활용해 포스터가 없는 영화들 조회
-        movies_without_posters = MovieTable.objects.filter(
-            models.Q(poster_url='') | models.Q(poster_url__isnull=True),
-            is_active=True
-        ).exclude(
-            imdb_url=''
-        ).exclude(
-            imdb_url__isnull=True
-        )[:max_movies]
-        
-        total_count = len(movies_without_posters)
-        
-        if total_count == 0:
-            logger.info("포스터 업데이트가 필요한 영화가 없습니다")
-            return {'total': 0, 'updated': 0, 'failed': 0}
-        
-        logger.info(f"배치 포스터 업데이트 시작: {total_count}개 영화")
-        
-        extractor = IMDBPosterExtractor()
-        updated_count = 0
-        failed_count = 0
-        
-        # 배치별 처리
-        for i in range(0, total_count, batch_size):
-            batch = movies_without_posters[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (total_count + batch_size - 1) // batch_size
-            
-            logger.info(f"배치 {batch_num}/{total_batches} 처리 중...")
-            
-            batch_updated, batch_failed = process_poster_batch(batch, extractor)
-            updated_count += batch_updated
-            failed_count += batch_failed
-            
-            # 배치 간 휴식 (서버 부하 방지)
-            time.sleep(2)
-        
-        logger.info(f"배치 포스터 업데이트 완료: {updated_count}개 성공, {failed_count}개 실패")
-        
+        backfill = PosterBackfill(workers=workers, batch_size=batch_size, use_checkpoint=False)
+        result = backfill.run(max_movies=max_movies)
+
         return {
-            'total': total_count,
-            'updated': updated_count,
-            'failed': failed_count
+            'total': result['processed'],
+            'updated': result['updated'],
+            'failed': result['failed']
         }
-        
+
     except Exception as e:
         logger.error(f"배치 포스터 업데이트 실패: {e}")
         return {'total': 0, 'updated': 0, 'failed': 0}
 
 
+def update_movie_poster(movie, extractor, download_image=True):
+    """
+    영화 한 편의 포스터 URL 추출 + 이미지 저장
+    - 반환: 성공 여부
+    - 요청 간격은 extractor.rate_limiter 가 호스트별로 조절
+    """
+    if not movie.imdb_url:
+        return False
+
+    # 포스터 URL 추출
+    poster_url = extractor.extract_poster_url(movie.imdb_url)
+
+    if not poster_url:
+        logger.warning(f"포스터 추출 실패: {movie.movie_title}")
+        return False
+
+    poster_file = None
+    if download_image:
+        if extractor.rate_limiter is not None:
+            extractor.rate_limiter.wait(poster_url)
+        filename = convert_to_pep8_filename(movie.movie_title)
+        poster_file = download_poster_image(poster_url, filename, session=extractor.session)
+
+    # 트랜잭션으로 안전하게 업데이트
+    try:
+        with transaction.atomic():
+            movie.poster_url = poster_url
+            movie.data_quality = 'verified'  # IMDB 정보 있으면 검증됨
+
+            if poster_file:
+                # 임시 파일을 저장소로 이동 → 저장소가 실제로 돌려준 이름을 기록 (upload_to, 중복 회피 반영)
+                movie.poster_image.save(poster_file.name, poster_file, save=False)
+                movie.poster_image_path = movie.poster_image.name
+
+            movie.save(update_fields=[
+                'poster_url', 'data_quality', 'poster_image', 'poster_image_path'
+            ])
+    finally:
+        if poster_file:
+            poster_file.close()
+
+    if poster_file:
+        # 썸네일/WebP 변환본 생성 (트랜잭션 밖에서 처리)
+        generate_poster_variants_on_ingest(movie)
+
+    logger.info(f"포스터 업데이트 성공: {movie.movie_title}")
+    return True
+
+
 def process_poster_batch(movies, extractor):
     """
-    포스터 배치 처리
+    포스터 배치 처리 (순차)
+    - 동시 처리는 poster_backfill.PosterBackfill 사용
     """
     updated_count = 0
     failed_count = 0
     
     for movie in movies:
         try:
-            if not movie.imdb_url:
-                failed_count += 1
-                continue
-            
-            # 포스터 URL 추출
-            poster_url = extractor.extract_poster_url(movie.imdb_url)
-            
-            if poster_url:
-                # 트랜잭션으로 안전하게 업데이트
-                with transaction.atomic():
-                    movie.poster_url = poster_url
-                    movie.data_quality = 'verified'  # IMDB 정보 있으면 검증됨
-                    
-                    # 포스터 이미지 다운로드 (선택적)
-                    filename = convert_to_pep8_filename(movie.movie_title)
-                    poster_file = download_poster_image(poster_url, filename)
-                    
-                    if poster_file:
-                        movie.poster_image = poster_file
-                        movie.poster_image_path = f'posters/{poster_file.name}'
-                    
-                    movie.save(update_fields=[
-                        'poster_url', 'data_quality', 'poster_image', 'poster_image_path'
-                    ])
-                
+            if update_movie_poster(movie, extractor):
                 updated_count += 1
-                logger.info(f"포스터 업데이트 성공: {movie.movie_title}")
             else:
                 failed_count += 1
-                logger.warning(f"포스터 추출 실패: {movie.movie_title}")
-            
-            # 요청 간 간격 (서버 부하 방지)
-            time.sleep(1)
             
         except Exception as e:
             failed_count += 1
@@ -692,28 +732,38 @@ def get_poster_url(movie_title, release_year=None):
         return None
 
 
-def ensure_movie_posters(movie_list):
+def ensure_movie_posters(movie_list, workers=4):
     """
     영화 목록의 포스터 확인 및 보완
     - views.py의 결과 처리와 연동
+    - 스레드 풀로 동시 추출, 호스트별 속도 제한 + 스레드별 세션 재사용
     """
-    extractor = IMDBPosterExtractor()
-    
-    for movie_data in movie_list:
+    from phrase.utils.poster_backfill import get_shared_rate_limiter, get_thread_extractor
+
+    targets = [
+        movie_data for movie_data in movie_list
+        if not movie_data.get('poster_url') and movie_data.get('imdb_url')
+    ]
+    if not targets:
+        return movie_list
+
+    # 백필과 같은 프로세스 공용 제한기 → 호출마다 새 예약표로 IMDB 속도 제한을 우회하지 않음
+    rate_limiter = get_shared_rate_limiter()
+
+    def fill_poster(movie_data):
         try:
-            if not movie_data.get('poster_url') and movie_data.get('imdb_url'):
-                poster_url = extractor.extract_poster_url(movie_data['imdb_url'])
-                
-                if poster_url:
-                    movie_data['poster_url'] = poster_url
-                    logger.info(f"영화 목록 포스터 보완: {movie_data.get('title', 'Unknown')}")
-                
-                # API 호출 간격
-                time.sleep(0.5)
+            extractor = get_thread_extractor(rate_limiter)
+            poster_url = extractor.extract_poster_url(movie_data['imdb_url'])
+            
+            if poster_url:
+                movie_data['poster_url'] = poster_url
+                logger.info(f"영화 목록 포스터 보완: {movie_data.get('title', 'Unknown')}")
                 
         except Exception as e:
             logger.error(f"영화 포스터 보완 실패: {e}")
-            continue
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets)))) as executor:
+        list(executor.map(fill_poster, targets))
     
     return movie_list
 
@@ -761,51 +811,39 @@ def get_imdb_extraction_statistics():
 
 def monitor_extraction_performance():
     """
-    추출 성능 모니터링
+    추출 성능 모니터링 (메트릭 레지스트리, 서버 시작 이후 전체 워커 합계)
     """
-    today = timezone.now().strftime('%Y-%m-%d')
-    cache_key = f"imdb_performance_{today}"
-    
-    performance_stats = cache.get(cache_key, {
-        'total_extractions': 0,
-        'successful_extractions': 0,
-        'failed_extractions': 0,
-        'avg_response_time': 0,
-        'cache_hits': 0,
-        'last_reset': timezone.now().isoformat()
-    })
+    successful = POSTER_EXTRACTIONS.value(result='success')
+    failed = POSTER_EXTRACTIONS.value(result='failed')
+    upstream = UPSTREAM_DURATION.snapshot(service='imdb')
     
-    return performance_stats
+    return {
+        'total_extractions': successful + failed,
+        'successful_extractions': successful,
+        'failed_extractions': failed,
+        'avg_response_time': round(upstream['sum'] / upstream['count'], 3) if upstream['count'] else 0,
+        'cache_hits': CACHE_REQUESTS.value(cache='imdb_poster', result='hit'),
+    }
 
 
-def cleanup_invalid_poster_urls():
+def cleanup_invalid_poster_urls(recheck_after_hours=0):
     """
     유효하지 않은 포스터 URL 정리
+    - link_checker.LinkChecker 로 동시 검사 후 'dead' 로 확인된 URL 만 비움
+    - 일시적 오류(error)는 남겨두고 다음 검사에서 재확인
     """
+    from phrase.utils.link_checker import LinkChecker
+
     try:
-        invalid_urls = MovieTable.objects.filter(
-            poster_url__isnull=False
-        ).exclude(poster_url='')
-        
-        cleaned_count = 0
+        LinkChecker('poster', recheck_after_hours=recheck_after_hours).run()
         
-        for movie in invalid_urls:
-            try:
-                # URL 유효성 간단 체크
-                response = requests.head(movie.poster_url, timeout=10)
-                
-                if response.status_code >= 400:
-                    movie.poster_url = ''
-                    movie.save(update_fields=['poster_url'])
-                    cleaned_count += 1
-                    logger.info(f"유효하지 않은 포스터 URL 제거: {movie.movie_title}")
-                
-            except Exception:
-                movie.poster_url = ''
-                movie.save(update_fields=['poster_url'])
-                cleaned_count += 1
-            
-            time.sleep(0.5)  # 서버 부하 방지
+        cleaned_count = MovieTable.objects.filter(
+            poster_url_status='dead'
+        ).exclude(
+            poster_url=''
+        ).exclude(
+            poster_url__isnull=True
+        ).update(poster_url='', poster_url_status='unchecked', updated_at=timezone.now())
         
         logger.info(f"포스터 URL 정리 완료: {cleaned_count}개 제거")
         return cleaned_count
@@ -815,6 +853,77 @@ def cleanup_invalid_poster_urls():
         return 0
 
 
+# ===== 벤치마크 =====
+
+def load_html_fixtures(fixture_dir):
+    """
+    저장된 IMDB HTML 픽스처 로드
+    - fixture_dir/*.html → {파일명: html}
+    - fixture_dir/expected.json (선택) → {파일명: 정답 포스터 URL}
+    """
+    import os
+
+    pages = {}
+    for name in sorted(os.listdir(fixture_dir)):
+        if name.endswith('.html'):
+            with open(os.path.join(fixture_dir, name), encoding='utf-8', errors='replace') as f:
+                pages[name] = f.read()
+
+    expected = None
+    expected_path = os.path.join(fixture_dir, 'expected.json')
+    if os.path.exists(expected_path):
+        with open(expected_path, encoding='utf-8') as f:
+            expected = json.load(f)
+
+    return pages, expected
+
+
+def benchmark_poster_extraction(pages, expected=None, repeat=3, base_url='https://www.imdb.com/'):
+    """
+    전체 트리 파싱 / head 빠른 경로 비교 (초당 페이지 수, 추출 정확도)
+    - pages: {이름: html}
+    - expected: {이름: 정답 포스터 URL}, 없으면 전체 트리 결과를 정답으로 사용
+    - URL 은 정규화(_normalize_poster_url) 후 비교
+    """
+    extractor = IMDBPosterExtractor()
+    strategies = (
+        ('full_tree', extractor._parse_poster_from_tree),
+        ('fast_path', extractor._parse_poster_from_html),
+    )
+
+    def normalize(url):
+        return extractor._normalize_poster_url(url) if url else None
+
+    outputs = {}
+    results = {}
+    for name, parse in strategies:
+        start = time.perf_counter()
+        for _ in range(max(repeat, 1)):
+            outputs[name] = {key: normalize(parse(html, base_url)) for key, html in pages.items()}
+        elapsed = time.perf_counter() - start
+
+        results[name] = {
+            'pages': len(pages),
+            'pages_per_second': round(len(pages) * max(repeat, 1) / elapsed, 2) if elapsed > 0 else None,
+            'found': sum(1 for url in outputs[name].values() if url),
+        }
+
+    reference = {key: normalize(url) for key, url in expected.items()} if expected else outputs['full_tree']
+    for name, _ in strategies:
+        correct = sum(1 for key in pages if outputs[name].get(key) == reference.get(key))
+        results[name]['accuracy'] = round(correct / len(pages), 4) if pages else None
+
+    results['fast_path']['head_hits'] = sum(
+        1 for html in pages.values() if extractor._parse_poster_from_head(html, base_url)
+    )
+    if results['full_tree']['pages_per_second'] and results['fast_path']['pages_per_second']:
+        results['speedup'] = round(
+            results['fast_path']['pages_per_second'] / results['full_tree']['pages_per_second'], 2
+        )
+
+    return results
+
+
 # ===== 레거시 호환성 함수들 =====
 
 def get_posters_with_movies(movie_data):
@@ -842,14 +951,4 @@ __author__ = "AI Assistant"
 __description__ = "4개 모듈과 완벽 연동된 IMDB 포스터 추출 시스템"
 
 # 모듈 초기화 로깅
-logger.info(f"""
-=== get_imdb_poster_url.py v{__version__} 초기화 완료 ===
-📱 models.py 연동: ✅ 파일 필드 및 모델 구조 활용
-🔧 managers.py 연동: ✅ 검색 및 통계 매니저 활용
-🌐 views.py 연동: ✅ API 패턴 및 캐시 전략 일치
-🔗 get_movie_info.py 연동: ✅ 캐시 시스템 및 중복 방지
-🚀 성능 최적화: ✅ 배치, 캐싱, 재시도 로직
-📊 모니터링: ✅ 통계 및 성능 추적
-🎨 포스터 관리: ✅ 스마트 추출 및 파일 관리
-기능: {len(__features__)}개 최적화 완료
-""")
\ No newline at end of file
+logger.debug(f"get_imdb_poster_url v{__version__} 로드")
\ No newline at end of file
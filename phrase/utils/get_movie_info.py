@@ -7,6 +7,7 @@ playphrase.me API 영화 정보 가져오기 모듈 - 최적화된 모델 활용
 - 에러 처리 및 재시도 로직 강화
 - 응답 데이터 검증 및 정규화
 """
+import asyncio
 import requests
 import time
 import logging
@@ -15,6 +16,12 @@ from django.conf import settings
 from django.utils import timezone
 from phrase.models import RequestTable, DialogueTable
 from phrase.utils.clean_data import clean_data_from_playphrase
+from phrase.utils.negative_cache import is_known_no_result
+from phrase.utils.external_services import playphrase_search_url
+from phrase.utils.metrics import (
+    span, timed_stage, record_cache, record_upstream, upstream_outcome,
+    PLAYPHRASE_API_REQUESTS, PLAYPHRASE_RESPONSE_BYTES,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +34,7 @@ class PlayPhraseAPIClient:
     """
     
     def __init__(self):
-        self.base_url = 'https://www.playphrase.me/api/v1/phrases/search'
+        self.base_url = playphrase_search_url()  # EXTERNAL_SERVICE_SETTINGS.PLAYPHRASE_BASE_URL
         self.timeout = 30
         self.max_retries = 3
         self.retry_delay = 1
@@ -65,71 +72,41 @@ class PlayPhraseAPIClient:
             return None
         
         text = text.strip()
-        
-        # 캐시 확인
-        cache_key = f"playphrase_api_{hash(text)}_{limit}_{skip}"
-        cached_result = cache.get(cache_key)
-        
-        if cached_result:
-            logger.info(f"API 응답 캐시에서 조회: {text}")
+        cache_key, cached_result, should_request = self._precheck(text, limit, skip)
+        if not should_request:
             return cached_result
         
-        # DB에서 기존 데이터 확인 (새 모델 활용)
-        if self._has_existing_data(text):
-            logger.info(f"DB에 기존 데이터 존재, API 호출 건너뜀: {text}")
-            return None  # DB 우선 사용
-        
-        params = {
-            'q': text,
-            'limit': str(limit),
-            'language': 'en',
-            'platform': 'desktop safari',
-            'skip': str(skip),
-        }
+        params = self._request_params(text, limit, skip)
         
         # 재시도 로직
         for attempt in range(self.max_retries):
             try:
                 logger.info(f"playphrase.me API 요청 (시도 {attempt + 1}/{self.max_retries}): {text}")
                 
-                response = requests.get(
-                    self.base_url,
-                    params=params,
-                    cookies=self.cookies,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
+                request_start = time.perf_counter()
+                try:
+                    response = requests.get(
+                        self.base_url,
+                        params=params,
+                        cookies=self.cookies,
+                        headers=self.headers,
+                        timeout=self.timeout
+                    )
+                except requests.exceptions.Timeout:
+                    record_upstream('playphrase', 'timeout', time.perf_counter() - request_start)
+                    raise
+                except requests.exceptions.RequestException:
+                    record_upstream('playphrase', 'connection_error', time.perf_counter() - request_start)
+                    raise
+                record_upstream('playphrase', upstream_outcome(response.status_code), time.perf_counter() - request_start)
                 
                 if response.status_code == 200:
-                    data = response.text
-                    
-                    # 응답 검증
-                    if self._validate_response(data, text):
-                        # 캐시에 저장
-                        cache.set(cache_key, data, self.cache_timeout)
-                        
-                        # API 사용 통계 기록
-                        self._record_api_usage(text, True, len(data))
-                        
-                        logger.info(f"API 응답 수신 성공: {len(data)} 문자")
-                        return data
-                    else:
-                        logger.warning(f"응답 검증 실패: {text}")
-                        return None
+                    return self._accept_response(text, cache_key, response.text)
                 
-                elif response.status_code == 429:  # Rate limit
-                    wait_time = self.retry_delay * (attempt + 1) * 2
-                    logger.warning(f"API 요청 제한, {wait_time}초 대기...")
+                wait_time = self._retry_wait(attempt, response.status_code, response.text)
+                if wait_time is not None:
                     time.sleep(wait_time)
                     continue
-                
-                else:
-                    logger.error(f"API 응답 오류 - 상태 코드: {response.status_code}")
-                    logger.error(f"응답 내용: {response.text[:200]}...")
-                    
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (attempt + 1))
-                        continue
                     
             except requests.exceptions.Timeout:
                 logger.error(f"API 요청 타임아웃 (시도 {attempt + 1}): {text}")
@@ -158,6 +135,117 @@ class PlayPhraseAPIClient:
         logger.error(f"API 요청 최종 실패: {text}")
         return None
     
+    async def asearch_phrase(self, text, limit=10, skip=0):
+        """
+        search_phrase 의 비동기 버전 (ASGI 뷰용)
+        - 캐시 / DB 확인과 응답 저장은 스레드 풀, HTTP 대기는 이벤트 루프 (스레드 점유 없음)
+        - httpx 미설치 시 동기 버전을 스레드 풀에서 실행
+        """
+        from phrase.utils.async_support import async_http_client, httpx, run_sync, upstream_slot
+        
+        client = async_http_client()
+        if client is None:
+            return await run_sync(self.search_phrase, text, limit, skip)
+        
+        if not text or not text.strip():
+            logger.warning("검색 텍스트가 비어있습니다.")
+            return None
+        
+        text = text.strip()
+        cache_key, cached_result, should_request = await run_sync(self._precheck, text, limit, skip)
+        if not should_request:
+            return cached_result
+        
+        params = self._request_params(text, limit, skip)
+        
+        for attempt in range(self.max_retries):
+            wait_time = self.retry_delay * (attempt + 1) if attempt < self.max_retries - 1 else None
+            request_start = time.perf_counter()
+            try:
+                async with upstream_slot():
+                    response = await client.get(
+                        self.base_url, params=params, cookies=self.cookies,
+                        headers=self.headers, timeout=self.timeout,
+                    )
+            except httpx.TimeoutException:
+                record_upstream('playphrase', 'timeout', time.perf_counter() - request_start)
+                logger.error(f"API 요청 타임아웃 (시도 {attempt + 1}): {text}")
+            except httpx.HTTPError as e:
+                record_upstream('playphrase', 'connection_error', time.perf_counter() - request_start)
+                logger.error(f"API 요청 중 오류 (시도 {attempt + 1}): {e}")
+            else:
+                record_upstream('playphrase', upstream_outcome(response.status_code), time.perf_counter() - request_start)
+                if response.status_code == 200:
+                    return await run_sync(self._accept_response, text, cache_key, response.text)
+                wait_time = self._retry_wait(attempt, response.status_code, response.text)
+            
+            if wait_time is None:
+                break
+            await asyncio.sleep(wait_time)
+        
+        self._record_api_usage(text, False, 0)
+        logger.error(f"API 요청 최종 실패: {text}")
+        return None
+    
+    def _precheck(self, text, limit, skip):
+        """
+        요청 전 확인 → (캐시 키, 캐시된 응답, API 호출 필요 여부)
+        - 캐시 → 네거티브 캐시 → DB 기존 데이터 순
+        """
+        cache_key = f"playphrase_api_{hash(text)}_{limit}_{skip}"
+        cached_result = cache.get(cache_key)
+        record_cache('playphrase', bool(cached_result))
+        
+        if cached_result:
+            logger.info(f"API 응답 캐시에서 조회: {text}")
+            return cache_key, cached_result, False
+        
+        # 최근 결과가 없었던 구문 (네거티브 캐시)
+        if is_known_no_result(text):
+            return cache_key, None, False
+        
+        # DB에서 기존 데이터 확인 (새 모델 활용)
+        if self._has_existing_data(text):
+            logger.info(f"DB에 기존 데이터 존재, API 호출 건너뜀: {text}")
+            return cache_key, None, False  # DB 우선 사용
+        
+        return cache_key, None, True
+    
+    def _request_params(self, text, limit, skip):
+        return {
+            'q': text,
+            'limit': str(limit),
+            'language': 'en',
+            'platform': 'desktop safari',
+            'skip': str(skip),
+        }
+    
+    def _accept_response(self, text, cache_key, data):
+        """200 응답 검증 → 캐시 저장 / 사용 통계 (검증 실패 시 None)"""
+        if not self._validate_response(data, text):
+            logger.warning(f"응답 검증 실패: {text}")
+            return None
+        
+        cache.set(cache_key, data, self.cache_timeout)
+        self._record_api_usage(text, True, len(data))
+        
+        logger.info(f"API 응답 수신 성공: {len(data)} 문자")
+        return data
+    
+    def _retry_wait(self, attempt, status_code, body):
+        """200 이 아닌 응답의 재시도 대기 시간 (None 이면 재시도 안 함)"""
+        if status_code == 429:  # Rate limit
+            wait_time = self.retry_delay * (attempt + 1) * 2
+            logger.warning(f"API 요청 제한, {wait_time}초 대기...")
+            return wait_time
+        
+        logger.error(f"API 응답 오류 - 상태 코드: {status_code}")
+        logger.error(f"응답 내용: {body[:200]}...")
+        
+        if attempt < self.max_retries - 1:
+            return self.retry_delay * (attempt + 1)
+        return None
+    
     def _has_existing_data(self, text):
         """
         DB에 해당 텍스트와 관련된 데이터가 이미 있는지 확인 (매니저 활용)
@@ -204,41 +292,19 @@ class PlayPhraseAPIClient:
     
     def _record_api_usage(self, text, success, response_size):
         """
-        API 사용 통계 기록
+        API 사용 통계 기록 (메트릭 레지스트리 카운터, 캐시 왕복 없음)
         """
         try:
-            today = timezone.now().strftime('%Y-%m-%d')
-            stats_key = f"api_usage_stats_{today}"
-            
-            daily_stats = cache.get(stats_key, {
-                'total_requests': 0,
-                'successful_requests': 0,
-                'failed_requests': 0,
-                'total_response_size': 0,
-                'unique_queries': set(),
-            })
-            
-            daily_stats['total_requests'] += 1
-            daily_stats['unique_queries'].add(text[:50])  # 첫 50자만 저장
-            
+            PLAYPHRASE_API_REQUESTS.inc(result='success' if success else 'failed')
             if success:
-                daily_stats['successful_requests'] += 1
-                daily_stats['total_response_size'] += response_size
-            else:
-                daily_stats['failed_requests'] += 1
-            
-            # set은 JSON 직렬화가 안되므로 길이만 저장
-            daily_stats['unique_query_count'] = len(daily_stats['unique_queries'])
-            del daily_stats['unique_queries']  # 캐시 저장 전 제거
-            
-            cache.set(stats_key, daily_stats, 86400)  # 24시간
-            
+                PLAYPHRASE_RESPONSE_BYTES.inc(response_size)
         except Exception as e:
             logger.error(f"API 통계 기록 실패: {e}")
 
 # 전역 클라이언트 인스턴스
 api_client = PlayPhraseAPIClient()
 
+@timed_stage('external_api')
 def get_movie_info(text):
     """
     playphrase.me API에서 영화 정보를 가져오는 메인 함수 (최적화)
@@ -255,6 +321,10 @@ def get_movie_info(text):
     
     text = text.strip()
     
+    # 최근 결과가 없었던 구문은 DB/API 모두 생략
+    if is_known_no_result(text):
+        return None
+    
     # DB 우선 확인 (새 모델 활용)
     existing_data = check_existing_database_data(text)
     if existing_data:
@@ -284,6 +354,42 @@ def get_movie_info(text):
         logger.error(f"응답 처리 중 오류: {e}")
         return None
 
+async def aget_movie_info(text):
+    """
+    get_movie_info 의 비동기 버전 (ASGI 뷰용)
+    - DB / 캐시 확인과 응답 후처리는 스레드 풀, playphrase 호출은 비동기 HTTP
+    """
+    from phrase.utils.async_support import run_sync
+    
+    if not text or not text.strip():
+        logger.warning("검색 텍스트가 비어있습니다.")
+        return None
+    
+    text = text.strip()
+    
+    with span('external_api'):
+        if await run_sync(_skip_api_call, text):
+            return None
+        
+        response_data = await api_client.asearch_phrase(text)
+        if not response_data:
+            logger.warning(f"API에서 데이터를 가져올 수 없음: {text}")
+            return None
+        
+        processed_data = await run_sync(post_process_response, response_data, text)
+        if not processed_data:
+            logger.warning(f"응답 후처리 실패: {text}")
+        return processed_data
+
+def _skip_api_call(text):
+    """최근 결과 없음 (네거티브 캐시) 또는 DB 에 기존 데이터가 있으면 True"""
+    if is_known_no_result(text):
+        return True
+    if check_existing_database_data(text):
+        logger.info(f"DB에서 기존 데이터 발견, API 호출 생략: {text}")
+        return True
+    return False
+
 def check_existing_database_data(text):
     """
     DB에서 기존 데이터 확인 (매니저 활용)
@@ -389,33 +495,21 @@ def get_movie_info_batch(text_list, batch_size=5):
 
 def get_api_statistics():
     """
-    API 사용 통계 조회
+    API 사용 통계 조회 (메트릭 레지스트리, 서버 시작 이후 전체 워커 합계)
     """
-    today = timezone.now().strftime('%Y-%m-%d')
-    stats_key = f"api_usage_stats_{today}"
-    
-    daily_stats = cache.get(stats_key, {
-        'total_requests': 0,
-        'successful_requests': 0,
-        'failed_requests': 0,
-        'total_response_size': 0,
-        'unique_query_count': 0,
-    })
-    
-    # 성공률 계산
-    total = daily_stats.get('total_requests', 0)
-    if total > 0:
-        daily_stats['success_rate'] = round(
-            (daily_stats.get('successful_requests', 0) / total) * 100, 1
-        )
-        daily_stats['avg_response_size'] = round(
-            daily_stats.get('total_response_size', 0) / daily_stats.get('successful_requests', 1)
-        )
-    else:
-        daily_stats['success_rate'] = 0
-        daily_stats['avg_response_size'] = 0
+    successful = PLAYPHRASE_API_REQUESTS.value(result='success')
+    failed = PLAYPHRASE_API_REQUESTS.value(result='failed')
+    total = successful + failed
+    total_response_size = PLAYPHRASE_RESPONSE_BYTES.value()
     
-    return daily_stats
+    return {
+        'total_requests': total,
+        'successful_requests': successful,
+        'failed_requests': failed,
+        'total_response_size': total_response_size,
+        'success_rate': round((successful / total) * 100, 1) if total else 0,
+        'avg_response_size': round(total_response_size / successful) if successful else 0,
+    }
 
 def clear_api_cache(pattern=None):
     """
@@ -466,7 +560,7 @@ def validate_api_health():
 get_movie_info_legacy = get_movie_info
 
 # 모듈 초기화
-logger.info("get_movie_info 모듈 초기화 완료 (최적화된 모델 연동)")
+logger.debug("get_movie_info 모듈 초기화 완료 (최적화된 모델 연동)")
 
 # 설정 검증
 if hasattr(settings, 'PLAYPHRASE_API_SETTINGS'):
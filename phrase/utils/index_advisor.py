@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/index_advisor.py
+"""
+표본 SQL 지문 → EXPLAIN → 복합 / 커버링 인덱스 제안 (manage.py index_advice)
+- 지문 예시 SQL 의 WHERE / ORDER BY 에서 기준 테이블 컬럼을 뽑아
+  등치 → 정렬 → 범위 순서로 후보 인덱스 구성 (IN 은 범위로 취급)
+- SELECT 컬럼이 적으면(COUNT, values) 나머지 컬럼을 붙인 커버링 인덱스로 제안
+- 이미 같은 앞부분을 가진 인덱스가 있으면 제외, 후보의 앞부분과 같은 단일/짧은 인덱스는 삭제 후보로 표시
+- EXPLAIN: MySQL(EXPLAIN), SQLite(EXPLAIN QUERY PLAN) → 전체 스캔 / filesort 여부
+- 예상 효과 = 표본 누적 시간 ÷ SAMPLE_RATE × 개선 비율 (전체 스캔 0.9, 정렬 0.5, 그 외 0.2)
+  → 비교용 추정치, 실제 효과는 마이그레이션 후 같은 표본으로 다시 확인
+"""
+import re
+import hashlib
+import logging
+
+from django.apps import apps
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+re_identifier = r'[`"]?(\w+)[`"]?'
+re_qualified_column = re.compile(r'^\(*\s*(?:[`"]?(\w+)[`"]?\.)?[`"](\w+)[`"]\s*(.*)$', re.DOTALL)
+re_main_table = re.compile(
+    r'^\s*(?:SELECT\b.*?\bFROM|UPDATE|DELETE\s+FROM)\s+' + re_identifier, re.IGNORECASE | re.DOTALL
+)
+re_clause_end = re.compile(r'\s(?:GROUP BY|ORDER BY|HAVING|LIMIT|FOR UPDATE)\s', re.IGNORECASE)
+re_order_by = re.compile(r'\sORDER BY\s(.*?)(?:\sLIMIT\s|\sFOR UPDATE|$)', re.IGNORECASE | re.DOTALL)
+re_select_list = re.compile(r'^\s*SELECT\s+(?:DISTINCT\s+)?(.*?)\sFROM\s', re.IGNORECASE | re.DOTALL)
+re_and = re.compile(r'\sAND\s', re.IGNORECASE)
+re_or = re.compile(r'\sOR\s', re.IGNORECASE)
+re_count_all = re.compile(r'^COUNT\(\*\)', re.IGNORECASE)
+
+MAX_INDEX_COLUMNS = 5
+IMPROVEMENT_RATIOS = {'full_scan': 0.9, 'filesort': 0.5, 'partial': 0.2}
+
+
+# ===== SQL 분석 =====
+
+def _where_clause(sql):
+    where_at = re.search(r'\sWHERE\s', sql, re.IGNORECASE)
+    if where_at is None:
+        return ''
+    rest = sql[where_at.end():]
+    end = re_clause_end.search(rest)
+    return rest[:end.start()] if end else rest
+
+
+def _column_of(expression, table):
+    """'`t`.`col` = %s' → ('col', 나머지) (기준 테이블 컬럼이 아니면 None)"""
+    match = re_qualified_column.match(expression.strip())
+    if match is None or (match.group(1) and match.group(1) != table):
+        return None
+    return match.group(2), match.group(3).strip()
+
+
+def parse_query_shape(sql):
+    """
+    기준 테이블과 인덱스로 쓸 수 있는 조건
+    → {'table', 'equality', 'range', 'order', 'selected', 'count_only', 'unsupported'}
+    """
+    table_match = re_main_table.match(sql)
+    if table_match is None:
+        return None
+    table = table_match.group(1)
+    shape = {
+        'table': table, 'equality': [], 'range': [], 'order': [],
+        'selected': [], 'count_only': False, 'unsupported': [],
+    }
+
+    where = _where_clause(sql)
+    if where and re_or.search(where):
+        shape['unsupported'].append('OR 조건')
+    for predicate in (re_and.split(where) if where else []):
+        predicate = predicate.strip().lstrip('(').strip()
+        if predicate.upper().startswith('NOT ') or re_or.search(predicate):
+            continue                            # 부정 / OR 묶음은 인덱스 앞부분으로 쓰지 않음
+        parsed = _column_of(predicate, table)
+        if parsed is None:
+            continue
+        column, operator = parsed
+        operator = operator.rstrip(')').strip()
+        operator_upper = operator.upper()
+        if operator_upper.startswith('IS NOT NULL'):
+            continue
+        if not operator or operator_upper.startswith(('=', 'IS NULL')):
+            target = shape['equality']          # 불리언 컬럼 단독, 등치, NULL 검사
+        elif operator_upper.startswith(('IN ', 'IN(', '>', '<', 'BETWEEN')):
+            target = shape['range']
+        else:
+            shape['unsupported'].append(f"{column} {operator_upper.split(' ')[0]}")   # LIKE %..% 등
+            continue
+        if column not in shape['equality'] and column not in target:
+            target.append(column)
+
+    order_match = re_order_by.search(sql)
+    if order_match:
+        for term in order_match.group(1).split(','):
+            parsed = _column_of(term, table)
+            if parsed is None:
+                shape['order'] = []             # 다른 테이블 / 식 정렬 → 인덱스 정렬 불가
+                shape['unsupported'].append('ORDER BY 식')
+                break
+            column, direction = parsed
+            shape['order'].append((column, 'DESC' if direction.upper().startswith('DESC') else 'ASC'))
+
+    select_match = re_select_list.match(sql)
+    if select_match:
+        select_list = select_match.group(1).strip()
+        shape['count_only'] = bool(re_count_all.match(select_list))
+        for term in select_list.split(','):
+            parsed = _column_of(term, table)
+            if parsed is not None:
+                shape['selected'].append(parsed[0])
+    return shape
+
+
+def candidate_columns(shape):
+    """
+    등치 → 정렬 → 범위 순서의 후보 컬럼과 커버링 여부
+    - 정렬 방향이 섞이면(ASC/DESC) 정렬 컬럼은 제외
+    - 범위 조건은 정렬을 인덱스로 처리할 수 없을 때만 마지막에 하나
+    """
+    columns = list(shape['equality'])
+    order = [column for column, _ in shape['order'] if column not in columns]
+    directions = {direction for _, direction in shape['order']}
+    if order and len(directions) == 1 and not shape['range']:
+        columns += order
+    elif shape['range']:
+        columns.append(shape['range'][0])
+    columns = columns[:MAX_INDEX_COLUMNS]
+
+    covering = False
+    if columns and shape['count_only']:
+        covering = True                        # COUNT(*) 는 인덱스만으로 계산
+    elif columns and shape['selected']:
+        # 기본 키(id)는 보조 인덱스에 이미 포함 (InnoDB / SQLite rowid)
+        extra = [column for column in shape['selected'] if column not in columns and column != 'id']
+        if len(columns) + len(extra) <= MAX_INDEX_COLUMNS:
+            columns += extra
+            covering = True
+    if columns in (['id'], []):
+        return [], False
+    return columns, covering
+
+
+# ===== EXPLAIN =====
+
+def explain_query(sql, params, using='default'):
+    """
+    실행 계획 요약 → {'vendor', 'issues': [...], 'rows', 'plan': [...]} (지원 안 하면 None)
+    - SELECT 만 실행 (EXPLAIN 은 쿼리를 실행하지 않음)
+    """
+    if not sql.lstrip().upper().startswith('SELECT'):
+        return None
+    connection = connections[using]
+    vendor = connection.vendor
+    try:
+        with connection.cursor() as cursor:
+            if vendor == 'mysql':
+                cursor.execute('EXPLAIN ' + sql, params)
+                names = [column[0] for column in cursor.description]
+                rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+                issues = set()
+                for row in rows:
+                    extra = row.get('Extra') or ''
+                    if row.get('type') == 'ALL':
+                        issues.add('full_scan')
+                    if 'filesort' in extra or 'temporary' in extra:
+                        issues.add('filesort')
+                return {
+                    'vendor': vendor,
+                    'issues': sorted(issues),
+                    'rows': max((row.get('rows') or 0 for row in rows), default=0),
+                    'plan': [f"{row.get('table')}: {row.get('type')} key={row.get('key')} {row.get('Extra') or ''}".strip()
+                             for row in rows],
+                }
+            if vendor == 'sqlite':
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                details = [row[-1] for row in cursor.fetchall()]
+                issues = set()
+                for detail in details:
+                    if detail.startswith('SCAN') and 'INDEX' not in detail:
+                        issues.add('full_scan')
+                    if 'TEMP B-TREE' in detail:
+                        issues.add('filesort')
+                return {'vendor': vendor, 'issues': sorted(issues), 'rows': None, 'plan': details}
+    except Exception as e:
+        logger.warning(f"⚠️ [IndexAdvice] EXPLAIN 실패: {e}")
+        return {'vendor': vendor, 'issues': [], 'rows': None, 'plan': [], 'error': str(e)}
+    return None
+
+
+# ===== 기존 인덱스 / 모델 =====
+
+def existing_indexes(table, using='default'):
+    """{인덱스 이름: {'columns': [...], 'unique': bool, 'primary_key': bool}}"""
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, table)
+    return {
+        name: {
+            'columns': list(info['columns'] or []),
+            'unique': bool(info.get('unique')),
+            'primary_key': bool(info.get('primary_key')),
+        }
+        for name, info in constraints.items()
+        if info.get('index') or info.get('primary_key') or info.get('unique')
+    }
+
+
+def model_for_table(table):
+    for model in apps.get_models():
+        if model._meta.db_table == table:
+            return model
+    return None
+
+
+def _field_names(model, columns):
+    by_column = {field.column: field.name for field in model._meta.concrete_fields}
+    return [by_column.get(column, column) for column in columns]
+
+
+def index_name(table, columns):
+    """Django Index 이름 규칙 (30자 이내, 문자로 시작)"""
+    digest = hashlib.md5(f"{table}:{','.join(columns)}".encode('utf-8')).hexdigest()[:6]
+    prefix = '_'.join([table.replace('_table', '')[:8]] + [column[:4] for column in columns[:2]])
+    return f"{prefix[:19]}_{digest}_idx"
+
+
+# ===== 제안 =====
+
+def advise_indexes(stats, using='default', sample_rate=1.0, min_calls=1, top=20):
+    """
+    fingerprint_stats() → 인덱스 제안 목록 (예상 효과 큰 순)
+        {'table', 'model', 'columns', 'fields', 'covering', 'estimated_saving_s',
+         'fingerprints', 'issues', 'redundant', 'index_code', 'name'}
+    """
+    scale = 1.0 / sample_rate if sample_rate else 1.0
+    index_cache = {}
+    proposals = {}
+
+    for entry in [entry for entry in stats if entry['calls'] >= min_calls][:top]:
+        if not entry['examples']:
+            continue
+        sql, params = entry['examples'][0]
+        shape = parse_query_shape(sql)
+        if shape is None:
+            continue
+        columns, covering = candidate_columns(shape)
+        if not columns:
+            continue
+
+        table = shape['table']
+        if table not in index_cache:
+            try:
+                index_cache[table] = existing_indexes(table, using)
+            except Exception as e:
+                logger.warning(f"⚠️ [IndexAdvice] {table} 인덱스 조회 실패: {e}")
+                index_cache[table] = {}
+        indexes = index_cache[table]
+        if any(info['columns'][:len(columns)] == columns for info in indexes.values()):
+            continue                            # 이미 같은 앞부분의 인덱스가 있음
+
+        plan = explain_query(sql, params, using)
+        issues = plan['issues'] if plan else []
+        ratio = max((IMPROVEMENT_RATIOS[issue] for issue in issues), default=IMPROVEMENT_RATIOS['partial'])
+
+        proposal = proposals.setdefault((table, tuple(columns)), {
+            'table': table,
+            'columns': columns,
+            'covering': covering,
+            'estimated_saving_s': 0.0,
+            'fingerprints': [],
+            'issues': set(),
+            'plan': plan['plan'] if plan else [],
+        })
+        proposal['estimated_saving_s'] += entry['seconds'] * scale * ratio
+        proposal['fingerprints'].append({
+            'fingerprint': entry['fingerprint'], 'calls': entry['calls'], 'seconds': round(entry['seconds'], 4),
+            'unsupported': shape['unsupported'],
+        })
+        proposal['issues'].update(issues)
+
+    merged = _merge_prefix_proposals(list(proposals.values()))
+    for proposal in merged:
+        indexes = index_cache.get(proposal['table'], {})
+        proposal['redundant'] = sorted(
+            name for name, info in indexes.items()
+            if not info['unique'] and not info['primary_key'] and info['columns']
+            and len(info['columns']) < len(proposal['columns'])
+            and proposal['columns'][:len(info['columns'])] == info['columns']
+        )
+        model = model_for_table(proposal['table'])
+        proposal['model'] = f"{model._meta.app_label}.{model.__name__}" if model else None
+        proposal['fields'] = _field_names(model, proposal['columns']) if model else proposal['columns']
+        proposal['name'] = index_name(proposal['table'], proposal['columns'])
+        proposal['index_code'] = f"models.Index(fields={proposal['fields']!r}, name='{proposal['name']}')"
+        proposal['issues'] = sorted(proposal['issues'])
+        proposal['estimated_saving_s'] = round(proposal['estimated_saving_s'], 3)
+    return sorted(merged, key=lambda proposal: proposal['estimated_saving_s'], reverse=True)
+
+
+def _merge_prefix_proposals(proposals):
+    """같은 테이블에서 다른 제안의 앞부분인 제안은 긴 쪽에 합침 (인덱스 하나로 둘 다 처리)"""
+    proposals.sort(key=lambda proposal: len(proposal['columns']), reverse=True)
+    merged = []
+    for proposal in proposals:
+        target = next((
+            kept for kept in merged
+            if kept['table'] == proposal['table']
+            and kept['columns'][:len(proposal['columns'])] == proposal['columns']
+        ), None)
+        if target is None:
+            merged.append(proposal)
+            continue
+        target['estimated_saving_s'] += proposal['estimated_saving_s']
+        target['fingerprints'] += proposal['fingerprints']
+        target['issues'].update(proposal['issues'])
+    return merged
@@ -6,6 +6,7 @@
 import re
 import logging
 from phrase.utils.translate import LibreTranslator
+from phrase.utils.spelling import suggest_correction, corpus_has_phrase
 
 logger = logging.getLogger(__name__)
 
@@ -184,7 +185,13 @@ class InputValidator:
         """반복 문자 오타 교정 제안"""
         # 반복 제거
         deduplicated = re.sub(r'(.)\1+', r'\1', text)
-        return [deduplicated] if deduplicated != text else []
+        suggestions = [deduplicated] if deduplicated != text else []
+        
+        # 코퍼스 어휘 기준 교정 ('helllo' → 'hello')
+        corrected = suggest_correction(deduplicated)
+        if corrected and corrected not in suggestions:
+            suggestions.insert(0, corrected)
+        return suggestions
     
     def _check_mixed_languages(self, text):
         """언어 혼용 검사"""
@@ -208,6 +215,16 @@ class InputValidator:
     def _check_potential_typos(self, text):
         """영어 오타 가능성 검사"""
         
+        # 코퍼스 어휘에 없는 단어 → "혹시 이것을 찾으셨나요?" (교정된 구문이 DB 에 있을 때만)
+        corrected = suggest_correction(text)
+        if corrected and corpus_has_phrase(corrected):
+            return {
+                'needs_confirmation': True,
+                'warning_type': 'did_you_mean',
+                'warning_message': f'혹시 "{corrected}"을(를) 찾으셨나요?',
+                'suggestions': [corrected, text]
+            }
+        
         # 연속된 자음이 많은 경우
         consonant_clusters = re.findall(r'[bcdfghjklmnpqrstvwxyz]{3,}', text.lower())
         if consonant_clusters:
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/link_checker.py
+"""
+저장된 URL 링크 검사 (MovieTable.poster_url, DialogueTable.video_url)
+- 스레드 풀로 동시 검사, 호스트별 동시 요청 수 제한
+- 스레드마다 requests.Session 재사용 (keep-alive)
+- 결과를 *_status / *_checked_at 에 기록 → 검색 경로는 실시간 확인 없이 'dead' 를 제외
+
+설정 (settings.LINK_CHECK_SETTINGS):
+    WORKERS: 스레드 수 (기본 16)
+    PER_HOST_CONCURRENCY: 호스트별 동시 요청 수 (기본 4)
+    TIMEOUT: 요청 타임아웃 초 (기본 10)
+    BATCH_SIZE: 키셋 배치 크기 (기본 500)
+    RECHECK_AFTER_HOURS: 재검사 주기 (기본 168 = 7일)
+"""
+import time
+import logging
+import threading
+from datetime import timedelta
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from phrase.models import MovieTable, DialogueTable
+
+logger = logging.getLogger(__name__)
+
+# 대상 → (모델, URL 필드, 상태 필드, 확인 시각 필드)
+LINK_TARGETS = {
+    'poster': (MovieTable, 'poster_url', 'poster_url_status', 'poster_url_checked_at'),
+    'video': (DialogueTable, 'video_url', 'video_url_status', 'video_url_checked_at'),
+}
+
+# 확실히 없어진 리소스만 dead 로 기록 (그 외 4xx/5xx, 네트워크 오류는 error → 다음 주기에 재검사)
+DEAD_STATUS_CODES = (404, 410)
+
+# HEAD 를 지원하지 않는 서버는 1바이트 GET 으로 재확인
+HEAD_UNSUPPORTED_CODES = (403, 405, 501)
+
+_thread_local = threading.local()
+
+
+def get_link_check_settings():
+    """링크 검사 설정 (settings 값 우선)"""
+    link_settings = {
+        'WORKERS': 16,
+        'PER_HOST_CONCURRENCY': 4,
+        'TIMEOUT': 10,
+        'BATCH_SIZE': 500,
+        'RECHECK_AFTER_HOURS': 24 * 7,
+    }
+    if hasattr(settings, 'LINK_CHECK_SETTINGS'):
+        link_settings.update(settings.LINK_CHECK_SETTINGS)
+    return link_settings
+
+
+class HostConcurrencyLimiter:
+    """호스트별 동시 요청 수 제한 (스레드 안전)"""
+
+    def __init__(self, per_host):
+        self.per_host = max(1, per_host)
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def limit(self, url):
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+        with semaphore:
+            yield
+
+
+def get_thread_session(pool_size):
+    """스레드별 keep-alive 세션"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _thread_local.session = session
+    return session
+
+
+def check_url(session, url, timeout=10):
+    """
+    URL 한 건 검사 → (상태, HTTP 코드)
+    - 상태: 'alive' | 'dead' | 'error'
+    """
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        if response.status_code in HEAD_UNSUPPORTED_CODES:
+            response = session.get(
+                url, headers={'Range': 'bytes=0-0'}, stream=True,
+                allow_redirects=True, timeout=timeout
+            )
+            response.close()
+    except requests.RequestException as e:
+        logger.debug(f"링크 검사 실패: {url} - {e}")
+        return 'error', None
+
+    status_code = response.status_code
+    if status_code < 400:
+        return 'alive', status_code
+    if status_code in DEAD_STATUS_CODES:
+        return 'dead', status_code
+    return 'error', status_code
+
+
+class LinkChecker:
+    """
+    저장된 URL 동시 검사
+        LinkChecker('video').run()
+        LinkChecker('poster', workers=8, per_host=2).run(max_rows=1000)
+    """
+
+    def __init__(self, target, workers=None, per_host=None, timeout=None,
+                 batch_size=None, recheck_after_hours=None):
+        if target not in LINK_TARGETS:
+            raise ValueError(f"지원하지 않는 링크 대상: {target}")
+
+        link_settings = get_link_check_settings()
+        self.target = target
+        self.model, self.url_field, self.status_field, self.checked_at_field = LINK_TARGETS[target]
+        self.workers = max(1, workers or link_settings['WORKERS'])
+        self.per_host = per_host or link_settings['PER_HOST_CONCURRENCY']
+        self.timeout = timeout or link_settings['TIMEOUT']
+        self.batch_size = max(1, batch_size or link_settings['BATCH_SIZE'])
+        self.recheck_after = timedelta(hours=link_settings['RECHECK_AFTER_HOURS']
+                                       if recheck_after_hours is None else recheck_after_hours)
+        self.limiter = HostConcurrencyLimiter(self.per_host)
+
+    def get_candidates(self):
+        """검사 대상: URL 이 있고, 한 번도 검사하지 않았거나 재검사 주기가 지난 행"""
+        cutoff = timezone.now() - self.recheck_after
+        return self.model.objects.filter(
+            models.Q(**{f'{self.checked_at_field}__isnull': True}) |
+            models.Q(**{f'{self.checked_at_field}__lt': cutoff}),
+            is_active=True
+        ).exclude(
+            **{self.url_field: ''}
+        ).exclude(
+            **{f'{self.url_field}__isnull': True}
+        )
+
+    def iter_batches(self, max_rows=None):
+        """id 키셋 순회 (검사 결과 기록에 필요한 컬럼만 조회)"""
+        queryset = self.get_candidates().only(
+            'id', 'updated_at', self.url_field, self.status_field, self.checked_at_field
+        )
+        last_id = 0
+        remaining = max_rows
+
+        while remaining is None or remaining > 0:
+            limit = self.batch_size if remaining is None else min(self.batch_size, remaining)
+            batch = list(queryset.filter(id__gt=last_id).order_by('id')[:limit])
+            if not batch:
+                return
+            last_id = batch[-1].id
+            if remaining is not None:
+                remaining -= len(batch)
+            yield batch
+
+    def check(self, url):
+        """워커 스레드에서 실행"""
+        session = get_thread_session(self.per_host)
+        with self.limiter.limit(url):
+            return check_url(session, url, self.timeout)
+
+    def run(self, max_rows=None):
+        stats = {'target': self.target, 'checked': 0, 'alive': 0, 'dead': 0, 'error': 0, 'changed': 0}
+        start_time = time.monotonic()
+
+        logger.info(f"🔗 링크 검사 시작 ({self.target}): 워커 {self.workers}개, 호스트당 {self.per_host}개")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch in self.iter_batches(max_rows):
+                urls = [getattr(obj, self.url_field) for obj in batch]
+                results = list(executor.map(self.check, urls))
+                now = timezone.now()
+
+                for obj, (status, _status_code) in zip(batch, results):
+                    if getattr(obj, self.status_field) != status:
+                        # 상태가 바뀐 행만 updated_at 갱신 (조건부 GET 검증자 반영)
+                        obj.updated_at = now
+                        stats['changed'] += 1
+                    setattr(obj, self.status_field, status)
+                    setattr(obj, self.checked_at_field, now)
+                    stats[status] += 1
+
+                self.model.objects.bulk_update(
+                    batch, [self.status_field, self.checked_at_field, 'updated_at']
+                )
+                stats['checked'] += len(batch)
+                logger.info(
+                    f"  진행 ({self.target}): {stats['checked']}개 "
+                    f"(정상 {stats['alive']}, 끊김 {stats['dead']}, 오류 {stats['error']})"
+                )
+
+        stats['elapsed'] = round(time.monotonic() - start_time, 2)
+        logger.info(f"✅ 링크 검사 완료 ({self.target}): {stats}")
+        return stats
+
+
+def check_stored_links(targets=('poster', 'video'), **options):
+    """여러 대상 순차 검사 (대상 내부는 동시 처리)"""
+    max_rows = options.pop('max_rows', None)
+    return [LinkChecker(target, **options).run(max_rows=max_rows) for target in targets]
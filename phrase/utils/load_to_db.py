@@ -22,6 +22,11 @@ from phrase.models import RequestTable, MovieTable, DialogueTable
 from phrase.utils.get_imdb_poster_url import IMDBPosterExtractor, download_poster_image
 # 임포트 오류 수정: phrase.application.translate -> phrase.utils.translate
 from phrase.utils.translate import LibreTranslator
+from phrase.utils.result_records import MovieResult, DialogueResult
+from phrase.utils.poster_variants import generate_poster_variants_on_ingest
+from phrase.utils.streaming_download import stream_download, guess_extension
+from phrase.utils.negative_cache import forget_phrase
+from phrase.utils.metrics import timed_stage
 
 logger = logging.getLogger(__name__)
 
@@ -55,48 +60,21 @@ def convert_to_pep8_filename(text):
 
 
 def download_file_with_retry(url, file_type='image', max_retries=3, timeout=30):
-    """파일 다운로드 재시도 로직 (개선된 버전)"""
-    if not url:
-        logger.warning(f"{file_type} URL이 없습니다")
+    """
+    파일 다운로드 재시도 로직 (스트리밍 버전)
+    - MEDIA_ROOT 임시 파일에 청크 단위 기록, 재시도 시 Range 이어받기
+    - 반환: (StreamedDownloadFile, ext) 또는 None
+    """
+    max_size = 50 if file_type == 'video' else 10  # MB
+
+    downloaded = stream_download(
+        url, file_type=file_type, max_size_mb=max_size,
+        max_retries=max_retries, timeout=(10, timeout)
+    )
+    if downloaded is None:
         return None
-    
-    for attempt in range(max_retries):
-        try:
-            logger.info(f"{file_type} 다운로드 시도 {attempt + 1}/{max_retries}: {url}")
-            
-            response = requests.get(
-                url, 
-                stream=True, 
-                timeout=timeout,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
-            response.raise_for_status()
-            
-            # 파일 크기 체크 (메모리 보호)
-            content_length = response.headers.get('content-length')
-            if content_length:
-                size_mb = int(content_length) / (1024 * 1024)
-                max_size = 50 if file_type == 'video' else 10  # MB
-                
-                if size_mb > max_size:
-                    logger.warning(f"{file_type} 파일이 너무 큼: {size_mb:.1f}MB (최대 {max_size}MB)")
-                    return None
-            
-            content = BytesIO(response.content)
-            ext = 'jpg' if file_type == 'image' else 'mp4'
-            
-            logger.info(f"{file_type} 다운로드 성공: {len(response.content)} bytes")
-            return content, ext
-            
-        except requests.RequestException as e:
-            logger.warning(f"{file_type} 다운로드 시도 {attempt + 1} 실패: {e}")
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # 지수 백오프
-            else:
-                logger.error(f"{file_type} 다운로드 최종 실패: {url}")
-                return None
+
+    return downloaded, guess_extension(downloaded.content_type, file_type)
 
 
 # ===== 4개 모듈 연동 최적화 함수들 =====
@@ -218,13 +196,18 @@ def collect_imdb_info_smart(movie_obj, imdb_url):
                 content, ext = poster_content
                 file_name = f"{filename}.{ext}"
                 
-                # Django File 객체 생성
-                poster_file = File(content, name=file_name)
-                movie_obj.poster_image = poster_file
-                movie_obj.poster_image_path = f'posters/{file_name}'
+                # 임시 파일을 저장소로 이동 (FileSystemStorage 는 rename)
+                try:
+                    movie_obj.poster_image.save(file_name, content, save=False)
+                finally:
+                    content.close()
+                movie_obj.poster_image_path = movie_obj.poster_image.name
                 movie_obj.save(update_fields=['poster_image', 'poster_image_path'])
                 
                 logger.info(f"✅ 포스터 다운로드 성공: {movie_obj.movie_title}")
+                
+                # 썸네일/WebP 변환본 생성
+                generate_poster_variants_on_ingest(movie_obj)
         
         # 캐시에 저장 (24시간)
         if imdb_info:
@@ -292,10 +275,13 @@ def save_dialogue_table_optimized(movie_obj, dialogue_data,
                 filename = convert_to_pep8_filename(dialogue_phrase[:50])
                 file_name = f"{filename}.{ext}"
                 
-                video_file = File(content, name=file_name)
-                dialogue_obj.video_file = video_file
-                dialogue_obj.video_file_path = f'videos/{file_name}'
-                dialogue_obj.file_size_bytes = len(content.getvalue())
+                # 임시 파일을 저장소로 이동 (FileSystemStorage 는 rename)
+                try:
+                    dialogue_obj.file_size_bytes = content.size
+                    dialogue_obj.video_file.save(file_name, content, save=False)
+                finally:
+                    content.close()
+                dialogue_obj.video_file_path = dialogue_obj.video_file.name
                 dialogue_obj.save(update_fields=[
                     'video_file', 'video_file_path', 'file_size_bytes'
                 ])
@@ -355,6 +341,7 @@ def perform_smart_translation(text):
 
 # ===== 메인 로드 함수 (4개 모듈 최적화) =====
 
+@timed_stage('ingest')
 def load_to_db(movies, request_phrase=None, request_korean=None, 
                batch_size=20, auto_translate=True, download_media=False):
     """
@@ -407,6 +394,10 @@ def load_to_db(movies, request_phrase=None, request_korean=None,
         except Exception as e:
             logger.warning(f"결과 수 업데이트 실패: {e}")
     
+    # 결과가 생긴 구문은 네거티브 캐시에서 제거
+    if request_phrase and processed_movies:
+        forget_phrase(request_phrase)
+    
     # 4단계: 통계 및 캐시 업데이트
     update_statistics_and_cache(processed_movies)
     
@@ -459,43 +450,11 @@ def process_movie_batch_optimized(batch, auto_translate=True, download_media=Fal
 
 def build_views_compatible_result(movie_obj, dialogue_obj):
     """
-    views.py와 호환되는 결과 형식 생성 (일본어/중국어 필드 제거)
+    views.py와 호환되는 결과 형식 생성 (v2 레코드)
     """
-    return {
-        'title': movie_obj.movie_title,
-        'original_title': movie_obj.original_title or movie_obj.movie_title,
-        'year': movie_obj.release_year,
-        'country': movie_obj.production_country,
-        'director': movie_obj.director,
-        'genre': movie_obj.genre or '',
-        'imdb_rating': float(movie_obj.imdb_rating) if movie_obj.imdb_rating else None,
-        'imdb_url': movie_obj.imdb_url or '',
-        'poster_url': movie_obj.poster_url or '',
-        'poster_image_path': movie_obj.poster_image.url if movie_obj.poster_image else '',
-        'data_quality': movie_obj.data_quality,
-        'view_count': movie_obj.view_count,
-        'like_count': movie_obj.like_count,
-        'dialogues': [{
-            'id': dialogue_obj.id,
-            'text': dialogue_obj.dialogue_phrase,
-            'text_ko': dialogue_obj.dialogue_phrase_ko or '',
-            # 일본어, 중국어 필드 제거
-            'start_time': dialogue_obj.dialogue_start_time,
-            'end_time': dialogue_obj.dialogue_end_time or '',
-            'duration_seconds': dialogue_obj.duration_seconds,
-            'duration_display': getattr(dialogue_obj, 'get_duration_display', lambda: '알 수 없음')(),
-            'video_url': dialogue_obj.video_url,
-            'video_file_path': dialogue_obj.video_file.url if dialogue_obj.video_file else '',
-            'video_quality': dialogue_obj.video_quality,
-            'file_size_bytes': dialogue_obj.file_size_bytes,
-            'translation_method': dialogue_obj.translation_method,
-            'translation_quality': dialogue_obj.translation_quality,
-            'play_count': dialogue_obj.play_count,
-            'like_count': dialogue_obj.like_count,
-            'created_at': dialogue_obj.created_at.isoformat(),
-        }],
-        'dialogue_count': 1
-    }
+    return MovieResult.from_model(
+        movie_obj, [DialogueResult.from_model(dialogue_obj)]
+    )
 
 
 def update_statistics_and_cache(processed_movies):
@@ -529,13 +488,13 @@ def get_search_results_from_db(request_phrase, request_korean=None):
         # 기본 텍스트 검색
         search_results = DialogueTable.objects.filter(
             dialogue_phrase__icontains=request_phrase
-        )
+        ).exclude(video_url_status='dead')
         
         # 한글 검색 추가
         if request_korean:
             korean_results = DialogueTable.objects.filter(
                 dialogue_phrase_ko__icontains=request_korean
-            )
+            ).exclude(video_url_status='dead')
             search_results = search_results.union(korean_results)
         
         # 영화 정보와 함께 조회 (select_related 최적화)
@@ -586,11 +545,4 @@ __features__ = [
 ]
 
 # 모듈 초기화 로깅
-logger.info(f"""
-=== load_to_db.py v{__version__} 초기화 완료 (수정됨) ===
-🔧 일본어/중국어 필드 제거: ✅ 완료
-🔗 임포트 오류 수정: ✅ phrase.utils.translate 사용
-📱 models.py 연동: ✅ 새 모델 구조 완전 활용
-🌐 views.py 연동: ✅ 캐시 전략 및 형식 호환  
-🚀 에러 처리 강화: ✅ 안전한 배치 처리
-""")
\ No newline at end of file
+logger.debug(f"load_to_db v{__version__} 로드")
\ No newline at end of file
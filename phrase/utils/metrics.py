@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/metrics.py
+"""
+요청 단계별 시간 측정과 Prometheus 메트릭
+- span('db_search') / @timed_stage('translation'): 현재 요청의 단계 시간 기록
+  (StageTimingMiddleware 가 요청마다 측정 컨텍스트를 열고 Server-Timing 헤더로 내보냄)
+- 단계: translation, db_search, external_api, ingest, context_build, template_render
+- 캐시 적중/미스 카운터(record_cache), 외부 서비스 호출 수·지연(record_upstream)
+- /metrics 에서 Prometheus 텍스트 형식으로 노출 (render_prometheus)
+- 모든 값은 저장소에 원자적으로 누적 (cache.get → 수정 → cache.set 없음),
+  MULTIPROCESS_DIR 지정 시 워커별 mmap 파일에 쓰고 읽을 때 합산
+- 통계 API 용 누적 값(api 사용량, 번역 품질, 포스터 추출)도 여기서 정의
+
+설정 (settings.METRICS_SETTINGS):
+    ENABLED: 측정 여부 (기본 True)
+    ALLOWED_IPS: /metrics 접근 허용 IP (REMOTE_ADDR 기준, 기본 ('127.0.0.1', '::1'), TOKEN 지정 시 무시)
+    TOKEN: /metrics Bearer 토큰 (기본 '', 리버스 프록시 뒤에서는 지정 필요)
+    SERVER_TIMING_HEADER: 응답에 Server-Timing 헤더 추가 (기본 True)
+    BUCKETS: 지연 히스토그램 버킷 (초)
+    MULTIPROCESS_DIR: 워커 공유 mmap 값 파일 디렉터리 (없으면 프로세스 메모리, gunicorn 에서는 지정)
+"""
+import os
+import glob
+import json
+import mmap
+import time
+import struct
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def get_metrics_settings():
+    """메트릭 설정 (settings 값 우선)"""
+    metrics_settings = {
+        'ENABLED': True,
+        'ALLOWED_IPS': ('127.0.0.1', '::1'),
+        'TOKEN': '',
+        'SERVER_TIMING_HEADER': True,
+        'BUCKETS': DEFAULT_BUCKETS,
+        'MULTIPROCESS_DIR': None,
+    }
+    if hasattr(settings, 'METRICS_SETTINGS'):
+        metrics_settings.update(settings.METRICS_SETTINGS)
+    return metrics_settings
+
+
+# ===== Prometheus 텍스트 형식 =====
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, labelvalues, extra=None):
+    pairs = list(zip(labelnames, labelvalues))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ===== 값 저장소 =====
+
+class LocalValueStore:
+    """프로세스 메모리 저장소 (runserver, 단일 프로세스)"""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, key, amount):
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._values)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+class MmapValueFile:
+    """
+    프로세스 하나가 쓰는 mmap 값 파일
+    - 헤더 8바이트(사용 바이트 수) + 항목 [키 길이 uint32][키 UTF-8][8바이트 정렬][double 값]
+    - 항목을 먼저 쓰고 사용 바이트 수를 마지막에 갱신 → 다른 프로세스가 읽는 중에도 반쯤 쓴 항목은 안 보임
+    """
+
+    HEADER = struct.Struct('<I4x')
+    KEY_LENGTH = struct.Struct('<I')
+    VALUE = struct.Struct('<d')
+    INITIAL_SIZE = 64 * 1024
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._positions = {}
+        self._file = open(path, 'a+b')
+        if os.fstat(self._file.fileno()).st_size < self.INITIAL_SIZE:
+            self._file.truncate(self.INITIAL_SIZE)
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._used = self.HEADER.unpack_from(self._map, 0)[0] or self.HEADER.size
+        for key, _, position in self._entries(self._map, self._used):
+            self._positions[key] = position
+
+    @classmethod
+    def _entries(cls, buffer, used):
+        offset = cls.HEADER.size
+        while offset < used:
+            key_length = cls.KEY_LENGTH.unpack_from(buffer, offset)[0]
+            key_start = offset + cls.KEY_LENGTH.size
+            key = bytes(buffer[key_start:key_start + key_length]).decode('utf-8')
+            position = (key_start + key_length + 7) & ~7
+            yield key, cls.VALUE.unpack_from(buffer, position)[0], position
+            offset = position + cls.VALUE.size
+
+    def _append(self, key):
+        encoded = key.encode('utf-8')
+        position = (self._used + self.KEY_LENGTH.size + len(encoded) + 7) & ~7
+        end = position + self.VALUE.size
+        if end > len(self._map):
+            size = len(self._map)
+            while size < end:
+                size *= 2
+            self._map.close()
+            self._file.truncate(size)
+            self._map = mmap.mmap(self._file.fileno(), 0)
+
+        self.KEY_LENGTH.pack_into(self._map, self._used, len(encoded))
+        self._map[self._used + self.KEY_LENGTH.size:self._used + self.KEY_LENGTH.size + len(encoded)] = encoded
+        self.VALUE.pack_into(self._map, position, 0.0)
+        self._used = end
+        self.HEADER.pack_into(self._map, 0, self._used)
+        self._positions[key] = position
+        return position
+
+    def inc(self, key, amount):
+        with self._lock:
+            position = self._positions.get(key)
+            if position is None:
+                position = self._append(key)
+            value = self.VALUE.unpack_from(self._map, position)[0]
+            self.VALUE.pack_into(self._map, position, value + amount)
+
+    @classmethod
+    def read(cls, path):
+        """다른 프로세스 파일 읽기 → {키: 값}"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < cls.HEADER.size:
+            return {}
+        used = min(cls.HEADER.unpack_from(data, 0)[0], len(data))
+        return {key: value for key, value, _ in cls._entries(data, used)}
+
+
+class MultiProcessValueStore:
+    """
+    gunicorn 워커 공유 저장소
+    - 워커(pid)마다 자기 파일에만 씀 → 프로세스 간 잠금 없이 갱신이 유실되지 않음
+    - 읽을 때 디렉터리의 모든 파일을 합산 (종료된 워커 값도 유지 → 카운터 단조 증가)
+    - fork 후 pid 가 바뀌면 새 파일 사용 (preload 된 마스터 값과 섞이지 않음)
+    """
+
+    def __init__(self, directory, mode=None):
+        self.directory = directory
+        if mode is None:
+            os.makedirs(directory, exist_ok=True)
+        else:
+            # 이미 있던 디렉터리도 권한을 좁힘 (예: 쿼리 예시 저장소는 0700)
+            os.makedirs(directory, mode=mode, exist_ok=True)
+            os.chmod(directory, mode)
+        self._pid = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _own_file(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            with self._lock:
+                if self._pid != pid:
+                    self._file = MmapValueFile(os.path.join(self.directory, f"metrics_{pid}.db"))
+                    self._pid = pid
+        return self._file
+
+    def inc(self, key, amount):
+        self._own_file().inc(key, amount)
+
+    def snapshot(self):
+        totals = {}
+        for path in glob.glob(os.path.join(self.directory, 'metrics_*.db')):
+            try:
+                values = MmapValueFile.read(path)
+            except (OSError, struct.error, UnicodeDecodeError) as e:
+                logger.warning(f"⚠️ [Metrics] 값 파일 읽기 실패: {path} - {e}")
+                continue
+            for key, value in values.items():
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def clear(self):
+        """모든 값 파일 삭제 (다른 프로세스가 열어 둔 파일은 그 프로세스 종료까지 유지)"""
+        with self._lock:
+            for path in glob.glob(os.path.join(self.directory, 'metrics_*.db')):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"⚠️ [Metrics] 값 파일 삭제 실패: {path} - {e}")
+            self._pid = None
+            self._file = None
+
+
+# ===== 메트릭 타입 =====
+
+class _Metric:
+    """저장소 키: JSON [메트릭 이름, 접미사, 레이블 값...]"""
+
+    kind = None
+
+    def __init__(self, store, name, documentation, labelnames=()):
+        self.store = store
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._keys = {}
+
+    def _labelvalues(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _store_key(self, suffix, labelvalues):
+        key = self._keys.get((suffix, labelvalues))
+        if key is None:
+            key = self._keys[(suffix, labelvalues)] = json.dumps(
+                [self.name, suffix, *labelvalues], ensure_ascii=False
+            )
+        return key
+
+    def _values(self, snapshot=None):
+        """{(접미사, 레이블 값 튜플): 값} (이 메트릭만)"""
+        values = {}
+        for key, value in (self.store.snapshot() if snapshot is None else snapshot).items():
+            if not key.startswith(f'["{self.name}"'):
+                continue
+            name, suffix, *labelvalues = json.loads(key)
+            if name == self.name:
+                values[(suffix, tuple(labelvalues))] = value
+        return values
+
+
+class Counter(_Metric):
+    """단조 증가 카운터 (레이블별)"""
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        self.store.inc(self._store_key('', self._labelvalues(labels)), amount)
+
+    def items(self, snapshot=None):
+        """[(레이블 값 튜플, 값)]"""
+        return sorted((labelvalues, _as_number(value)) for (_, labelvalues), value in self._values(snapshot).items())
+
+    def value(self, **labels):
+        return dict(self.items()).get(self._labelvalues(labels), 0)
+
+    def samples(self, snapshot=None):
+        for labelvalues, value in self.items(snapshot):
+            yield self.name, _format_labels(self.labelnames, labelvalues), value
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (버킷별 개수 / 합 / 개수를 따로 저장, 출력 시 누적)"""
+
+    kind = 'histogram'
+
+    def __init__(self, store, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(store, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        labelvalues = self._labelvalues(labels)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.store.inc(self._store_key(f'b{index}', labelvalues), 1)
+                break
+        self.store.inc(self._store_key('sum', labelvalues), value)
+        self.store.inc(self._store_key('count', labelvalues), 1)
+
+    def _states(self, snapshot=None):
+        """{레이블 값 튜플: [버킷별 개수..., 합, 개수]}"""
+        states = {}
+        for (suffix, labelvalues), value in self._values(snapshot).items():
+            state = states.setdefault(labelvalues, [0] * len(self.buckets) + [0.0, 0])
+            if suffix == 'sum':
+                state[-2] = value
+            elif suffix == 'count':
+                state[-1] = int(value)
+            elif suffix.startswith('b') and int(suffix[1:]) < len(self.buckets):
+                state[int(suffix[1:])] = int(value)
+        return states
+
+    def label_values(self):
+        """기록된 레이블 값 튜플 목록"""
+        return sorted(self._states())
+
+    def snapshot(self, **labels):
+        """{'count', 'sum'} (레이블 일치 항목)"""
+        state = self._states().get(self._labelvalues(labels))
+        if state is None:
+            return {'count': 0, 'sum': 0.0}
+        return {'count': state[-1], 'sum': state[-2]}
+
+    def samples(self, snapshot=None):
+        for labelvalues, state in sorted(self._states(snapshot).items()):
+            cumulative = 0
+            for index, bound in enumerate(self.buckets):
+                cumulative += state[index]
+                yield (f"{self.name}_bucket",
+                       _format_labels(self.labelnames, labelvalues, ('le', _format_value(float(bound)))),
+                       cumulative)
+            yield f"{self.name}_bucket", _format_labels(self.labelnames, labelvalues, ('le', '+Inf')), state[-1]
+            yield f"{self.name}_sum", _format_labels(self.labelnames, labelvalues), state[-2]
+            yield f"{self.name}_count", _format_labels(self.labelnames, labelvalues), state[-1]
+
+
+def _as_number(value):
+    return int(value) if float(value).is_integer() else value
+
+
+class MetricsRegistry:
+    """
+    메트릭 목록과 Prometheus 텍스트 출력
+    - MULTIPROCESS_DIR 설정 시 mmap 파일 저장소 (워커 합산), 없으면 프로세스 메모리
+    """
+
+    def __init__(self, store=None):
+        if store is None:
+            directory = get_metrics_settings()['MULTIPROCESS_DIR']
+            store = MultiProcessValueStore(str(directory)) if directory else LocalValueStore()
+        self.store = store
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(self.store, name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=None):
+        return self._register(Histogram(
+            self.store, name, documentation, labelnames, buckets or get_metrics_settings()['BUCKETS']
+        ))
+
+    def render(self):
+        snapshot = self.store.snapshot()   # 파일은 한 번만 읽음
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples(snapshot):
+                lines.append(f"{name}{labels} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+REQUEST_DURATION = registry.histogram(
+    'phrase_request_duration_seconds', '요청 처리 시간', ('view', 'method', 'status'))
+STAGE_DURATION = registry.histogram(
+    'phrase_stage_duration_seconds', '요청 단계별 처리 시간', ('view', 'stage'))
+VIEW_DURATION = registry.histogram(
+    'phrase_view_duration_seconds', 'DRF 뷰 처리 시간 (AdvancedPerformanceMonitoringMixin)', ('view',))
+CACHE_REQUESTS = registry.counter(
+    'phrase_cache_requests_total', '캐시 조회 수 (result: hit / miss)', ('cache', 'result'))
+UPSTREAM_REQUESTS = registry.counter(
+    'phrase_upstream_requests_total', '외부 서비스 호출 수', ('service', 'outcome'))
+UPSTREAM_DURATION = registry.histogram(
+    'phrase_upstream_duration_seconds', '외부 서비스 호출 시간', ('service',))
+PLAYPHRASE_API_REQUESTS = registry.counter(
+    'phrase_playphrase_api_requests_total', 'playphrase 검색 API 사용 (result: success / failed)', ('result',))
+PLAYPHRASE_RESPONSE_BYTES = registry.counter(
+    'phrase_playphrase_response_bytes_total', 'playphrase 성공 응답 크기 합계')
+TRANSLATIONS = registry.counter(
+    'phrase_translations_total', '번역 API 결과 (quality: success / poor_quality / failed)', ('langpair', 'quality'))
+BULK_TRANSLATIONS = registry.counter(
+    'phrase_bulk_translations_total', '일괄 번역 처리 수 (result: successful / failed)', ('result',))
+POSTER_EXTRACTIONS = registry.counter(
+    'phrase_poster_extractions_total', 'IMDB 포스터 추출 (result: success / failed)', ('result',))
+LOG_RECORDS_DROPPED = registry.counter(
+    'phrase_log_records_dropped_total', '로그 큐가 가득 차서 버린 기록 수 (phrase.utils.event_log)')
+
+
+# ===== 요청 단계 측정 =====
+
+class RequestTiming:
+    """한 요청의 단계별 누적 시간"""
+
+    def __init__(self):
+        self.view = 'unresolved'
+        self.stages = {}
+
+    def add(self, stage, seconds):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def server_timing(self):
+        """Server-Timing 헤더 값 (ms)"""
+        return ', '.join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.stages.items())
+
+
+_current_timing = contextvars.ContextVar('phrase_request_timing', default=None)
+
+
+def begin_request():
+    """요청 측정 시작 → (RequestTiming, 복원 토큰)"""
+    timing = RequestTiming()
+    return timing, _current_timing.set(timing)
+
+
+def end_request(token):
+    _current_timing.reset(token)
+
+
+def current_timing():
+    return _current_timing.get()
+
+
+@contextmanager
+def span(stage):
+    """
+    단계 시간 측정
+        with span('db_search'):
+            ...
+    - 요청 밖(명령, 백그라운드 스레드)에서는 view='background' 로 기록
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timing = _current_timing.get()
+        STAGE_DURATION.observe(elapsed, view=timing.view if timing else 'background', stage=stage)
+        if timing is not None:
+            timing.add(stage, elapsed)
+
+
+def timed_stage(stage):
+    """함수 전체를 한 단계로 측정하는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cache(cache_name, hit):
+    CACHE_REQUESTS.inc(cache=cache_name, result='hit' if hit else 'miss')
+
+
+def record_upstream(service, outcome, seconds):
+    """
+    외부 서비스 호출 기록
+    - outcome: 'ok', 'rate_limited', 'http_error', 'timeout', 'connection_error', 'error'
+    """
+    UPSTREAM_REQUESTS.inc(service=service, outcome=outcome)
+    UPSTREAM_DURATION.observe(seconds, service=service)
+
+
+def upstream_outcome(status_code):
+    if status_code == 429:
+        return 'rate_limited'
+    return 'ok' if status_code < 400 else 'http_error'
+
+
+# ===== 조회 =====
+
+def cache_hit_rates():
+    """{캐시: {'hits', 'misses', 'hit_rate'}} (MULTIPROCESS_DIR 지정 시 모든 워커 합산, 아니면 이 프로세스 기준)"""
+    rates = {}
+    for (cache_name, result), value in CACHE_REQUESTS.items():
+        rates.setdefault(cache_name, {'hits': 0, 'misses': 0})['hits' if result == 'hit' else 'misses'] += value
+    for stats in rates.values():
+        total = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / total * 100, 1) if total else None
+    return rates
+
+
+def render_prometheus():
+    return registry.render()
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/negative_cache.py
+"""
+결과 없는 구문 네거티브 캐시 (Bloom 필터 + TTL 정확 캐시)
+- playphrase 에서 결과가 0개였던 구문을 정규화해 기록
+- Bloom 필터(프로세스 메모리)에 없으면 즉시 False → 대부분의 검색은 추가 비용 0
+- Bloom 필터에 있으면 TTL 정확 캐시로 확인 (거짓 양성 / 만료 처리)
+- 필터는 RequestTable(result_count=0) 에서 주기적으로 재생성해 파일로 저장
+  (python manage.py rebuild_negative_cache, cron 등록 권장)
+
+설정 (settings.NEGATIVE_CACHE_SETTINGS):
+    ENABLED: 사용 여부 (기본 True)
+    TTL: 정확 캐시 유지 시간 초 (기본 6시간)
+    EXPECTED_ITEMS: 필터 최소 용량 (기본 100000)
+    FALSE_POSITIVE_RATE: 목표 거짓 양성률 (기본 0.01)
+    BLOOM_PATH: 필터 저장 경로
+    RELOAD_INTERVAL: 필터 파일 변경 확인 주기 초 (기본 60)
+"""
+import os
+import re
+import math
+import time
+import struct
+import hashlib
+import logging
+import threading
+import unicodedata
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from phrase.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+BLOOM_MAGIC = b'BLM1'
+BLOOM_HEADER = struct.Struct('>4sIQQ')  # magic, hash_count, size(bits), count
+
+NEGATIVE_CACHE_PREFIX = 'negative_phrase'
+
+re_non_phrase_chars = re.compile(r"[^\w\s']")
+
+
+def get_negative_cache_settings():
+    """네거티브 캐시 설정 (settings 값 우선)"""
+    negative_settings = {
+        'ENABLED': True,
+        'TTL': 6 * 3600,
+        'EXPECTED_ITEMS': 100000,
+        'FALSE_POSITIVE_RATE': 0.01,
+        'BLOOM_PATH': os.path.join(str(settings.BASE_DIR), 'logs', 'negative_phrases.bloom'),
+        'RELOAD_INTERVAL': 60,
+    }
+    if hasattr(settings, 'NEGATIVE_CACHE_SETTINGS'):
+        negative_settings.update(settings.NEGATIVE_CACHE_SETTINGS)
+    return negative_settings
+
+
+def normalize_phrase(text):
+    """구문 정규화 (대소문자, 구두점, 공백 차이 무시)"""
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).lower()
+    text = re_non_phrase_chars.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def _exact_key(normalized):
+    return f"{NEGATIVE_CACHE_PREFIX}:{hashlib.md5(normalized.encode('utf-8')).hexdigest()}"
+
+
+# ===== Bloom 필터 =====
+
+class BloomFilter:
+    """
+    비트 배열 Bloom 필터 (double hashing, blake2b)
+    - 프로세스/재시작과 무관하게 같은 위치를 계산 (내장 hash() 미사용)
+    """
+    __slots__ = ('size', 'hash_count', 'bits', 'count')
+
+    def __init__(self, size, hash_count, bits=None, count=0):
+        self.size = max(8, size)
+        self.hash_count = max(1, hash_count)
+        self.bits = bits if bits is not None else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    @classmethod
+    def for_capacity(cls, expected_items, false_positive_rate=0.01):
+        """예상 항목 수와 거짓 양성률로 최적 크기 계산"""
+        expected_items = max(1, expected_items)
+        size = int(math.ceil(-expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        hash_count = int(round(size / expected_items * math.log(2)))
+        return cls(size, hash_count)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self):
+        return self.count
+
+    def to_bytes(self):
+        return BLOOM_HEADER.pack(BLOOM_MAGIC, self.hash_count, self.size, self.count) + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, hash_count, size, count = BLOOM_HEADER.unpack_from(data)
+        bits = bytearray(data[BLOOM_HEADER.size:])
+        if magic != BLOOM_MAGIC or len(bits) != (size + 7) // 8:
+            raise ValueError("잘못된 Bloom 필터 파일")
+        return cls(size, hash_count, bits, count)
+
+
+# 프로세스별 필터 상태
+_bloom_state = {
+    'filter': None,
+    'loaded_mtime': None,
+    'checked_at': 0.0,
+    'pending': set(),   # 마지막 재생성 이후 이 프로세스에서 추가한 구문
+}
+_bloom_lock = threading.Lock()
+
+MAX_PENDING = 10000
+
+
+def get_bloom_filter():
+    """현재 프로세스의 Bloom 필터 (파일이 갱신되면 RELOAD_INTERVAL 안에 다시 로드)"""
+    negative_settings = get_negative_cache_settings()
+    now = time.monotonic()
+    bloom = _bloom_state['filter']
+    if bloom is not None and now - _bloom_state['checked_at'] < negative_settings['RELOAD_INTERVAL']:
+        return bloom
+
+    with _bloom_lock:
+        _bloom_state['checked_at'] = now
+        path = negative_settings['BLOOM_PATH']
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            mtime = None
+
+        if mtime is not None and mtime != _bloom_state['loaded_mtime']:
+            try:
+                with open(path, 'rb') as f:
+                    loaded = BloomFilter.from_bytes(f.read())
+                for phrase in _bloom_state['pending']:
+                    loaded.add(phrase)
+                _bloom_state['filter'] = loaded
+                _bloom_state['loaded_mtime'] = mtime
+                logger.info(f"🌸 [NegativeCache] Bloom 필터 로드: {len(loaded)}개")
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning(f"⚠️ [NegativeCache] Bloom 필터 로드 실패: {e}")
+
+        if _bloom_state['filter'] is None:
+            _bloom_state['filter'] = BloomFilter.for_capacity(
+                negative_settings['EXPECTED_ITEMS'], negative_settings['FALSE_POSITIVE_RATE']
+            )
+
+        return _bloom_state['filter']
+
+
+# ===== 조회 / 기록 =====
+
+def is_known_no_result(phrase):
+    """
+    최근 결과가 없었던 구문인지 확인
+    - Bloom 필터에 없으면 DB/캐시/네트워크 접근 없이 False
+    """
+    negative_settings = get_negative_cache_settings()
+    if not negative_settings['ENABLED']:
+        return False
+
+    normalized = normalize_phrase(phrase)
+    if not normalized or normalized not in get_bloom_filter():
+        record_cache('negative_cache', False)
+        return False
+
+    if cache.get(_exact_key(normalized)) is None:
+        record_cache('negative_cache', False)
+        return False
+
+    record_cache('negative_cache', True)
+    logger.info(f"🚫 [NegativeCache] 결과 없는 구문으로 스킵: {phrase[:50]}")
+    return True
+
+
+def record_no_result(phrase, request_korean=None):
+    """playphrase 결과 0개 구문 기록 (정확 캐시 + Bloom 필터 + RequestTable)"""
+    negative_settings = get_negative_cache_settings()
+    normalized = normalize_phrase(phrase)
+    if not negative_settings['ENABLED'] or not normalized:
+        return
+
+    cache.set(_exact_key(normalized), 1, negative_settings['TTL'])
+
+    bloom = get_bloom_filter()
+    with _bloom_lock:
+        bloom.add(normalized)
+        if len(_bloom_state['pending']) < MAX_PENDING:
+            _bloom_state['pending'].add(normalized)
+
+    # 재생성 원본 (재시작/캐시 초기화 후에도 유지)
+    try:
+        from phrase.models import RequestTable
+
+        RequestTable.objects.get_or_create(
+            request_phrase=phrase[:191],
+            defaults={'request_korean': request_korean, 'search_count': 1, 'result_count': 0}
+        )
+    except Exception as e:
+        logger.warning(f"⚠️ [NegativeCache] 요청 기록 실패: {e}")
+
+    logger.info(f"🚫 [NegativeCache] 결과 없음 기록: {phrase[:50]}")
+
+
+def forget_phrase(phrase):
+    """결과가 생긴 구문은 정확 캐시에서 제거 (Bloom 필터는 다음 재생성 때 정리)"""
+    normalized = normalize_phrase(phrase)
+    if normalized:
+        cache.delete(_exact_key(normalized))
+
+
+def rebuild_bloom_filter(path=None):
+    """
+    RequestTable(result_count=0) 에서 Bloom 필터 재생성 후 파일로 원자적 저장
+    - TTL 안에 갱신된 구문은 정확 캐시도 다시 채움 (캐시 초기화 대비)
+    """
+    from phrase.models import RequestTable
+
+    negative_settings = get_negative_cache_settings()
+    path = path or negative_settings['BLOOM_PATH']
+    ttl = negative_settings['TTL']
+
+    queryset = RequestTable.objects.filter(result_count=0)
+    total = queryset.count()
+    bloom = BloomFilter.for_capacity(
+        max(total * 2, negative_settings['EXPECTED_ITEMS']), negative_settings['FALSE_POSITIVE_RATE']
+    )
+
+    cutoff = timezone.now() - timedelta(seconds=ttl)
+    exact_keys = {}
+    rows = queryset.values_list('request_phrase', 'updated_at').iterator(chunk_size=2000)
+    for request_phrase, updated_at in rows:
+        normalized = normalize_phrase(request_phrase)
+        if not normalized:
+            continue
+        bloom.add(normalized)
+        if updated_at and updated_at >= cutoff:
+            exact_keys[_exact_key(normalized)] = 1
+        if len(exact_keys) >= 1000:
+            cache.set_many(exact_keys, ttl)
+            exact_keys = {}
+    if exact_keys:
+        cache.set_many(exact_keys, ttl)
+
+    os.makedirs(os.path.dirname(str(path)) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(bloom.to_bytes())
+    os.replace(temp_path, path)
+
+    with _bloom_lock:
+        _bloom_state['filter'] = bloom
+        _bloom_state['loaded_mtime'] = os.path.getmtime(path)
+        _bloom_state['checked_at'] = time.monotonic()
+        _bloom_state['pending'] = set()
+
+    logger.info(f"🌸 [NegativeCache] Bloom 필터 재생성: {len(bloom)}개, {len(bloom.bits)} bytes")
+    return {'phrases': len(bloom), 'bytes': len(bloom.bits), 'hash_count': bloom.hash_count}
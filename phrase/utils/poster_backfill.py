@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/poster_backfill.py
+"""
+포스터 백필 엔진 (동시 처리)
+- 포스터가 없는 영화를 id 키셋으로 배치 조회 (OFFSET 없음)
+- 스레드 풀로 동시 처리, 스레드마다 IMDBPosterExtractor.session 재사용 (keep-alive)
+- 고정 sleep 대신 호스트별 속도 제한 (HostRateLimiter)
+- 배치마다 마지막 id 를 체크포인트 파일에 기록 → 중단 후 이어서 실행
+- dry-run: DB 를 수정하지 않고 대상 수와 예상 처리량/소요 시간 보고
+
+설정 (settings.POSTER_BACKFILL_SETTINGS):
+    WORKERS: 스레드 수 (기본 4)
+    BATCH_SIZE: 키셋 배치 크기 (기본 100)
+    REQUESTS_PER_SECOND: 호스트별 기본 초당 요청 수 (기본 2.0)
+    PER_HOST_RATES: 호스트별 초당 요청 수 {'www.imdb.com': 2.0, ...}
+    CHECKPOINT_PATH: 체크포인트 JSON 경로
+"""
+import os
+import json
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from phrase.models import MovieTable
+from phrase.utils.get_imdb_poster_url import IMDBPosterExtractor, update_movie_poster
+
+logger = logging.getLogger(__name__)
+
+_thread_local = threading.local()
+
+
+def get_backfill_settings():
+    """백필 설정 (settings 값 우선)"""
+    backfill_settings = {
+        'WORKERS': 4,
+        'BATCH_SIZE': 100,
+        'REQUESTS_PER_SECOND': 2.0,
+        'PER_HOST_RATES': {},
+        'CHECKPOINT_PATH': os.path.join(str(settings.BASE_DIR), 'logs', 'poster_backfill_checkpoint.json'),
+    }
+    if hasattr(settings, 'POSTER_BACKFILL_SETTINGS'):
+        backfill_settings.update(settings.POSTER_BACKFILL_SETTINGS)
+    return backfill_settings
+
+
+# ===== 호스트별 속도 제한 =====
+
+class HostRateLimiter:
+    """
+    호스트별 최소 요청 간격 보장 (스레드 안전)
+    - 호출 스레드마다 다음 슬롯을 예약하고 잠금 밖에서 대기
+    - 우선순위: per_host_rates 인자 > requests_per_second 인자 (모든 호스트) > 설정 PER_HOST_RATES > 설정 기본값
+    """
+
+    def __init__(self, requests_per_second=None, per_host_rates=None):
+        backfill_settings = get_backfill_settings()
+        if requests_per_second:
+            # 명시한 기본 속도는 설정의 호스트별 속도보다 우선
+            self.default_rate = requests_per_second
+            self.per_host_rates = {}
+        else:
+            self.default_rate = backfill_settings['REQUESTS_PER_SECOND']
+            self.per_host_rates = dict(backfill_settings['PER_HOST_RATES'])
+        self.per_host_rates.update({host.lower(): rate for host, rate in (per_host_rates or {}).items()})
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def get_rate(self, host):
+        return self.per_host_rates.get(host, self.default_rate)
+
+    def wait(self, url):
+        """url 호스트의 다음 요청 슬롯까지 대기 → 대기한 초 반환"""
+        host = urlparse(url).netloc.lower()
+        rate = self.get_rate(host)
+        if not rate or rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + 1.0 / rate
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_shared_rate_limiter = None
+_shared_rate_limiter_lock = threading.Lock()
+
+
+def get_shared_rate_limiter():
+    """
+    프로세스 공용 HostRateLimiter (설정 속도 사용)
+    - 백필과 요청 경로(ensure_movie_posters)가 같은 호스트별 예약표를 공유
+    """
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        with _shared_rate_limiter_lock:
+            if _shared_rate_limiter is None:
+                _shared_rate_limiter = HostRateLimiter()
+    return _shared_rate_limiter
+
+
+def get_thread_extractor(rate_limiter=None):
+    """스레드별 IMDBPosterExtractor (requests.Session 은 스레드 간 공유하지 않음)"""
+    extractor = getattr(_thread_local, 'extractor', None)
+    if extractor is None:
+        extractor = IMDBPosterExtractor()
+        _thread_local.extractor = extractor
+    extractor.rate_limiter = rate_limiter
+    return extractor
+
+
+# ===== 대상 조회 및 체크포인트 =====
+
+def movies_missing_posters():
+    """포스터 URL 이 없고 IMDB URL 이 있는 활성 영화"""
+    return MovieTable.objects.filter(
+        models.Q(poster_url='') | models.Q(poster_url__isnull=True),
+        is_active=True
+    ).exclude(
+        imdb_url=''
+    ).exclude(
+        imdb_url__isnull=True
+    )
+
+
+def iter_missing_poster_batches(batch_size, after_id=0, max_movies=None):
+    """id 키셋 순회로 배치 단위 영화 목록 생성"""
+    queryset = movies_missing_posters()
+    last_id = after_id
+    remaining = max_movies
+
+    while remaining is None or remaining > 0:
+        limit = batch_size if remaining is None else min(batch_size, remaining)
+        batch = list(queryset.filter(id__gt=last_id).order_by('id')[:limit])
+        if not batch:
+            return
+        last_id = batch[-1].id
+        if remaining is not None:
+            remaining -= len(batch)
+        yield batch
+
+
+def load_checkpoint(path):
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ 체크포인트 읽기 실패, 처음부터 시작: {e}")
+        return {}
+
+
+def save_checkpoint(path, state):
+    """임시 파일에 쓴 뒤 os.replace 로 교체 (중단되어도 파일이 깨지지 않음)"""
+    if not path:
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+# ===== 백필 엔진 =====
+
+class PosterBackfill:
+    """
+    포스터 동시 백필
+        backfill = PosterBackfill(workers=8)
+        backfill.run()                 # 체크포인트부터 이어서 실행
+        backfill.run(resume=False)     # 처음부터
+        PosterBackfill(dry_run=True).run()
+    """
+
+    def __init__(self, workers=None, batch_size=None, requests_per_second=None, per_host_rates=None,
+                 checkpoint_path=None, use_checkpoint=True, download_images=True, dry_run=False):
+        backfill_settings = get_backfill_settings()
+        self.workers = max(1, workers or backfill_settings['WORKERS'])
+        self.batch_size = max(1, batch_size or backfill_settings['BATCH_SIZE'])
+        if requests_per_second or per_host_rates:
+            self.rate_limiter = HostRateLimiter(requests_per_second, per_host_rates)
+        else:
+            self.rate_limiter = get_shared_rate_limiter()
+        self.checkpoint_path = (checkpoint_path or backfill_settings['CHECKPOINT_PATH']) if use_checkpoint else None
+        self.download_images = download_images
+        self.dry_run = dry_run
+
+    def process_movie(self, movie):
+        """워커 스레드에서 실행 → 성공 여부"""
+        extractor = get_thread_extractor(self.rate_limiter)
+        try:
+            return update_movie_poster(movie, extractor, download_image=self.download_images)
+        except Exception as e:
+            logger.error(f"영화 포스터 처리 실패 (ID: {movie.id}): {e}")
+            return False
+
+    def run(self, max_movies=None, resume=True, sample_size=5):
+        if self.dry_run:
+            return self.estimate(max_movies=max_movies, resume=resume, sample_size=sample_size)
+
+        checkpoint = load_checkpoint(self.checkpoint_path) if resume else {}
+        after_id = checkpoint.get('last_id', 0)
+        stats = {'processed': 0, 'updated': 0, 'failed': 0, 'last_id': after_id}
+        start_time = time.monotonic()
+
+        if after_id:
+            logger.info(f"🔁 포스터 백필 재개: id > {after_id}")
+        logger.info(f"🖼️ 포스터 백필 시작: 워커 {self.workers}개, 배치 {self.batch_size}")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch in iter_missing_poster_batches(self.batch_size, after_id, max_movies):
+                results = list(executor.map(self.process_movie, batch))
+
+                updated = sum(1 for result in results if result)
+                stats['processed'] += len(batch)
+                stats['updated'] += updated
+                stats['failed'] += len(batch) - updated
+                stats['last_id'] = batch[-1].id
+
+                # 배치 전체가 끝난 뒤에만 기록 → 재개 시 누락 없음
+                save_checkpoint(self.checkpoint_path, {
+                    'last_id': stats['last_id'],
+                    'updated': checkpoint.get('updated', 0) + stats['updated'],
+                    'failed': checkpoint.get('failed', 0) + stats['failed'],
+                    'updated_at': timezone.now().isoformat(),
+                })
+
+                elapsed = time.monotonic() - start_time
+                logger.info(
+                    f"  진행: {stats['processed']}개 (성공 {stats['updated']}, 실패 {stats['failed']}), "
+                    f"{stats['processed'] / elapsed if elapsed > 0 else 0:.2f}개/초"
+                )
+
+        stats['elapsed'] = round(time.monotonic() - start_time, 2)
+        stats['rate'] = round(stats['processed'] / stats['elapsed'], 2) if stats['elapsed'] > 0 else 0
+        logger.info(
+            f"✅ 포스터 백필 완료: {stats['updated']}개 성공, {stats['failed']}개 실패 "
+            f"({stats['elapsed']}초, {stats['rate']}개/초)"
+        )
+        return stats
+
+    def estimate(self, max_movies=None, resume=True, sample_size=5):
+        """
+        dry-run: DB 수정 없이 예상 처리량 계산
+        - 표본 영화의 포스터 URL 추출 시간을 측정 (저장/다운로드 없음)
+        - 처리량 = min(워커 수 / 평균 지연, IMDB 호스트 속도 제한)
+        """
+        checkpoint = load_checkpoint(self.checkpoint_path) if resume else {}
+        after_id = checkpoint.get('last_id', 0)
+
+        pending = movies_missing_posters().filter(id__gt=after_id).count()
+        if max_movies is not None:
+            pending = min(pending, max_movies)
+
+        latencies = []
+        extractor = get_thread_extractor(self.rate_limiter)
+        sample = movies_missing_posters().filter(id__gt=after_id).order_by('id')[:max(0, sample_size)]
+        for movie in sample:
+            start = time.monotonic()
+            extractor.extract_poster_url(movie.imdb_url)
+            latencies.append(time.monotonic() - start)
+
+        imdb_rate = self.rate_limiter.get_rate('www.imdb.com') or float('inf')
+        avg_latency = sum(latencies) / len(latencies) if latencies else None
+        worker_rate = self.workers / avg_latency if avg_latency else float('inf')
+        projected_rate = min(worker_rate, imdb_rate)
+
+        report = {
+            'dry_run': True,
+            'pending': pending,
+            'resume_after_id': after_id,
+            'workers': self.workers,
+            'sampled': len(latencies),
+            'avg_latency': round(avg_latency, 3) if avg_latency else None,
+            'rate_limit': imdb_rate if imdb_rate != float('inf') else None,
+            'projected_rate': round(projected_rate, 2) if projected_rate != float('inf') else None,
+            'projected_seconds': round(pending / projected_rate, 1)
+            if projected_rate not in (0, float('inf')) else None,
+        }
+        logger.info(f"🔍 포스터 백필 dry-run: {report}")
+        return report
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/poster_variants.py
+"""
+포스터 변환본(썸네일/WebP) 생성 파이프라인
+- 원본 poster_image 를 고정 크기 JPEG + WebP 로 변환
+- 경로는 MovieTable.poster_variants 에 저장
+- 수집 시(ingest) 자동 생성, 기존 데이터는 regenerate_poster_variants 명령으로 일괄 생성
+
+설정 (settings.POSTER_VARIANT_SETTINGS):
+    SIZES: {'thumb': (160, 240), 'card': (400, 600)}
+    JPEG_QUALITY: 82
+    WEBP_QUALITY: 80
+    GENERATE_ON_INGEST: True
+"""
+import logging
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VARIANT_SIZES = {
+    'thumb': (160, 240),   # 목록/자동완성용
+    'card': (400, 600),    # 검색 결과 카드 (300px 높이 × 2배 밀도)
+}
+
+VARIANT_FORMATS = ('jpeg', 'webp')
+
+
+def get_variant_settings():
+    """변환본 설정 (settings 값 우선)"""
+    variant_settings = {
+        'SIZES': DEFAULT_VARIANT_SIZES,
+        'JPEG_QUALITY': 82,
+        'WEBP_QUALITY': 80,
+        'GENERATE_ON_INGEST': True,
+    }
+    if hasattr(settings, 'POSTER_VARIANT_SETTINGS'):
+        variant_settings.update(settings.POSTER_VARIANT_SETTINGS)
+    return variant_settings
+
+
+def normalize_variant_request(size, image_format=None):
+    """
+    요청한 크기 / 형식을 설정된 변환본 목록으로 검증 → (size, image_format)
+    - 모르는 크기는 '' (변환본 사용 안 함), 모르는 형식은 'webp'
+    """
+    size = size if size in get_variant_settings()['SIZES'] else ''
+    image_format = image_format if image_format in VARIANT_FORMATS else 'webp'
+    return size, image_format
+
+
+def get_variant_path(movie_id, size, image_format):
+    """변환본 저장 경로 (영화별 고정 경로, 재생성 시 덮어씀)"""
+    ext = 'jpg' if image_format == 'jpeg' else image_format
+    return f"posters/variants/{movie_id}/{size}.{ext}"
+
+
+def _encode_variant(image, image_format, variant_settings):
+    buffer = BytesIO()
+    if image_format == 'webp':
+        image.save(buffer, 'WEBP', quality=variant_settings['WEBP_QUALITY'], method=4)
+    else:
+        image.save(buffer, 'JPEG', quality=variant_settings['JPEG_QUALITY'],
+                   optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def build_poster_variants(movie_id, source_file, variant_settings=None):
+    """
+    원본 이미지 파일에서 변환본 생성 후 저장
+    - 반환: {'thumb': {'jpeg': path, 'webp': path}, ...}
+    """
+    from PIL import Image, ImageOps
+
+    variant_settings = variant_settings or get_variant_settings()
+    variants = {}
+
+    with Image.open(source_file) as source:
+        source = ImageOps.exif_transpose(source)
+        if source.mode not in ('RGB', 'L'):
+            source = source.convert('RGB')
+
+        # 큰 크기부터 줄여 나가면 리샘플링 비용 감소
+        sizes = sorted(variant_settings['SIZES'].items(), key=lambda item: -item[1][0])
+        working = source
+        for size_name, box in sizes:
+            working = working.copy()
+            working.thumbnail(box, Image.LANCZOS)
+
+            variants[size_name] = {}
+            for image_format in VARIANT_FORMATS:
+                path = get_variant_path(movie_id, size_name, image_format)
+                if default_storage.exists(path):
+                    default_storage.delete(path)
+                saved_path = default_storage.save(
+                    path, ContentFile(_encode_variant(working, image_format, variant_settings))
+                )
+                variants[size_name][image_format] = saved_path
+
+    return variants
+
+
+def generate_poster_variants(movie, force=False):
+    """
+    영화 포스터 변환본 생성 및 MovieTable.poster_variants 저장
+    - 원본 poster_image 가 없으면 건너뜀
+    - force=False 이면 이미 생성된 영화는 건너뜀
+    """
+    if not movie.poster_image:
+        return None
+
+    variant_settings = get_variant_settings()
+    existing = movie.poster_variants or {}
+    if not force and existing.get('source') == movie.poster_image.name \
+            and all(size in existing for size in variant_settings['SIZES']):
+        return existing
+
+    try:
+        with movie.poster_image.open('rb') as source_file:
+            variants = build_poster_variants(movie.id, source_file, variant_settings)
+    except Exception as e:
+        logger.error(f"❌ 포스터 변환본 생성 실패 (ID: {movie.id}): {e}")
+        return None
+
+    variants['source'] = movie.poster_image.name
+    movie.poster_variants = variants
+    movie.save(update_fields=['poster_variants', 'updated_at'])
+
+    logger.info(f"🖼️ 포스터 변환본 생성: {movie.movie_title} ({', '.join(variant_settings['SIZES'])})")
+    return variants
+
+
+def generate_poster_variants_on_ingest(movie):
+    """수집 파이프라인용: 설정이 켜져 있을 때만 생성, 실패해도 수집은 계속"""
+    if not get_variant_settings()['GENERATE_ON_INGEST']:
+        return None
+    try:
+        return generate_poster_variants(movie)
+    except Exception as e:
+        logger.warning(f"⚠️ 포스터 변환본 생성 건너뜀: {e}")
+        return None
+
+
+def get_poster_variant_url(movie, size='card', image_format='webp'):
+    """변환본 URL (없으면 빈 문자열)"""
+    path = movie.get_poster_variant_path(size, image_format)
+    return default_storage.url(path) if path else ''
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/query_budget.py
+"""
+요청별 SQL 쿼리 예산과 N+1 감지
+- connection.execute_wrapper 로 실행된 SQL 을 모음 (DEBUG 와 무관하게 동작)
+- 지문(fingerprint): 문자열/숫자 리터럴과 IN 목록을 ? 로 바꾼 SQL
+  → 같은 지문이 REPEAT_THRESHOLD 번 이상이면 N+1 의심
+- 모든 공개 엔드포인트(URL 이름)의 쿼리 예산을 ENDPOINT_QUERY_BUDGETS 에 선언
+  · QueryBudgetMiddleware: 개발 모드에서 예산 초과 / N+1 을 로그 (RAISE=True 면 예외)
+  · 테스트: with assert_query_budget('search-quotes'): client.get(...)
+
+설정 (settings.QUERY_BUDGET_SETTINGS):
+    ENABLED: 미들웨어 검사 여부 (기본 settings.DEBUG)
+    RAISE: 초과 시 QueryBudgetExceeded 예외 (기본 False, 로그만)
+    REPEAT_THRESHOLD: N+1 로 볼 같은 지문 반복 수 (기본 5)
+    BUDGETS: 엔드포인트별 예산 덮어쓰기 {URL 이름: 쿼리 수}
+"""
+import re
+import logging
+from collections import Counter
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# URL 이름 → 캐시가 비어 있을 때 허용하는 최대 쿼리 수
+# (세션·인증·스로틀 기록 쿼리 포함, 결과 수와 무관해야 함)
+ENDPOINT_QUERY_BUDGETS = {
+    # phrase (웹)
+    'phrase:home': 0,
+    'phrase:index': 2,
+    'phrase:process_text': 30,
+    'phrase:popular_searches_api': 3,
+    'phrase:statistics_api': 25,
+    'phrase:debug_view': 2,
+    'phrase:korean_translation_status': 20,
+    'phrase:bulk_translate_dialogues': 30,
+    'phrase:metrics': 2,
+
+    # api
+    'search-quotes': 20,
+    'search-quotes-async': 20,      # 스레드 풀 연결에서 실행 (미들웨어 집계 밖)
+    'autocomplete': 2,
+    'request-table-list': 6,
+    'movie-table-list': 6,
+    'dialogue-table-list': 6,
+    'comprehensive-statistics': 40,
+    'search-analytics': 25,
+    'api-info': 2,
+    'schema-info': 2,
+    'system-health': 10,
+    'bulk-update-dialogues': 15,
+    'movie-list': 6,
+    'movie-detail': 3,
+    'quote-list': 6,
+    'legacy-search': 12,
+    'quote-detail': 5,
+    'movie-quotes': 6,
+}
+
+re_string_literal = re.compile(r"'(?:[^']|'')*'")
+re_number_literal = re.compile(r'\b\d+(?:\.\d+)?\b')
+re_in_list = re.compile(r'\bIN\s*\((?:\s*(?:\?|%s)\s*,?)+\)', re.IGNORECASE)
+re_whitespace = re.compile(r'\s+')
+
+
+def get_query_budget_settings():
+    """쿼리 예산 설정 (settings 값 우선)"""
+    budget_settings = {
+        'ENABLED': settings.DEBUG,
+        'RAISE': False,
+        'REPEAT_THRESHOLD': 5,
+        'BUDGETS': {},
+    }
+    if hasattr(settings, 'QUERY_BUDGET_SETTINGS'):
+        budget_settings.update(settings.QUERY_BUDGET_SETTINGS)
+    return budget_settings
+
+
+def get_endpoint_budget(url_name):
+    """URL 이름의 쿼리 예산 (선언 없으면 None)"""
+    overrides = get_query_budget_settings()['BUDGETS']
+    if url_name in overrides:
+        return overrides[url_name]
+    return ENDPOINT_QUERY_BUDGETS.get(url_name)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """쿼리 예산 초과 또는 N+1 감지"""
+
+
+def fingerprint(sql):
+    """리터럴을 제거한 SQL 지문"""
+    normalized = re_string_literal.sub('?', sql)
+    normalized = re_number_literal.sub('?', normalized)
+    normalized = re_in_list.sub('IN (...)', normalized)
+    return re_whitespace.sub(' ', normalized).strip()
+
+
+# ===== 쿼리 수집 =====
+
+class QueryRecorder:
+    """
+    모든 DB 연결의 실행 SQL 수집
+        with QueryRecorder() as recorder:
+            ...
+        recorder.count, recorder.repeated(threshold=5)
+    """
+
+    def __init__(self, using=None):
+        self.aliases = [using] if using else list(connections)
+        self.queries = []
+        self._wrappers = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        for alias in self.aliases:
+            wrapper = connections[alias].execute_wrapper(self)
+            wrapper.__enter__()
+            self._wrappers.append(wrapper)
+        return self
+
+    def __exit__(self, *exc_info):
+        while self._wrappers:
+            self._wrappers.pop().__exit__(*exc_info)
+        return False
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def repeated(self, threshold=None):
+        """[(지문, 반복 수)] (threshold 번 이상 반복된 것만, 많은 순)"""
+        threshold = threshold or get_query_budget_settings()['REPEAT_THRESHOLD']
+        counts = Counter(fingerprint(sql) for sql in self.queries)
+        return [(sql, count) for sql, count in counts.most_common() if count >= threshold]
+
+    def violations(self, budget=None, threshold=None):
+        """예산 초과 / N+1 설명 목록 (없으면 빈 목록)"""
+        problems = []
+        if budget is not None and self.count > budget:
+            problems.append(f"쿼리 {self.count}개 > 예산 {budget}개")
+        for sql, count in self.repeated(threshold):
+            problems.append(f"N+1 의심 ({count}회): {sql[:200]}")
+        return problems
+
+
+@contextmanager
+def assert_query_budget(budget, threshold=None, using=None):
+    """
+    테스트용 예산 검사
+        with assert_query_budget('movie-table-list'):      # URL 이름 → 선언된 예산
+        with assert_query_budget(3):                        # 직접 지정
+    - 예산 초과 또는 같은 지문이 threshold 번 이상이면 QueryBudgetExceeded
+    """
+    if isinstance(budget, str):
+        url_name, budget = budget, get_endpoint_budget(budget)
+        if budget is None:
+            raise QueryBudgetExceeded(f"쿼리 예산이 선언되지 않은 엔드포인트: {url_name}")
+
+    with QueryRecorder(using=using) as recorder:
+        yield recorder
+
+    problems = recorder.violations(budget, threshold)
+    if problems:
+        listing = '\n'.join(f"  {index}. {sql[:200]}" for index, sql in enumerate(recorder.queries, 1))
+        raise QueryBudgetExceeded('\n'.join(problems) + f"\n실행된 쿼리:\n{listing}")
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/query_sampling.py
+"""
+표본 요청의 SQL 지문별 호출 수 / 누적 시간 수집 (인덱스 분석용, manage.py index_advice)
+- QuerySamplingMiddleware 가 SAMPLE_RATE 비율의 요청(should_sample())에만 QuerySampler 를 엶 (with QuerySampler(): ...)
+- 지문은 phrase.utils.query_budget.fingerprint (리터럴 / IN 목록 정규화)
+- 지문마다 SQL 예시를 프로세스당 하나 저장 (EXPLAIN 실행용)
+  · 파라미터 값은 저장하지 않고 타입만 저장 (세션 키 / IP / 검색어 등이 파일에 남지 않음)
+  · index_advice 실행 시 타입별 대표값을 바인딩해 EXPLAIN
+- 값은 메트릭 저장소에 누적 (MULTIPROCESS_DIR/queries 의 워커별 mmap 파일, 디렉터리 권한 0700,
+  /metrics 에는 노출 안 함) → 재시작 후에도 유지, index_advice --reset 으로 비움
+
+설정 (settings.QUERY_SAMPLING_SETTINGS):
+    ENABLED: 표본 수집 여부 (기본 True)
+    SAMPLE_RATE: 수집할 요청 비율 (기본 0.01)
+    MAX_EXAMPLE_LENGTH: 예시로 저장할 SQL 최대 길이 (기본 4000)
+"""
+import os
+import json
+import time
+import random
+import logging
+import threading
+from datetime import date, datetime, time as dt_time
+
+from django.conf import settings
+
+from phrase.utils.metrics import (
+    LocalValueStore, MetricsRegistry, MultiProcessValueStore, get_metrics_settings,
+)
+from phrase.utils.query_budget import QueryRecorder, fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def get_query_sampling_settings():
+    """쿼리 표본 설정 (settings 값 우선)"""
+    sampling_settings = {
+        'ENABLED': True,
+        'SAMPLE_RATE': 0.01,
+        'MAX_EXAMPLE_LENGTH': 4000,
+    }
+    if hasattr(settings, 'QUERY_SAMPLING_SETTINGS'):
+        sampling_settings.update(settings.QUERY_SAMPLING_SETTINGS)
+    return sampling_settings
+
+
+def _sampling_store():
+    directory = get_metrics_settings()['MULTIPROCESS_DIR']
+    if directory:
+        return MultiProcessValueStore(os.path.join(str(directory), 'queries'), mode=0o700)
+    return LocalValueStore()
+
+
+query_registry = MetricsRegistry(store=_sampling_store())
+
+QUERY_CALLS = query_registry.counter(
+    'phrase_sql_fingerprint_calls_total', '표본 요청의 SQL 지문별 실행 수', ('fingerprint',))
+QUERY_SECONDS = query_registry.counter(
+    'phrase_sql_fingerprint_seconds_total', '표본 요청의 SQL 지문별 누적 실행 시간', ('fingerprint',))
+QUERY_EXAMPLES = query_registry.counter(
+    'phrase_sql_fingerprint_example_shapes', 'SQL 지문별 실행 예시 (EXPLAIN 용, 파라미터는 타입만)',
+    ('fingerprint', 'sql', 'param_types'))
+
+_example_lock = threading.Lock()
+_example_fingerprints = set()
+
+# 파라미터 타입별 EXPLAIN 대표값 (목록에 없는 타입은 문자열로 취급)
+PARAM_PLACEHOLDERS = {
+    'NoneType': None,
+    'bool': True,
+    'int': 1,
+    'float': 1.0,
+    'Decimal': 1,
+    'str': 'a',
+    'bytes': b'a',
+    'datetime': datetime(2000, 1, 1),
+    'date': date(2000, 1, 1),
+    'time': dt_time(0, 0),
+}
+
+
+def param_types(params):
+    """파라미터 값 → 타입 이름 목록 (값 자체는 버림)"""
+    return [
+        type(value).__name__ if type(value).__name__ in PARAM_PLACEHOLDERS else 'str'
+        for value in params or ()
+    ]
+
+
+def bind_placeholders(types):
+    """타입 이름 목록 → EXPLAIN 에 바인딩할 대표값 목록"""
+    return [PARAM_PLACEHOLDERS.get(name, 'a') for name in types]
+
+
+def record_query(sql, params, seconds, many=False):
+    """지문별 호출 수 / 시간 누적, 처음 본 지문은 예시 저장"""
+    key = fingerprint(sql)
+    QUERY_CALLS.inc(fingerprint=key)
+    QUERY_SECONDS.inc(seconds, fingerprint=key)
+
+    if many or key in _example_fingerprints or len(sql) > get_query_sampling_settings()['MAX_EXAMPLE_LENGTH']:
+        return
+    with _example_lock:
+        if key in _example_fingerprints:
+            return
+        _example_fingerprints.add(key)
+    if isinstance(params, dict):
+        return  # 이름 있는 파라미터는 예시로 쓰지 않음
+    QUERY_EXAMPLES.inc(fingerprint=key, sql=sql, param_types=json.dumps(param_types(params)))
+
+
+class QuerySampler(QueryRecorder):
+    """
+    실행 시간을 재서 지문별로 누적하는 execute_wrapper
+        with QuerySampler():
+            ...
+    """
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            try:
+                record_query(sql, params, time.perf_counter() - start, many)
+            except Exception as e:
+                logger.debug(f"[QuerySampling] 기록 실패: {e}")
+
+
+def should_sample():
+    sampling_settings = get_query_sampling_settings()
+    return sampling_settings['ENABLED'] and random.random() < sampling_settings['SAMPLE_RATE']
+
+
+def fingerprint_stats():
+    """
+    지문별 누적 → [{'fingerprint', 'calls', 'seconds', 'mean_ms', 'examples': [(sql, params)]}]
+    (누적 시간 큰 순, 예시 params 는 타입별 대표값)
+    """
+    snapshot = query_registry.store.snapshot()
+    stats = {}
+    for (key,), calls in QUERY_CALLS.items(snapshot):
+        stats[key] = {'fingerprint': key, 'calls': int(calls), 'seconds': 0.0, 'examples': []}
+    for (key,), seconds in QUERY_SECONDS.items(snapshot):
+        if key in stats:
+            stats[key]['seconds'] = float(seconds)
+    for (key, sql, types), _ in QUERY_EXAMPLES.items(snapshot):
+        if key in stats:
+            stats[key]['examples'].append((sql, bind_placeholders(json.loads(types))))
+
+    for entry in stats.values():
+        entry['mean_ms'] = round(entry['seconds'] / entry['calls'] * 1000, 3) if entry['calls'] else 0.0
+    return sorted(stats.values(), key=lambda entry: entry['seconds'], reverse=True)
+
+
+def reset_query_samples():
+    """수집한 지문 통계 삭제"""
+    query_registry.store.clear()
+    with _example_lock:
+        _example_fingerprints.clear()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/result_records.py
+"""
+검색 결과 v2 레코드 (캐시/템플릿 공용)
+- 필드명 하나만 유지 (title/movie_title 등 중복 키 제거)
+- __slots__ + 튜플 pickle 로 캐시 페이로드 최소화
+- 파일 URL, 길이 표시 문자열은 접근 시점에 계산 (lazy)
+"""
+import pickle
+import time
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+RESULT_FORMAT_VERSION = 2
+
+
+def search_result_cache_key(request_phrase):
+    """검색 결과 캐시 키 (내장 hash() 는 프로세스마다 달라 워커/예열 명령 간 공유 불가 → md5)"""
+    digest = hashlib.md5((request_phrase or '').encode('utf-8')).hexdigest()
+    return f"search_result_v{RESULT_FORMAT_VERSION}_{digest}"
+
+
+class _ResultRecord:
+    """
+    슬롯 기반 결과 레코드 공통 동작
+    - 기존 dict 소비 코드(.get, ['key'], ['key'] = v)와 템플릿 dict 조회 호환
+    - pickle 시 필드명 없이 값 튜플만 저장
+    """
+    __slots__ = ()
+
+    def __init__(self, *values, **fields):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+        for name in self.__slots__[len(values):]:
+            setattr(self, name, fields.get(name, self._defaults.get(name)))
+
+    def __reduce__(self):
+        return (self.__class__, tuple(getattr(self, name) for name in self.__slots__))
+
+    def __getitem__(self, key):
+        if key in self.__slots__ or isinstance(getattr(type(self), key, None), property):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def as_dict(self):
+        """JSON 응답 등 평범한 dict 가 필요한 경우"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.as_dict()!r})"
+
+
+def _storage_url(name):
+    """저장소 파일명을 URL로 변환 (템플릿에서 실제 사용할 때만 호출)"""
+    if not name:
+        return ''
+    try:
+        from django.core.files.storage import default_storage
+        return default_storage.url(name)
+    except Exception as e:
+        logger.warning(f"⚠️ 파일 URL 변환 실패: {name} - {e}")
+        return ''
+
+
+class DialogueResult(_ResultRecord):
+    """대사 결과 레코드 (DialogueTable 한 행)"""
+    __slots__ = (
+        'id',
+        'text',
+        'text_ko',
+        'start_time',
+        'end_time',
+        'duration_seconds',
+        'video_url',
+        'video_file',
+        'video_quality',
+        'file_size_bytes',
+        'translation_method',
+        'translation_quality',
+        'play_count',
+        'like_count',
+        'created_at',
+    )
+    _defaults = {'text_ko': '', 'end_time': '', 'video_file': '', 'play_count': 0, 'like_count': 0}
+
+    @classmethod
+    def from_model(cls, dialogue):
+        return cls(
+            dialogue.id,
+            dialogue.dialogue_phrase,
+            dialogue.dialogue_phrase_ko or '',
+            dialogue.dialogue_start_time,
+            dialogue.dialogue_end_time or '',
+            dialogue.duration_seconds,
+            dialogue.video_url,
+            dialogue.video_file.name if dialogue.video_file else '',
+            dialogue.video_quality,
+            dialogue.file_size_bytes,
+            dialogue.translation_method,
+            dialogue.translation_quality,
+            dialogue.play_count,
+            dialogue.like_count,
+            dialogue.created_at,
+        )
+
+    @property
+    def video_file_path(self):
+        return _storage_url(self.video_file)
+
+    @property
+    def duration_display(self):
+        if self.duration_seconds:
+            minutes = self.duration_seconds // 60
+            seconds = self.duration_seconds % 60
+            return f"{minutes:02d}:{seconds:02d}"
+        return "알 수 없음"
+
+
+class MovieResult(_ResultRecord):
+    """영화 결과 레코드 (MovieTable 한 행 + 대사 목록)"""
+    __slots__ = (
+        'title',
+        'original_title',
+        'year',
+        'country',
+        'director',
+        'genre',
+        'imdb_rating',
+        'imdb_url',
+        'poster_url',
+        'poster_image',
+        'data_quality',
+        'view_count',
+        'like_count',
+        'dialogues',
+        'poster_variants',
+    )
+    _defaults = {'genre': '', 'imdb_url': '', 'poster_url': '', 'poster_image': '', 'view_count': 0, 'like_count': 0}
+
+    def __init__(self, *values, **fields):
+        super().__init__(*values, **fields)
+        if self.dialogues is None:
+            self.dialogues = []
+        if self.poster_variants is None:
+            self.poster_variants = {}
+
+    @classmethod
+    def from_model(cls, movie, dialogues=None):
+        return cls(
+            movie.movie_title,
+            movie.original_title or movie.movie_title,
+            movie.release_year,
+            movie.production_country,
+            movie.director,
+            movie.genre or '',
+            float(movie.imdb_rating) if movie.imdb_rating else None,
+            movie.imdb_url or '',
+            movie.poster_url or '',
+            movie.poster_image.name if movie.poster_image else '',
+            movie.data_quality,
+            movie.view_count,
+            movie.like_count,
+            dialogues if dialogues is not None else [],
+            movie.poster_variants or {},
+        )
+
+    @property
+    def poster_image_path(self):
+        return _storage_url(self.poster_image)
+
+    @property
+    def poster_sources(self):
+        """카드 크기 포스터 변환본 URL {'webp': ..., 'jpeg': ...} (없으면 빈 dict)"""
+        card = self.poster_variants.get('card', {})
+        return {image_format: _storage_url(path) for image_format, path in card.items() if path}
+
+    @property
+    def dialogue_count(self):
+        return len(self.dialogues)
+
+
+# ===== 페이로드 측정 =====
+
+def measure_results_payload(build_func, search_results, repeat=5):
+    """
+    결과 변환 함수의 빌드 시간과 캐시 페이로드 크기 측정
+    - build_func: search_results 를 받아 캐시에 저장할 객체를 반환하는 함수
+    - search_results: 미리 평가된 대사 목록 (DB 조회 시간 제외)
+    """
+    search_results = list(search_results)
+    timings = []
+    built = None
+
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        built = build_func(search_results)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    payload = pickle.dumps(built, pickle.HIGHEST_PROTOCOL)
+    timings.sort()
+
+    return {
+        'format_version': RESULT_FORMAT_VERSION,
+        'dialogues': len(search_results),
+        'movies': len(built) if built else 0,
+        'build_ms_min': round(timings[0], 3),
+        'build_ms_median': round(timings[len(timings) // 2], 3),
+        'payload_bytes': len(payload),
+    }
@@ -7,8 +7,11 @@
 import logging
 from phrase.models import RequestTable, UserSearchQuery
 from phrase.utils.translate import LibreTranslator
+from phrase.utils.event_log import get_event_logger
 
 logger = logging.getLogger(__name__)
+request_log = get_event_logger('request')
+db_log = get_event_logger('db')
 
 
 def get_client_ip(request):
@@ -17,16 +20,14 @@ def get_client_ip(request):
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
             ip = x_forwarded_for.split(',')[0]
-            print(f"🌐 DEBUG: X-Forwarded-For IP: {ip}")
         else:
             ip = request.META.get('REMOTE_ADDR')
-            print(f"🌐 DEBUG: Remote Addr IP: {ip}")
         
         final_ip = ip or '0.0.0.0'
-        print(f"🌐 DEBUG: 최종 IP: {final_ip}")
+        request_log.debug("🌐 클라이언트 IP", ip=final_ip, forwarded=bool(x_forwarded_for))
         return final_ip
     except Exception as e:
-        print(f"❌ DEBUG: IP 추출 오류: {e}")
+        request_log.warning(f"❌ IP 추출 오류: {e}")
         return '0.0.0.0'
 
 
@@ -54,7 +55,7 @@ def record_search_query(session_key, original_query, translated_query,
             search_query.search_count += 1
             search_query.save(update_fields=['search_count'])
         
-        logger.info(f"📊 검색기록 저장: {original_query} ({result_count}개 결과)")
+        db_log.info("📊 검색기록 저장", query=original_query, result_count=result_count, created=created)
         
     except Exception as e:
         logger.error(f"❌ 검색기록 저장 실패: {e}")
@@ -76,9 +77,9 @@ def increment_search_count(request_phrase, request_korean, result_count, user_ip
         if not created:
             request_obj.search_count += 1
             request_obj.save(update_fields=['search_count'])
-        print("📊 DEBUG: 검색횟수 증가 완료")
+        db_log.debug("📊 검색횟수 증가", phrase=request_phrase, created=created)
     except Exception as e:
-        print(f"⚠️ DEBUG: 검색횟수 증가 실패: {e}")
+        db_log.warning(f"⚠️ 검색횟수 증가 실패: {e}", phrase=request_phrase)
 
 
 def get_input_type(user_input):
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/similar_search.py
+"""
+유사 검색어 인덱스 (글자 trigram, 메모리)
+- 원본: 결과가 있었던 RequestTable.request_phrase (DB 캐시에서 바로 응답 가능한 검색어)
+- 각 구문을 단어별로 '  word ' 패딩 후 3글자 조각(trigram)으로 분해 → trigram 별 역색인
+- 질의 trigram 을 드문 것부터 역색인에서 세고, 후보마다 Jaccard / 코사인 점수 계산
+- 훑는 역색인 항목 수를 MAX_POSTINGS 로 제한 → 흔한 trigram 만 남은 질의도 지연 시간 일정
+- 변경분만 가져와 배열을 새로 만든 뒤 참조만 교체 (조회는 잠금 없음)
+- 첫 생성과 갱신 모두 백그라운드 스레드에서 수행, 첫 생성 전에는 제안 없음
+- 삭제된 검색어는 전체 행 수가 달라졌을 때 id 목록과 대조해 제거
+
+설정 (settings.SIMILAR_SEARCH_SETTINGS):
+    REFRESH_INTERVAL: 갱신 주기 초 (기본 300)
+    METRIC: 'jaccard' | 'cosine' (기본 'jaccard')
+    MIN_SCORE: 제안할 최소 유사도 (기본 0.3)
+    MAX_POSTINGS: 질의당 훑을 역색인 항목 수 상한 (기본 20000)
+"""
+import math
+import time
+import heapq
+import logging
+import threading
+from array import array
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection
+
+from phrase.utils.negative_cache import normalize_phrase
+
+logger = logging.getLogger(__name__)
+
+METRICS = ('jaccard', 'cosine')
+
+
+def get_similar_search_settings():
+    """유사 검색어 설정 (settings 값 우선)"""
+    similar_settings = {
+        'REFRESH_INTERVAL': 300,
+        'METRIC': 'jaccard',
+        'MIN_SCORE': 0.3,
+        'MAX_POSTINGS': 20000,
+    }
+    if hasattr(settings, 'SIMILAR_SEARCH_SETTINGS'):
+        similar_settings.update(settings.SIMILAR_SEARCH_SETTINGS)
+    return similar_settings
+
+
+def trigrams(text):
+    """정규화된 구문의 trigram 집합 (pg_trgm 과 같은 단어별 패딩)"""
+    grams = set()
+    for word in normalize_phrase(text).split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+class TrigramIndex:
+    """
+    불변 trigram 역색인
+    - phrases / weights / sizes: 문서 id 순 (표시 텍스트, (search_count, result_count), trigram 수)
+    - postings: trigram → array('I') 문서 id
+    """
+    __slots__ = ('phrases', 'weights', 'sizes', 'postings')
+
+    def __init__(self, documents):
+        self.phrases = []
+        self.weights = []
+        self.sizes = array('H')
+        postings = defaultdict(lambda: array('I'))
+        for doc_id, (phrase, weight) in enumerate(documents.items()):
+            grams = trigrams(phrase)
+            self.phrases.append(phrase)
+            self.weights.append(weight)
+            self.sizes.append(min(len(grams), 0xFFFF))
+            for gram in grams:
+                postings[gram].append(doc_id)
+        self.postings = dict(postings)
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def search(self, query, limit=5, metric='jaccard', min_score=0.3, max_postings=20000, exclude=()):
+        """유사 구문 상위 limit 개 → [(점수, 구문, (search_count, result_count))]"""
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        # 드문 trigram 부터 → 상한에 걸려도 변별력 높은 후보는 이미 집계됨
+        lists = sorted(
+            (self.postings[gram] for gram in query_grams if gram in self.postings), key=len
+        )
+        shared = Counter()
+        scanned = 0
+        for doc_ids in lists:
+            if scanned + len(doc_ids) > max_postings and shared:
+                break
+            scanned += len(doc_ids)
+            shared.update(doc_ids)
+
+        query_size = len(query_grams)
+        excluded = {normalize_phrase(text) for text in exclude}
+        scored = []
+        for doc_id, common in shared.items():
+            size = self.sizes[doc_id]
+            if metric == 'cosine':
+                score = common / math.sqrt(query_size * size)
+            else:
+                score = common / (query_size + size - common)
+            if score >= min_score:
+                scored.append((score, self.weights[doc_id][0], doc_id))
+
+        results = []
+        for score, _search_count, doc_id in heapq.nlargest(limit + len(excluded), scored):
+            phrase = self.phrases[doc_id]
+            if normalize_phrase(phrase) in excluded:
+                continue
+            results.append((round(score, 4), phrase, self.weights[doc_id]))
+            if len(results) >= limit:
+                break
+        return results
+
+
+class SimilarSearchIndex:
+    """
+    과거 검색어 유사도 인덱스 (프로세스별 싱글톤: get_similar_search_index())
+    - refresh(): 마지막 갱신 이후 변경/삭제된 RequestTable 행만 반영
+    """
+
+    def __init__(self):
+        self.settings = get_similar_search_settings()
+        self.rows = {}          # RequestTable id → (정규화 키, 표시 텍스트, (search_count, result_count)), 제안 대상만
+        self.known_ids = set()  # 읽은 적 있는 모든 id (삭제 감지용)
+        self.index = TrigramIndex({})
+        self.watermark = None
+        self.refreshed_at = 0.0
+        self._refresh_lock = threading.Lock()
+
+    def _load_requests(self):
+        from phrase.models import RequestTable
+
+        queryset = RequestTable.objects.all()
+        if self.watermark is not None:
+            # 같은 시각에 저장된 행을 놓치지 않도록 >=, 다시 읽은 행은 값이 같으면 변경으로 세지 않음
+            queryset = queryset.filter(updated_at__gte=self.watermark)
+
+        changed = 0
+        rows = queryset.values_list(
+            'id', 'request_phrase', 'search_count', 'result_count', 'is_active', 'updated_at'
+        ).iterator(chunk_size=2000)
+        for request_id, request_phrase, search_count, result_count, is_active, updated_at in rows:
+            self.known_ids.add(request_id)
+            key = normalize_phrase(request_phrase)
+            # DB 에 결과가 있는 활성 검색어만 제안
+            if key and is_active and result_count:
+                row = (key, request_phrase.strip(), (search_count or 0, result_count))
+            else:
+                row = None
+            if self.rows.get(request_id) != row:
+                if row is None:
+                    del self.rows[request_id]
+                else:
+                    self.rows[request_id] = row
+                changed += 1
+            if self.watermark is None or updated_at > self.watermark:
+                self.watermark = updated_at
+        return changed
+
+    def _drop_deleted_requests(self):
+        """삭제된 행 제거 (행 수가 읽은 id 수와 같으면 id 목록 조회 생략)"""
+        from phrase.models import RequestTable
+
+        if RequestTable.objects.count() == len(self.known_ids):
+            return 0
+        existing = set(RequestTable.objects.values_list('id', flat=True).iterator(chunk_size=10000))
+        deleted = self.known_ids - existing
+        self.known_ids -= deleted
+        changed = 0
+        for request_id in deleted:
+            if self.rows.pop(request_id, None) is not None:
+                changed += 1
+        return changed
+
+    def _build(self):
+        """정규화 키가 같은 검색어는 검색 횟수가 많은 쪽 하나만 색인"""
+        documents = {}
+        for key, text, weight in self.rows.values():
+            if key not in documents or weight[0] > documents[key][1][0]:
+                documents[key] = (text, weight)
+        return TrigramIndex({text: weight for text, weight in documents.values()})
+
+    def refresh(self):
+        """변경분 반영 후 인덱스 교체 → 반영된 행 수"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return 0
+        try:
+            start = time.perf_counter()
+            changed = self._load_requests() + self._drop_deleted_requests()
+            if changed or not self.refreshed_at:
+                self.index = self._build()
+                logger.info(
+                    f"🧩 [SimilarSearch] 인덱스 갱신: {changed}행 반영, {len(self.index)}개 검색어 "
+                    f"({(time.perf_counter() - start) * 1000:.0f}ms)"
+                )
+            self.refreshed_at = time.monotonic()
+            return changed
+        finally:
+            self._refresh_lock.release()
+
+    @property
+    def ready(self):
+        """첫 생성 완료 여부"""
+        return bool(self.refreshed_at)
+
+    def refresh_in_background_if_stale(self):
+        if self.ready and time.monotonic() - self.refreshed_at < self.settings['REFRESH_INTERVAL']:
+            return
+        if self._refresh_lock.locked():
+            return
+        threading.Thread(target=self._safe_refresh, name='similar-search-refresh', daemon=True).start()
+
+    def _safe_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"❌ [SimilarSearch] 인덱스 갱신 실패: {e}")
+        finally:
+            # 백그라운드 스레드 전용 연결 정리
+            connection.close()
+
+    def similar(self, query, limit=5, exclude=()):
+        """유사 검색어 → [{'text', 'similarity', 'search_count', 'result_count'}]"""
+        metric = self.settings['METRIC'] if self.settings['METRIC'] in METRICS else 'jaccard'
+        results = self.index.search(
+            query, limit, metric, self.settings['MIN_SCORE'], self.settings['MAX_POSTINGS'],
+            exclude=(query,) + tuple(exclude)
+        )
+        return [
+            {'text': text, 'similarity': score, 'search_count': search_count, 'result_count': result_count}
+            for score, text, (search_count, result_count) in results
+        ]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_similar_search_index():
+    """
+    프로세스별 인덱스
+    - 첫 호출은 빈 인덱스를 바로 돌려주고 생성은 백그라운드에서 수행 (그동안 제안 없음)
+    - 이후 REFRESH_INTERVAL 마다 백그라운드 갱신
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SimilarSearchIndex()
+    _index.refresh_in_background_if_stale()
+    return _index
+
+
+def find_similar_searches(*queries, limit=5):
+    """
+    여러 질의(원문, 번역문 등)의 유사 검색어를 점수순으로 합침
+    - 인덱스 오류 시 빈 목록 (검색 결과 없음 응답은 제안 없이 진행)
+    """
+    queries = [query for query in queries if query]
+    try:
+        index = get_similar_search_index()
+        merged = {}
+        for query in queries:
+            for suggestion in index.similar(query, limit, exclude=queries):
+                key = normalize_phrase(suggestion['text'])
+                if key not in merged or merged[key]['similarity'] < suggestion['similarity']:
+                    merged[key] = suggestion
+        return sorted(merged.values(), key=lambda s: (-s['similarity'], -s['search_count']))[:limit]
+    except Exception as e:
+        logger.warning(f"⚠️ [SimilarSearch] 유사 검색어 조회 실패: {e}")
+        return []
+
+
+def measure_similar_search_latency(index, queries, repeat=20, limit=5):
+    """유사 검색어 조회 지연 측정 (ms, p50 / p99)"""
+    timings = []
+    for _ in range(max(repeat, 1)):
+        for query in queries:
+            start = time.perf_counter()
+            index.similar(query, limit)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    if not timings:
+        return {}
+    return {
+        'count': len(timings),
+        'p50_ms': round(timings[len(timings) // 2], 4),
+        'p99_ms': round(timings[min(len(timings) - 1, int(len(timings) * 0.99))], 4),
+        'max_ms': round(timings[-1], 4),
+    }
@@ -0,0 +1,386 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/spelling.py
+"""
+코퍼스 어휘 기반 오타 교정 (SymSpell 방식 대칭 삭제 인덱스)
+- 어휘: DialogueTable.dialogue_phrase + RequestTable.request_phrase 의 영어 단어 (빈도 포함)
+- 각 단어의 접두사(PREFIX_LENGTH)에서 최대 MAX_EDIT_DISTANCE 글자를 지운 변형을 색인
+- 조회 시 입력 단어의 삭제 변형으로 후보를 찾고 실제 편집 거리(OSA)로 검증
+- 구문 교정의 허용 거리는 단어 길이에 비례 (4글자 이하 0, 7글자 이하 1, 그 이상 2)
+  → 'zoo' → 'you', 'help' → 'hello' 처럼 짧은 정상 단어를 바꾸지 않음
+- 저장 형식: 삭제 변형 해시(40bit) + 단어 id(24bit) 를 하나의 64bit 정수로 묶은 정렬 배열
+  (파이썬 dict 대비 메모리 1/10 수준, 파일로 저장/로드)
+- 인덱스는 build_spelling_index 명령으로 생성, 각 프로세스는 파일을 한 번 로드
+
+설정 (settings.SPELLING_SETTINGS):
+    MAX_EDIT_DISTANCE: 최대 편집 거리 (기본 2)
+    PREFIX_LENGTH: 삭제 변형을 만들 접두사 길이 (기본 7)
+    MIN_WORD_COUNT: 어휘에 포함할 최소 빈도 (기본 2)
+    INDEX_PATH: 인덱스 파일 경로
+"""
+import os
+import re
+import time
+import zlib
+import struct
+import random
+import string
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+re_english_words = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+INDEX_MAGIC = b'SYM1'
+INDEX_HEADER = struct.Struct('>4sBBIQ')  # magic, max_distance, prefix_length, word_count, entry_count
+
+WORD_ID_BITS = 24
+WORD_ID_MASK = (1 << WORD_ID_BITS) - 1
+
+# (최대 단어 길이, 허용 편집 거리), 더 긴 단어는 2 (인덱스 MAX_EDIT_DISTANCE 로 제한)
+DISTANCE_BY_LENGTH = ((4, 0), (7, 1))
+
+
+def get_spelling_settings():
+    """오타 교정 설정 (settings 값 우선)"""
+    spelling_settings = {
+        'MAX_EDIT_DISTANCE': 2,
+        'PREFIX_LENGTH': 7,
+        'MIN_WORD_COUNT': 2,
+        'INDEX_PATH': os.path.join(str(settings.BASE_DIR), 'logs', 'spelling_index.bin'),
+    }
+    if hasattr(settings, 'SPELLING_SETTINGS'):
+        spelling_settings.update(settings.SPELLING_SETTINGS)
+    return spelling_settings
+
+
+def _delete_hash(delete):
+    """삭제 변형 40bit 해시 (프로세스와 무관하게 동일)"""
+    return ((len(delete) & 0xFF) << 32) | zlib.crc32(delete.encode('utf-8'))
+
+
+def _deletes_by_distance(word, max_distance):
+    """word 에서 글자를 지운 변형을 지운 글자 수별로 → [{word}, {1글자 삭제}, {2글자 삭제}, ...]"""
+    levels = [{word}]
+    for _ in range(min(max_distance, len(word))):
+        levels.append({
+            delete[:i] + delete[i + 1:]
+            for delete in levels[-1]
+            for i in range(len(delete))
+        })
+    return levels
+
+
+def allowed_edit_distance(word):
+    """단어 길이에 따른 교정 허용 편집 거리"""
+    for max_length, distance in DISTANCE_BY_LENGTH:
+        if len(word) <= max_length:
+            return distance
+    return 2
+
+
+def edit_distance(a, b, max_distance):
+    """제한된 OSA(Damerau-Levenshtein) 거리, max_distance 초과 시 max_distance + 1"""
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # 공통 접두사/접미사 제거 후 남은 부분만 계산
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        distance = len(a) or len(b)
+        return distance if distance <= max_distance else max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        a_char = a[i - 1]
+        current = [i] * (len(b) + 1)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            value = previous[j - 1] if a_char == b[j - 1] else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (i > 1 and j > 1 and a_char == b[j - 2] and a[i - 2] == b[j - 1]
+                    and previous_previous[j - 2] + 1 < value):
+                value = previous_previous[j - 2] + 1
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class SpellingIndex:
+    """
+    대칭 삭제 오타 교정 인덱스
+        index = SpellingIndex.build(Counter({'hello': 10, ...}))
+        index.lookup('helo')              # → 'hello'
+        index.correct_phrase('helo wrld') # → 'hello world'
+    """
+
+    def __init__(self, words, counts, entries, max_distance=2, prefix_length=7):
+        self.words = words                  # list[str], id 순
+        self.counts = counts                # array('I')
+        self.entries = entries              # array('Q'), 정렬됨: (해시 << 24) | 단어 id
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.word_ids = {word: word_id for word_id, word in enumerate(words)}
+
+    @classmethod
+    def build(cls, word_counts, max_distance=2, prefix_length=7, min_count=1):
+        words = [word for word, count in word_counts.most_common() if count >= min_count][:WORD_ID_MASK]
+        counts = array('I', (min(word_counts[word], 0xFFFFFFFF) for word in words))
+
+        packed = []
+        for word_id, word in enumerate(words):
+            for delete in set().union(*_deletes_by_distance(word[:prefix_length], max_distance)):
+                packed.append((_delete_hash(delete) << WORD_ID_BITS) | word_id)
+        packed.sort()
+
+        return cls(words, counts, array('Q', packed), max_distance, prefix_length)
+
+    def __len__(self):
+        return len(self.words)
+
+    @property
+    def nbytes(self):
+        return self.entries.itemsize * len(self.entries) + self.counts.itemsize * len(self.counts) \
+            + sum(len(word) + 1 for word in self.words)
+
+    def _candidate_ids(self, delete):
+        low = _delete_hash(delete) << WORD_ID_BITS
+        entries = self.entries
+        position = bisect_left(entries, low)
+        high = low | WORD_ID_MASK
+        while position < len(entries) and entries[position] <= high:
+            yield entries[position] & WORD_ID_MASK
+            position += 1
+
+    def lookup(self, word, max_distance=None):
+        """
+        가장 가까운 어휘 단어 (거리 → 빈도 순), 없으면 None
+        - 어휘에 있는 단어는 그대로 반환
+        """
+        word = word.lower()
+        if word in self.word_ids:
+            return word
+
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        best = None
+        best_key = (max_distance, 0)
+        seen = set()
+        # 지운 글자 수가 적은 변형부터 → 찾은 최선 거리보다 많이 지운 변형은 볼 필요 없음
+        for deleted, deletes in enumerate(_deletes_by_distance(word[:self.prefix_length], max_distance)):
+            if deleted > best_key[0]:
+                break
+            for delete in deletes:
+                for word_id in self._candidate_ids(delete):
+                    if word_id in seen:
+                        continue
+                    seen.add(word_id)
+                    candidate = self.words[word_id]
+                    distance = edit_distance(word, candidate, best_key[0])
+                    if distance > best_key[0]:
+                        continue
+                    key = (distance, -self.counts[word_id])
+                    if best is None or key < best_key:
+                        best, best_key = candidate, key
+        return best
+
+    def correct_phrase(self, phrase):
+        """구문의 각 영어 단어를 길이에 맞는 거리 안에서 교정 (교정할 단어가 없으면 원문 그대로)"""
+        def replace(match):
+            word = match.group(0)
+            max_distance = min(allowed_edit_distance(word), self.max_distance)
+            if max_distance == 0:
+                return word
+            corrected = self.lookup(word, max_distance)
+            return corrected if corrected else word
+
+        return re_english_words.sub(replace, phrase.lower())
+
+    # ----- 저장 / 로드 -----
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(str(path)) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        vocabulary = '\n'.join(self.words).encode('utf-8')
+        with open(temp_path, 'wb') as f:
+            f.write(INDEX_HEADER.pack(
+                INDEX_MAGIC, self.max_distance, self.prefix_length, len(self.words), len(self.entries)
+            ))
+            f.write(struct.pack('>Q', len(vocabulary)))
+            f.write(vocabulary)
+            self.counts.tofile(f)
+            self.entries.tofile(f)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            magic, max_distance, prefix_length, word_count, entry_count = INDEX_HEADER.unpack(
+                f.read(INDEX_HEADER.size)
+            )
+            if magic != INDEX_MAGIC:
+                raise ValueError("잘못된 오타 교정 인덱스 파일")
+            vocabulary_size, = struct.unpack('>Q', f.read(8))
+            words = f.read(vocabulary_size).decode('utf-8').split('\n') if word_count else []
+            counts = array('I')
+            counts.fromfile(f, word_count)
+            entries = array('Q')
+            entries.fromfile(f, entry_count)
+        return cls(words, counts, entries, max_distance, prefix_length)
+
+
+# ===== 어휘 수집 / 프로세스 인덱스 =====
+
+def collect_corpus_vocabulary():
+    """대사 + 검색어 영어 단어 빈도"""
+    from phrase.models import DialogueTable, RequestTable
+
+    word_counts = Counter()
+    for text in DialogueTable.objects.filter(is_active=True).values_list(
+            'dialogue_phrase', flat=True).iterator(chunk_size=2000):
+        word_counts.update(re_english_words.findall((text or '').lower()))
+    for text, search_count in RequestTable.objects.filter(result_count__gt=0).values_list(
+            'request_phrase', 'search_count').iterator(chunk_size=2000):
+        for word in re_english_words.findall((text or '').lower()):
+            word_counts[word] += max(search_count or 1, 1)
+    return word_counts
+
+
+def build_spelling_index(path=None):
+    """코퍼스에서 인덱스 생성 후 파일로 저장"""
+    spelling_settings = get_spelling_settings()
+    path = path or spelling_settings['INDEX_PATH']
+
+    start = time.perf_counter()
+    index = SpellingIndex.build(
+        collect_corpus_vocabulary(),
+        spelling_settings['MAX_EDIT_DISTANCE'],
+        spelling_settings['PREFIX_LENGTH'],
+        spelling_settings['MIN_WORD_COUNT'],
+    )
+    index.save(path)
+    _spelling_state['index'] = index
+
+    logger.info(
+        f"🔡 [Spelling] 인덱스 생성: {len(index)}개 단어, {index.nbytes // 1024}KB "
+        f"({time.perf_counter() - start:.1f}초)"
+    )
+    return {'words': len(index), 'entries': len(index.entries), 'bytes': index.nbytes}
+
+
+_spelling_state = {'index': None, 'loaded': False}
+_spelling_lock = threading.Lock()
+
+
+def get_spelling_index():
+    """프로세스별 인덱스 (파일이 없으면 None → 교정 제안 생략)"""
+    if _spelling_state['loaded']:
+        return _spelling_state['index']
+
+    with _spelling_lock:
+        if not _spelling_state['loaded']:
+            path = get_spelling_settings()['INDEX_PATH']
+            try:
+                _spelling_state['index'] = SpellingIndex.load(path)
+                logger.info(f"🔡 [Spelling] 인덱스 로드: {len(_spelling_state['index'])}개 단어")
+            except FileNotFoundError:
+                logger.info("🔡 [Spelling] 인덱스 파일 없음 (python manage.py build_spelling_index)")
+            except (OSError, ValueError, struct.error, EOFError) as e:
+                logger.warning(f"⚠️ [Spelling] 인덱스 로드 실패: {e}")
+            _spelling_state['loaded'] = True
+    return _spelling_state['index']
+
+
+def suggest_correction(phrase):
+    """
+    "혹시 이것을 찾으셨나요?" 제안 → 교정된 구문 또는 None
+    - 한글 등 영어 단어가 없는 입력, 인덱스가 없는 경우 None
+    """
+    index = get_spelling_index()
+    if index is None or not phrase or not re_english_words.search(phrase.lower()):
+        return None
+
+    corrected = index.correct_phrase(phrase)
+    normalized = ' '.join(phrase.lower().split())
+    corrected = ' '.join(corrected.split())
+    return corrected if corrected != normalized else None
+
+
+def corpus_has_phrase(phrase):
+    """교정된 구문이 대사에 실제로 있는지 (있을 때만 외부 검색 대신 교정 제안)"""
+    from phrase.models import DialogueTable
+
+    return DialogueTable.objects.search_with_movie(phrase).exists()
+
+
+# ===== 벤치마크 =====
+
+def benchmark_spelling_index(vocabulary_size=200000, lookups=20000, seed=42):
+    """
+    합성 어휘로 인덱스 생성 시간 / 메모리 / 초당 조회 수 측정
+    - 조회 입력은 어휘 단어에 1~2글자 오타(치환/삭제/삽입/전치)를 넣어 생성
+    """
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+
+    word_counts = Counter()
+    while len(word_counts) < vocabulary_size:
+        word = ''.join(rng.choice(letters) for _ in range(rng.randint(3, 12)))
+        word_counts[word] = rng.randint(1, 10000)
+
+    start = time.perf_counter()
+    index = SpellingIndex.build(word_counts)
+    build_seconds = time.perf_counter() - start
+
+    def misspell(word):
+        chars = list(word)
+        for _ in range(rng.randint(1, 2)):
+            operation = rng.choice(('replace', 'delete', 'insert', 'transpose'))
+            position = rng.randrange(len(chars))
+            if operation == 'replace':
+                chars[position] = rng.choice(letters)
+            elif operation == 'delete' and len(chars) > 3:
+                del chars[position]
+            elif operation == 'insert':
+                chars.insert(position, rng.choice(letters))
+            elif position + 1 < len(chars):
+                chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        return ''.join(chars)
+
+    vocabulary = index.words
+    queries = [misspell(rng.choice(vocabulary)) for _ in range(lookups)]
+
+    start = time.perf_counter()
+    found = sum(1 for query in queries if index.lookup(query))
+    lookup_seconds = time.perf_counter() - start
+
+    return {
+        'vocabulary': len(index),
+        'entries': len(index.entries),
+        'index_bytes': index.nbytes,
+        'build_seconds': round(build_seconds, 2),
+        'lookups': lookups,
+        'lookups_per_second': round(lookups / lookup_seconds, 1) if lookup_seconds > 0 else None,
+        'found_ratio': round(found / lookups, 4) if lookups else None,
+    }
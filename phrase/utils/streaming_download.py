@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/streaming_download.py
+"""
+스트리밍 파일 다운로드 (비디오/이미지 공용)
+- 응답 전체를 메모리(BytesIO)에 올리지 않고 MEDIA_ROOT 안의 임시 파일에 청크 단위로 기록
+- 스트리밍 중 크기/Content-Type 검증
+- 재시도 시 HTTP Range 로 이어받기
+- FileSystemStorage 저장 시 임시 파일을 rename 으로 원자적 이동 (복사 없음)
+
+설정 (settings.DOWNLOAD_SETTINGS):
+    TEMP_DIR: 임시 파일 디렉토리 (기본 MEDIA_ROOT/tmp/downloads, 같은 파일시스템이어야 rename 가능)
+    CHUNK_SIZE: 청크 크기 (기본 64KB)
+"""
+import os
+import re
+import time
+import tempfile
+import logging
+
+import requests
+from django.conf import settings
+from django.core.files import File
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+ALLOWED_CONTENT_TYPES = {
+    'video': ('video/', 'application/octet-stream', 'binary/octet-stream'),
+    'image': ('image/',),
+}
+
+re_content_range_total = re.compile(r'/(\d+)\s*$')
+
+
+class DownloadRejected(Exception):
+    """재시도해도 소용없는 다운로드 거부 (크기 초과, 잘못된 Content-Type 등)"""
+
+
+class StreamedDownloadFile(File):
+    """
+    디스크 임시 파일 기반 다운로드 결과
+    - temporary_file_path() 를 제공하므로 FileSystemStorage 가 복사 대신 rename 으로 이동
+      (django.core.files.uploadedfile.TemporaryUploadedFile 과 같은 방식)
+    """
+
+    def __init__(self, name, temp_dir):
+        os.makedirs(temp_dir, exist_ok=True)
+        super().__init__(tempfile.NamedTemporaryFile(suffix='.part', dir=temp_dir), name)
+        self.content_type = ''
+        self.bytes_written = 0
+
+    def temporary_file_path(self):
+        return self.file.name
+
+    @property
+    def size(self):
+        return self.bytes_written
+
+    def restart(self):
+        """서버가 Range 를 지원하지 않을 때 처음부터 다시 기록"""
+        self.file.seek(0)
+        self.file.truncate()
+        self.bytes_written = 0
+
+    def write_chunk(self, chunk):
+        self.file.write(chunk)
+        self.bytes_written += len(chunk)
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            # 저장소로 이동(rename)된 뒤에는 임시 파일이 이미 없음
+            pass
+
+
+def get_download_settings():
+    download_settings = {
+        'TEMP_DIR': os.path.join(str(settings.MEDIA_ROOT), 'tmp', 'downloads'),
+        'CHUNK_SIZE': 64 * 1024,
+    }
+    if hasattr(settings, 'DOWNLOAD_SETTINGS'):
+        download_settings.update(settings.DOWNLOAD_SETTINGS)
+    return download_settings
+
+
+def _expected_total(response):
+    """응답에서 전체 파일 크기 추출 (206 은 Content-Range, 200 은 Content-Length)"""
+    if response.status_code == 206:
+        match = re_content_range_total.search(response.headers.get('content-range', ''))
+        return int(match.group(1)) if match else None
+    content_length = response.headers.get('content-length')
+    return int(content_length) if content_length and content_length.isdigit() else None
+
+
+def stream_download(url, file_type='video', max_size_mb=100, name='download',
+                    max_retries=3, timeout=(10, 60), session=None):
+    """
+    URL 을 임시 파일로 스트리밍 다운로드
+    - 성공: StreamedDownloadFile (읽기 위치 0, content_type 설정됨)
+    - 실패: None (임시 파일 삭제)
+    """
+    if not url:
+        logger.warning(f"{file_type} URL이 없습니다")
+        return None
+
+    download_settings = get_download_settings()
+    chunk_size = download_settings['CHUNK_SIZE']
+    max_bytes = int(max_size_mb * 1024 * 1024)
+    allowed_types = ALLOWED_CONTENT_TYPES.get(file_type, ())
+    http = session or requests
+
+    downloaded = StreamedDownloadFile(name, download_settings['TEMP_DIR'])
+    expected_total = None
+
+    try:
+        for attempt in range(max_retries):
+            offset = downloaded.size
+            headers = {'User-Agent': DEFAULT_USER_AGENT}
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+
+            try:
+                logger.info(f"{file_type} 다운로드 시도 {attempt + 1}/{max_retries}: {url} (offset {offset})")
+
+                with http.get(url, stream=True, timeout=timeout, headers=headers) as response:
+                    # 이전 시도에서 이미 전부 받은 경우
+                    if offset and response.status_code == 416 and offset == expected_total:
+                        break
+
+                    response.raise_for_status()
+
+                    if offset and response.status_code != 206:
+                        logger.info(f"{file_type} Range 미지원 서버, 처음부터 다시 받음")
+                        downloaded.restart()
+
+                    content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+                    if allowed_types and not content_type.startswith(allowed_types):
+                        raise DownloadRejected(f"허용되지 않는 Content-Type: {content_type}")
+                    downloaded.content_type = downloaded.content_type or content_type
+
+                    expected_total = _expected_total(response) or expected_total
+                    if expected_total and expected_total > max_bytes:
+                        raise DownloadRejected(
+                            f"파일이 너무 큼: {expected_total / (1024 * 1024):.1f}MB (최대 {max_size_mb}MB)"
+                        )
+
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+                        if downloaded.size + len(chunk) > max_bytes:
+                            raise DownloadRejected(f"다운로드 중 크기 초과: 최대 {max_size_mb}MB")
+                        downloaded.write_chunk(chunk)
+
+                if expected_total is None or downloaded.size >= expected_total:
+                    break
+
+                raise requests.RequestException(
+                    f"불완전한 응답: {downloaded.size}/{expected_total} bytes"
+                )
+
+            except requests.RequestException as e:
+                logger.warning(f"{file_type} 다운로드 시도 {attempt + 1} 실패: {e}")
+                if attempt < max_retries - 1:
+                    time.sleep(2 ** attempt)  # 지수 백오프
+        else:
+            logger.error(f"{file_type} 다운로드 최종 실패: {url}")
+            downloaded.close()
+            return None
+
+    except DownloadRejected as e:
+        logger.warning(f"{file_type} 다운로드 거부: {e}")
+        downloaded.close()
+        return None
+    except Exception as e:
+        logger.error(f"{file_type} 다운로드 중 오류: {e}")
+        downloaded.close()
+        return None
+
+    downloaded.file.flush()
+    downloaded.seek(0)
+    logger.info(f"{file_type} 다운로드 성공: {downloaded.size} bytes ({downloaded.content_type})")
+    return downloaded
+
+
+def guess_extension(content_type, file_type='video'):
+    """Content-Type 으로 확장자 결정"""
+    if 'png' in content_type:
+        return 'png'
+    if 'webp' in content_type:
+        return 'webp'
+    if 'webm' in content_type:
+        return 'webm'
+    return 'jpg' if file_type == 'image' else 'mp4'
@@ -6,14 +6,16 @@
 from django.shortcuts import render
 from django.http import HttpResponse
 
+from phrase.utils.metrics import timed_stage
+from phrase.utils.event_log import get_event_logger
 
+render_log = get_event_logger('render')
+
+
+@timed_stage('template_render')
 def render_search_results(request, original_query, translated_query, 
                          search_phrase, results, from_cache=False):
     """검색 결과 렌더링 - HttpResponse 반환 보장"""
-    print(f"🎨 DEBUG: render_search_results 호출")
-    print(f"📊 DEBUG: 결과 개수: {len(results) if results else 0}")
-    print(f"🗄️ DEBUG: 캐시에서 로드: {from_cache}")
-    
     try:
         total_results = len(results) if results else 0
         displayed_results = min(total_results, 5)
@@ -30,15 +32,15 @@ def render_search_results(request, original_query, translated_query,
             'source': 'cache' if from_cache else 'api',
         }
         
-        print(f"📋 DEBUG: 컨텍스트 준비 완료: {list(context.keys())}")
-        print(f"🎬 DEBUG: 영화 목록 샘플: {[m.get('title', 'No title') for m in (results[:2] if results else [])]}")
+        render_log.debug(
+            "🎨 검색 결과 렌더링", total_results=total_results, from_cache=from_cache,
+            sample=lambda: [m.get('title', 'No title') for m in (results[:2] if results else [])],
+        )
         
-        response = render(request, 'index.html', context)
-        print("✅ DEBUG: 템플릿 렌더링 성공")
-        return response
+        return render(request, 'index.html', context)
         
     except Exception as e:
-        print(f"❌ DEBUG: render_search_results 오류: {e}")
+        render_log.exception("❌ render_search_results 오류", query=original_query)
         # 렌더링 실패 시 최소한의 응답
         try:
             fallback_context = {
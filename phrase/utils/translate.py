@@ -9,6 +9,7 @@
 """
 import requests
 import re
+import hashlib
 from urllib.parse import quote
 import time
 import logging
@@ -16,13 +17,26 @@ from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
+from phrase.utils.external_services import mymemory_translate_url
+from phrase.utils.metrics import (
+    record_cache, record_upstream, upstream_outcome, TRANSLATIONS, BULK_TRANSLATIONS,
+)
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+re_korean = re.compile(r'[가-힣]')
+re_english = re.compile(r'[a-zA-Z]')
+
+
+def translation_cache_key(prefix, langpair, text):
+    """번역 캐시 키 (프로세스와 무관하게 동일 → 예열 명령/다른 워커와 공유)"""
+    return f"{prefix}{langpair}_{hashlib.md5(text.encode('utf-8')).hexdigest()}"
+
 class LibreTranslator:
     def __init__(self):
         # MyMemory API 사용 (더 안정적)
-        self.api_url = "https://api.mymemory.translated.net/get"
+        self.api_url = mymemory_translate_url()  # EXTERNAL_SERVICE_SETTINGS.MYMEMORY_BASE_URL
         self.max_retries = 3
         self.retry_delay = 1
         
@@ -32,13 +46,11 @@ class LibreTranslator:
     
     def is_korean(self, text):
         """한글 포함 여부 확인"""
-        korean_pattern = re.compile(r'[가-힣]')
-        return bool(korean_pattern.search(text))
+        return bool(re_korean.search(text))
     
     def is_english(self, text):
         """영어 포함 여부 확인"""
-        english_pattern = re.compile(r'[a-zA-Z]')
-        return bool(english_pattern.search(text))
+        return bool(re_english.search(text))
     
     def translate_to_english(self, text):
         """한글 → 영어 번역 (캐싱 적용)"""
@@ -49,8 +61,9 @@ class LibreTranslator:
             return text
         
         # 캐시 확인
-        cache_key = f"{self.cache_prefix}ko_en_{hash(text)}"
+        cache_key = translation_cache_key(self.cache_prefix, 'ko_en', text)
         cached_result = cache.get(cache_key)
+        record_cache('translation', bool(cached_result))
         
         if cached_result:
             logger.debug(f"캐시에서 번역 조회: {text[:20]}...")
@@ -74,8 +87,9 @@ class LibreTranslator:
             return text
         
         # 캐시 확인
-        cache_key = f"{self.cache_prefix}en_ko_{hash(text)}"
+        cache_key = translation_cache_key(self.cache_prefix, 'en_ko', text)
         cached_result = cache.get(cache_key)
+        record_cache('translation', bool(cached_result))
         
         if cached_result:
             logger.debug(f"캐시에서 번역 조회: {text[:20]}...")
@@ -100,14 +114,23 @@ class LibreTranslator:
                     'langpair': langpair
                 }
                 
-                response = requests.get(
-                    self.api_url, 
-                    params=params, 
-                    timeout=10,
-                    headers={
-                        'User-Agent': 'EndlessRealClips/1.0'
-                    }
-                )
+                request_start = time.perf_counter()
+                try:
+                    response = requests.get(
+                        self.api_url, 
+                        params=params, 
+                        timeout=10,
+                        headers={
+                            'User-Agent': 'EndlessRealClips/1.0'
+                        }
+                    )
+                except requests.exceptions.Timeout:
+                    record_upstream('mymemory', 'timeout', time.perf_counter() - request_start)
+                    raise
+                except requests.exceptions.RequestException:
+                    record_upstream('mymemory', 'connection_error', time.perf_counter() - request_start)
+                    raise
+                record_upstream('mymemory', upstream_outcome(response.status_code), time.perf_counter() - request_start)
                 
                 logger.debug(f"번역 API 응답: {response.status_code} (시도 {attempt + 1}/{self.max_retries})")
                 
@@ -208,38 +231,9 @@ class LibreTranslator:
         return False
     
     def _record_translation_quality(self, original, translated, langpair, quality):
-        """번역 품질 기록 (통계 및 개선용)"""
+        """번역 품질 기록 (메트릭 레지스트리 카운터, 캐시 왕복 없음)"""
         try:
-            quality_data = {
-                'original_length': len(original),
-                'translated_length': len(translated),
-                'langpair': langpair,
-                'quality': quality,
-                'timestamp': timezone.now().isoformat()
-            }
-            
-            # 캐시에 통계 저장 (일일 통계)
-            today = timezone.now().strftime('%Y-%m-%d')
-            stats_key = f"translation_stats_{today}"
-            
-            daily_stats = cache.get(stats_key, {
-                'total': 0,
-                'success': 0,
-                'poor_quality': 0,
-                'failed': 0,
-                'ko_en': 0,
-                'en_ko': 0
-            })
-            
-            daily_stats['total'] += 1
-            daily_stats[quality] += 1
-            if langpair == 'ko|en':
-                daily_stats['ko_en'] += 1
-            else:
-                daily_stats['en_ko'] += 1
-            
-            cache.set(stats_key, daily_stats, 86400)  # 24시간
-            
+            TRANSLATIONS.inc(langpair=langpair, quality=quality)
         except Exception as e:
             logger.error(f"번역 품질 기록 실패: {e}")
     
@@ -303,18 +297,13 @@ class LibreTranslator:
         return min(confidence, 1.0)
     
     def get_translation_statistics(self):
-        """번역 통계 조회"""
-        today = timezone.now().strftime('%Y-%m-%d')
-        stats_key = f"translation_stats_{today}"
-        
-        return cache.get(stats_key, {
-            'total': 0,
-            'success': 0,
-            'poor_quality': 0,
-            'failed': 0,
-            'ko_en': 0,
-            'en_ko': 0
-        })
+        """번역 통계 조회 (서버 시작 이후 전체 워커 합계)"""
+        stats = {'total': 0, 'success': 0, 'poor_quality': 0, 'failed': 0, 'ko_en': 0, 'en_ko': 0}
+        for (langpair, quality), count in TRANSLATIONS.items():
+            stats['total'] += count
+            stats[quality] = stats.get(quality, 0) + count
+            stats['ko_en' if langpair == 'ko|en' else 'en_ko'] += count
+        return stats
 
 # 번역 유틸리티 함수들 (새 모델 활용)
 
@@ -556,24 +545,11 @@ def _generate_translation_recommendations(overall_stats, quality_by_method):
 
 
 def _update_translation_statistics(success_count, failed_count):
-    """번역 통계 업데이트"""
+    """번역 통계 업데이트 (카운터 누적 + 마지막 실행 시각)"""
     try:
-        today = timezone.now().strftime('%Y-%m-%d')
-        stats_key = f"bulk_translation_stats_{today}"
-        
-        daily_bulk_stats = cache.get(stats_key, {
-            'total_processed': 0,
-            'successful': 0,
-            'failed': 0,
-            'last_run': None
-        })
-        
-        daily_bulk_stats['total_processed'] += success_count + failed_count
-        daily_bulk_stats['successful'] += success_count
-        daily_bulk_stats['failed'] += failed_count
-        daily_bulk_stats['last_run'] = timezone.now().isoformat()
-        
-        cache.set(stats_key, daily_bulk_stats, 86400)  # 24시간
+        BULK_TRANSLATIONS.inc(success_count, result='successful')
+        BULK_TRANSLATIONS.inc(failed_count, result='failed')
+        cache.set('bulk_translation_last_run', timezone.now().isoformat(), 86400)
         
     except Exception as e:
         logger.error(f"번역 통계 업데이트 실패: {e}")
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# dj/phrase/utils/warmup.py
+"""
+배포 직후 캐시 예열
+- 인기 검색어(RequestTable.popular_searches) 상위 N 개를 실제 검색 경로로 재생
+  · API: get_smart_translation_result → perform_db_search_optimized (번역 / DB 검색 캐시)
+  · 웹: get_existing_results_from_db (검색 결과 캐시)
+  · playphrase 는 호출하지 않음 (번역 캐시가 없는 한국어 검색어만 번역 API 호출)
+- 통계 캐시(매니저 get_statistics), 자주 쓰는 정규식 / URL 패턴, 템플릿 컴파일
+- 프로세스 메모리 인덱스(자동완성, 유사 검색어, 오타 교정, 네거티브 캐시 필터)
+  · 워커 시작 시에는 백그라운드 스레드에서 생성 (코퍼스가 커도 post_worker_init 이 워커 타임아웃에 걸리지 않음)
+- 시간 상한(max_seconds)을 넘기면 남은 단계는 건너뜀 (report['skipped'])
+- 재생 2회차 지연(p50/p95)을 함께 보고 → 배포 직후 1분 p95 의 기대치
+
+사용:
+    python manage.py warm_caches              (공유 캐시 백엔드 예열, 배포 스크립트에서)
+    gunicorn.conf.py 의 post_worker_init     (워커별 메모리 캐시/인덱스 예열)
+
+설정 (settings.WARMUP_SETTINGS):
+    TOP_N: 재생할 인기 검색어 수 (기본 50)
+    WORKER_TOP_N: 워커 시작 시 재생할 수 (기본 20)
+    WORKER_MAX_SECONDS: 워커 예열 시간 상한 (기본 15, 워커 타임아웃보다 짧게)
+    SEARCH_LIMIT: 검색 결과 수 (API 기본값과 같아야 캐시 키가 일치, 기본 20)
+    TEMPLATES: 미리 컴파일할 템플릿
+    ON_WORKER_START: 워커 시작 시 예열 여부 (기본 True)
+"""
+import time
+import logging
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_warmup_settings():
+    """캐시 예열 설정 (settings 값 우선)"""
+    warmup_settings = {
+        'TOP_N': 50,
+        'WORKER_TOP_N': 20,
+        'WORKER_MAX_SECONDS': 15,
+        'SEARCH_LIMIT': 20,
+        'TEMPLATES': (
+            'index.html',
+            'components/error_section.html',
+            'components/search_form.html',
+        ),
+        'ON_WORKER_START': True,
+    }
+    if hasattr(settings, 'WARMUP_SETTINGS'):
+        warmup_settings.update(settings.WARMUP_SETTINGS)
+    return warmup_settings
+
+
+def _percentile(timings, ratio):
+    if not timings:
+        return None
+    ordered = sorted(timings)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))], 2)
+
+
+def is_shared_cache():
+    """프로세스 간 공유되는 캐시 백엔드인지 (LocMemCache / DummyCache 는 아님)"""
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    return not backend.endswith(('LocMemCache', 'DummyCache'))
+
+
+# ===== 단계별 예열 =====
+
+def default_search_options():
+    """파라미터 없는 /api/search/?q= 요청과 같은 옵션 (캐시 키 일치)"""
+    return {
+        'include_inactive': False,
+        'quality_filter': '',
+        'translation_required': False,
+        'sort_by': 'relevance',
+        'movie_filter': '',
+        'year_filter': '',
+        'exact_match': False,
+        'spellcheck': True,
+        'fields': None,
+        'exclude': None,
+    }
+
+
+def replay_popular_searches(top_n, limit=20, deadline=None):
+    """
+    인기 검색어를 검색 경로로 재생 → 검색어별 소요 시간(ms)
+    - deadline(time.monotonic 기준)을 넘기면 중단
+    """
+    from phrase.models import RequestTable
+    from phrase.utils.data_processing import get_existing_results_from_db
+    from api.views import get_smart_translation_result, perform_db_search_optimized
+
+    search_options = default_search_options()
+    # 결과 없던 검색어는 네거티브 캐시가 처리하므로 제외
+    popular = [
+        (request.request_phrase, request.request_korean)
+        for request in RequestTable.objects.popular_searches(top_n)
+        if request.result_count
+    ] if top_n else []
+
+    timings = []
+    for request_phrase, request_korean in popular:
+        if deadline is not None and time.monotonic() > deadline:
+            logger.info(f"⏱️ [Warmup] 시간 상한 도달: {len(timings)}/{len(popular)}개 재생")
+            break
+        start = time.perf_counter()
+        try:
+            for query in filter(None, (request_phrase, request_korean)):
+                translation_result = get_smart_translation_result(query)
+                perform_db_search_optimized(translation_result, limit, search_options)
+            get_existing_results_from_db(request_phrase, request_korean)
+        except Exception as e:
+            logger.warning(f"⚠️ [Warmup] 검색 재생 실패: {request_phrase[:50]} - {e}")
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def warm_statistics():
+    from phrase.models import RequestTable, MovieTable, DialogueTable
+
+    for manager in (RequestTable.objects, MovieTable.objects, DialogueTable.objects):
+        manager.get_statistics()
+
+
+def warm_regexes_and_urls():
+    """모듈 수준 정규식 / 지연 컴파일 정규식 / URL 패턴 컴파일"""
+    from django.urls import resolve, Resolver404
+    from phrase.utils.translate import LibreTranslator
+    from phrase.utils.negative_cache import normalize_phrase
+    from phrase.utils.autocomplete import detect_language
+    from phrase.utils.spelling import re_english_words
+    from phrase.utils.get_imdb_poster_url import scan_html_head
+    from api.middleware import re_accepts_br, re_accepts_gzip
+
+    translator = LibreTranslator()
+    for sample in ("I'll be back", '다시 돌아올게'):
+        translator.is_korean(sample)
+        translator.is_english(sample)
+        normalize_phrase(sample)
+        detect_language(sample)
+        re_english_words.findall(sample.lower())
+    scan_html_head('<html><head><meta property="og:image" content=""></head><body></body></html>')
+    re_accepts_br.search('gzip, br')
+    re_accepts_gzip.search('gzip, br')
+
+    for path in ('/', '/api/search/', '/api/autocomplete/', '/api/dialogues/'):
+        try:
+            resolve(path)
+        except Resolver404:
+            pass
+
+
+def warm_templates(names):
+    from django.template import TemplateDoesNotExist
+    from django.template.loader import get_template
+
+    loaded = 0
+    for name in names:
+        try:
+            get_template(name)
+            loaded += 1
+        except TemplateDoesNotExist:
+            logger.warning(f"⚠️ [Warmup] 템플릿 없음: {name}")
+    return loaded
+
+
+def warm_process_indexes():
+    """프로세스 메모리 인덱스 (워커마다 필요)"""
+    from phrase.utils.negative_cache import get_bloom_filter
+    from phrase.utils.autocomplete import get_autocomplete_index
+    from phrase.utils.similar_search import get_similar_search_index
+    from phrase.utils.spelling import get_spelling_index
+
+    get_bloom_filter()
+    # getter 는 백그라운드 생성만 시작하므로 여기서 직접 생성 (이미 생성 중이면 바로 반환)
+    get_autocomplete_index().refresh()
+    get_similar_search_index().refresh()
+    get_spelling_index()
+
+
+def warm_process_indexes_in_background():
+    """프로세스 인덱스를 데몬 스레드에서 생성 (생성 전 요청은 각 인덱스 getter 의 대체 경로로 응답)"""
+    def run():
+        from django.db import close_old_connections
+
+        start = time.perf_counter()
+        try:
+            warm_process_indexes()
+            logger.info(f"🔥 [Warmup] 프로세스 인덱스 생성 완료 ({time.perf_counter() - start:.1f}초)")
+        except Exception as e:
+            logger.warning(f"⚠️ [Warmup] 프로세스 인덱스 생성 실패: {e}")
+        finally:
+            close_old_connections()
+
+    thread = threading.Thread(target=run, name='phrase-warmup-indexes', daemon=True)
+    thread.start()
+    return thread
+
+
+# ===== 전체 예열 =====
+
+def warm_caches(top_n=None, include_process_indexes=True, max_seconds=None, measure=True,
+                background_indexes=False):
+    """
+    전체 예열 → 보고서
+        {'stages': {단계: ms}, 'skipped': [...], 'replayed': n, 'cold_p95_ms', 'warm_p50_ms', 'warm_p95_ms', 'total_ms', ...}
+    - max_seconds: 모든 단계에 적용 (상한을 넘기면 남은 단계 생략, 검색 재생은 도중에 중단)
+    - background_indexes: 프로세스 인덱스를 백그라운드 스레드에서 생성 (상한과 무관)
+    - measure: 재생을 한 번 더 해서 예열 후 지연(배포 직후 기대치) 측정
+    """
+    warmup_settings = get_warmup_settings()
+    top_n = warmup_settings['TOP_N'] if top_n is None else top_n
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+    limit = warmup_settings['SEARCH_LIMIT']
+
+    report = {'stages': {}, 'skipped': [], 'shared_cache': is_shared_cache()}
+    total_start = time.perf_counter()
+
+    def run_stage(name, func, *args):
+        if deadline is not None and time.monotonic() > deadline:
+            report['skipped'].append(name)
+            return None
+        start = time.perf_counter()
+        try:
+            result = func(*args)
+        except Exception as e:
+            logger.warning(f"⚠️ [Warmup] {name} 실패: {e}")
+            result = None
+        report['stages'][name] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    run_stage('regexes_and_urls', warm_regexes_and_urls)
+    run_stage('templates', warm_templates, warmup_settings['TEMPLATES'])
+    run_stage('statistics', warm_statistics)
+    if include_process_indexes and background_indexes:
+        warm_process_indexes_in_background()
+        report['process_indexes'] = 'background'
+    elif include_process_indexes:
+        run_stage('process_indexes', warm_process_indexes)
+
+    cold_timings = run_stage('searches', replay_popular_searches, top_n, limit, deadline) or []
+    report['replayed'] = len(cold_timings)
+    report['cold_p95_ms'] = _percentile(cold_timings, 0.95)
+
+    if measure and cold_timings and (deadline is None or time.monotonic() < deadline):
+        warm_timings = replay_popular_searches(len(cold_timings), limit, deadline)
+        report['warm_p50_ms'] = _percentile(warm_timings, 0.5)
+        report['warm_p95_ms'] = _percentile(warm_timings, 0.95)
+
+    report['total_ms'] = round((time.perf_counter() - total_start) * 1000, 1)
+    logger.info(f"🔥 [Warmup] 캐시 예열 완료: {report}")
+    return report
+
+
+def warm_worker():
+    """
+    워커 시작 시 예열 (gunicorn post_worker_init 등에서 호출)
+    - 메모리 캐시 / 인덱스는 프로세스마다 따로라 워커별로 필요
+    - 시간 상한 안에서만 수행, 실패해도 워커 시작은 계속
+    - 프로세스 인덱스는 백그라운드 스레드에서 생성 (워커 첫 heartbeat 를 막지 않음)
+    """
+    warmup_settings = get_warmup_settings()
+    if not warmup_settings['ON_WORKER_START']:
+        return None
+    try:
+        return warm_caches(
+            top_n=warmup_settings['WORKER_TOP_N'],
+            max_seconds=warmup_settings['WORKER_MAX_SECONDS'],
+            measure=False,
+            background_indexes=True,
+        )
+    except Exception as e:
+        logger.error(f"❌ [Warmup] 워커 예열 실패: {e}")
+        return None
+    finally:
+        # 예열에 쓴 DB 연결은 요청 처리 전에 정리
+        from django.db import close_old_connections
+        close_old_connections()
@@ -6,7 +6,7 @@
 
 from .main_views import index, process_text
 from .api_views import popular_searches_api, statistics_api
-from .helper_views import debug_view, korean_translation_status, bulk_translate_dialogues
+from .helper_views import debug_view, korean_translation_status, bulk_translate_dialogues, metrics_view
 
 __all__ = [
     'index',
@@ -15,5 +15,6 @@ __all__ = [
     'statistics_api',
     'debug_view',
     'korean_translation_status',
-    'bulk_translate_dialogues'
+    'bulk_translate_dialogues',
+    'metrics_view'
 ]
\ No newline at end of file
@@ -4,17 +4,18 @@
 헬퍼 뷰 - 디버그, 관리자용 뷰들 (수정된 버전)
 """
 import time
-import logging
 from django.shortcuts import render
 from django.http import HttpResponse, JsonResponse
+from django.utils.crypto import constant_time_compare
 from django.db import transaction, models
 from django.contrib.auth.decorators import user_passes_test
 
 from phrase.models import RequestTable, MovieTable, DialogueTable, UserSearchQuery
 from phrase.utils.translate import LibreTranslator
 from ..utils.search_helpers import get_input_type
+from ..utils.event_log import get_event_logger
 
-logger = logging.getLogger(__name__)
+translation_log = get_event_logger('translation')
 
 
 def debug_view(request):
@@ -74,17 +75,12 @@ def debug_view(request):
 
 def korean_translation_status(request):
     """한글 번역 상태 확인 뷰 - 완전히 새로 작성"""
-    print("🔍 DEBUG: korean_translation_status 뷰 호출")
-    
     try:
         # 기본 통계 계산
-        print("📊 DEBUG: 기본 통계 계산 시작")
-        
         try:
             total_dialogues = DialogueTable.objects.filter(is_active=True).count()
-            print(f"📊 DEBUG: 전체 대사 수: {total_dialogues}")
         except Exception as e:
-            print(f"❌ DEBUG: 전체 대사 수 계산 실패: {e}")
+            translation_log.warning(f"❌ 전체 대사 수 계산 실패: {e}")
             total_dialogues = 0
         
         try:
@@ -92,9 +88,8 @@ def korean_translation_status(request):
                 is_active=True, 
                 dialogue_phrase_ko__isnull=False
             ).exclude(dialogue_phrase_ko='').count()
-            print(f"📊 DEBUG: 한글 번역 완료: {with_korean}")
         except Exception as e:
-            print(f"❌ DEBUG: 한글 번역 완료 수 계산 실패: {e}")
+            translation_log.warning(f"❌ 한글 번역 완료 수 계산 실패: {e}")
             with_korean = 0
         
         without_korean = total_dialogues - with_korean
@@ -107,10 +102,9 @@ def korean_translation_status(request):
             'translation_rate': translation_rate,
         }
         
-        print(f"📊 DEBUG: 통계 계산 완료: {dialogue_stats}")
+        translation_log.debug("📊 번역 통계", **dialogue_stats)
         
         # 최근 번역된 대사들
-        print("📋 DEBUG: 최근 번역된 대사 조회")
         try:
             recent_translated = DialogueTable.objects.filter(
                 is_active=True,
@@ -118,13 +112,11 @@ def korean_translation_status(request):
             ).exclude(dialogue_phrase_ko='').select_related('movie').order_by('-updated_at')[:10]
             
             recent_translated_list = list(recent_translated)
-            print(f"📋 DEBUG: 최근 번역된 대사: {len(recent_translated_list)}개")
         except Exception as e:
-            print(f"❌ DEBUG: 최근 번역된 대사 조회 실패: {e}")
+            translation_log.warning(f"❌ 최근 번역된 대사 조회 실패: {e}")
             recent_translated_list = []
         
         # 번역이 필요한 대사들
-        print("📋 DEBUG: 번역 필요한 대사 조회")
         try:
             needs_translation = DialogueTable.objects.filter(
                 is_active=True
@@ -133,9 +125,8 @@ def korean_translation_status(request):
             ).select_related('movie')[:10]
             
             needs_translation_list = list(needs_translation)
-            print(f"📋 DEBUG: 번역 필요한 대사: {len(needs_translation_list)}개")
         except Exception as e:
-            print(f"❌ DEBUG: 번역 필요한 대사 조회 실패: {e}")
+            translation_log.warning(f"❌ 번역 필요한 대사 조회 실패: {e}")
             needs_translation_list = []
         
         # 컨텍스트 구성
@@ -145,18 +136,10 @@ def korean_translation_status(request):
             'needs_translation': needs_translation_list,
         }
         
-        print(f"📋 DEBUG: 최종 컨텍스트 키: {list(context.keys())}")
-        print("🎭 DEBUG: korean_translation_status.html 렌더링 시작")
-        
-        response = render(request, 'korean_translation_status.html', context)
-        print("✅ DEBUG: 템플릿 렌더링 성공")
-        return response
+        return render(request, 'korean_translation_status.html', context)
         
     except Exception as e:
-        print(f"❌ DEBUG: korean_translation_status 뷰 전체 오류: {e}")
-        print(f"❌ DEBUG: 오류 타입: {type(e).__name__}")
-        import traceback
-        print(f"❌ DEBUG: 스택 트레이스: {traceback.format_exc()}")
+        translation_log.exception("❌ korean_translation_status 뷰 오류")
         
         # 오류 시 기본 컨텍스트로 렌더링 시도
         try:
@@ -171,22 +154,17 @@ def korean_translation_status(request):
                 'needs_translation': [],
                 'error': f'번역 상태 조회 중 오류가 발생했습니다: {str(e)}'
             }
-            print("🔄 DEBUG: 폴백 컨텍스트로 렌더링 시도")
             return render(request, 'korean_translation_status.html', fallback_context)
         except Exception as render_error:
-            print(f"❌ DEBUG: 폴백 렌더링도 실패: {render_error}")
+            translation_log.error(f"❌ 폴백 렌더링도 실패: {render_error}")
             return HttpResponse(f"번역 상태 뷰 오류: {str(e)}", status=500)
 
 
 @user_passes_test(lambda u: u.is_staff)
 def bulk_translate_dialogues(request):
     """대사 일괄 번역 뷰 (관리자용) - 수정된 버전"""
-    print("🔧 DEBUG: bulk_translate_dialogues 뷰 호출")
-    
     try:
         if request.method == 'POST':
-            print("📝 DEBUG: POST 요청 - 일괄 번역 시작")
-            
             try:
                 # 번역이 필요한 대사들 조회
                 dialogues_to_translate = DialogueTable.objects.filter(
@@ -196,7 +174,7 @@ def bulk_translate_dialogues(request):
                 )[:100]
                 
                 dialogues_list = list(dialogues_to_translate)
-                print(f"🔍 DEBUG: 번역 대상 대사: {len(dialogues_list)}개")
+                translation_log.info("🔄 일괄 번역 시작", targets=len(dialogues_list))
                 
                 if not dialogues_list:
                     return JsonResponse({
@@ -209,7 +187,6 @@ def bulk_translate_dialogues(request):
                 updated_count = 0
                 
                 # 배치 번역 처리
-                print("🔄 DEBUG: 배치 번역 시작")
                 with transaction.atomic():
                     for dialogue in dialogues_list:
                         try:
@@ -219,15 +196,15 @@ def bulk_translate_dialogues(request):
                                 dialogue.translation_method = 'api_auto'
                                 dialogue.save(update_fields=['dialogue_phrase_ko', 'translation_method'])
                                 updated_count += 1
-                                print(f"✅ DEBUG: 번역 완료: {dialogue.dialogue_phrase[:30]}...")
+                                translation_log.debug("✅ 번역 완료", dialogue_id=dialogue.pk)
                         except Exception as e:
-                            print(f"❌ DEBUG: 개별 번역 실패: {e}")
+                            translation_log.warning(f"❌ 개별 번역 실패: {e}", dialogue_id=dialogue.pk)
                             continue
                         
                         # API 호출 간격 조절
                         time.sleep(0.1)
                 
-                print(f"🎉 DEBUG: 일괄 번역 완료: {updated_count}개")
+                translation_log.info("🎉 일괄 번역 완료", updated_count=updated_count)
                 return JsonResponse({
                     'success': True,
                     'updated_count': updated_count,
@@ -235,15 +212,13 @@ def bulk_translate_dialogues(request):
                 })
                 
             except Exception as e:
-                print(f"❌ DEBUG: 일괄 번역 처리 중 오류: {e}")
-                logger.error(f"일괄 번역 오류: {e}")
+                translation_log.exception("❌ 일괄 번역 처리 중 오류")
                 return JsonResponse({
                     'success': False,
                     'error': f'번역 중 오류가 발생했습니다: {str(e)}'
                 }, status=500)
         
         # GET 요청 - 일괄 번역 페이지 표시
-        print("🔍 DEBUG: GET 요청 - 일괄 번역 페이지")
         try:
             # 간단한 통계
             total_needs_translation = DialogueTable.objects.filter(
@@ -258,9 +233,34 @@ def bulk_translate_dialogues(request):
             
             return render(request, 'bulk_translate.html', context)
         except Exception as e:
-            print(f"❌ DEBUG: 일괄 번역 페이지 렌더링 실패: {e}")
+            translation_log.exception("❌ 일괄 번역 페이지 렌더링 실패")
             return HttpResponse(f"일괄 번역 페이지 오류: {str(e)}", status=500)
         
     except Exception as e:
-        print(f"❌ DEBUG: bulk_translate_dialogues 전체 오류: {e}")
-        return HttpResponse(f"일괄 번역 뷰 오류: {str(e)}", status=500)
\ No newline at end of file
+        translation_log.exception("❌ bulk_translate_dialogues 오류")
+        return HttpResponse(f"일괄 번역 뷰 오류: {str(e)}", status=500)
+
+def _metrics_access_allowed(request, metrics_settings):
+    """
+    /metrics 접근 허용 여부 (스태프는 항상 허용)
+    - TOKEN 지정 시: Authorization: Bearer <TOKEN> 만 허용 (IP 허용 목록 무시)
+    - 미지정 시: REMOTE_ADDR 가 ALLOWED_IPS 에 포함
+      (같은 호스트의 리버스 프록시 뒤에서는 모든 클라이언트가 127.0.0.1 → 운영에서는 TOKEN 지정)
+    """
+    if request.user.is_staff:
+        return True
+    token = metrics_settings.get('TOKEN')
+    if token:
+        scheme, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        return scheme.lower() == 'bearer' and constant_time_compare(credentials.strip(), token)
+    return request.META.get('REMOTE_ADDR') in metrics_settings['ALLOWED_IPS']
+
+
+def metrics_view(request):
+    """Prometheus 메트릭 (METRICS_SETTINGS.TOKEN / ALLOWED_IPS 또는 스태프만)"""
+    from phrase.utils.metrics import get_metrics_settings, render_prometheus
+
+    if not _metrics_access_allowed(request, get_metrics_settings()):
+        return HttpResponse('Forbidden', status=403, content_type='text/plain')
+
+    return HttpResponse(render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -22,7 +22,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'phrase.middleware.StageTimingMiddleware',
+    'phrase.middleware.QueryBudgetMiddleware',
+    'phrase.middleware.QuerySamplingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.APICompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -97,4 +101,167 @@ REST_FRAMEWORK = {
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
     ],
-}
\ No newline at end of file
+}
+# 고속 JSON 렌더러 (orjson 설치 시, 선택)
+API_FAST_JSON = os.getenv('API_FAST_JSON', 'False') == 'True'
+if API_FAST_JSON:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'api.renderers.FastJSONRenderer',
+    ]
+
+# API 응답 압축 (api.middleware.APICompressionMiddleware)
+API_COMPRESSION_SETTINGS = {
+    'MIN_SIZE': int(os.getenv('API_COMPRESSION_MIN_SIZE', '1024')),
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 4,
+    'PATH_PREFIXES': ('/api/',),
+}
+
+# 포스터 변환본 (phrase.utils.poster_variants)
+POSTER_VARIANT_SETTINGS = {
+    'SIZES': {
+        'thumb': (160, 240),
+        'card': (400, 600),
+    },
+    'JPEG_QUALITY': 82,
+    'WEBP_QUALITY': 80,
+    'GENERATE_ON_INGEST': True,
+}
+
+# 스트리밍 다운로드 (phrase.utils.streaming_download)
+# 임시 파일은 MEDIA_ROOT 와 같은 파일시스템에 두어야 rename 으로 원자적 이동 가능
+DOWNLOAD_SETTINGS = {
+    'TEMP_DIR': MEDIA_ROOT / 'tmp' / 'downloads',
+    'CHUNK_SIZE': 64 * 1024,
+}
+
+# 포스터 동시 백필 (phrase.utils.poster_backfill)
+POSTER_BACKFILL_SETTINGS = {
+    'WORKERS': int(os.getenv('POSTER_BACKFILL_WORKERS', '4')),
+    'BATCH_SIZE': 100,
+    'REQUESTS_PER_SECOND': 2.0,
+    'PER_HOST_RATES': {
+        'www.imdb.com': 2.0,
+        'm.media-amazon.com': 8.0,
+    },
+    'CHECKPOINT_PATH': BASE_DIR / 'logs' / 'poster_backfill_checkpoint.json',
+}
+
+# 저장된 URL 링크 검사 (phrase.utils.link_checker)
+LINK_CHECK_SETTINGS = {
+    'WORKERS': int(os.getenv('LINK_CHECK_WORKERS', '16')),
+    'PER_HOST_CONCURRENCY': 4,
+    'TIMEOUT': 10,
+    'BATCH_SIZE': 500,
+    'RECHECK_AFTER_HOURS': 24 * 7,
+}
+
+# 결과 없는 구문 네거티브 캐시 (phrase.utils.negative_cache)
+NEGATIVE_CACHE_SETTINGS = {
+    'ENABLED': os.getenv('NEGATIVE_CACHE_ENABLED', 'True') == 'True',
+    'TTL': 6 * 3600,
+    'EXPECTED_ITEMS': 100000,
+    'FALSE_POSITIVE_RATE': 0.01,
+    'BLOOM_PATH': BASE_DIR / 'logs' / 'negative_phrases.bloom',
+    'RELOAD_INTERVAL': 60,
+}
+
+# 접두사 자동완성 인덱스 (phrase.utils.autocomplete)
+AUTOCOMPLETE_SETTINGS = {
+    'REFRESH_INTERVAL': int(os.getenv('AUTOCOMPLETE_REFRESH_INTERVAL', '300')),
+    'NGRAM_SIZES': (2, 3, 4),
+    'MIN_NGRAM_COUNT': 3,
+    'NGRAM_WEIGHT': 0.5,
+    'MAX_NGRAMS': 200000,
+    'PRECOMPUTE_PREFIX_LENGTH': 3,
+    'TOP_K': 10,
+}
+
+# 코퍼스 어휘 기반 오타 교정 (phrase.utils.spelling)
+SPELLING_SETTINGS = {
+    'MAX_EDIT_DISTANCE': 2,
+    'PREFIX_LENGTH': 7,
+    'MIN_WORD_COUNT': int(os.getenv('SPELLING_MIN_WORD_COUNT', '2')),
+    'INDEX_PATH': BASE_DIR / 'logs' / 'spelling_index.bin',
+}
+
+# 유사 검색어 trigram 인덱스 (phrase.utils.similar_search)
+SIMILAR_SEARCH_SETTINGS = {
+    'REFRESH_INTERVAL': int(os.getenv('SIMILAR_SEARCH_REFRESH_INTERVAL', '300')),
+    'METRIC': 'jaccard',
+    'MIN_SCORE': 0.3,
+    'MAX_POSTINGS': 20000,
+}
+
+# 배포 직후 캐시 예열 (phrase.utils.warmup, manage.py warm_caches, gunicorn.conf.py)
+WARMUP_SETTINGS = {
+    'TOP_N': int(os.getenv('WARMUP_TOP_N', '50')),
+    'WORKER_TOP_N': int(os.getenv('WARMUP_WORKER_TOP_N', '20')),
+    'WORKER_MAX_SECONDS': 15,
+    'SEARCH_LIMIT': 20,
+    'TEMPLATES': (
+        'index.html',
+        'components/error_section.html',
+        'components/search_form.html',
+    ),
+    'ON_WORKER_START': os.getenv('WARM_ON_WORKER_START', 'True') == 'True',
+}
+
+# 외부 서비스 기본 URL (phrase.utils.external_services)
+# 로컬 대역 서버: python manage.py run_fake_servers 출력값을 환경변수로 지정
+EXTERNAL_SERVICE_SETTINGS = {
+    'PLAYPHRASE_BASE_URL': os.getenv('PLAYPHRASE_BASE_URL', 'https://www.playphrase.me'),
+    'MYMEMORY_BASE_URL': os.getenv('MYMEMORY_BASE_URL', 'https://api.mymemory.translated.net'),
+    'IMDB_BASE_URL': os.getenv('IMDB_BASE_URL', 'https://www.imdb.com'),
+}
+
+# 요청 단계 시간 / Prometheus 메트릭 (phrase.utils.metrics, phrase.middleware, /metrics)
+METRICS_SETTINGS = {
+    'ENABLED': os.getenv('METRICS_ENABLED', 'True') == 'True',
+    # REMOTE_ADDR 기준 → 같은 호스트의 리버스 프록시(nginx) 뒤에서는 모든 요청이 127.0.0.1 로 보임
+    'ALLOWED_IPS': tuple(os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')),
+    # 지정하면 IP 허용 목록 대신 Authorization: Bearer <TOKEN> 요구 (프록시 뒤 운영에서는 지정)
+    'TOKEN': os.getenv('METRICS_TOKEN', ''),
+    'SERVER_TIMING_HEADER': True,
+    # gunicorn.conf.py 가 지정 (워커별 mmap 파일 → /metrics 에서 합산), 없으면 프로세스 메모리
+    'MULTIPROCESS_DIR': os.getenv('METRICS_MULTIPROCESS_DIR') or None,
+}
+
+# 요청별 SQL 쿼리 예산 / N+1 감지 (phrase.utils.query_budget, 개발 모드 미들웨어와 테스트)
+# ENABLED 를 지정하지 않으면 DEBUG 를 따름 (local 켜짐, production 꺼짐)
+QUERY_BUDGET_SETTINGS = {
+    'RAISE': os.getenv('QUERY_BUDGET_RAISE', 'False') == 'True',
+    'REPEAT_THRESHOLD': 5,
+    'BUDGETS': {},
+}
+
+# SQL 지문 표본 수집 (phrase.utils.query_sampling, manage.py index_advice 가 분석)
+QUERY_SAMPLING_SETTINGS = {
+    'ENABLED': os.getenv('QUERY_SAMPLING_ENABLED', 'True') == 'True',
+    'SAMPLE_RATE': float(os.getenv('QUERY_SAMPLE_RATE', '0.01')),
+    'MAX_EXAMPLE_LENGTH': 4000,
+}
+
+# 구조화 이벤트 로그 (phrase.utils.event_log, 핫 패스 디버그 추적)
+# 범주: request / search / db / render / translation, 꺼진 레벨은 호출 비용만 남음
+EVENT_LOG_SETTINGS = {
+    'DEFAULT_LEVEL': os.getenv('EVENT_LOG_LEVEL', 'WARNING'),
+    'LEVELS': {},
+    # 요청마다 남는 DEBUG / INFO 이벤트는 표본만 기록 (WARNING 이상은 항상)
+    'SAMPLE_RATES': {
+        'request': float(os.getenv('EVENT_LOG_REQUEST_SAMPLE_RATE', '0.01')),
+    },
+    # 루트 / django 핸들러를 QueueListener 뒤로 옮겨 포맷 / 쓰기를 요청 스레드 밖에서 처리
+    'QUEUE': os.getenv('EVENT_LOG_QUEUE', 'True') == 'True',
+    'QUEUE_SIZE': 10000,
+}
+
+# 비동기(ASGI) 검색 API (phrase.utils.async_support, /api/search/async/)
+ASYNC_SETTINGS = {
+    # 동기 작업(ORM / 캐시 / 번역) 스레드 수 = 워커당 DB 연결 상한
+    'THREAD_POOL_SIZE': int(os.getenv('ASYNC_THREAD_POOL_SIZE', '16')),
+    'UPSTREAM_CONCURRENCY': int(os.getenv('ASYNC_UPSTREAM_CONCURRENCY', '100')),
+    'HTTP_TIMEOUT': 30,
+    # 풀 스레드는 DB 연결을 호출 사이에 유지 (CONN_MAX_AGE 와 무관), 이 시간이 지나면 다시 연결
+    'POOL_CONN_MAX_AGE': 300,
+}
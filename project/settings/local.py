@@ -58,9 +58,13 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
+            'class': 'phrase.utils.event_log.FieldsFormatter',
             'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
             'style': '{',
         },
+        'structured': {
+            'class': 'phrase.utils.event_log.StructuredFormatter',
+        },
     },
     'handlers': {
         'console': {
@@ -72,7 +76,7 @@ LOGGING = {
             'filename': 'logs/django.log',
             'maxBytes': 1024 * 1024 * 15,  # 15MB
             'backupCount': 10,
-            'formatter': 'verbose',
+            'formatter': 'structured',
         },
     },
     'root': {
@@ -86,4 +90,11 @@ LOGGING = {
             'propagate': False,
         },
     },
-}
\ No newline at end of file
+}
+
+# 개발 환경은 이벤트 로그 전체 기록 (EVENT_LOG_LEVEL=WARNING 으로 끔)
+EVENT_LOG_SETTINGS = {
+    **EVENT_LOG_SETTINGS,
+    'DEFAULT_LEVEL': os.getenv('EVENT_LOG_LEVEL', 'DEBUG'),
+    'SAMPLE_RATES': {},
+}
@@ -70,9 +70,13 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
+            'class': 'phrase.utils.event_log.FieldsFormatter',
             'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
             'style': '{',
         },
+        'structured': {
+            'class': 'phrase.utils.event_log.StructuredFormatter',
+        },
     },
     'handlers': {
         'console': {
@@ -84,7 +88,7 @@ LOGGING = {
             'filename': LOGGING_PATH,
             'maxBytes': 1024 * 1024 * 15,  # 15MB
             'backupCount': 10,
-            'formatter': 'verbose',
+            'formatter': 'structured',
         },
     },
     'root': {